@@ -2,19 +2,44 @@
 Cerberus - Intelligent Code Context Engine
 
 MCP-based interface for code indexing, retrieval, and memory.
+
+Exports are loaded lazily on first access, so importing a submodule such as
+``cerberus.memory.session_cli`` does not pull in the index, retrieval or MCP
+stacks.
 """
 
+from typing import TYPE_CHECKING
+
+from cerberus.lazy_imports import lazy_exports
+
 __version__ = "2.0.0"
 
-# Core exports
-from cerberus.index import build_index, load_index
-from cerberus.retrieval import hybrid_search
-from cerberus.retrieval.utils import find_symbol_fts, read_range
-from cerberus.storage import SQLiteIndexStore, ScanResultAdapter
-from cerberus.schemas import CodeSymbol, ScanResult
+if TYPE_CHECKING:
+    # Core exports
+    from cerberus.index import build_index, load_index
+    from cerberus.retrieval import hybrid_search
+    from cerberus.retrieval.utils import find_symbol_fts, read_range
+    from cerberus.storage import SQLiteIndexStore, ScanResultAdapter
+    from cerberus.schemas import CodeSymbol, ScanResult
+
+    # MCP server
+    from cerberus.mcp import create_server, run_server
 
-# MCP server
-from cerberus.mcp import create_server, run_server
+__getattr__, __dir__ = lazy_exports(__name__, {
+    # Core exports
+    "build_index": "cerberus.index",
+    "load_index": "cerberus.index",
+    "hybrid_search": "cerberus.retrieval",
+    "find_symbol_fts": "cerberus.retrieval.utils",
+    "read_range": "cerberus.retrieval.utils",
+    "SQLiteIndexStore": "cerberus.storage",
+    "ScanResultAdapter": "cerberus.storage",
+    "CodeSymbol": "cerberus.schemas",
+    "ScanResult": "cerberus.schemas",
+    # MCP server
+    "create_server": "cerberus.mcp",
+    "run_server": "cerberus.mcp",
+})
 
 __all__ = [
     "__version__",
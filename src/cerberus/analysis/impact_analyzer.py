@@ -8,9 +8,9 @@ Helps AI agents make safe refactoring decisions.
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Dict, Optional, Any, Set
-import re
 
 from cerberus.resolution.call_graph_builder import CallGraphBuilder
+from cerberus.analysis.test_index import TestIndex
 
 
 @dataclass
@@ -67,6 +67,7 @@ class ImpactAnalyzer:
         self.store = store
         self.project_root = project_root or Path.cwd()
         self.call_graph_builder = CallGraphBuilder(store)
+        self.test_index = TestIndex(store, self.project_root)
 
     def analyze_impact(self, symbol_name: str, file_path: Optional[str] = None) -> ImpactAnalysis:
         """
@@ -160,46 +161,19 @@ class ImpactAnalyzer:
         file_path: str,
         direct_callers: List[tuple]
     ) -> List[str]:
-        """Find test files that would be affected by changes."""
-        affected_tests = []
-
-        # Convert file path to potential test names
-        path_obj = Path(file_path)
-        module_name = path_obj.stem
-
-        # Common test file patterns
-        test_patterns = [
-            f"test_{module_name}.py",
-            f"{module_name}_test.py",
-            f"test_{symbol_name.lower()}.py",
-        ]
+        """Find tests that would be affected by changes (indexed lookup)."""
+        affected_tests = self.test_index.find_tests(symbol_name, limit=10)
 
-        # Search for test files
-        test_dir = self.project_root / "tests"
-        if test_dir.exists():
-            for pattern in test_patterns:
-                for test_file in test_dir.glob(f"**/{pattern}"):
-                    # Check if test file mentions the symbol
-                    try:
-                        content = test_file.read_text()
-                        if symbol_name in content:
-                            rel_path = test_file.relative_to(self.project_root)
-                            # Find test functions that use this symbol
-                            test_funcs = re.findall(r'def (test_\w+)', content)
-                            for func in test_funcs:
-                                # Check if symbol is mentioned near this test
-                                func_match = re.search(f'def {func}.*?(?=def |$)', content, re.DOTALL)
-                                if func_match and symbol_name in func_match.group(0):
-                                    affected_tests.append(f"{rel_path}::{func}")
-                    except:
-                        continue
-
-        # Also check if any direct callers are test functions
+        # Direct callers that are test functions outside the test index (e.g. ad-hoc test dirs)
         for caller_name, caller_file, _ in direct_callers:
+            if len(affected_tests) >= 10:
+                break
             if "test" in caller_file.lower() and caller_name.startswith("test_"):
-                affected_tests.append(f"{caller_file}::{caller_name}")
+                test_ref = f"{self.test_index.relative_path(caller_file)}::{caller_name}"
+                if test_ref not in affected_tests:
+                    affected_tests.append(test_ref)
 
-        return list(set(affected_tests))[:10]  # Limit to top 10
+        return affected_tests
 
     def _calculate_test_coverage(self, direct_callers: int, affected_tests: List[str]) -> float:
         """Calculate rough test coverage score."""
@@ -3,15 +3,24 @@ Project Onboarding Summary Generator.
 
 Generates comprehensive project overviews for AI agents starting new sessions.
 Aims for 80/20 value in ~800 tokens instead of 5,000+ token exploration.
+
+When an index store is available, file lists, symbol statistics and the import
+graph come from the index, and each summary section is cached in index
+metadata together with a digest of its inputs (index generation, indexed file
+set, manifest files). Later calls only regenerate the sections whose inputs
+changed.
 """
 
 from collections import Counter
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Dict, List, Optional, Any
+from pathlib import Path, PurePath
+from typing import Callable, Dict, List, Optional, Any
+import hashlib
 import json
+import os
 import re
-import subprocess
+
+from cerberus.logging_config import logger
 
 PROJECT_MARKERS = {
     "go": ["go.mod", "go.sum"],
@@ -37,6 +46,42 @@ EXTENSION_TO_LANGUAGE = {
     ".rb": "ruby",
 }
 
+SKIPPED_DIRS = {"node_modules", "__pycache__", "venv", "build", "dist"}
+
+# Files whose content feeds stack/dependency/testing detection
+MANIFEST_FILES = sorted(
+    {marker for markers in PROJECT_MARKERS.values() for marker in markers}
+    | {"pytest.ini", "conftest.py", "tests/conftest.py"}
+)
+
+# Bump when section generation changes so cached summaries are discarded
+SUMMARY_CACHE_VERSION = 1
+SUMMARY_CACHE_METADATA_KEY = "project_summary_cache"
+
+# Inputs each section depends on:
+#   generation - index contents (bumped by builds and incremental updates)
+#   files      - set of indexed file paths
+#   manifests  - manifest files and top-level layout of the project root
+SECTION_INPUTS = {
+    "languages": ("files", "manifests"),
+    "tech_stack": ("files", "manifests"),
+    "project_type": ("files", "manifests"),
+    "architecture": ("files", "manifests"),
+    "key_modules": ("files",),
+    "entry_points": ("files", "manifests"),
+    "coding_patterns": ("generation",),
+    "dependencies": ("manifests",),
+    "testing_approach": ("files", "manifests"),
+    "index_stats": ("generation",),
+}
+
+CODING_PATTERN_CHECKS = [
+    (re.compile(r'@dataclass'), "Use dataclasses for data structures"),
+    (re.compile(r'async def'), "Async/await for I/O operations"),
+    (re.compile(r'def \w+\([^)]*:\s*\w+'), "Type hints required on functions"),
+    (re.compile(r'try:'), "Use try/except for error handling"),
+]
+
 ENTRY_POINT_PATTERNS = {
     "go": ["main.go", "cmd/*/main.go", "*/main.go"],
     "python": ["main.py", "__main__.py", "cli.py", "app.py"],
@@ -59,6 +104,7 @@ class ProjectSummary:
     dependencies: Dict[str, List[str]] = field(default_factory=dict)
     testing_approach: str = ""
     project_type: str = ""
+    index_stats: Dict[str, Any] = field(default_factory=dict)
     token_estimate: int = 800
 
     def to_dict(self) -> Dict[str, Any]:
@@ -71,6 +117,7 @@ class ProjectSummary:
             "dependencies": self.dependencies,
             "testing_approach": self.testing_approach,
             "project_type": self.project_type,
+            "index_stats": self.index_stats,
             "token_estimate": self.token_estimate,
         }
 
@@ -80,7 +127,8 @@ class ProjectSummaryAnalyzer:
     Analyzes project structure and generates onboarding summaries.
 
     Uses existing index + file system analysis to build a comprehensive
-    but token-efficient project overview.
+    but token-efficient project overview. With a store, sections are cached
+    in index metadata and only regenerated when their inputs change.
     """
 
     def __init__(self, project_root: Path, store: Optional[Any] = None):
@@ -93,6 +141,8 @@ class ProjectSummaryAnalyzer:
         """
         self.project_root = Path(project_root)
         self.store = store
+        self._files: Optional[List[str]] = None
+        self._languages: Optional[List[str]] = None
 
     def generate_summary(self) -> ProjectSummary:
         """
@@ -101,48 +151,188 @@ class ProjectSummaryAnalyzer:
         Returns:
             ProjectSummary with all fields populated
         """
-        summary = ProjectSummary()
-
-        # Detect tech stack
-        summary.tech_stack = self._detect_tech_stack()
-
-        # Detect project type
-        summary.project_type = self._detect_project_type()
-
-        # Analyze architecture
-        summary.architecture = self._infer_architecture()
-
-        # Map key modules
-        summary.key_modules = self._map_key_modules()
-
-        # Find entry points
-        summary.entry_points = self._find_entry_points()
+        builders: Dict[str, Callable[[], Any]] = {
+            "languages": self._detect_languages,
+            "tech_stack": self._detect_tech_stack,
+            "project_type": self._detect_project_type,
+            "architecture": self._infer_architecture,
+            "key_modules": self._map_key_modules,
+            "entry_points": self._find_entry_points,
+            "coding_patterns": self._extract_coding_patterns,
+            "dependencies": self._parse_dependencies,
+            "testing_approach": self._detect_testing_approach,
+            "index_stats": self._collect_index_stats,
+        }
 
-        # Extract coding patterns
-        summary.coding_patterns = self._extract_coding_patterns()
+        cache = self._load_cache()
+        inputs = self._compute_inputs(cache)
+        cached_sections = cache.get("sections", {}) if cache else {}
+        cached_digests = cache.get("digests", {}) if cache else {}
+
+        sections: Dict[str, Any] = {}
+        digests: Dict[str, str] = {}
+        regenerated = []
+        for name, builder in builders.items():
+            digest = _digest([inputs[key] for key in SECTION_INPUTS[name]])
+            digests[name] = digest
+            if name in cached_sections and cached_digests.get(name) == digest:
+                sections[name] = cached_sections[name]
+            else:
+                sections[name] = builder()
+                regenerated.append(name)
+
+            if name == "languages":
+                self._languages = sections[name]
+
+        if regenerated:
+            logger.debug(f"Project summary: regenerated {', '.join(regenerated)}")
+            self._save_cache(inputs, digests, sections)
+
+        return ProjectSummary(
+            tech_stack=sections["tech_stack"],
+            architecture=sections["architecture"],
+            key_modules=sections["key_modules"],
+            entry_points=sections["entry_points"],
+            coding_patterns=sections["coding_patterns"],
+            dependencies=sections["dependencies"],
+            testing_approach=sections["testing_approach"],
+            project_type=sections["project_type"],
+            index_stats=sections["index_stats"],
+        )
+
+    def _load_cache(self) -> Optional[Dict[str, Any]]:
+        """Load cached sections from index metadata (None without a store)."""
+        if self.store is None:
+            return None
+        try:
+            raw = self.store.get_metadata(SUMMARY_CACHE_METADATA_KEY)
+            cache = json.loads(raw) if raw else {}
+        except Exception as e:
+            logger.debug(f"Project summary cache unavailable: {e}")
+            return {}
+        if cache.get("version") != SUMMARY_CACHE_VERSION:
+            return {}
+        return cache
+
+    def _save_cache(
+        self,
+        inputs: Dict[str, str],
+        digests: Dict[str, str],
+        sections: Dict[str, Any],
+    ) -> None:
+        """Persist sections and their input digests to index metadata."""
+        if self.store is None:
+            return
+        payload = {
+            "version": SUMMARY_CACHE_VERSION,
+            "inputs": inputs,
+            "digests": digests,
+            "sections": sections,
+        }
+        try:
+            self.store.set_metadata(SUMMARY_CACHE_METADATA_KEY, json.dumps(payload))
+        except Exception as e:
+            logger.debug(f"Could not cache project summary: {e}")
 
-        # Parse dependencies
-        summary.dependencies = self._parse_dependencies()
+    def _compute_inputs(self, cache: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Compute a fingerprint per input source.
 
-        # Detect testing approach
-        summary.testing_approach = self._detect_testing_approach()
+        The indexed file set is only re-read when the index generation moved,
+        so an unchanged index costs one metadata lookup plus a few stat calls.
+        """
+        inputs = {"manifests": self._manifest_fingerprint()}
+
+        if self.store is None:
+            # No index: nothing is cached, every section is generated
+            inputs["generation"] = inputs["files"] = ""
+            return inputs
+
+        generation = str(self.store.get_generation())
+        inputs["generation"] = generation
+
+        cached_inputs = (cache or {}).get("inputs", {})
+        if cached_inputs.get("generation") == generation and "files" in cached_inputs:
+            inputs["files"] = cached_inputs["files"]
+        else:
+            inputs["files"] = _digest(sorted(self._list_files()))
+        return inputs
+
+    def _manifest_fingerprint(self) -> str:
+        """Fingerprint manifest files (name, mtime, size) and top-level entries."""
+        parts = []
+        for name in MANIFEST_FILES:
+            try:
+                stat = (self.project_root / name).stat()
+                parts.append(f"{name}:{stat.st_mtime_ns}:{stat.st_size}")
+            except OSError:
+                continue
+        try:
+            with os.scandir(self.project_root) as entries:
+                parts.extend(sorted(
+                    f"{entry.name}/" if entry.is_dir() else entry.name
+                    for entry in entries
+                ))
+        except OSError:
+            pass
+        return _digest(parts)
+
+    def _list_files(self) -> List[str]:
+        """
+        List project files as POSIX paths relative to the project root.
 
-        return summary
+        Reads the indexed file list when a store is available, otherwise walks
+        the project once (skipping hidden and vendored directories).
+        """
+        if self._files is not None:
+            return self._files
+
+        files: List[str] = []
+        if self.store is not None:
+            root = self.project_root.resolve()
+            conn = self.store._get_connection()
+            try:
+                for row in conn.execute("SELECT path FROM files"):
+                    path = Path(row["path"])
+                    if path.is_absolute():
+                        try:
+                            path = path.relative_to(root)
+                        except ValueError:
+                            continue
+                    files.append(path.as_posix())
+            finally:
+                conn.close()
+        else:
+            for dirpath, dirnames, filenames in os.walk(self.project_root):
+                dirnames[:] = [
+                    d for d in dirnames
+                    if not d.startswith(".") and d not in SKIPPED_DIRS
+                ]
+                rel_dir = Path(dirpath).relative_to(self.project_root)
+                files.extend((rel_dir / name).as_posix() for name in filenames)
+
+        self._files = files
+        return files
 
     def _detect_languages(self) -> List[str]:
         """Detect languages present using markers and file extensions."""
+        if self._languages is not None:
+            return self._languages
+
         counts = Counter()
         counts.update(self._detect_languages_by_markers())
         counts.update(self._detect_languages_by_files())
 
         if not counts:
-            return []
+            self._languages = []
+            return self._languages
 
         languages = [lang for lang, _ in counts.most_common()]
 
         if "typescript" in languages and "javascript" in languages:
             languages = [lang for lang in languages if lang != "javascript"]
 
+        self._languages = languages
         return languages
 
     def _detect_languages_by_markers(self) -> Dict[str, int]:
@@ -160,10 +350,10 @@ class ProjectSummaryAnalyzer:
         """Count files by extension to infer languages."""
         counts: Dict[str, int] = {}
 
-        for ext, language in EXTENSION_TO_LANGUAGE.items():
-            matches = list(self.project_root.rglob(f"*{ext}"))
-            if matches:
-                counts[language] = counts.get(language, 0) + len(matches)
+        for path in self._list_files():
+            language = EXTENSION_TO_LANGUAGE.get(PurePath(path).suffix)
+            if language:
+                counts[language] = counts.get(language, 0) + 1
 
         return counts
 
@@ -447,30 +637,29 @@ class ProjectSummaryAnalyzer:
         """Map key modules to their purposes."""
         modules = {}
 
-        # Scan src/ or lib/ directories
-        src_dirs = [
-            self.project_root / "src",
-            self.project_root / "lib",
-            self.project_root,
-        ]
-
-        for src_dir in src_dirs:
-            if not src_dir.exists():
+        # Package directories containing project files, under src/, lib/ or
+        # the project root (in that order of precedence)
+        module_dirs = set()
+        for path in self._list_files():
+            parts = PurePath(path).parts
+            if len(parts) >= 3 and parts[0] in ("src", "lib"):
+                module_dirs.add(parts[:2])
+            if len(parts) >= 2:
+                module_dirs.add(parts[:1])
+
+        for parts in sorted(module_dirs, key=lambda p: (len(p) == 1, p)):
+            name = parts[-1]
+            if name.startswith((".", "_")):
                 continue
 
-            # Find main package directories
-            for item in src_dir.iterdir():
-                if not item.is_dir() or item.name.startswith((".", "_")):
-                    continue
-
-                # Skip common non-code directories
-                if item.name in ("tests", "docs", "scripts", "tools", "build", "dist"):
-                    continue
+            # Skip common non-code directories
+            if name in ("tests", "docs", "scripts", "tools", "build", "dist"):
+                continue
 
-                # Infer purpose from directory name and contents
-                purpose = self._infer_module_purpose(item)
-                if purpose:
-                    modules[f"{item.name}/"] = purpose
+            # Infer purpose from directory name and contents
+            purpose = self._infer_module_purpose(self.project_root.joinpath(*parts))
+            if purpose:
+                modules.setdefault(f"{name}/", purpose)
 
         return modules
 
@@ -529,14 +718,14 @@ class ProjectSummaryAnalyzer:
         """Find main entry points of the application."""
         entry_points: List[str] = []
         languages = self._detect_languages() or ["python"]
+        files = sorted(self._list_files())
 
         for language in languages:
             patterns = ENTRY_POINT_PATTERNS.get(language, [])
             for pattern in patterns:
-                for match in self.project_root.rglob(pattern):
-                    if match.is_file():
-                        rel_path = match.relative_to(self.project_root)
-                        entry_points.append(str(rel_path))
+                entry_points.extend(
+                    path for path in files if PurePath(path).match(pattern)
+                )
 
         seen = set()
         deduped = []
@@ -548,48 +737,44 @@ class ProjectSummaryAnalyzer:
         return deduped[:5]
 
     def _extract_coding_patterns(self) -> List[str]:
-        """Extract common coding patterns from the codebase."""
-        patterns = []
-
-        # Check for dataclass usage
-        if self._check_pattern(r'@dataclass'):
-            patterns.append("Use dataclasses for data structures")
-
-        # Check for async/await
-        if self._check_pattern(r'async def'):
-            patterns.append("Async/await for I/O operations")
-
-        # Check for type hints
-        if self._check_pattern(r'def \w+\([^)]*:\s*\w+'):
-            patterns.append("Type hints required on functions")
-
-        # Check for docstring style
-        py_files = list(self.project_root.glob("**/*.py"))
-        if py_files:
-            sample_file = py_files[0]
-            content = sample_file.read_text()
-            if '"""' in content and "Args:" in content:
-                patterns.append("Docstrings use Google style")
-            elif '"""' in content and ":param" in content:
-                patterns.append("Docstrings use Sphinx style")
-
-        # Check for error handling
-        if self._check_pattern(r'try:'):
-            patterns.append("Use try/except for error handling")
+        """
+        Extract common coding patterns from the codebase.
 
-        return patterns[:7]  # Limit to top 7
+        Makes a single pass over the Python files, checking every pattern per
+        file and stopping once all patterns have been seen.
+        """
+        found = set()
+        docstring_style = None
+
+        for path in self._list_files():
+            if not path.endswith(".py"):
+                continue
+            try:
+                content = (self.project_root / path).read_text(errors="ignore")
+            except OSError:
+                continue
+
+            for regex, description in CODING_PATTERN_CHECKS:
+                if description not in found and regex.search(content):
+                    found.add(description)
+
+            if docstring_style is None and '"""' in content:
+                if "Args:" in content:
+                    docstring_style = "Docstrings use Google style"
+                elif ":param" in content:
+                    docstring_style = "Docstrings use Sphinx style"
+
+            if docstring_style and len(found) == len(CODING_PATTERN_CHECKS):
+                break
+
+        patterns = [
+            description for _, description in CODING_PATTERN_CHECKS
+            if description in found
+        ]
+        if docstring_style:
+            patterns.append(docstring_style)
 
-    def _check_pattern(self, regex: str) -> bool:
-        """Check if a pattern exists in Python files."""
-        for py_file in self.project_root.glob("**/*.py"):
-            if py_file.is_file():
-                try:
-                    content = py_file.read_text()
-                    if re.search(regex, content):
-                        return True
-                except:
-                    continue
-        return False
+        return patterns[:7]  # Limit to top 7
 
     def _parse_dependencies(self) -> Dict[str, List[str]]:
         """Parse project dependencies."""
@@ -650,14 +835,62 @@ class ProjectSummaryAnalyzer:
             return "pytest"
 
         # Check for unittest
-        test_files = list(self.project_root.glob("**/test_*.py"))
+        test_files = sorted(
+            path for path in self._list_files()
+            if PurePath(path).match("test_*.py")
+        )
         if test_files:
-            sample = test_files[0].read_text()
+            sample = (self.project_root / test_files[0]).read_text(errors="ignore")
             if "import unittest" in sample:
                 return "unittest"
 
         return "No testing framework detected"
 
+    def _collect_index_stats(self) -> Dict[str, Any]:
+        """
+        Summarize index contents: files by extension, symbols by type and the
+        most imported modules from the import graph.
+        """
+        extensions = Counter(
+            PurePath(path).suffix or PurePath(path).name for path in self._list_files()
+        )
+        stats: Dict[str, Any] = {
+            "files_by_extension": dict(extensions.most_common(8)),
+        }
+        if self.store is None:
+            return stats
+
+        conn = self.store._get_connection()
+        try:
+            stats["symbols_by_type"] = {
+                row["type"]: row["count"] for row in conn.execute("""
+                    SELECT type, COUNT(*) AS count FROM symbols
+                    GROUP BY type ORDER BY count DESC
+                """)
+            }
+            stats["top_imports"] = {
+                row["module"]: row["importers"] for row in conn.execute("""
+                    SELECT module, COUNT(DISTINCT file_path) AS importers
+                    FROM imports
+                    GROUP BY module
+                    ORDER BY importers DESC, module
+                    LIMIT 8
+                """)
+            }
+        finally:
+            conn.close()
+
+        return stats
+
+
+def _digest(parts: List[str]) -> str:
+    """Stable short digest of a list of strings."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8", errors="ignore"))
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
 
 def generate_project_summary(project_root: Path, store: Optional[Any] = None) -> ProjectSummary:
     """
@@ -0,0 +1,268 @@
+"""
+Persistent Test Index.
+
+Maps test functions to the symbols they call and reference, and test files
+to the modules they import. The index lives in the ``test_links`` table of
+the SQLite index: it is built as an index post-processing step and refreshed
+per file on incremental updates, so impact analysis and test mapping become
+indexed lookups instead of scans over the whole test tree.
+"""
+
+import keyword
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from cerberus.logging_config import logger
+from cerberus.parser.dependencies import extract_calls, extract_imports
+from cerberus.schemas import TestLink
+
+# Bump when link extraction changes so older indexes are rebuilt lazily
+TEST_INDEX_VERSION = "1"
+TEST_INDEX_METADATA_KEY = "test_index_version"
+
+TEST_DIR_NAMES = {"tests", "test", "__tests__", "spec"}
+TEST_FILE_SUFFIXES = ("_test.py", "_test.go", "_spec.py")
+TEST_JS_MARKERS = (".test.", ".spec.")
+TEST_EXTENSIONS = {".py", ".js", ".jsx", ".ts", ".tsx", ".go"}
+
+IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+IGNORED_IDENTIFIERS = set(keyword.kwlist) | {"self", "cls", "None", "True", "False"}
+
+
+def is_test_file(path: str, project_root: Optional[str] = None) -> bool:
+    """
+    Check whether a path looks like a test file.
+
+    A file counts as a test when it lives under a test directory
+    (``tests/``, ``test/``, ``__tests__/``, ``spec/``) or follows a
+    test naming convention (``*_test.py``, ``*_test.go``, ``*.test.ts``...).
+    Directories above ``project_root`` are ignored for absolute paths.
+    """
+    p = Path(path)
+    if p.suffix not in TEST_EXTENSIONS:
+        return False
+
+    name = p.name
+    if name.endswith(TEST_FILE_SUFFIXES) or any(marker in name for marker in TEST_JS_MARKERS):
+        return True
+
+    if project_root and p.is_absolute():
+        try:
+            p = p.relative_to(project_root)
+        except ValueError:
+            pass
+
+    return any(part in TEST_DIR_NAMES for part in p.parts[:-1])
+
+
+def _module_targets(module: str) -> Set[str]:
+    """Names under which an imported module can be looked up (full path and leaf)."""
+    cleaned = module.strip().rstrip("/")
+    leaf = re.split(r"[./\\]", cleaned)[-1] if cleaned else ""
+    return {name for name in (cleaned, leaf) if name}
+
+
+def extract_test_links(file_path: str, abs_path: str, test_symbols: List[Any]) -> List[TestLink]:
+    """
+    Extract test index links for a single test file.
+
+    Args:
+        file_path: Path of the file as stored in the index
+        abs_path: Absolute path used to read file content
+        test_symbols: Test function symbols (rows with name/start_line/end_line)
+
+    Returns:
+        List of TestLink objects for the file
+    """
+    path = Path(abs_path)
+    try:
+        content = path.read_text(encoding="utf-8", errors="ignore")
+    except OSError as e:
+        logger.debug(f"Test index: could not read {abs_path}: {e}")
+        return []
+
+    links: List[TestLink] = []
+
+    # File-level import links
+    modules: Set[str] = set()
+    for imp in extract_imports(path, content):
+        modules.update(_module_targets(imp.module))
+    for module in sorted(modules):
+        links.append(TestLink(test_file=file_path, target=module, link_type="import"))
+
+    if not test_symbols:
+        return links
+
+    # Same call extraction that feeds the call graph, bucketed by line
+    calls_by_line: Dict[int, Set[str]] = {}
+    for call in extract_calls(path, content):
+        calls_by_line.setdefault(call.line, set()).add(call.callee)
+
+    lines = content.splitlines()
+    for symbol in test_symbols:
+        name = symbol["name"]
+        start_line = symbol["start_line"]
+        end_line = symbol["end_line"]
+
+        called: Set[str] = set()
+        for line in range(start_line, end_line + 1):
+            called.update(calls_by_line.get(line, ()))
+
+        body = "\n".join(lines[start_line - 1:end_line])
+        referenced = set(IDENTIFIER_RE.findall(body))
+        referenced.discard(name)
+
+        for target in sorted(referenced | called):
+            if target in IGNORED_IDENTIFIERS:
+                continue
+            links.append(TestLink(
+                test_file=file_path,
+                test_name=name,
+                test_line=start_line,
+                target=target,
+                link_type="call" if target in called else "reference",
+            ))
+
+    return links
+
+
+def build_test_index(store: Any, file_paths: Optional[Iterable[str]] = None) -> int:
+    """
+    Build or refresh the persistent test index.
+
+    With ``file_paths=None`` the whole index is rebuilt from every test file in
+    the ``files`` table. Otherwise only the given files are refreshed: their
+    existing links are dropped and re-extracted if they are still indexed test
+    files (deleted files are already cleaned up by the foreign key cascade).
+
+    Args:
+        store: SQLite index store
+        file_paths: Optional subset of indexed file paths to refresh
+
+    Returns:
+        Number of links written
+    """
+    if file_paths is not None and store.get_metadata(TEST_INDEX_METADATA_KEY) != TEST_INDEX_VERSION:
+        file_paths = None  # No usable index to refresh yet - build it in full
+
+    full_rebuild = file_paths is None
+    project_root = store.get_metadata("project_root")
+    requested = None if full_rebuild else {
+        p for p in file_paths if is_test_file(p, project_root)
+    }
+
+    if requested is not None and not requested:
+        return 0
+
+    conn = store._get_connection()
+    try:
+        rows = conn.execute("SELECT path, abs_path FROM files").fetchall()
+        test_files = [
+            (row["path"], row["abs_path"]) for row in rows
+            if is_test_file(row["path"], project_root)
+            and (requested is None or row["path"] in requested)
+        ]
+
+        links: List[TestLink] = []
+        for path, abs_path in test_files:
+            test_symbols = conn.execute("""
+                SELECT name, start_line, end_line
+                FROM symbols
+                WHERE file_path = ?
+                AND type IN ('function', 'method')
+                AND name LIKE 'test%'
+                ORDER BY start_line
+            """, (path,)).fetchall()
+            links.extend(extract_test_links(path, abs_path, test_symbols))
+    finally:
+        conn.close()
+
+    with store.transaction() as conn:
+        store.delete_test_links(None if full_rebuild else sorted(requested), conn=conn)
+        store.write_test_links_batch(links, conn=conn)
+        store.set_metadata(TEST_INDEX_METADATA_KEY, TEST_INDEX_VERSION, conn=conn)
+
+    logger.info(f"Test index: wrote {len(links)} links for {len(test_files)} test files")
+    return len(links)
+
+
+class TestIndex:
+    """
+    Query helper over the persistent test index.
+
+    Shared by ImpactAnalyzer and TestCoverageMapper. Builds the index lazily
+    (once, persisted) for stores created before the test index existed.
+    """
+
+    __test__ = False  # Not a pytest test class
+
+    def __init__(self, store: Any, project_root: Optional[Path] = None):
+        """
+        Initialize test index queries.
+
+        Args:
+            store: SQLite symbol store
+            project_root: Optional project root used to relativize test paths
+        """
+        self.store = store
+        self.project_root = project_root or Path.cwd()
+        self._ready = False
+
+    def ensure_built(self) -> None:
+        """Build the test index if this store has not got one yet."""
+        if self._ready:
+            return
+        if self.store.get_metadata(TEST_INDEX_METADATA_KEY) != TEST_INDEX_VERSION:
+            logger.info("Test index missing or outdated, building it now")
+            build_test_index(self.store)
+        self._ready = True
+
+    def find_test_files(self, targets: List[str]) -> List[str]:
+        """
+        Find test files that import, call or reference any of the targets.
+
+        Args:
+            targets: Symbol and/or module names
+
+        Returns:
+            Project-relative test file paths, in index order
+        """
+        self.ensure_built()
+        files: Dict[str, None] = {}
+        for link in self.store.query_test_links(targets):
+            files.setdefault(self.relative_path(link.test_file))
+        return list(files)
+
+    def find_tests(self, symbol_name: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Find test functions that call or reference a symbol.
+
+        Calls are listed before plain references.
+
+        Args:
+            symbol_name: Symbol name to look up
+            limit: Optional maximum number of tests
+
+        Returns:
+            Test references formatted as ``relative/path.py::test_name``
+        """
+        self.ensure_built()
+        by_type: Dict[str, List[str]] = {"call": [], "reference": []}
+        seen: Set[str] = set()
+        for link in self.store.query_test_links([symbol_name], link_types=["call", "reference"]):
+            test_ref = f"{self.relative_path(link.test_file)}::{link.test_name}"
+            if test_ref in seen:
+                continue
+            seen.add(test_ref)
+            by_type[link.link_type].append(test_ref)
+
+        tests = by_type["call"] + by_type["reference"]
+        return tests[:limit] if limit is not None else tests
+
+    def relative_path(self, path: str) -> str:
+        """Return a path relative to the project root when possible."""
+        try:
+            return str(Path(path).relative_to(Path(self.project_root).resolve()))
+        except ValueError:
+            return path
@@ -11,6 +11,7 @@ from typing import List, Dict, Optional, Any, Set
 import re
 
 from cerberus.resolution.call_graph_builder import CallGraphBuilder
+from cerberus.analysis.test_index import TestIndex
 
 
 @dataclass
@@ -63,6 +64,7 @@ class TestCoverageMapper:
         self.store = store
         self.project_root = project_root or Path.cwd()
         self.call_graph_builder = CallGraphBuilder(store)
+        self.test_index = TestIndex(store, self.project_root)
 
     def map_coverage(self, symbol_name: str, file_path: Optional[str] = None) -> TestCoverageReport:
         """
@@ -87,7 +89,7 @@ class TestCoverageMapper:
         file_resolved, start_line, end_line = location
         report.file = file_resolved
 
-        # Find test files that import or reference this symbol
+        # Find test files that import or reference this symbol (persistent test index)
         report.test_files = self._find_test_files(symbol_name, file_resolved)
 
         # Find specific tests that exercise this symbol
@@ -121,37 +123,9 @@ class TestCoverageMapper:
         return report
 
     def _find_test_files(self, symbol_name: str, file_path: str) -> List[str]:
-        """Find test files that might test this symbol."""
-        test_files = []
-
-        # Convert file path to potential test names
-        path_obj = Path(file_path)
-        module_name = path_obj.stem
-
-        # Common test file patterns
-        test_patterns = [
-            f"test_{module_name}.py",
-            f"{module_name}_test.py",
-            f"test_*{module_name}*.py",
-            "test_*.py",  # All test files as fallback
-        ]
-
-        # Search for test files
-        test_dir = self.project_root / "tests"
-        if test_dir.exists():
-            for pattern in test_patterns:
-                for test_file in test_dir.glob(f"**/{pattern}"):
-                    try:
-                        content = test_file.read_text()
-                        # Check if test file mentions the symbol or imports from the module
-                        if symbol_name in content or module_name in content:
-                            rel_path = str(test_file.relative_to(self.project_root))
-                            if rel_path not in test_files:
-                                test_files.append(rel_path)
-                    except:
-                        continue
-
-        return test_files
+        """Find test files that import the module or use this symbol (indexed lookup)."""
+        module_name = Path(file_path).stem
+        return self.test_index.find_test_files([symbol_name, module_name])
 
     def _find_covering_tests(
         self,
@@ -159,43 +133,8 @@ class TestCoverageMapper:
         file_path: str,
         test_files: List[str]
     ) -> List[str]:
-        """Find specific test functions that exercise this symbol."""
-        covering_tests = []
-
-        for test_file_rel in test_files:
-            test_file = self.project_root / test_file_rel
-            if not test_file.exists():
-                continue
-
-            try:
-                content = test_file.read_text()
-
-                # Find all test functions
-                test_funcs = re.findall(r'def (test_\w+)', content)
-
-                for func in test_funcs:
-                    # Check if symbol is mentioned in this test function
-                    # Look for the function definition and its body
-                    func_pattern = f'def {func}.*?(?=\ndef |$)'
-                    func_match = re.search(func_pattern, content, re.DOTALL)
-
-                    if func_match:
-                        func_body = func_match.group(0)
-                        # Check if symbol is called or referenced
-                        if symbol_name in func_body:
-                            covering_tests.append(f"{test_file_rel}::{func}")
-            except:
-                continue
-
-        # Also check call graph - are any test functions calling this symbol?
-        callers = self.call_graph_builder._get_callers(symbol_name, file_path)
-        for caller_name, caller_file, _ in callers:
-            if "test" in caller_file.lower() and caller_name.startswith("test_"):
-                test_ref = f"{caller_file}::{caller_name}"
-                if test_ref not in covering_tests:
-                    covering_tests.append(test_ref)
-
-        return covering_tests[:20]  # Limit to top 20
+        """Find specific test functions that call or reference this symbol (indexed lookup)."""
+        return self.test_index.find_tests(symbol_name, limit=20)
 
     def _find_uncovered_branches(
         self,
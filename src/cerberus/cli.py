@@ -12,16 +12,30 @@ Usage:
     cerberus memory session-end
     cerberus memory session-status
     cerberus memory recover [SESSION_ID] [--list] [--discard]
+
+Subcommand handlers import their dependencies on demand so session hooks
+start without loading the index, retrieval or MCP stacks. When a watcher
+daemon serves the project, commands are forwarded to it and run in its warm
+process (set CERBERUS_NO_DAEMON=1 to always run in-process).
 """
 
 import sys
-from typing import Optional
+from typing import List, Optional
+
 
+def main(argv: Optional[List[str]] = None):
+    """
+    Main CLI entrypoint.
 
-def main():
-    """Main CLI entrypoint."""
+    Args:
+        argv: Arguments without the program name. When omitted, sys.argv is
+              used and the command is forwarded to a running daemon if possible.
+    """
     import argparse
 
+    if argv is None and _forward_to_daemon(sys.argv[1:]):
+        return
+
     parser = argparse.ArgumentParser(
         prog="cerberus",
         description="Cerberus code exploration and memory system"
@@ -92,6 +106,28 @@ def main():
         help="CLI tool to test hooks for"
     )
 
+    # cerberus memory session-start / session-end / session-status
+    memory_subparsers.add_parser("session-start", help="Start a memory session manually")
+    memory_subparsers.add_parser("session-end", help="End the active memory session")
+    memory_subparsers.add_parser("session-status", help="Show the active memory session")
+
+    # cerberus memory recover
+    recover_parser = memory_subparsers.add_parser(
+        "recover",
+        help="Recover or list crashed sessions"
+    )
+    recover_parser.add_argument("session_id", nargs="?", help="Session ID to recover")
+    recover_parser.add_argument(
+        "--list",
+        action="store_true",
+        help="List crashed sessions"
+    )
+    recover_parser.add_argument(
+        "--discard",
+        action="store_true",
+        help="Discard the crashed session instead of recovering it"
+    )
+
     # Config command group
     config_parser = subparsers.add_parser("config", help="Configuration management")
     config_subparsers = config_parser.add_subparsers(dest="config_command")
@@ -124,7 +160,7 @@ def main():
     )
 
     # Parse arguments
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Route to appropriate handler
     if args.command == "memory":
@@ -136,25 +172,40 @@ def main():
         sys.exit(1)
 
 
+def _forward_to_daemon(argv: List[str]) -> bool:
+    """
+    Run the command in the project's daemon, if one is running.
+
+    Interactive commands always run locally since they need the terminal.
+
+    Returns:
+        False when the command should run in-process (exits otherwise)
+    """
+    if argv[:2] == ["memory", "propose"] and "--batch" not in argv:
+        return False
+
+    from cerberus.watcher.command_server import forward_command
+
+    try:
+        result = forward_command(argv)
+    except TimeoutError as e:
+        print(f"✗ {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if result is None:
+        return False
+
+    sys.stdout.write(result.stdout)
+    sys.stderr.write(result.stderr)
+    sys.exit(result.exit_code)
+
+
 def handle_memory_command(args):
     """Handle memory subcommands."""
-    from cerberus.memory.hooks import (
-        propose_hook_with_error_handling,
-        install_hooks,
-        uninstall_hooks,
-        verify_hooks
-    )
-    from cerberus.memory.session_cli import (
-        start_session,
-        end_session,
-        get_session_state_info,
-        list_crashed_sessions,
-        recover_crashed_session
-    )
-    from cerberus.memory.hooks import detect_context as hooks_detect_context
-
     if args.memory_command == "propose":
         # Propose and store memories
+        from cerberus.memory.hooks import propose_hook_with_error_handling
+
         interactive = args.interactive and not args.batch
         propose_hook_with_error_handling(
             interactive=interactive,
@@ -163,21 +214,30 @@ def handle_memory_command(args):
 
     elif args.memory_command == "install-hooks":
         # Install session hooks
+        from cerberus.memory.hooks import install_hooks
+
         success = install_hooks(args.cli, verbose=True)
         sys.exit(0 if success else 1)
 
     elif args.memory_command == "uninstall-hooks":
         # Uninstall session hooks
+        from cerberus.memory.hooks import uninstall_hooks
+
         success = uninstall_hooks(args.cli, verbose=True)
         sys.exit(0 if success else 1)
 
     elif args.memory_command == "test-hooks":
         # Test hook installation
+        from cerberus.memory.hooks import verify_hooks
+
         success = verify_hooks(args.cli)
         sys.exit(0 if success else 1)
 
     elif args.memory_command == "session-start":
         # Manually start session
+        from cerberus.memory.hooks import detect_context as hooks_detect_context
+        from cerberus.memory.session_cli import start_session
+
         context = hooks_detect_context()
         state = start_session(
             working_directory=context.working_directory,
@@ -190,6 +250,8 @@ def handle_memory_command(args):
 
     elif args.memory_command == "session-end":
         # Manually end session
+        from cerberus.memory.session_cli import end_session
+
         state = end_session("explicit")
         if state:
             print(f"✓ Ended session: {state.session_id}")
@@ -201,6 +263,8 @@ def handle_memory_command(args):
 
     elif args.memory_command == "session-status":
         # Show session status
+        from cerberus.memory.session_cli import get_session_state_info
+
         info = get_session_state_info()
         if info:
             print(f"Session Status:")
@@ -219,6 +283,8 @@ def handle_memory_command(args):
 
     elif args.memory_command == "recover":
         # Recover crashed session
+        from cerberus.memory.session_cli import list_crashed_sessions, recover_crashed_session
+
         if args.list or not args.session_id:
             # List crashed sessions
             sessions = list_crashed_sessions()
@@ -11,6 +11,8 @@ from loguru import logger
 
 from ..schemas import FileChange, ModifiedFile, IncrementalUpdateResult
 from ..index import load_index
+from ..index.index_loader import is_sqlite_index
+from ..storage.sqlite.generations import shadow_update
 from .git_diff import (
     get_git_root,
     get_current_commit,
@@ -96,6 +98,13 @@ def update_index_incrementally(
     """
     Update an index incrementally based on detected changes.
 
+    SQLite indexes are updated through a shadow copy that is published in one
+    step (see cerberus.storage.sqlite.generations), so concurrent readers
+    never see a half-applied update and concurrent updates are serialized.
+    That costs two copies of the database per published update, so changes
+    are detected first: when there are none, the index is left untouched and
+    keeps its generation (and every cache keyed by it).
+
     Args:
         index_path: Path to existing index file
         project_path: Path to project root (inferred from index if not provided)
@@ -120,15 +129,42 @@ def update_index_incrementally(
 
         if changes is None:
             logger.error("Failed to detect changes, aborting update")
-            return IncrementalUpdateResult(
-                updated_symbols=[],
-                removed_symbols=[],
-                affected_callers=[],
-                files_reparsed=0,
-                elapsed_time=time.time() - start_time,
-                strategy="failed",
-            )
+            return _unchanged_result(start_time, strategy="failed")
+
+    if not (changes.added or changes.modified or changes.deleted):
+        logger.debug("No changes to apply, index left untouched")
+        return _unchanged_result(start_time, strategy="incremental")
+
+    if not is_sqlite_index(index_path):
+        return _update_index(index_path, project_path, changes, force_full_reparse)
+
+    db_path = index_path if index_path.suffix == ".db" else index_path / "cerberus.db"
+    with shadow_update(db_path) as update:
+        result = _update_index(update.path, project_path, changes, force_full_reparse)
+        # Nothing was applied - keep the current generation
+        update.publish = bool(result.files_reparsed or result.updated_symbols or result.removed_symbols)
+    return result
+
 
+def _unchanged_result(start_time: float, strategy: str) -> IncrementalUpdateResult:
+    """Result of an update that applied nothing."""
+    return IncrementalUpdateResult(
+        updated_symbols=[],
+        removed_symbols=[],
+        affected_callers=[],
+        files_reparsed=0,
+        elapsed_time=time.time() - start_time,
+        strategy=strategy,
+    )
+
+
+def _update_index(
+    index_path: Path,
+    project_path: Path,
+    changes: FileChange,
+    force_full_reparse: bool,
+) -> IncrementalUpdateResult:
+    """Apply detected changes to an index in place."""
     # Check if we should fall back to full reparse
     total_files = len(load_index(index_path).symbols)  # Approximate
     affected_files = calculate_affected_files(changes.added, changes.modified, changes.deleted)
@@ -19,6 +19,7 @@ from ..schemas import (
 )
 from ..scanner import scan
 from ..index import load_index, save_index
+from ..index.columnar_store import ColumnarScanResult
 from ..storage import ScanResultAdapter, SQLiteIndexStore
 from .config import INCREMENTAL_CONFIG
 from .change_analyzer import (
@@ -66,6 +67,9 @@ def apply_surgical_update(
         )
     else:
         logger.info("Using legacy JSON update path")
+        if isinstance(scan_result, ColumnarScanResult):
+            # Columnar views are read-only; update a materialized copy
+            scan_result = scan_result.to_scan_result()
         return _apply_surgical_update_json(
             scan_result=scan_result,
             index_path=index_path,
@@ -149,6 +153,18 @@ def _apply_surgical_update_sqlite(
         store._faiss_store.save()
         logger.info("Saved updated FAISS index")
 
+    # Refresh test index links for changed test files (deletions cascade)
+    changed_paths = list(file_changes.added) + [m.path for m in file_changes.modified]
+    if changed_paths:
+        try:
+            from ..analysis.test_index import build_test_index
+            build_test_index(store, changed_paths)
+        except Exception as e:
+            logger.warning(f"Test index refresh failed: {e}")
+
+    # Invalidate caches derived from the previous index contents
+    store.bump_generation()
+
     # Clear adapter cache to reload fresh data
     scan_result.clear_cache()
 
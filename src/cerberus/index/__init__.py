@@ -2,26 +2,53 @@
 Public API for the indexing subsystem.
 """
 from pathlib import Path
-from typing import Union
-from .json_store import JSONIndexStore
-from .index_builder import build_index
-from .index_loader import load_index, is_sqlite_index
-from .stats import compute_stats
-from cerberus.retrieval.utils import find_symbol, find_symbol_fts, read_range
-from cerberus.semantic.search import semantic_search
-from cerberus.schemas import ScanResult
-from cerberus.storage import ScanResultAdapter
-
-
-def save_index(scan_result: Union[ScanResult, ScanResultAdapter], index_path: Path) -> Path:
+from typing import TYPE_CHECKING, Union
+
+from cerberus.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .json_store import JSONIndexStore
+    from .columnar_store import ColumnarIndexStore, ColumnarScanResult, convert_json_index
+    from .index_builder import build_index
+    from .index_loader import load_index, is_sqlite_index, is_columnar_index
+    from .stats import compute_stats
+    from cerberus.retrieval.utils import find_symbol, find_symbol_fts, read_range
+    from cerberus.semantic.search import semantic_search
+    from cerberus.schemas import ScanResult
+    from cerberus.storage import ScanResultAdapter
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "JSONIndexStore": ".json_store",
+    "ColumnarIndexStore": ".columnar_store",
+    "ColumnarScanResult": ".columnar_store",
+    "convert_json_index": ".columnar_store",
+    "build_index": ".index_builder",
+    "load_index": ".index_loader",
+    "is_sqlite_index": ".index_loader",
+    "is_columnar_index": ".index_loader",
+    "compute_stats": ".stats",
+    "find_symbol": "cerberus.retrieval.utils",
+    "find_symbol_fts": "cerberus.retrieval.utils",
+    "read_range": "cerberus.retrieval.utils",
+    "semantic_search": "cerberus.semantic.search",
+    "ScanResult": "cerberus.schemas",
+    "ScanResultAdapter": "cerberus.storage",
+})
+
+
+def save_index(
+    scan_result: Union["ScanResult", "ColumnarScanResult", "ScanResultAdapter"],
+    index_path: Path,
+) -> Path:
     """
     Save a ScanResult or ScanResultAdapter to an index file.
 
-    Supports both legacy JSON format and new SQLite format.
+    Supports legacy JSON, columnar and SQLite formats.
 
     Args:
-        scan_result: The scan result to save (ScanResult for JSON, ScanResultAdapter for SQLite)
-        index_path: Path to save the index to
+        scan_result: The scan result to save (ScanResult or ColumnarScanResult for
+                     JSON/columnar, ScanResultAdapter for SQLite)
+        index_path: Path to save the index to (.cidx paths are written columnar)
 
     Returns:
         Path to the saved index file
@@ -29,6 +56,11 @@ def save_index(scan_result: Union[ScanResult, ScanResultAdapter], index_path: Pa
     Raises:
         ValueError: If SQLite adapter is used but index format is JSON
     """
+    from cerberus.schemas import ScanResult
+    from cerberus.storage import ScanResultAdapter
+    from .columnar_store import ColumnarScanResult
+    from .index_loader import legacy_index_store
+
     # Check if this is a SQLite adapter
     if isinstance(scan_result, ScanResultAdapter):
         # For SQLite, the data is already persisted to disk
@@ -36,9 +68,9 @@ def save_index(scan_result: Union[ScanResult, ScanResultAdapter], index_path: Pa
         # The store is already saved, so we just return the path
         return scan_result._store.db_path
 
-    # Legacy JSON format
-    if isinstance(scan_result, ScanResult):
-        store = JSONIndexStore(index_path)
+    # Legacy JSON or columnar format
+    if isinstance(scan_result, (ScanResult, ColumnarScanResult)):
+        store = legacy_index_store(Path(index_path))
         return store.write(scan_result)
 
     raise ValueError(f"Unsupported scan_result type: {type(scan_result)}")
@@ -46,6 +78,9 @@ def save_index(scan_result: Union[ScanResult, ScanResultAdapter], index_path: Pa
 
 __all__ = [
     "JSONIndexStore",
+    "ColumnarIndexStore",
+    "ColumnarScanResult",
+    "convert_json_index",
     "build_index",
     "load_index",
     "save_index",
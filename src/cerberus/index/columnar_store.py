@@ -0,0 +1,483 @@
+"""
+Columnar index storage.
+
+A memory-mapped replacement for the legacy JSON index. A columnar index is a
+directory (conventionally named *.cidx) holding a small manifest and one
+data directory per generation:
+
+    project.cidx/
+        manifest.json              format, generation, row counts, scan metadata
+        gen-2/
+            strings.bin            UTF-8 string table
+            strings.offsets.npy    int64 offsets into strings.bin
+            symbols.name.npy       int32 string ids (-1 = None)
+            symbols.start_line.npy int64
+            ...
+            embeddings.npy         float32 (n, dim) vectors
+
+Every model field is one column: int and float fields are numpy arrays,
+string fields are ids into the shared string table, and list/dict fields are
+ids of their JSON encoding. Reading parses only the manifest and memory-maps
+the columns; model objects are built when rows are accessed.
+
+A write publishes a complete new generation directory before replacing the
+manifest, so readers see either the old index or the new one.
+"""
+
+import json
+import mmap
+import os
+import shutil
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
+
+import numpy as np
+from pydantic import BaseModel
+
+from cerberus.logging_config import logger
+from cerberus.exceptions import IndexCorruptionError
+from cerberus.schemas import (
+    CallReference, CodeSymbol, FileObject, ImportReference,
+    ScanResult, SymbolEmbedding, TypeInfo, ImportLink
+)
+
+COLUMNAR_SUFFIX = ".cidx"
+MANIFEST_NAME = "manifest.json"
+FORMAT_VERSION = 1
+
+# Table name -> (model, {field: kind}); kind is "int", "float", "str" or "json".
+# Embeddings are stored separately: name/file_path columns plus the matrix.
+TABLES: Dict[str, Tuple[Type[BaseModel], Dict[str, str]]] = {
+    "files": (FileObject, {
+        "path": "str",
+        "abs_path": "str",
+        "size": "int",
+        "last_modified": "float",
+    }),
+    "symbols": (CodeSymbol, {
+        "name": "str",
+        "type": "str",
+        "file_path": "str",
+        "start_line": "int",
+        "end_line": "int",
+        "signature": "str",
+        "return_type": "str",
+        "parameters": "json",
+        "parameter_types": "json",
+        "parent_class": "str",
+    }),
+    "imports": (ImportReference, {
+        "module": "str",
+        "file_path": "str",
+        "line": "int",
+    }),
+    "calls": (CallReference, {
+        "caller_file": "str",
+        "callee": "str",
+        "line": "int",
+    }),
+    "type_infos": (TypeInfo, {
+        "name": "str",
+        "type_annotation": "str",
+        "inferred_type": "str",
+        "file_path": "str",
+        "line": "int",
+    }),
+    "import_links": (ImportLink, {
+        "importer_file": "str",
+        "imported_module": "str",
+        "imported_symbols": "json",
+        "import_line": "int",
+        "definition_file": "str",
+        "definition_symbol": "str",
+    }),
+}
+
+_DTYPES = {"int": np.int64, "float": np.float64, "str": np.int32, "json": np.int32}
+
+
+class StringTable:
+    """Read-only string table; strings are decoded on first access."""
+
+    def __init__(self, blob: bytes, offsets: np.ndarray):
+        self._blob = blob
+        self._offsets = offsets
+        self._decoded: Dict[int, str] = {}
+        self._all: Optional[List[Optional[str]]] = None
+
+    def __len__(self) -> int:
+        return max(len(self._offsets) - 1, 0)
+
+    def all(self) -> List[Optional[str]]:
+        """Every string by id, followed by None so that id -1 maps to None."""
+        if self._all is None:
+            offsets = self._offsets.tolist()
+            blob = self._blob
+            self._all = [blob[start:end].decode("utf-8") for start, end in zip(offsets, offsets[1:])]
+            self._all.append(None)
+        return self._all
+
+    def get(self, string_id: int) -> Optional[str]:
+        """Return a string by id (None for -1)."""
+        if string_id < 0:
+            return None
+        if self._all is not None:
+            return self._all[string_id]
+        value = self._decoded.get(string_id)
+        if value is None:
+            start, end = self._offsets[string_id], self._offsets[string_id + 1]
+            value = self._decoded[string_id] = self._blob[start:end].decode("utf-8")
+        return value
+
+
+class ColumnarTable(Sequence):
+    """
+    Lazy list of models backed by memory-mapped columns.
+
+    Supports len(), iteration, indexing and slicing like the list it stands
+    in for. Rows are built once and cached.
+    """
+
+    def __init__(
+        self,
+        model: Type[BaseModel],
+        kinds: Dict[str, str],
+        columns: Dict[str, np.ndarray],
+        strings: StringTable,
+        length: int,
+    ):
+        self._model = model
+        self._kinds = kinds
+        self._columns = columns
+        self._strings = strings
+        self._length = length
+        self._rows: Optional[List[Optional[BaseModel]]] = None
+        self._complete = False
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("columnar table index out of range")
+
+        if self._rows is None:
+            self._rows = [None] * self._length
+        row = self._rows[index]
+        if row is None:
+            values = {
+                name: self._decode(self._kinds[name], column[index].tolist())
+                for name, column in self._columns.items()
+            }
+            row = self._rows[index] = self._model.model_construct(**values)
+        return row
+
+    def __iter__(self) -> Iterator[BaseModel]:
+        if not self._complete:
+            self._materialize()
+        return iter(self._rows)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._model.__name__}, rows={self._length})"
+
+    def column(self, name: str) -> List[Any]:
+        """Decoded values of one field for all rows, without building models."""
+        kind = self._kinds[name]
+        values = self._columns[name].tolist()
+        if kind == "str":
+            strings = self._strings.all()
+            return [strings[i] for i in values]
+        if kind == "json":
+            # Each distinct JSON value is parsed once; rows get their own copy
+            strings = self._strings.all()
+            parsed = {i: None if strings[i] is None else json.loads(strings[i]) for i in set(values)}
+            return [None if parsed[i] is None else parsed[i].copy() for i in values]
+        return values
+
+    def _materialize(self) -> None:
+        """Build every missing row from whole-column reads."""
+        rows = self._rows or [None] * self._length
+        names = list(self._columns)
+        for i, values in enumerate(zip(*(self.column(name) for name in names))):
+            if rows[i] is None:
+                rows[i] = self._model.model_construct(**dict(zip(names, values)))
+        self._rows = rows
+        self._complete = True
+
+    def _decode(self, kind: str, value: Any) -> Any:
+        if kind == "str":
+            return self._strings.get(value)
+        if kind == "json":
+            text = self._strings.get(value)
+            return None if text is None else json.loads(text)
+        return value
+
+
+class ColumnarEmbeddings(ColumnarTable):
+    """Lazy list of SymbolEmbedding whose vectors are rows of a float32 memory-map."""
+
+    def __init__(self, columns: Dict[str, np.ndarray], strings: StringTable, matrix: np.ndarray):
+        kinds = {"name": "str", "file_path": "str", "vector": "vector"}
+        super().__init__(SymbolEmbedding, kinds, {**columns, "vector": matrix}, strings, len(matrix))
+        self.matrix = matrix
+
+    def keys(self) -> List[Tuple[str, str]]:
+        """(name, file_path) of every embedding, in matrix row order."""
+        return list(zip(self.column("name"), self.column("file_path")))
+
+
+class ColumnarScanResult:
+    """
+    ScanResult-compatible view of a columnar index.
+
+    Scan metadata comes from the manifest; the row lists are ColumnarTable
+    sequences that build models on access. Use to_scan_result() for a mutable
+    ScanResult copy.
+    """
+
+    def __init__(
+        self,
+        manifest: Dict[str, Any],
+        tables: Dict[str, ColumnarTable],
+        embeddings: ColumnarEmbeddings,
+    ):
+        self.generation: int = manifest["generation"]
+        self.total_files: int = manifest["total_files"]
+        self.scan_duration: float = manifest["scan_duration"]
+        self.project_root: str = manifest["project_root"]
+        self.metadata: Dict[str, Any] = manifest["metadata"]
+        self.files: ColumnarTable = tables["files"]
+        self.symbols: ColumnarTable = tables["symbols"]
+        self.imports: ColumnarTable = tables["imports"]
+        self.calls: ColumnarTable = tables["calls"]
+        self.type_infos: ColumnarTable = tables["type_infos"]
+        self.import_links: ColumnarTable = tables["import_links"]
+        self.embeddings: ColumnarEmbeddings = embeddings
+        # Not persisted by legacy indexes (same as JSON)
+        self.method_calls: List[Any] = []
+        self.symbol_references: List[Any] = []
+
+    def to_scan_result(self) -> ScanResult:
+        """Materialize the whole index as a ScanResult."""
+        return ScanResult.model_construct(
+            total_files=self.total_files,
+            files=list(self.files),
+            scan_duration=self.scan_duration,
+            symbols=list(self.symbols),
+            embeddings=list(self.embeddings),
+            imports=list(self.imports),
+            calls=list(self.calls),
+            type_infos=list(self.type_infos),
+            import_links=list(self.import_links),
+            method_calls=[],
+            symbol_references=[],
+            project_root=self.project_root,
+            metadata=dict(self.metadata),
+        )
+
+
+class _StringTableBuilder:
+    """Deduplicating string table under construction."""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._encoded: List[bytes] = []
+
+    def add(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = self._ids[value] = len(self._encoded)
+            self._encoded.append(value.encode("utf-8"))
+        return string_id
+
+    def write(self, directory: Path) -> None:
+        offsets = np.zeros(len(self._encoded) + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in self._encoded], out=offsets[1:])
+        (directory / "strings.bin").write_bytes(b"".join(self._encoded))
+        np.save(directory / "strings.offsets.npy", offsets)
+
+
+class ColumnarIndexStore:
+    """
+    Columnar storage for scan results with lazy, memory-mapped reads.
+
+    Drop-in alternative to JSONIndexStore: write() takes a ScanResult (or a
+    ColumnarScanResult), read() returns a ColumnarScanResult.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.path / MANIFEST_NAME
+
+    def generation(self) -> Optional[int]:
+        """Current generation from the manifest, or None if unreadable."""
+        try:
+            return int(json.loads(self.manifest_path.read_text())["generation"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def write(self, scan_result: Union[ScanResult, ColumnarScanResult]) -> Path:
+        """
+        Persist scan results as a new index generation.
+
+        All columns are encoded before anything is published, so a view of
+        this same index can be written back.
+        """
+        strings = _StringTableBuilder()
+        columns: Dict[str, np.ndarray] = {}
+        counts: Dict[str, int] = {}
+
+        for table, (_, kinds) in TABLES.items():
+            rows = getattr(scan_result, table)
+            counts[table] = len(rows)
+            for name, kind in kinds.items():
+                columns[f"{table}.{name}"] = _encode_column(
+                    [getattr(row, name) for row in rows], kind, strings
+                )
+
+        embeddings = scan_result.embeddings
+        counts["embeddings"] = len(embeddings)
+        matrix = getattr(embeddings, "matrix", None)
+        if matrix is None:
+            matrix = np.asarray([e.vector for e in embeddings], dtype=np.float32)
+        matrix = np.asarray(matrix, dtype=np.float32)
+        if matrix.ndim != 2:
+            matrix = np.zeros((0, 0), dtype=np.float32)
+        columns["embeddings.name"] = _encode_column([e.name for e in embeddings], "str", strings)
+        columns["embeddings.file_path"] = _encode_column([e.file_path for e in embeddings], "str", strings)
+
+        generation = (self.generation() or 0) + 1
+        data_dir = f"gen-{generation}"
+        target = self.path / data_dir
+        self.path.mkdir(parents=True, exist_ok=True)
+        shutil.rmtree(target, ignore_errors=True)
+        target.mkdir()
+
+        strings.write(target)
+        for name, values in columns.items():
+            np.save(target / f"{name}.npy", values)
+        np.save(target / "embeddings.npy", matrix)
+
+        manifest = {
+            "format": FORMAT_VERSION,
+            "generation": generation,
+            "data": data_dir,
+            "counts": counts,
+            "total_files": scan_result.total_files,
+            "scan_duration": scan_result.scan_duration,
+            "project_root": scan_result.project_root,
+            "metadata": dict(scan_result.metadata),
+        }
+        pending = self.path / f"{MANIFEST_NAME}.tmp"
+        pending.write_text(json.dumps(manifest, indent=2))
+        os.replace(pending, self.manifest_path)
+
+        # Readers of older generations keep their memory-maps open
+        for old in self.path.glob("gen-*"):
+            if old.name != data_dir:
+                shutil.rmtree(old, ignore_errors=True)
+
+        logger.info(
+            f"Wrote columnar index with {counts['files']} files and {counts['symbols']} symbols "
+            f"to {self.path} (generation {generation})"
+        )
+        return self.path
+
+    def read(self) -> ColumnarScanResult:
+        """
+        Open the index and memory-map its columns.
+
+        Raises:
+            IndexCorruptionError: If the manifest or a column file is missing or malformed.
+        """
+        try:
+            if not self.manifest_path.exists():
+                raise IndexCorruptionError(f"Columnar index manifest not found at {self.manifest_path}")
+
+            manifest = json.loads(self.manifest_path.read_text())
+            if manifest.get("format") != FORMAT_VERSION:
+                raise IndexCorruptionError(
+                    f"Unsupported columnar index format {manifest.get('format')!r} at {self.path}"
+                )
+
+            data_dir = self.path / manifest["data"]
+            counts = manifest["counts"]
+            strings = StringTable(
+                _map_file(data_dir / "strings.bin"),
+                np.load(data_dir / "strings.offsets.npy", mmap_mode="r"),
+            )
+
+            tables = {}
+            for table, (model, kinds) in TABLES.items():
+                columns = {name: _load_column(data_dir, f"{table}.{name}", counts[table]) for name in kinds}
+                tables[table] = ColumnarTable(model, kinds, columns, strings, counts[table])
+
+            matrix = np.load(data_dir / "embeddings.npy", mmap_mode="r")
+            if len(matrix) != counts["embeddings"]:
+                raise IndexCorruptionError(f"Embedding matrix of {self.path} has {len(matrix)} rows, expected {counts['embeddings']}")
+            embeddings = ColumnarEmbeddings(
+                {name: _load_column(data_dir, f"embeddings.{name}", counts["embeddings"]) for name in ("name", "file_path")},
+                strings,
+                matrix,
+            )
+
+            return ColumnarScanResult(manifest, tables, embeddings)
+
+        except json.JSONDecodeError as exc:
+            raise IndexCorruptionError(f"Columnar index manifest at {self.manifest_path} contains invalid JSON: {exc}")
+        except (KeyError, TypeError, ValueError, OSError) as exc:
+            raise IndexCorruptionError(f"Columnar index at {self.path} has invalid structure: {exc}")
+
+
+def convert_json_index(json_path: Path, output_path: Optional[Path] = None) -> Path:
+    """
+    Convert a legacy JSON index into a columnar index.
+
+    Args:
+        json_path: Path to the .json index
+        output_path: Columnar index directory (default: json_path with a .cidx suffix)
+
+    Returns:
+        Path to the columnar index
+
+    Raises:
+        IndexCorruptionError: If the JSON index cannot be read
+    """
+    from .json_store import JSONIndexStore
+
+    json_path = Path(json_path)
+    output_path = Path(output_path) if output_path else json_path.with_suffix(COLUMNAR_SUFFIX)
+    return ColumnarIndexStore(output_path).write(JSONIndexStore(json_path).read())
+
+
+def _encode_column(values: List[Any], kind: str, strings: _StringTableBuilder) -> np.ndarray:
+    if kind == "str":
+        values = [strings.add(v) for v in values]
+    elif kind == "json":
+        values = [strings.add(None if v is None else json.dumps(v)) for v in values]
+    return np.asarray(values, dtype=_DTYPES[kind])
+
+
+def _load_column(data_dir: Path, name: str, length: int) -> np.ndarray:
+    column = np.load(data_dir / f"{name}.npy", mmap_mode="r")
+    if column.shape != (length,):
+        raise IndexCorruptionError(f"Column {name} in {data_dir} has shape {column.shape}, expected ({length},)")
+    return column
+
+
+def _map_file(path: Path) -> bytes:
+    """Memory-map a file read-only (empty files cannot be mapped)."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
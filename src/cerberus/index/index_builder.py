@@ -1,12 +1,12 @@
 import json
 import time
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 
 import numpy as np
 
 from cerberus.logging_config import logger
-from cerberus.tracing import trace
+from cerberus.tracing import span, trace
 from cerberus.scanner import scan
 from cerberus.schemas import ScanResult, SymbolEmbedding
 from cerberus.exceptions import PreflightError
@@ -16,12 +16,14 @@ from cerberus.limits import (
     validate_index_health,
     get_limits_config,
 )
-from .json_store import JSONIndexStore
-from .index_loader import is_sqlite_index, load_index
+from .index_loader import is_columnar_index, is_sqlite_index, legacy_index_store, load_index
 from cerberus.storage import SQLiteIndexStore, FAISSVectorStore, ScanResultAdapter
 from cerberus.semantic.embeddings import embed_texts
 from cerberus.retrieval.utils import read_range
 
+# progress(phase, counts) - called as a SQLite build moves through its phases
+ProgressCallback = Callable[[str, Dict[str, int]], None]
+
 
 @trace
 def build_index(
@@ -35,12 +37,14 @@ def build_index(
     model_name: str = "all-MiniLM-L6-v2",
     max_bytes: Optional[int] = None,
     skip_preflight: bool = False,
+    progress: Optional[ProgressCallback] = None,
 ) -> Union[ScanResult, ScanResultAdapter]:
     """
     Run a scan and persist the results to an index.
 
     Automatically detects output format:
     - .json extension -> Legacy format (full memory load)
+    - .cidx directory -> Columnar legacy format (full memory load, memory-mapped reads)
     - Directory or .db -> SQLite + FAISS format (streaming, constant memory)
 
     Includes bloat protection:
@@ -50,7 +54,8 @@ def build_index(
 
     Args:
         directory: Project root to scan
-        output_path: Path to output index (.json for JSON, directory/file for SQLite)
+        output_path: Path to output index (.json for JSON, .cidx for columnar,
+                     directory/file for SQLite)
         respect_gitignore: Honor .gitignore patterns
         extensions: File extensions to scan (None = all)
         incremental: Use previous index for unchanged files
@@ -59,6 +64,10 @@ def build_index(
         model_name: Embedding model name
         max_bytes: Skip files larger than this (default: 1MB from limits config)
         skip_preflight: Skip disk space and permission checks
+        progress: Called with (phase, counts) as a SQLite build progresses:
+            "scan" after every written batch (files, symbols), then
+            "resolve_imports", "resolve_types", "resolve_inheritance" and
+            "test_index" as each post-processing phase starts
 
     Returns:
         ScanResult (JSON) or ScanResultAdapter (SQLite)
@@ -79,7 +88,7 @@ def build_index(
             logger.warning(f"Pre-flight warnings: {preflight.summary}")
 
     # Detect output format
-    use_sqlite = not (str(output_path).endswith('.json'))
+    use_sqlite = not (str(output_path).endswith('.json') or is_columnar_index(Path(output_path)))
 
     if use_sqlite:
         # SQLite streaming path - constant memory
@@ -94,6 +103,7 @@ def build_index(
             model_name=model_name,
             max_bytes=max_bytes,
             start_time=start_time,
+            progress=progress,
         )
     else:
         # JSON legacy path - full memory load
@@ -122,16 +132,17 @@ def _build_json_index(
     max_bytes: Optional[int],
 ) -> ScanResult:
     """
-    Build index in legacy JSON format (backward compatibility).
+    Build index in legacy JSON or columnar format (backward compatibility).
 
     Full memory accumulation before write.
     """
-    logger.info("Using JSON format (legacy, full memory load)")
+    logger.info("Using JSON/columnar format (legacy, full memory load)")
+    store = legacy_index_store(output_path)
 
     previous_index = None
     if incremental and output_path.exists():
         try:
-            previous_index = JSONIndexStore(output_path).read()
+            previous_index = store.read()
             logger.info(f"Loaded previous legacy index for incremental scan")
         except Exception as exc:
             logger.warning(f"Could not load previous legacy index: {exc}")
@@ -153,8 +164,7 @@ def _build_json_index(
     if store_embeddings:
         _generate_embeddings_json(scan_result, padding, model_name)
 
-    # Write to JSON
-    store = JSONIndexStore(output_path)
+    # Write to JSON or columnar
     store.write(scan_result)
 
     return scan_result
@@ -171,6 +181,7 @@ def _build_sqlite_index(
     model_name: str,
     max_bytes: Optional[int],
     start_time: float,
+    progress: Optional[ProgressCallback] = None,
 ) -> ScanResultAdapter:
     """
     Build index in SQLite format with true streaming.
@@ -217,6 +228,7 @@ def _build_sqlite_index(
 
     total_files = 0
     total_symbols = 0
+    written_files = []  # Paths (re)written this run, for incremental post-processing
     file_batch = []
     symbol_batch = []
     import_batch = []
@@ -243,6 +255,7 @@ def _build_sqlite_index(
     for file_result in enforced_stream:
         # Accumulate into batches
         file_batch.append(file_result.file_obj)
+        written_files.append(file_result.file_obj.path)
         symbol_batch.extend(file_result.symbols)
         import_batch.extend(file_result.imports)
         call_batch.extend(file_result.calls)
@@ -280,6 +293,7 @@ def _build_sqlite_index(
             import_link_batch.clear()
             method_call_batch.clear()  # Phase 5.1
 
+            _report_progress(progress, "scan", files=total_files, symbols=total_symbols)
             if total_files % 500 == 0:
                 logger.info(f"Progress: {total_files} files, {total_symbols} symbols written")
 
@@ -301,6 +315,7 @@ def _build_sqlite_index(
         )
 
         total_symbols += len(symbol_batch)
+        _report_progress(progress, "scan", files=total_files, symbols=total_symbols)
 
     # Store metadata
     project_root = str(directory.resolve())
@@ -333,7 +348,8 @@ def _build_sqlite_index(
         sqlite_store.set_metadata('limit_reason', enforcer.stats.limit_reached_reason)
 
     # Post-index validation (bloat protection health check)
-    validation = validate_index_health(output_path)
+    with span("index.validate", "index"):
+        validation = validate_index_health(output_path)
     if validation.status == "fail":
         logger.error(f"Post-index validation failed: {validation.summary}")
     elif validation.status == "warn":
@@ -343,36 +359,67 @@ def _build_sqlite_index(
     sqlite_store.set_metadata('validation_status', validation.status)
 
     # Phase 5.2: Post-processing - Import resolution
+    _report_progress(progress, "resolve_imports", files=total_files, symbols=total_symbols)
     try:
         from ..resolution import resolve_imports
-        resolved_count = resolve_imports(sqlite_store, project_root)
+        with span("index.resolve_imports", "index"):
+            resolved_count = resolve_imports(sqlite_store, project_root)
         logger.info(f"Phase 5.2: Resolved {resolved_count} import links")
     except Exception as e:
         logger.warning(f"Phase 5.2: Import resolution failed: {e}")
         # Continue anyway - resolution is optional enhancement
 
     # Phase 5.3: Post-processing - Type tracking and method resolution
+    _report_progress(progress, "resolve_types", files=total_files, symbols=total_symbols)
     try:
         from ..resolution import resolve_types
-        reference_count = resolve_types(sqlite_store)
+        with span("index.resolve_types", "index"):
+            reference_count = resolve_types(sqlite_store)
         logger.info(f"Phase 5.3: Created {reference_count} symbol references")
     except Exception as e:
         logger.warning(f"Phase 5.3: Type tracking failed: {e}")
         # Continue anyway - resolution is optional enhancement
 
     # Phase 6.1: Post-processing - Inheritance resolution
+    _report_progress(progress, "resolve_inheritance", files=total_files, symbols=total_symbols)
     try:
         from ..resolution import resolve_inheritance
-        inheritance_count = resolve_inheritance(sqlite_store, project_root)
+        with span("index.resolve_inheritance", "index"):
+            inheritance_count = resolve_inheritance(sqlite_store, project_root)
         logger.info(f"Phase 6.1: Created {inheritance_count} inheritance references")
     except Exception as e:
         logger.warning(f"Phase 6.1: Inheritance resolution failed: {e}")
         # Continue anyway - resolution is optional enhancement
 
+    # Post-processing - Test index (test -> symbol/module links)
+    _report_progress(progress, "test_index", files=total_files, symbols=total_symbols)
+    try:
+        from ..analysis.test_index import build_test_index
+        with span("index.test_index", "index"):
+            link_count = build_test_index(sqlite_store, written_files if incremental else None)
+        logger.info(f"Test index: {link_count} test links written")
+    except Exception as e:
+        logger.warning(f"Test index build failed: {e}")
+        # Continue anyway - analysis tools build it lazily on first use
+
+    # Invalidate caches derived from the previous index contents
+    sqlite_store.bump_generation()
+
     # Return adapter
     return ScanResultAdapter(sqlite_store)
 
 
+def _report_progress(progress: Optional[ProgressCallback], phase: str, **counts: int):
+    """Call a progress callback; a failing callback never fails the build."""
+    if progress is None:
+        return
+    try:
+        progress(phase, counts)
+    except Exception as exc:
+        logger.debug(f"Progress callback failed: {exc}")
+
+
+@trace(name="index.write_batch", category="index", log=False)
 def _write_batch_to_sqlite(
     sqlite_store: SQLiteIndexStore,
     faiss_store: Optional[FAISSVectorStore],
@@ -447,6 +494,7 @@ def _generate_embeddings_json(scan_result: ScanResult, padding: int, model_name:
         logger.warning(f"Failed to generate embeddings: {exc}")
 
 
+@trace(name="index.embed_batch", category="index", log=False)
 def _generate_embeddings_sqlite(
     symbols: List,
     symbol_ids: List[int],
@@ -3,6 +3,9 @@ from typing import Union
 
 from cerberus.tracing import trace
 from cerberus.logging_config import logger
+from cerberus.index.columnar_store import (
+    COLUMNAR_SUFFIX, MANIFEST_NAME, ColumnarIndexStore, ColumnarScanResult,
+)
 from cerberus.index.json_store import JSONIndexStore
 from cerberus.schemas import ScanResult
 from cerberus.storage import SQLiteIndexStore, ScanResultAdapter
@@ -27,18 +30,39 @@ def is_sqlite_index(index_path: Path) -> bool:
     return False
 
 
+def is_columnar_index(index_path: Path) -> bool:
+    """
+    Detect if index is columnar format.
+
+    Returns:
+        True for a .cidx path or a directory with a columnar manifest
+    """
+    if index_path.suffix == COLUMNAR_SUFFIX:
+        return True
+    return index_path.is_dir() and (index_path / MANIFEST_NAME).exists()
+
+
+def legacy_index_store(index_path: Path) -> Union[JSONIndexStore, ColumnarIndexStore]:
+    """Store for a non-SQLite index path (columnar or JSON)."""
+    if is_columnar_index(index_path):
+        return ColumnarIndexStore(index_path)
+    return JSONIndexStore(index_path)
+
+
 @trace
-def load_index(index_path: Path) -> Union[ScanResult, ScanResultAdapter]:
+def load_index(index_path: Path) -> Union[ScanResult, ColumnarScanResult, ScanResultAdapter]:
     """
     Load an index from disk with automatic format detection.
 
-    Supports both legacy JSON format and new SQLite format.
+    Supports legacy JSON, columnar and SQLite formats.
 
     Args:
-        index_path: Path to index file (.json) or directory (with cerberus.db)
+        index_path: Path to index file (.json), columnar directory (.cidx)
+                    or directory (with cerberus.db)
 
     Returns:
         ScanResult for JSON indices (full load, legacy)
+        ColumnarScanResult for columnar indices (memory-mapped, lazy rows)
         ScanResultAdapter for SQLite indices (lazy load, streaming)
 
     Raises:
@@ -64,6 +88,9 @@ def load_index(index_path: Path) -> Union[ScanResult, ScanResultAdapter]:
                 logger.warning(f"Failed to load FAISS index: {e}")
 
         return ScanResultAdapter(store)
+    elif is_columnar_index(index_path):
+        logger.info(f"Loading columnar index from {index_path}")
+        return ColumnarIndexStore(index_path).read()
     else:
         # Legacy JSON format - full load
         logger.info(f"Loading legacy index from {index_path}")
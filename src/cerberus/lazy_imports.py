@@ -0,0 +1,49 @@
+"""
+Lazy attribute loading for package facades (PEP 562).
+
+Package ``__init__`` modules re-export their public API without importing the
+implementing modules until an attribute is first used. Commands that only need
+a small part of Cerberus (memory session hooks, config) then start without
+loading fastmcp, numpy, scikit-learn or tree-sitter.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str,
+    exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build module-level ``__getattr__`` and ``__dir__`` for a package.
+
+    Usage (in a package ``__init__``):
+        __getattr__, __dir__ = lazy_exports(__name__, {
+            "hybrid_search": ".facade",
+        })
+
+    Args:
+        package: ``__name__`` of the package
+        exports: Attribute name -> module defining it (absolute, or relative
+                 to the package when starting with ".")
+
+    Returns:
+        (__getattr__, __dir__) functions for the package namespace
+    """
+    module = sys.modules[package]
+
+    def __getattr__(name: str) -> Any:
+        source = exports.get(name)
+        if source is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(source, package), name)
+        # Cache on the package so later lookups bypass __getattr__
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(module)) | set(exports))
+
+    return __getattr__, __dir__
@@ -1,4 +1,14 @@
 """Cerberus MCP Server - Model Context Protocol interface."""
-from .server import create_server, run_server
+from typing import TYPE_CHECKING
+
+from cerberus.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .server import create_server, run_server
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "create_server": ".server",
+    "run_server": ".server",
+})
 
 __all__ = ["create_server", "run_server"]
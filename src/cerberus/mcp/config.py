@@ -106,6 +106,33 @@ DEFAULTS = {
         "model": "llama3.2",
         "max_file_size_for_summary": 50000,
     },
+    "execution": {
+        "workers": 8,  # Worker threads serving regular tools
+        "heavy_workers": 2,  # Separate worker threads for heavy tools
+        "max_concurrency": 4,  # Concurrent calls per regular tool
+        "heavy_max_concurrency": 1,  # Concurrent calls per heavy tool
+        "timeout_seconds": 300.0,
+        "heavy_timeout_seconds": 1800.0,
+        # Long-running tools, kept off the workers that serve fast reads
+        "heavy_tools": [
+            "smart_update",
+            "blueprint",
+            "diff_branches",
+            "diff_branches_multi",
+            "project_summary",
+            "analyze_impact",
+            "test_coverage",
+            "validate_architecture",
+            "find_circular_deps",
+            "summarize",
+            "summarize_architecture",
+            "skeletonize_directory",
+            "style_check",
+            "style_fix",
+        ],
+        # Per-tool overrides, e.g. {"search": {"max_concurrency": 8, "timeout_seconds": 60}}
+        "tools": {},
+    },
 }
 
 
@@ -119,3 +146,15 @@ def get_memory_config() -> dict:
     result.update(memory_config)
 
     return result
+
+
+def get_execution_config() -> dict:
+    """Get tool execution configuration with defaults."""
+    config = load_config() or {}
+    execution_config = config.get("execution", {})
+
+    # Merge with defaults
+    result = {**DEFAULTS["execution"]}
+    result.update(execution_config)
+
+    return result
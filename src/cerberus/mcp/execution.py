@@ -0,0 +1,228 @@
+"""
+Asynchronous tool execution.
+
+Tools are written as plain functions. ToolRegistrar registers each one as a
+coroutine that runs the body on a worker thread, so a long index_build or
+diff_branches no longer blocks the event loop and every other request.
+
+- Heavy tools run on a separate small pool, so they never occupy the
+  workers serving fast read tools such as get_symbol.
+- Each tool has a concurrency limit; calls beyond it wait on the event loop
+  without holding a worker.
+- Each tool has a timeout; a call exceeding it fails with a ToolError.
+- A call cancelled by the client (or timed out) before its body starts is
+  dropped. A body that already started cannot be interrupted - Python threads
+  cannot be killed - so it finishes in the background and keeps its
+  concurrency slot until then.
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from fastmcp.exceptions import ToolError
+
+from .config import get_execution_config
+
+
+@dataclass(frozen=True)
+class ToolPolicy:
+    """How calls to one tool are scheduled (timeout None = no timeout)."""
+    heavy: bool = False
+    max_concurrency: int = 4
+    timeout: Optional[float] = 300.0
+
+
+class ToolExecutor:
+    """Runs tool bodies on bounded worker pools with per-tool limits and timeouts."""
+
+    def __init__(
+        self,
+        workers: int = 8,
+        heavy_workers: int = 2,
+        policies: Optional[Dict[str, ToolPolicy]] = None,
+        default_policy: Optional[ToolPolicy] = None,
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            workers: Worker threads for regular tools
+            heavy_workers: Worker threads for heavy tools
+            policies: Per-tool policies by tool name
+            default_policy: Policy for tools without an entry in policies
+        """
+        self.workers = max(1, workers)
+        self.heavy_workers = max(1, heavy_workers)
+        self.policies = dict(policies or {})
+        self.default_policy = default_policy or ToolPolicy()
+        self._pools: Dict[bool, ThreadPoolExecutor] = {}
+        self._pools_lock = threading.Lock()
+        # asyncio semaphores belong to one event loop
+        self._limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def policy_for(self, name: str) -> ToolPolicy:
+        """Return the scheduling policy of a tool."""
+        return self.policies.get(name, self.default_policy)
+
+    def _pool(self, heavy: bool) -> ThreadPoolExecutor:
+        with self._pools_lock:
+            pool = self._pools.get(heavy)
+            if pool is None:
+                pool = ThreadPoolExecutor(
+                    max_workers=self.heavy_workers if heavy else self.workers,
+                    thread_name_prefix="cerberus-heavy-tool" if heavy else "cerberus-tool",
+                )
+                self._pools[heavy] = pool
+            return pool
+
+    def _limiter(self, name: str, policy: ToolPolicy) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        limiters = self._limiters.setdefault(loop, {})
+        limiter = limiters.get(name)
+        if limiter is None:
+            limiter = limiters[name] = asyncio.Semaphore(max(1, policy.max_concurrency))
+        return limiter
+
+    async def run(self, name: str, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a tool body on a worker thread.
+
+        Args:
+            name: Tool name (selects the policy and concurrency limit)
+            fn: Synchronous tool body
+            *args, **kwargs: Arguments for fn
+
+        Returns:
+            Return value of fn
+
+        Raises:
+            ToolError: If the call exceeds the tool's timeout
+        """
+        policy = self.policy_for(name)
+        limiter = self._limiter(name, policy)
+        loop = asyncio.get_running_loop()
+
+        await limiter.acquire()
+        try:
+            # Copy the context so tracing spans nest under the tool call
+            context = contextvars.copy_context()
+            future = self._pool(policy.heavy).submit(context.run, functools.partial(fn, *args, **kwargs))
+        except BaseException:
+            limiter.release()
+            raise
+
+        def release(_):
+            # The slot is held until the body finishes, even if the caller is gone
+            try:
+                loop.call_soon_threadsafe(limiter.release)
+            except RuntimeError:
+                pass  # Event loop already closed
+
+        future.add_done_callback(release)
+
+        # Cancelling the wrapper cancels the call if it has not started yet
+        result = asyncio.wrap_future(future)
+        if policy.timeout is None:
+            return await result
+        try:
+            return await asyncio.wait_for(result, policy.timeout)
+        except asyncio.TimeoutError:
+            raise ToolError(f"Tool '{name}' timed out after {policy.timeout:g}s") from None
+
+    def wrap(self, fn: Callable[..., Any], name: Optional[str] = None) -> Callable[..., Any]:
+        """Return a coroutine function running fn through this executor."""
+        tool_name = name or fn.__name__
+
+        @functools.wraps(fn)
+        async def run_tool(*args: Any, **kwargs: Any) -> Any:
+            return await self.run(tool_name, fn, *args, **kwargs)
+
+        return run_tool
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the worker pools; queued calls are cancelled."""
+        with self._pools_lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+class ToolRegistrar:
+    """
+    Stands in for the FastMCP server in tool modules' register() functions.
+
+    ``@registrar.tool()`` registers the decorated function through the
+    executor (coroutine functions are registered as they are); every other
+    attribute is forwarded to the server.
+    """
+
+    def __init__(self, mcp, executor: ToolExecutor):
+        self._mcp = mcp
+        self._executor = executor
+
+    def tool(self, *args: Any, **kwargs: Any) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        register = self._mcp.tool(*args, **kwargs)
+
+        def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+            if inspect.iscoroutinefunction(fn):
+                # Async tools manage their own work (e.g. background index jobs)
+                register(fn)
+            else:
+                register(self._executor.wrap(fn, kwargs.get("name")))
+            return fn
+
+        return decorator
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._mcp, attr)
+
+
+def load_tool_executor() -> ToolExecutor:
+    """Create a ToolExecutor from the ``[execution]`` configuration."""
+    config = get_execution_config()
+    regular = ToolPolicy(
+        heavy=False,
+        max_concurrency=config["max_concurrency"],
+        timeout=config["timeout_seconds"] or None,
+    )
+    heavy = ToolPolicy(
+        heavy=True,
+        max_concurrency=config["heavy_max_concurrency"],
+        timeout=config["heavy_timeout_seconds"] or None,
+    )
+
+    policies = {name: heavy for name in config["heavy_tools"]}
+    for name, override in (config.get("tools") or {}).items():
+        base = policies.get(name, regular)
+        policies[name] = ToolPolicy(
+            heavy=override.get("heavy", base.heavy),
+            max_concurrency=override.get("max_concurrency", base.max_concurrency),
+            timeout=override.get("timeout_seconds", base.timeout) or None,
+        )
+
+    return ToolExecutor(
+        workers=config["workers"],
+        heavy_workers=config["heavy_workers"],
+        policies=policies,
+        default_policy=regular,
+    )
+
+
+_executor: Optional[ToolExecutor] = None
+
+
+def get_tool_executor() -> ToolExecutor:
+    """Get or create the global ToolExecutor."""
+    global _executor
+    if _executor is None:
+        _executor = load_tool_executor()
+    return _executor
@@ -0,0 +1,154 @@
+"""
+Background index build jobs.
+
+index_build starts a job and returns its ID instead of holding the request
+open for the whole scan, resolution and test-index pipeline. Jobs run one at
+a time on a dedicated thread; progress is kept on the job for the
+index_job_status tool and for MCP progress notifications.
+"""
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+from .index_manager import get_index_manager
+
+# Finished jobs kept for index_job_status
+MAX_FINISHED_JOBS = 20
+
+
+@dataclass
+class IndexJob:
+    """State of one background index build."""
+    id: str
+    path: str
+    extensions: List[str]
+    index_path: Optional[str] = None
+    status: str = "queued"  # queued | running | success | failed
+    phase: Optional[str] = None
+    files: int = 0
+    symbols: int = 0
+    updates: int = 0  # Increases on every change (MCP progress value)
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("success", "failed")
+
+    def to_dict(self) -> dict:
+        end = self.finished_at or time.time()
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "phase": self.phase,
+            "path": self.path,
+            "index_path": self.index_path,
+            "files": self.files,
+            "symbols": self.symbols,
+            "updates": self.updates,
+            "error": self.error,
+            "elapsed_seconds": round(end - self.started_at, 3) if self.started_at else 0.0,
+        }
+
+
+class IndexJobManager:
+    """Runs index builds in the background, one at a time."""
+
+    def __init__(self):
+        self._jobs: Dict[str, IndexJob] = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cerberus-index-job")
+
+    def start(self, path: Path, extensions: List[str]) -> IndexJob:
+        """
+        Start a build of a directory, or return the unfinished build of it.
+
+        Args:
+            path: Directory to index
+            extensions: File extensions to include
+
+        Returns:
+            The queued or running job
+        """
+        path = Path(path).resolve()
+        with self._lock:
+            for job in self._jobs.values():
+                if not job.done and job.path == str(path):
+                    return job
+
+            job = IndexJob(id=uuid.uuid4().hex[:12], path=str(path), extensions=list(extensions))
+            self._jobs[job.id] = job
+            self._prune()
+
+        self._pool.submit(self._run, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[IndexJob]:
+        """Return a job by ID."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def snapshot(self, job: IndexJob) -> dict:
+        """Return a consistent copy of a job's state."""
+        with self._lock:
+            return job.to_dict()
+
+    def list_jobs(self) -> List[dict]:
+        """Return all known jobs, newest first."""
+        with self._lock:
+            jobs = sorted(self._jobs.values(), key=lambda j: j.created_at, reverse=True)
+            return [job.to_dict() for job in jobs]
+
+    def _update(self, job: IndexJob, **changes):
+        with self._lock:
+            for key, value in changes.items():
+                setattr(job, key, value)
+            job.updates += 1
+
+    def _run(self, job: IndexJob):
+        self._update(job, status="running", phase="scan", started_at=time.time())
+
+        def progress(phase: str, counts: Dict[str, int]):
+            self._update(job, phase=phase, **counts)
+
+        try:
+            result = get_index_manager().rebuild(Path(job.path), job.extensions, progress=progress)
+        except Exception as e:
+            logger.error(f"Index job {job.id} failed: {e}")
+            self._update(job, status="failed", error=str(e), finished_at=time.time())
+            return
+
+        self._update(
+            job,
+            status="success",
+            phase="done",
+            index_path=result["path"],
+            files=result["files"],
+            symbols=result["symbols"],
+            finished_at=time.time(),
+        )
+
+    def _prune(self):
+        """Drop the oldest finished jobs beyond MAX_FINISHED_JOBS (lock held)."""
+        finished = sorted((j for j in self._jobs.values() if j.done), key=lambda j: j.created_at)
+        for job in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job.id]
+
+
+_jobs: Optional[IndexJobManager] = None
+
+
+def get_index_jobs() -> IndexJobManager:
+    """Get or create the global IndexJobManager."""
+    global _jobs
+    if _jobs is None:
+        _jobs = IndexJobManager()
+    return _jobs
@@ -9,6 +9,12 @@ from loguru import logger
 from cerberus.index import build_index, load_index
 from cerberus.schemas import ScanResult
 from cerberus.storage import ScanResultAdapter
+from cerberus.storage.sqlite.generations import (
+    index_write_lock,
+    publish_database,
+    remove_database,
+    shadow_path,
+)
 
 from .config import load_config, get_config_value, DEFAULTS
 
@@ -151,6 +157,8 @@ class IndexManager:
         self._index: Optional[Union[ScanResult, ScanResultAdapter]] = None
         self._index_path: Optional[Path] = None
         self._watcher: Optional[_WatcherHandle] = None
+        # Tools run concurrently on worker threads; load and rebuild one at a time
+        self._load_lock = threading.RLock()
         self._auto_update_enabled: bool = get_config_value(
             "index.auto_update", DEFAULTS["index"]["auto_update"]
         )
@@ -172,9 +180,13 @@ class IndexManager:
         Raises:
             FileNotFoundError: If no index can be discovered
         """
-        if self._index is None:
-            self._load_index()
-        return self._index
+        index = self._index
+        if index is None:
+            with self._load_lock:
+                if self._index is None:
+                    self._load_index()
+                index = self._index
+        return index
 
     def _load_index(self):
         """Load index from discovered or configured path."""
@@ -295,8 +307,8 @@ class IndexManager:
                 force_full_reparse=False,
             )
 
-            # Invalidate cache so next access reloads fresh index
-            self._index = None
+            # The update was published in place - keep serving, minus stale row caches
+            self.refresh()
 
             logger.info(
                 f"Incremental update complete: "
@@ -317,6 +329,19 @@ class IndexManager:
             finally:
                 self._watcher = None
 
+    def refresh(self):
+        """
+        Pick up a newly published index generation.
+
+        SQLite indexes are updated in place, so the loaded adapter keeps
+        serving and only drops its cached rows; other indexes are reloaded.
+        """
+        index = self._index
+        if isinstance(index, ScanResultAdapter):
+            index.clear_cache()
+        else:
+            self.invalidate()
+
     def invalidate(self):
         """Invalidate cached index - next get_index() will reload."""
         self._index = None
@@ -336,13 +361,18 @@ class IndexManager:
             "watch_extensions": self._watch_extensions,
         }
 
-    def rebuild(self, path: Path, extensions: list[str]) -> dict:
+    def rebuild(self, path: Path, extensions: list[str], progress=None) -> dict:
         """
         Explicitly rebuild index.
 
+        The index is built into a shadow database next to the live one and
+        published in a single step, so the previous index keeps serving
+        queries for the whole build.
+
         Args:
             path: Directory to index
             extensions: File extensions to include
+            progress: Optional build progress callback (see build_index)
 
         Returns:
             Index statistics
@@ -351,24 +381,34 @@ class IndexManager:
 
         output_path = path / ".cerberus" / "cerberus.db"
         output_path.parent.mkdir(parents=True, exist_ok=True)
+        build_path = shadow_path(output_path, "building")
+        remove_database(build_path)
 
-        scan_result = build_index(
-            directory=path,
-            output_path=output_path,
-            extensions=extensions,
-        )
+        try:
+            scan_result = build_index(
+                directory=path,
+                output_path=build_path,
+                extensions=extensions,
+                progress=progress,
+            )
+            total_files = scan_result.total_files
+            total_symbols = len(scan_result.symbols)
 
-        self._index_path = output_path
-        self._index = load_index(output_path)
+            with self._load_lock, index_write_lock(output_path):
+                publish_database(build_path, output_path)
+                self._index_path = output_path
+                self._index = load_index(output_path)
 
-        # Restart watcher for new path
-        self._stop_watcher()
-        self._start_watcher()
+                # Restart watcher for new path
+                self._stop_watcher()
+                self._start_watcher()
+        finally:
+            remove_database(build_path)
 
         return {
             "path": str(output_path),
-            "files": scan_result.total_files,
-            "symbols": len(scan_result.symbols),
+            "files": total_files,
+            "symbols": total_symbols,
         }
 
     def get_stats(self) -> dict:
@@ -0,0 +1,12 @@
+"""FastMCP middleware shared by all tools."""
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from cerberus.tracing import span
+
+
+class TracingMiddleware(Middleware):
+    """Open a ``tool.<name>`` span around every tool call."""
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        with span(f"tool.{context.message.name}", "mcp"):
+            return await call_next(context)
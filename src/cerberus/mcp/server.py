@@ -1,6 +1,8 @@
 """FastMCP server setup and tool registration."""
 from fastmcp import FastMCP
 
+from .execution import ToolRegistrar, get_tool_executor
+from .middleware import TracingMiddleware
 from .tools import (
     analysis,
     analysis_tools,
@@ -23,39 +25,46 @@ mcp = FastMCP("cerberus")
 
 def create_server():
     """Create and configure the MCP server."""
+    # Trace every tool call (registered once, create_server may be called again)
+    if not any(isinstance(m, TracingMiddleware) for m in mcp.middleware):
+        mcp.add_middleware(TracingMiddleware())
+
+    # Tool bodies run on worker threads, off the event loop
+    tools = ToolRegistrar(mcp, get_tool_executor())
+
     # Read tools
-    search.register(mcp)
-    symbols.register(mcp)
-    reading.register(mcp)
-    structure.register(mcp)
+    search.register(tools)
+    symbols.register(tools)
+    reading.register(tools)
+    structure.register(tools)
 
     # Synthesis tools (skeletonization, context building)
-    synthesis.register(mcp)
+    synthesis.register(tools)
 
     # Context assembly (power tool - replaces multi-tool workflows)
-    context.register(mcp)
+    context.register(tools)
 
     # Summarization tools (LLM-powered)
-    summarization.register(mcp)
+    summarization.register(tools)
 
     # Analysis tools (call graphs, dependencies)
-    analysis.register(mcp)
+    analysis.register(tools)
 
     # Advanced analysis tools (project summary, impact analysis, test coverage)
-    analysis_tools.register(mcp)
+    analysis_tools.register(tools)
 
     # Index management
-    indexing.register(mcp)
+    indexing.register(tools)
 
     # Memory system
-    memory.register(mcp)
+    memory.register(tools)
 
     # Quality & metrics
-    quality.register(mcp)
-    metrics.register(mcp)
+    quality.register(tools)
+    metrics.register(tools)
 
     # Diagnostics
-    diagnostics.register(mcp)
+    diagnostics.register(tools)
 
     return mcp
 
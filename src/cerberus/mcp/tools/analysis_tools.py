@@ -58,8 +58,9 @@ def register(mcp):
             index = manager.get_index()
             project_root = Path(getattr(index, "project_root", None) or Path.cwd())
 
-            # Generate summary
-            summary = generate_project_summary(project_root)
+            # Generate summary (sections cached in the index when available)
+            store = getattr(index, "_store", None)
+            summary = generate_project_summary(project_root, store)
 
             response = {
                 "status": "ok",
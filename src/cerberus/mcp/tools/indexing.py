@@ -1,24 +1,47 @@
 """Index management tools."""
+import asyncio
 import time
 from pathlib import Path
 from typing import List, Optional
 
+from fastmcp import Context
+
+from ..index_jobs import get_index_jobs
 from ..index_manager import get_index_manager
 
+# How often index_build checks a running job for progress
+JOB_POLL_SECONDS = 0.2
+
+
+def _progress_message(status: dict) -> str:
+    """Describe a job's progress for an MCP progress notification."""
+    return f"{status['phase'] or status['status']}: {status['files']} files, {status['symbols']} symbols"
+
 
 def register(mcp):
     @mcp.tool()
-    def index_build(path: str = ".", extensions: Optional[List[str]] = None) -> dict:
+    async def index_build(
+        path: str = ".",
+        extensions: Optional[List[str]] = None,
+        wait_seconds: float = 10.0,
+        ctx: Context = None,
+    ) -> dict:
         """
-        Build or rebuild the code index.
+        Build or rebuild the code index in the background.
+
+        The build runs as a job; the current index keeps serving queries until
+        the new one is swapped in. Waits up to wait_seconds (streaming progress
+        notifications) and returns the final statistics if the build finished,
+        otherwise the job's progress - poll index_job_status(job_id) for the rest.
 
         Args:
             path: Directory to index (default: current directory)
             extensions: File extensions to include (default: common code files)
                        IMPORTANT: Extensions must include the dot prefix (e.g., ".py", ".go", ".ts")
+            wait_seconds: How long to wait for the build before returning (0 = return immediately)
 
         Returns:
-            Index statistics (file count, symbol count, path)
+            Job status: job_id, status (queued/running/success/failed), phase, files, symbols
         """
         if extensions is None:
             # Code files
@@ -40,8 +63,45 @@ def register(mcp):
                     corrected_extensions.append(ext)
             extensions = corrected_extensions
 
-        manager = get_index_manager()
-        return manager.rebuild(Path(path), extensions)
+        jobs = get_index_jobs()
+        job = jobs.start(Path(path), extensions)
+
+        deadline = time.monotonic() + max(0.0, wait_seconds)
+        reported = 0
+        while True:
+            status = jobs.snapshot(job)
+            if ctx is not None and status["updates"] > reported:
+                reported = status["updates"]
+                await ctx.report_progress(reported, message=_progress_message(status))
+            if job.done or time.monotonic() >= deadline:
+                break
+            await asyncio.sleep(JOB_POLL_SECONDS)
+
+        status = jobs.snapshot(job)
+        if not job.done:
+            status["message"] = f"Build continues in the background. Poll index_job_status('{job.id}')."
+        return status
+
+    @mcp.tool()
+    def index_job_status(job_id: Optional[str] = None) -> dict:
+        """
+        Get the progress of background index builds.
+
+        Args:
+            job_id: Job returned by index_build (default: list all recent jobs)
+
+        Returns:
+            Job status (status, phase, files, symbols, elapsed_seconds, error),
+            or {"jobs": [...]} when no job_id is given
+        """
+        jobs = get_index_jobs()
+        if job_id is None:
+            return {"jobs": jobs.list_jobs()}
+
+        job = jobs.get(job_id)
+        if job is None:
+            return {"error": f"Unknown index job: {job_id}"}
+        return jobs.snapshot(job)
 
     @mcp.tool()
     def index_status() -> dict:
@@ -146,8 +206,8 @@ def register(mcp):
                 force_full_reparse=force_full,
             )
 
-            # Invalidate manager cache so next access reloads fresh index
-            manager.invalidate()
+            # Pick up the published update
+            manager.refresh()
 
             elapsed = time.time() - start_time
 
@@ -15,6 +15,7 @@ from cerberus.memory.storage import MemoryStorage
 from cerberus.memory.proposal_engine import MemoryProposal
 
 # Phase 6 (Version 2): SQLite Retrieval
+from cerberus.memory.indexing import TOKEN_COUNTS_SCHEMA_SQL
 from cerberus.memory.retrieval import MemoryRetrieval
 
 
@@ -566,6 +567,8 @@ def register(mcp):
                 # Clear existing memories
                 conn.execute("DELETE FROM memory_store")
                 conn.execute("DELETE FROM memory_fts")
+                conn.execute(TOKEN_COUNTS_SCHEMA_SQL)
+                conn.execute("DELETE FROM memory_token_counts")
 
             counts = {"preference": 0, "decision": 0, "correction": 0}
 
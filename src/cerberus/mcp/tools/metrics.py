@@ -4,6 +4,7 @@ from typing import Optional
 
 from cerberus.metrics import generate_efficiency_report, get_efficiency_tracker
 from cerberus.metrics.mcp_tracker import get_mcp_tracker, reset_mcp_tracker
+from cerberus import tracing
 
 
 def register(mcp):
@@ -222,3 +223,40 @@ def register(mcp):
                 "error_type": "reset_failed",
                 "message": str(exc),
             }
+
+    @mcp.tool()
+    def trace_report(top: int = 20, export_path: Optional[str] = None, reset: bool = False) -> dict:
+        """
+        Report where time is spent across tool calls, SQLite queries and indexing.
+
+        Aggregates traced spans (tool.*, sqlite.*, scanner.*, index.*) into
+        per-span latency percentiles. Optionally writes the buffered spans as a
+        Chrome trace-event file (open in chrome://tracing or Perfetto).
+
+        Args:
+            top: Number of span names to include, slowest total time first
+            export_path: Optional path to write a Chrome trace JSON file
+            reset: Clear collected spans after reporting
+
+        Returns:
+            dict with:
+            - status: "ok" or "error"
+            - spans: {name: {count, errors, total_ms, mean_ms, p50_ms, p95_ms, p99_ms, max_ms}}
+            - export_path: Path of the written trace (if requested)
+        """
+        try:
+            stats = tracing.get_stats(top=top)
+            result = {"status": "ok", **stats}
+            if export_path:
+                document = tracing.export_chrome_trace(export_path)
+                result["export_path"] = export_path
+                result["exported_events"] = len(document["traceEvents"])
+            if reset:
+                tracing.reset()
+            return result
+        except Exception as exc:
+            return {
+                "status": "error",
+                "error_type": "trace_report_failed",
+                "message": str(exc),
+            }
@@ -3,6 +3,7 @@ from typing import Dict, Any, List
 from pathlib import Path
 import re
 
+from cerberus.index.index_loader import is_sqlite_index
 from cerberus.retrieval import hybrid_search
 
 from ..index_manager import get_index_manager
@@ -46,7 +47,8 @@ def generate_suggestions(query: str, index_path: Path, limit: int = 5) -> List[s
     Generate query suggestions when search returns empty results.
 
     Extracts keywords from query and searches for each individually,
-    returning the most relevant filenames and symbols.
+    returning the most relevant filenames and symbols. SQLite indexes run
+    all keyword searches in one batched FTS5 statement.
 
     Args:
         query: Original search query
@@ -56,38 +58,50 @@ def generate_suggestions(query: str, index_path: Path, limit: int = 5) -> List[s
     Returns:
         List of suggested search terms
     """
-    keywords = extract_keywords(query)
+    keywords = extract_keywords(query)[:3]  # Limit to first 3 keywords to avoid too many searches
 
     if not keywords:
         return []
 
-    # Try searching for each keyword
-    suggestions = set()
-    for keyword in keywords[:3]:  # Limit to first 3 keywords to avoid too many searches
-        try:
-            results = hybrid_search(
-                query=keyword,
-                index_path=index_path,
-                mode="keyword",
-                top_k=3,  # Only need a few results per keyword
-            )
+    try:
+        batches = _keyword_matches(keywords, Path(index_path))
+    except Exception:
+        # If keyword search fails, there is nothing to suggest
+        return []
 
-            for r in results[:2]:  # Top 2 results per keyword
-                # Add filename if it looks relevant
-                filename = Path(r.symbol.file_path).name
-                if keyword.lower() in filename.lower():
-                    suggestions.add(filename)
+    suggestions = set()
+    for keyword, symbols in zip(keywords, batches):
+        for symbol in symbols[:2]:  # Top 2 results per keyword
+            # Add filename if it looks relevant
+            filename = Path(symbol.file_path).name
+            if keyword.lower() in filename.lower():
+                suggestions.add(filename)
 
-                # Add symbol name if it looks relevant
-                if keyword.lower() in r.symbol.name.lower():
-                    suggestions.add(r.symbol.name)
-        except:
-            # If keyword search fails, skip it
-            pass
+            # Add symbol name if it looks relevant
+            if keyword.lower() in symbol.name.lower():
+                suggestions.add(symbol.name)
 
     return sorted(list(suggestions))[:limit]
 
 
+def _keyword_matches(keywords: List[str], index_path: Path) -> List[List[Any]]:
+    """Top keyword matches (CodeSymbols) for each keyword."""
+    if not is_sqlite_index(index_path):
+        # Legacy JSON/columnar index: one keyword search per keyword
+        return [
+            [r.symbol for r in hybrid_search(query=keyword, index_path=index_path, mode="keyword", top_k=3)]
+            for keyword in keywords
+        ]
+
+    from cerberus.storage import SQLiteIndexStore
+
+    store = SQLiteIndexStore(index_path)
+    return [
+        [symbol for symbol, _ in matches]
+        for matches in store.fts5_search_batch(keywords, top_k=3)
+    ]
+
+
 def register(mcp):
     @mcp.tool()
     def search(
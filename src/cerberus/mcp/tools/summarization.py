@@ -141,7 +141,8 @@ def register(mcp):
             return {
                 "available": available,
                 "model": facade.llm_client.config.get("model", "unknown"),
-                "endpoint": facade.llm_client.config.get("ollama_url", "unknown"),
+                "endpoint": facade.llm_client.config.get("api_base", "unknown"),
+                "cache": facade.cache.get_stats() if facade.cache else None,
                 "hint": None if available else "Start Ollama: ollama serve"
             }
         except Exception as e:
@@ -2,9 +2,23 @@
 from typing import Optional, List
 from pathlib import Path
 
-from cerberus.synthesis.skeletonizer import Skeletonizer
 from cerberus.synthesis.facade import get_synthesis_facade
 
+from ..index_manager import get_index_manager
+
+
+def _get_store():
+    """
+    Store of the already-loaded SQLite index (persists skeletons), or None.
+
+    The index is never loaded here: that would read the whole index and
+    start the file watcher just to skeletonize one file.
+    """
+    try:
+        return getattr(get_index_manager()._index, "_store", None)
+    except Exception:
+        return None
+
 
 def register(mcp):
     @mcp.tool()
@@ -41,8 +55,8 @@ def register(mcp):
             return {"error": f"Path is not a file: {path}"}
 
         try:
-            skeletonizer = Skeletonizer()
-            result = skeletonizer.skeletonize_file(str(file_path), preserve_symbols)
+            facade = get_synthesis_facade()
+            result = facade.skeletonize_file(str(file_path), preserve_symbols, store=_get_store())
 
             if format == "json":
                 return {
@@ -105,7 +119,7 @@ def register(mcp):
 
         try:
             facade = get_synthesis_facade()
-            results = facade.skeletonize_directory(str(dir_path), pattern)
+            results = facade.skeletonize_directory(str(dir_path), pattern, store=_get_store())
 
             if not results:
                 return {"error": f"No files matched pattern: {pattern}"}
@@ -5,13 +5,29 @@ Captures developer preferences, decisions, and learnings across sessions.
 Injects context into future AI sessions to eliminate repetitive explanation.
 
 Storage: ~/.cerberus/memory.db (SQLite)
+
+Exports are loaded lazily so session hooks only import what they use.
 """
 
-from cerberus.memory.extract import GitExtractor
-from cerberus.memory.storage import MemoryStorage
-from cerberus.memory.retrieval import MemoryRetrieval
-from cerberus.memory.search import MemorySearchEngine
-from cerberus.memory.context_injector import inject_startup_context, inject_query_context
+from typing import TYPE_CHECKING
+
+from cerberus.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from cerberus.memory.extract import GitExtractor
+    from cerberus.memory.storage import MemoryStorage
+    from cerberus.memory.retrieval import MemoryRetrieval
+    from cerberus.memory.search import MemorySearchEngine
+    from cerberus.memory.context_injector import inject_startup_context, inject_query_context
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'GitExtractor': 'cerberus.memory.extract',
+    'MemoryStorage': 'cerberus.memory.storage',
+    'MemoryRetrieval': 'cerberus.memory.retrieval',
+    'MemorySearchEngine': 'cerberus.memory.search',
+    'inject_startup_context': 'cerberus.memory.context_injector',
+    'inject_query_context': 'cerberus.memory.context_injector',
+})
 
 __all__ = [
     'GitExtractor',
@@ -4,13 +4,20 @@ Phase 14: Dynamic Anchoring
 Links abstract rules to concrete code examples for precise pattern replication.
 
 Zero token cost for anchor discovery (uses Cerberus index).
+
+Batches of memories are anchored with one index open and one FTS5 query batch
+(see AnchorEngine.anchor_memories); results are cached per rule and index
+generation.
 """
 
+import hashlib
 import math
 import json
 import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Tuple
 from pathlib import Path
 from datetime import datetime
 
@@ -35,6 +42,16 @@ LANGUAGE_EXTENSIONS = {
     "kotlin": "kt",
 }
 
+# Keyword matches kept per keyword, and candidate files scored per rule
+KEYWORD_TOP_K = 10
+MAX_CANDIDATES = 20
+
+# Characters of file content compared against the rule
+RELEVANCE_CONTENT_CHARS = 5000
+
+# Anchors cached per (index database, index generation, rule)
+ANCHOR_CACHE_SIZE = 1024
+
 
 @dataclass
 class AnchorCandidate:
@@ -58,6 +75,34 @@ class AnchoredMemory:
     anchor_metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+_anchor_cache: "OrderedDict[Tuple[str, int, str], Optional[AnchorCandidate]]" = OrderedDict()
+_anchor_cache_lock = threading.Lock()
+
+
+def _cached_anchor(key: Tuple[str, int, str]) -> Tuple[bool, Optional[AnchorCandidate]]:
+    """Look up a cached anchor; returns (hit, anchor)."""
+    with _anchor_cache_lock:
+        if key not in _anchor_cache:
+            return False, None
+        _anchor_cache.move_to_end(key)
+        return True, _anchor_cache[key]
+
+
+def _cache_anchor(key: Tuple[str, int, str], anchor: Optional[AnchorCandidate]) -> None:
+    """Cache an anchor (or the absence of one), evicting the oldest entries."""
+    with _anchor_cache_lock:
+        _anchor_cache[key] = anchor
+        _anchor_cache.move_to_end(key)
+        while len(_anchor_cache) > ANCHOR_CACHE_SIZE:
+            _anchor_cache.popitem(last=False)
+
+
+def clear_anchor_cache() -> None:
+    """Drop all cached anchors."""
+    with _anchor_cache_lock:
+        _anchor_cache.clear()
+
+
 class AnchorEngine:
     """
     Finds and manages code anchors for memories.
@@ -118,20 +163,141 @@ class AnchorEngine:
         if not candidates:
             return None
 
-        # Score candidates
+        return self._best_candidate(rule, candidates, min_quality)
+
+    def anchor_memories(
+        self,
+        memories: Iterable[Tuple[str, str, str]],
+        min_quality: float = 0.7
+    ) -> Dict[str, Optional[AnchorCandidate]]:
+        """
+        Find anchors for a batch of memories.
+
+        Opens the code index once and runs the keyword lookups of all rules
+        as a single FTS5 query batch. Anchors are cached per rule and index
+        generation, so re-anchoring against an unchanged index is free. Falls
+        back to anchor_memory() per memory for non-SQLite indexes.
+
+        Args:
+            memories: (memory_id, content, scope) tuples
+            min_quality: Minimum quality threshold (0.0-1.0, default 0.7)
+
+        Returns:
+            Dict mapping memory IDs to their AnchorCandidate (or None)
+        """
+        memories = list(memories)
+        anchors: Dict[str, Optional[AnchorCandidate]] = {memory_id: None for memory_id, _, _ in memories}
+
+        pending = [
+            (memory_id, content, extract_language_from_scope(scope))
+            for memory_id, content, scope in memories
+            if scope != "universal" and self._extract_keywords(content)
+        ]
+        if not pending:
+            return anchors
+
+        store = self._open_sqlite_index()
+        if store is None:
+            for memory_id, content, scope in memories:
+                if scope != "universal":
+                    anchors[memory_id] = self.anchor_memory(memory_id, content, scope)
+            return anchors
+
+        try:
+            generation = store.get_generation()
+        except Exception:
+            return anchors
+
+        # Serve cached rules, batch the keyword lookups of the rest
+        misses = []
+        for memory_id, content, language in pending:
+            rule_hash = hashlib.sha256(
+                json.dumps([content, language, min_quality]).encode()
+            ).hexdigest()
+            key = (str(store.db_path), generation, rule_hash)
+            hit, anchor = _cached_anchor(key)
+            if hit:
+                anchors[memory_id] = anchor
+            else:
+                misses.append((memory_id, content, language, key))
+
+        if not misses:
+            return anchors
+
+        keywords = list(dict.fromkeys(
+            keyword for _, content, _, _ in misses for keyword in self._extract_keywords(content)
+        ))
+        try:
+            batches = store.fts5_search_batch(keywords, top_k=KEYWORD_TOP_K)
+        except Exception:
+            return anchors
+        matches = dict(zip(keywords, batches))
+
+        # Files shared between rules are read once per batch
+        profiles: Dict[str, Tuple[str, int, float]] = {}
+        for memory_id, content, language, key in misses:
+            candidates = self._collect_candidates(
+                (match for keyword in self._extract_keywords(content) for match in matches[keyword]),
+                language
+            )
+            anchor = self._best_candidate(content, candidates, min_quality, profiles) if candidates else None
+            _cache_anchor(key, anchor)
+            anchors[memory_id] = anchor
+
+        return anchors
+
+    def _open_sqlite_index(self):
+        """Open the SQLite code index without loading vectors, or None."""
+        try:
+            # Import here to avoid circular dependency
+            from cerberus.mcp.index_manager import get_index_manager
+            from cerberus.index.index_loader import is_sqlite_index
+            from cerberus.storage.sqlite_store import SQLiteIndexStore
+
+            manager = get_index_manager()
+            index_path = manager._index_path or manager._discover_index_path()
+            if not index_path or not is_sqlite_index(Path(index_path)):
+                return None
+            return SQLiteIndexStore(Path(index_path))
+        except Exception:
+            return None
+
+    def _best_candidate(
+        self,
+        rule: str,
+        candidates: List[Dict[str, Any]],
+        min_quality: float,
+        profiles: Optional[Dict[str, Tuple[str, int, float]]] = None
+    ) -> Optional[AnchorCandidate]:
+        """
+        Score candidates by relevance, size and recency and pick the best.
+
+        Args:
+            rule: Abstract rule text
+            candidates: Candidate dicts from _collect_candidates()
+            min_quality: Minimum quality threshold
+            profiles: Optional cache of _file_profile() results by file path
+
+        Returns:
+            Highest scoring AnchorCandidate above the threshold, or None
+        """
+        profiles = {} if profiles is None else profiles
+
         scored = []
         for candidate in candidates:
             try:
+                file_path = candidate['file_path']
+                if file_path not in profiles:
+                    profiles[file_path] = self._file_profile(file_path)
+                content, file_size, recency = profiles[file_path]
+
                 # Relevance: TF-IDF similarity between rule and file content
-                relevance = self._calculate_relevance(rule, candidate['file_path'])
+                relevance = self._text_relevance(rule, content)
 
                 # Size penalty: Prefer concise examples (< 500 lines)
-                file_size = candidate.get('file_size', self._get_file_size(candidate['file_path']))
+                file_size = candidate.get('file_size', file_size)
                 size_score = 1.0 - (min(file_size, 500) / 500)
 
-                # Recency: Prefer recently modified files
-                recency = self._calculate_recency(candidate['file_path'])
-
                 # Combined score: weighted average
                 quality = (
                     0.6 * relevance +
@@ -141,7 +307,7 @@ class AnchorEngine:
 
                 if quality >= min_quality:
                     scored.append(AnchorCandidate(
-                        file_path=candidate['file_path'],
+                        file_path=file_path,
                         symbol_name=candidate.get('name'),
                         match_score=relevance,
                         file_size=file_size,
@@ -157,6 +323,22 @@ class AnchorEngine:
             return max(scored, key=lambda c: c.quality_score)
         return None
 
+    def _file_profile(self, file_path: str) -> Tuple[str, int, float]:
+        """
+        Read a file once for scoring.
+
+        Returns:
+            (leading content, size in lines, recency score)
+        """
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+            lines = content.count('\n') + (1 if content and not content.endswith('\n') else 0)
+        except Exception:
+            content, lines = "", 100  # Same defaults as the single-file helpers
+
+        return content[:RELEVANCE_CONTENT_CHARS], lines, self._calculate_recency(file_path)
+
     def _extract_keywords(self, rule: str) -> List[str]:
         """
         Extract meaningful keywords from rule text.
@@ -191,8 +373,6 @@ class AnchorEngine:
 
         Uses Cerberus index manager for efficient search.
         """
-        candidates = []
-
         try:
             # Import here to avoid circular dependency
             from cerberus.mcp.index_manager import get_index_manager
@@ -205,45 +385,59 @@ class AnchorEngine:
                 return []
 
             # Search for each keyword
+            matches = []
             for keyword in keywords:
                 results = hybrid_search(
                     query=keyword,
                     index_path=index_path,
                     mode="keyword",  # Use keyword mode for anchoring
-                    top_k=10
+                    top_k=KEYWORD_TOP_K
                 )
-
-                for result in results:
-                    candidate = {
-                        'file_path': result.symbol.file_path,
-                        'name': result.symbol.name,
-                        'type': result.symbol.type,
-                        'start_line': result.symbol.start_line,
-                        'end_line': result.symbol.end_line,
-                        'score': result.hybrid_score
-                    }
-
-                    # Filter by language if specified
-                    if language:
-                        ext = LANGUAGE_EXTENSIONS.get(language)
-                        if ext and not candidate['file_path'].endswith(f".{ext}"):
-                            continue
-
-                    candidates.append(candidate)
+                matches.extend((result.symbol, result.hybrid_score) for result in results)
 
         except Exception:
             # Fallback: glob search if Cerberus index unavailable
             return []
 
-        # Deduplicate by file path
+        return self._collect_candidates(matches, language)
+
+    def _collect_candidates(
+        self,
+        matches: Iterable[Tuple[Any, float]],
+        language: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Turn (symbol, score) search matches into candidate dicts.
+
+        Filters by language, keeps the first match per file and limits the
+        result to MAX_CANDIDATES files.
+        """
+        ext = LANGUAGE_EXTENSIONS.get(language) if language else None
+
         seen = set()
-        unique_candidates = []
-        for candidate in candidates:
-            if candidate['file_path'] not in seen:
-                seen.add(candidate['file_path'])
-                unique_candidates.append(candidate)
+        candidates = []
+        for symbol, score in matches:
+            # Filter by language if specified
+            if ext and not symbol.file_path.endswith(f".{ext}"):
+                continue
+
+            # Deduplicate by file path
+            if symbol.file_path in seen:
+                continue
+            seen.add(symbol.file_path)
+
+            candidates.append({
+                'file_path': symbol.file_path,
+                'name': symbol.name,
+                'type': symbol.type,
+                'start_line': symbol.start_line,
+                'end_line': symbol.end_line,
+                'score': score
+            })
+            if len(candidates) >= MAX_CANDIDATES:
+                break
 
-        return unique_candidates[:20]  # Limit to top 20
+        return candidates
 
     def _calculate_relevance(self, rule: str, file_path: str) -> float:
         """
@@ -255,13 +449,18 @@ class AnchorEngine:
             # Read file content
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                 file_content = f.read()
+        except Exception:
+            return 0.0
 
-            # Limit file content to first 5000 chars for efficiency
-            file_content = file_content[:5000]
+        # Limit file content to first 5000 chars for efficiency
+        return self._text_relevance(rule, file_content[:RELEVANCE_CONTENT_CHARS])
 
+    def _text_relevance(self, rule: str, content: str) -> float:
+        """TF-IDF similarity between rule and (already truncated) file content."""
+        try:
             # Vectorize
             vectorizer = TfidfVectorizer(max_features=100)
-            vectors = vectorizer.fit_transform([rule, file_content])
+            vectors = vectorizer.fit_transform([rule, content])
 
             # Cosine similarity
             similarity = cosine_similarity(vectors[0:1], vectors[1:2])[0][0]
@@ -30,6 +30,13 @@ MEMORY_DEFAULTS = {
 
     # Retention
     "max_project_age_days": 90,
+
+    # Access tracking (write-behind buffer for memory search)
+    "access_flush_threshold": 200,  # Buffered memory ids before a flush
+    "access_flush_interval_seconds": 30,  # Max age of buffered accesses
+
+    # Anchoring (1 = discover code anchors in a background thread after storing)
+    "anchor_in_background": 0,
 }
 
 # Cached config
@@ -14,11 +14,49 @@ Architecture:
 - run_conflict_resolution(): Full workflow
 """
 
+import math
+import re
 import uuid
+from collections import Counter
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Dict, Any, Set
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Set, Tuple
+
+# Candidate-pair generation for conflict detection. Small memory sets are
+# compared exhaustively; larger ones only compare each memory with its
+# nearest TF-IDF neighbours and any pair above the candidate threshold.
+CONFLICT_DETECTION_CONFIG = {
+    "exhaustive_below": 300,       # Compare all pairs below this many memories
+    "top_k": 10,                   # Nearest neighbours checked per memory
+    "candidate_threshold": 0.4,    # Corpus cosine that always makes a pair a candidate
+    "block_size": 1024,            # Rows per sparse similarity block
+    "max_term_share": 0.05,        # Ignore terms in more memories than this when pairing...
+    "max_term_floor": 500,         # ...unless they appear in fewer than this many
+}
+
+# Similarity thresholds (pairwise TF-IDF cosine)
+REDUNDANCY_THRESHOLD = 0.85
+OBSOLESCENCE_THRESHOLD = 0.75
+OBSOLESCENCE_MIN_AGE_DIFF_DAYS = 30
+
+AFFIRMATIVE_MARKERS = ("use", "prefer", "always", "do")
+NEGATIVE_MARKERS = ("avoid", "never", "don't", "do not")
+
+STOPWORDS = frozenset({
+    "a", "an", "the", "is", "are", "was", "were", "be", "been",
+    "have", "has", "had", "do", "does", "did", "will", "would",
+    "should", "could", "may", "might", "must", "can", "to", "of",
+    "in", "on", "at", "for", "with", "by", "from", "as", "and",
+    "or", "but", "if", "when", "where", "why", "how"
+})
+
+# Tokenization of sklearn's TfidfVectorizer (default token_pattern, lowercased)
+_TFIDF_TOKEN_RE = re.compile(r"(?u)\b\w\w+\b")
+
+# IDF of a term present in only one of two documents (smooth_idf, n=2)
+_PAIR_UNIQUE_IDF = math.log(3 / 2) + 1
 
 
 class ConflictType(Enum):
@@ -72,10 +110,9 @@ def detect_conflicts(
 
     Strategy:
     1. Load memories in scope
-    2. Pairwise comparison for contradictions
-    3. Similarity clustering for redundancies
-    4. Recency check for obsolescence
-    5. Scope hierarchy check for scope conflicts
+    2. Pick candidate pairs (all pairs for small sets, TF-IDF neighbours otherwise)
+    3. Contradiction and redundancy checks on candidate pairs
+    4. Recency check for obsolescence on the same pairs
 
     Args:
         scope: Optional scope filter (None = all memories)
@@ -87,45 +124,200 @@ def detect_conflicts(
     retrieval = MemoryRetrieval()
 
     memories = retrieval.get_all(scope=scope)
+    return find_conflicts(memories)
+
+
+def find_conflicts(memories: List[Any]) -> List[MemoryConflict]:
+    """
+    Find contradiction, redundancy and obsolescence conflicts among memories.
+
+    Args:
+        memories: Memories with id, content, scope, confidence and created_at
+
+    Returns:
+        List of MemoryConflict objects (contradictions/redundancies first,
+        then obsolescence), in memory order
+    """
+    features = [_content_features(mem.content) for mem in memories]
+    candidates = []
+    for i, j in _candidate_pairs(memories):
+        candidates.append((i, j, _features_similarity(features[i], features[j])))
+
     conflicts = []
 
-    # Pairwise contradiction and redundancy detection
-    for i, mem_a in enumerate(memories):
-        for mem_b in memories[i+1:]:
-            # Check contradiction
-            if _is_contradiction(mem_a, mem_b):
-                similarity = _calculate_similarity(mem_a.content, mem_b.content)
-                conflicts.append(MemoryConflict(
-                    conflict_id=f"conflict-{uuid.uuid4().hex[:8]}",
-                    conflict_type=ConflictType.CONTRADICTION,
-                    memory_a=mem_a,
-                    memory_b=mem_b,
-                    similarity=similarity,
-                    severity=_calculate_severity(mem_a, mem_b, ConflictType.CONTRADICTION),
-                    auto_resolvable=_can_auto_resolve_contradiction(mem_a, mem_b),
-                    recommended_resolution=_recommend_contradiction_resolution(mem_a, mem_b)
-                ))
+    for i, j, similarity in candidates:
+        mem_a, mem_b = memories[i], memories[j]
+
+        # Check contradiction
+        if _features_contradict(features[i], features[j]):
+            conflicts.append(MemoryConflict(
+                conflict_id=f"conflict-{uuid.uuid4().hex[:8]}",
+                conflict_type=ConflictType.CONTRADICTION,
+                memory_a=mem_a,
+                memory_b=mem_b,
+                similarity=similarity,
+                severity=_calculate_severity(mem_a, mem_b, ConflictType.CONTRADICTION),
+                auto_resolvable=_can_auto_resolve_contradiction(mem_a, mem_b),
+                recommended_resolution=_recommend_contradiction_resolution(mem_a, mem_b)
+            ))
+
+        # Check redundancy (high similarity)
+        elif similarity > REDUNDANCY_THRESHOLD:
+            conflicts.append(MemoryConflict(
+                conflict_id=f"conflict-{uuid.uuid4().hex[:8]}",
+                conflict_type=ConflictType.REDUNDANCY,
+                memory_a=mem_a,
+                memory_b=mem_b,
+                similarity=similarity,
+                severity=_calculate_severity(mem_a, mem_b, ConflictType.REDUNDANCY),
+                auto_resolvable=True,
+                recommended_resolution="keep_newer"
+            ))
+
+    # Obsolescence detection (separate pass over the same candidates)
+    conflicts.extend(_detect_obsolescence(memories, candidates))
+
+    return conflicts
+
+
+@dataclass(frozen=True)
+class _ContentFeatures:
+    """Per-memory data used by pairwise checks (computed once per content)."""
+    keywords: frozenset
+    affirmative: bool
+    negative: bool
+    term_counts: Tuple[Tuple[str, int], ...]
+
+
+@lru_cache(maxsize=65536)
+def _content_features(content: str) -> _ContentFeatures:
+    """Extract keywords, sentiment markers and term counts from memory content."""
+    lowered = content.lower()
+    return _ContentFeatures(
+        keywords=frozenset(_extract_keywords(lowered)),
+        affirmative=any(kw in lowered for kw in AFFIRMATIVE_MARKERS),
+        negative=any(kw in lowered for kw in NEGATIVE_MARKERS),
+        term_counts=tuple(Counter(_TFIDF_TOKEN_RE.findall(lowered)).items()),
+    )
 
-            # Check redundancy (high similarity)
+
+def _candidate_pairs(memories: List[Any]) -> List[Tuple[int, int]]:
+    """
+    Select index pairs (i < j) worth checking for conflicts.
+
+    Below ``exhaustive_below`` memories every pair is returned. Otherwise one
+    TF-IDF matrix is built for the whole set and multiplied with itself in
+    row blocks; each memory keeps its ``top_k`` most similar neighbours plus
+    every neighbour at or above ``candidate_threshold``. In large sets, terms
+    found in more than ``max_term_share`` of the memories are ignored for
+    pairing only; the checks themselves use the full text.
+
+    Args:
+        memories: Memories to pair up
+
+    Returns:
+        Sorted list of (i, j) index pairs
+    """
+    n = len(memories)
+    config = CONFLICT_DETECTION_CONFIG
+    if n < 2:
+        return []
+    if n < config["exhaustive_below"]:
+        return [(i, j) for i in range(n) for j in range(i + 1, n)]
+
+    try:
+        import numpy as np
+        from sklearn.feature_extraction.text import TfidfVectorizer
+    except ImportError:
+        return [(i, j) for i in range(n) for j in range(i + 1, n)]
+
+    contents = [mem.content for mem in memories]
+    try:
+        # Very common terms ("use", "always") link everything to everything
+        # and carry little signal; leaving them out keeps the products sparse
+        max_df = max(int(config["max_term_share"] * n), config["max_term_floor"])
+        matrix = TfidfVectorizer(max_df=max_df).fit_transform(contents)
+    except ValueError:
+        try:
+            matrix = TfidfVectorizer().fit_transform(contents)
+        except ValueError:
+            # Empty vocabulary - fall back to exhaustive comparison
+            return [(i, j) for i in range(n) for j in range(i + 1, n)]
+    matrix = matrix.tocsr()
+
+    top_k = config["top_k"]
+    threshold = config["candidate_threshold"]
+    transposed = matrix.T.tocsc()
+    keys = []  # i * n + j for every kept pair with i < j
+
+    for start in range(0, n, config["block_size"]):
+        block = (matrix[start:start + config["block_size"]] @ transposed).tocsr()
+        rows = np.repeat(np.arange(start, start + block.shape[0]), np.diff(block.indptr))
+        keep = block.data >= threshold
+
+        # Top-k per row; rows with few neighbours keep them all
+        for row in np.flatnonzero(np.diff(block.indptr) > 0):
+            lo, hi = block.indptr[row], block.indptr[row + 1]
+            if hi - lo <= top_k + 1:
+                keep[lo:hi] = True
             else:
-                similarity = _calculate_similarity(mem_a.content, mem_b.content)
-                if similarity > 0.85:  # High similarity = redundant
-                    conflicts.append(MemoryConflict(
-                        conflict_id=f"conflict-{uuid.uuid4().hex[:8]}",
-                        conflict_type=ConflictType.REDUNDANCY,
-                        memory_a=mem_a,
-                        memory_b=mem_b,
-                        similarity=similarity,
-                        severity=_calculate_severity(mem_a, mem_b, ConflictType.REDUNDANCY),
-                        auto_resolvable=True,
-                        recommended_resolution="keep_newer"
-                    ))
-
-    # Obsolescence detection (separate pass)
-    obsolete_conflicts = _detect_obsolescence(memories)
-    conflicts.extend(obsolete_conflicts)
+                keep[lo + np.argpartition(-block.data[lo:hi], top_k + 1)[:top_k + 1]] = True
 
-    return conflicts
+        i, j = rows[keep], block.indices[keep]
+        distinct = i != j
+        i, j = i[distinct], j[distinct]
+        keys.append(np.minimum(i, j).astype(np.int64) * n + np.maximum(i, j))
+
+    unique = np.unique(np.concatenate(keys)) if keys else np.empty(0, dtype=np.int64)
+    return list(zip((unique // n).tolist(), (unique % n).tolist()))
+
+
+def _features_contradict(features_a: _ContentFeatures, features_b: _ContentFeatures) -> bool:
+    """Contradiction check on precomputed features (see _is_contradiction)."""
+    if not features_a.keywords & features_b.keywords:
+        return False  # No common topic
+
+    # Contradiction: one affirmative, one negative, same topic
+    return bool(
+        (features_a.affirmative and features_b.negative)
+        or (features_a.negative and features_b.affirmative)
+    )
+
+
+def _features_similarity(features_a: _ContentFeatures, features_b: _ContentFeatures) -> float:
+    """
+    TF-IDF cosine similarity of two memories, fitted on just the pair.
+
+    Equivalent to fitting sklearn's TfidfVectorizer on the two texts: terms in
+    both documents get IDF 1, terms in one get ln(3/2) + 1; vectors are
+    L2-normalized raw counts times IDF.
+    """
+    counts_a = dict(features_a.term_counts)
+    counts_b = dict(features_b.term_counts)
+
+    if not counts_a and not counts_b:
+        # Empty vocabulary - fall back to simple word overlap
+        if not features_a.keywords or not features_b.keywords:
+            return 0.0
+        return len(features_a.keywords & features_b.keywords) / len(features_a.keywords | features_b.keywords)
+
+    dot = 0.0
+    norm_a = 0.0
+    for term, count in counts_a.items():
+        if term in counts_b:
+            dot += count * counts_b[term]
+            norm_a += count * count
+        else:
+            norm_a += (count * _PAIR_UNIQUE_IDF) ** 2
+
+    norm_b = 0.0
+    for term, count in counts_b.items():
+        weight = count if term in counts_a else count * _PAIR_UNIQUE_IDF
+        norm_b += weight * weight
+
+    if not dot or not norm_a or not norm_b:
+        return 0.0
+    return min(1.0, dot / math.sqrt(norm_a * norm_b))
 
 
 def _is_contradiction(mem_a: Any, mem_b: Any) -> bool:
@@ -144,31 +336,7 @@ def _is_contradiction(mem_a: Any, mem_b: Any) -> bool:
     Returns:
         True if memories contradict, False otherwise
     """
-    content_a = mem_a.content.lower()
-    content_b = mem_b.content.lower()
-
-    # Extract keywords
-    keywords_a = set(_extract_keywords(content_a))
-    keywords_b = set(_extract_keywords(content_b))
-
-    # Check keyword overlap
-    overlap = keywords_a & keywords_b
-
-    if not overlap:
-        return False  # No common topic
-
-    # Check opposing sentiment
-    affirmative_a = any(kw in content_a for kw in ["use", "prefer", "always", "do"])
-    negative_a = any(kw in content_a for kw in ["avoid", "never", "don't", "do not"])
-
-    affirmative_b = any(kw in content_b for kw in ["use", "prefer", "always", "do"])
-    negative_b = any(kw in content_b for kw in ["avoid", "never", "don't", "do not"])
-
-    # Contradiction: one affirmative, one negative, same topic
-    if (affirmative_a and negative_b) or (negative_a and affirmative_b):
-        return True
-
-    return False
+    return _features_contradict(_content_features(mem_a.content), _content_features(mem_b.content))
 
 
 def _extract_keywords(text: str) -> List[str]:
@@ -182,16 +350,8 @@ def _extract_keywords(text: str) -> List[str]:
         List of keywords
     """
     # Simple keyword extraction: split on whitespace, remove stopwords
-    stopwords = {
-        "a", "an", "the", "is", "are", "was", "were", "be", "been",
-        "have", "has", "had", "do", "does", "did", "will", "would",
-        "should", "could", "may", "might", "must", "can", "to", "of",
-        "in", "on", "at", "for", "with", "by", "from", "as", "and",
-        "or", "but", "if", "when", "where", "why", "how"
-    }
-
     words = text.lower().split()
-    keywords = [w.strip(".,!?;:") for w in words if w not in stopwords and len(w) > 2]
+    keywords = [w.strip(".,!?;:") for w in words if w not in STOPWORDS and len(w) > 2]
 
     return keywords
 
@@ -207,27 +367,7 @@ def _calculate_similarity(content_a: str, content_b: str) -> float:
     Returns:
         Similarity score (0.0-1.0)
     """
-    try:
-        from sklearn.feature_extraction.text import TfidfVectorizer
-        from sklearn.metrics.pairwise import cosine_similarity
-
-        vectorizer = TfidfVectorizer()
-        vectors = vectorizer.fit_transform([content_a, content_b])
-        similarity = cosine_similarity(vectors[0:1], vectors[1:2])[0][0]
-
-        return float(similarity)
-    except Exception:
-        # Fallback: simple word overlap
-        words_a = set(_extract_keywords(content_a))
-        words_b = set(_extract_keywords(content_b))
-
-        if not words_a or not words_b:
-            return 0.0
-
-        overlap = len(words_a & words_b)
-        total = len(words_a | words_b)
-
-        return overlap / total if total > 0 else 0.0
+    return _features_similarity(_content_features(content_a), _content_features(content_b))
 
 
 def _calculate_severity(
@@ -297,7 +437,10 @@ def _calculate_severity(
         return "low"
 
 
-def _detect_obsolescence(memories: List[Any]) -> List[MemoryConflict]:
+def _detect_obsolescence(
+    memories: List[Any],
+    candidates: Optional[List[Tuple[int, int, float]]] = None
+) -> List[MemoryConflict]:
     """
     Detect obsolescence conflicts.
 
@@ -306,30 +449,36 @@ def _detect_obsolescence(memories: List[Any]) -> List[MemoryConflict]:
 
     Args:
         memories: List of memories to check
+        candidates: Precomputed (i, j, similarity) candidate pairs
 
     Returns:
         List of obsolescence conflicts
     """
+    if candidates is None:
+        features = [_content_features(mem.content) for mem in memories]
+        candidates = [
+            (i, j, _features_similarity(features[i], features[j]))
+            for i, j in _candidate_pairs(memories)
+        ]
+
     conflicts = []
 
-    for i, mem_a in enumerate(memories):
-        for mem_b in memories[i+1:]:
-            similarity = _calculate_similarity(mem_a.content, mem_b.content)
-
-            if similarity > 0.75:  # Similar enough to be same rule
-                age_diff_days = abs((mem_a.created_at - mem_b.created_at).days)
-
-                if age_diff_days > 30:  # Significant age difference
-                    conflicts.append(MemoryConflict(
-                        conflict_id=f"conflict-{uuid.uuid4().hex[:8]}",
-                        conflict_type=ConflictType.OBSOLESCENCE,
-                        memory_a=mem_a,
-                        memory_b=mem_b,
-                        similarity=similarity,
-                        severity=_calculate_severity(mem_a, mem_b, ConflictType.OBSOLESCENCE),
-                        auto_resolvable=True,
-                        recommended_resolution="keep_newer"
-                    ))
+    for i, j, similarity in candidates:
+        if similarity > OBSOLESCENCE_THRESHOLD:  # Similar enough to be same rule
+            mem_a, mem_b = memories[i], memories[j]
+            age_diff_days = abs((mem_a.created_at - mem_b.created_at).days)
+
+            if age_diff_days > OBSOLESCENCE_MIN_AGE_DIFF_DAYS:  # Significant age difference
+                conflicts.append(MemoryConflict(
+                    conflict_id=f"conflict-{uuid.uuid4().hex[:8]}",
+                    conflict_type=ConflictType.OBSOLESCENCE,
+                    memory_a=mem_a,
+                    memory_b=mem_b,
+                    similarity=similarity,
+                    severity=_calculate_severity(mem_a, mem_b, ConflictType.OBSOLESCENCE),
+                    auto_resolvable=True,
+                    recommended_resolution="keep_newer"
+                ))
 
     return conflicts
 
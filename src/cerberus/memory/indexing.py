@@ -93,6 +93,26 @@ CREATE INDEX IF NOT EXISTS idx_sess_path ON sessions(project_path) WHERE project
 CREATE UNIQUE INDEX IF NOT EXISTS idx_unique_active_session ON sessions(scope, status) WHERE status = 'active';
 """
 
+# Token counts per memory and tokenizer encoding (computed once, at store time).
+# Kept separate from SCHEMA_SQL so retrieval can create it on older databases.
+TOKEN_COUNTS_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS memory_token_counts (
+    memory_id TEXT NOT NULL,
+    encoding TEXT NOT NULL,
+    token_count INTEGER NOT NULL,
+    PRIMARY KEY (memory_id, encoding)
+);
+"""
+
+# Incremental transcript reading state (byte offset + extracted data per transcript)
+TRANSCRIPT_CHECKPOINTS_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS transcript_checkpoints (
+    transcript_path TEXT PRIMARY KEY,
+    state TEXT NOT NULL,        -- JSON blob (offsets, candidates, keyword index, session digest)
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
 
 @dataclass
 class IndexedMemory:
@@ -197,6 +217,8 @@ class MemoryIndexManager:
 
         # Create schema
         conn.executescript(SCHEMA_SQL)
+        conn.executescript(TOKEN_COUNTS_SCHEMA_SQL)
+        conn.executescript(TRANSCRIPT_CHECKPOINTS_SCHEMA_SQL)
 
         # Run migrations for existing databases
         self._migrate_sessions_table(conn)
@@ -366,6 +388,9 @@ class MemoryIndexManager:
             VALUES (?, ?)
         """, (mem_id, content))
 
+        # Content may have changed - retrieval recounts tokens on next use
+        conn.execute("DELETE FROM memory_token_counts WHERE memory_id = ?", (mem_id,))
+
     def get_memory(self, memory_id: str) -> Optional[IndexedMemory]:
         """
         Retrieve a memory by ID.
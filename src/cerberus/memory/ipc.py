@@ -81,6 +81,10 @@ def run_cli_command(
     """
     Run CLI command as subprocess.
 
+    ``cerberus`` commands are forwarded to the project's daemon when one is
+    running, so they skip the cold start; other commands (and ``cerberus``
+    without a daemon) run as subprocesses.
+
     Args:
         command: Command and arguments as list (e.g., ["cerberus", "memory", "propose"])
         capture_output: Whether to capture stdout/stderr (default: True)
@@ -94,6 +98,28 @@ def run_cli_command(
         subprocess.CalledProcessError: If command fails and check=True
         subprocess.TimeoutExpired: If timeout exceeded
     """
+    if command and Path(command[0]).name == "cerberus":
+        from cerberus.watcher.command_server import forward_command
+
+        try:
+            forwarded = forward_command(command[1:], timeout=timeout)
+        except TimeoutError:
+            raise subprocess.TimeoutExpired(command, timeout)
+
+        if forwarded is not None:
+            if not capture_output:
+                sys.stdout.write(forwarded.stdout)
+                sys.stderr.write(forwarded.stderr)
+            result = subprocess.CompletedProcess(
+                command,
+                forwarded.exit_code,
+                forwarded.stdout if capture_output else None,
+                forwarded.stderr if capture_output else None,
+            )
+            if check:
+                result.check_returncode()
+            return result
+
     return subprocess.run(
         command,
         capture_output=capture_output,
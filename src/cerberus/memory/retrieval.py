@@ -5,17 +5,65 @@ Query and filter memories from SQLite using FTS5 for context-aware injection.
 This is Phase Beta implementation - replaces JSON loading from Phase Alpha.
 
 Zero token cost (pure retrieval, tokens counted in Phase 7).
+
+Token counts are persisted per memory and encoding in memory_token_counts,
+so injection cost does not grow with re-tokenizing the whole store.
 """
 
 import sqlite3
 import json
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from datetime import datetime
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 import tiktoken
 
-from .search import MemorySearchEngine, SearchQuery, SearchResult
+from .indexing import TOKEN_COUNTS_SCHEMA_SQL
+from .search import MemorySearchEngine
+
+# Encoding used for persisted token counts unless a caller asks for another
+DEFAULT_TOKEN_ENCODING = "cl100k_base"
+
+_tokenizers: Dict[str, object] = {}
+
+
+def get_tokenizer(encoding: str = DEFAULT_TOKEN_ENCODING):
+    """
+    Get a tiktoken encoding, or None if it cannot be loaded (e.g. offline).
+
+    Args:
+        encoding: Tokenizer encoding name
+
+    Returns:
+        tiktoken Encoding or None
+    """
+    if encoding not in _tokenizers:
+        try:
+            _tokenizers[encoding] = tiktoken.get_encoding(encoding)
+        except Exception:
+            # Remember the failure - loading may involve a network download
+            _tokenizers[encoding] = None
+    return _tokenizers[encoding]
+
+
+def count_tokens(text: str, tokenizer=None) -> int:
+    """
+    Count tokens in text.
+
+    Args:
+        text: Text to count
+        tokenizer: tiktoken Encoding (estimates from length if None)
+
+    Returns:
+        Token count
+    """
+    if tokenizer is not None:
+        try:
+            return len(tokenizer.encode(text))
+        except Exception:
+            pass
+    # Fallback: rough estimate (1 token ≈ 4 chars)
+    return len(text) // 4
 
 
 @dataclass
@@ -41,6 +89,11 @@ class RetrievedMemory:
     valid_modes: Optional[str] = None  # JSON string of list
     mode_priority: Optional[str] = None  # JSON string of dict
 
+    @property
+    def created_at(self) -> datetime:
+        """Creation time parsed from ``timestamp``."""
+        return datetime.fromisoformat(self.timestamp)
+
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
         return {
@@ -95,7 +148,8 @@ class MemoryRetrieval:
         self.base_dir = base_dir
         self.db_path = base_dir / "memory.db"
         self.search_engine = MemorySearchEngine(self.db_path)
-        self.tokenizer = tiktoken.get_encoding(encoding)
+        self.encoding = encoding
+        self._token_table_ready = False
 
     def retrieve(
         self,
@@ -109,6 +163,11 @@ class MemoryRetrieval:
         """
         Retrieve memories with relevance scoring and budget awareness.
 
+        Relevance is computed and ordered in SQL; rows are consumed in
+        relevance order until the token budget is full, so only the memories
+        that are returned get materialized. Token counts come from
+        memory_token_counts and are computed (and persisted) only when missing.
+
         Args:
             scope: Optional scope filter (universal, language:X, project:X)
             language: Current language context (e.g., "python", "go")
@@ -125,71 +184,98 @@ class MemoryRetrieval:
 
         # Build scope pattern for filtering
         scope_pattern = self._build_scope_pattern(language, project, scope)
+        sql, params = self._build_query(scope_pattern, category, language, project, min_relevance)
 
-        # Query database using search engine
-        search_query = SearchQuery(
-            text=None,  # No full-text search, just scope filtering
-            scope=scope_pattern,
-            category=category,
-            min_confidence=0.0,  # Apply min_relevance later after scoring
-            limit=1000,  # Large limit, will be filtered by budget
-            order_by="recency"  # Start with recent memories
-        )
-
-        results = self.search_engine.search(search_query)
+        conn = sqlite3.connect(str(self.db_path))
+        conn.row_factory = sqlite3.Row
 
-        # Convert to RetrievedMemory with relevance scoring
         retrieved = []
-        for result in results:
-            # Calculate relevance score (recency already from DB)
-            relevance = self._calculate_relevance(
-                result, language, project
-            )
+        new_counts = []
+        total_tokens = 0
+
+        try:
+            self._ensure_token_counts_table(conn)
+            try:
+                cursor = conn.execute(sql, params)
+            except sqlite3.OperationalError:
+                return []
+
+            for row in cursor:
+                token_count = row["token_count"]
+                if token_count is None:
+                    token_count = self._count_tokens(row["content"])
+                    if self.tokenizer is not None:
+                        new_counts.append((row["id"], self.encoding, token_count))
+
+                if total_tokens + token_count > token_budget:
+                    # Budget exhausted
+                    break
+                total_tokens += token_count
+
+                retrieved.append(self._to_retrieved_memory(row, token_count))
+
+            if new_counts:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO memory_token_counts (memory_id, encoding, token_count) "
+                    "VALUES (?, ?, ?)",
+                    new_counts
+                )
+                conn.commit()
+        finally:
+            conn.close()
 
-            if relevance < min_relevance:
-                continue
-
-            # Count tokens
-            token_count = self._count_tokens(result.content)
-
-            # Extract rationale from metadata
-            rationale = result.metadata.get("rationale", "")
-
-            # Parse anchor metadata if present
-            anchor_metadata = None
-            if result.anchor_metadata:
-                try:
-                    anchor_metadata = json.loads(result.anchor_metadata)
-                except (json.JSONDecodeError, TypeError):
-                    anchor_metadata = None
-
-            retrieved.append(RetrievedMemory(
-                id=result.memory_id,
-                category=result.category,
-                scope=result.scope,
-                content=result.content,
-                rationale=rationale,
-                confidence=result.confidence,
-                timestamp=result.created_at,
-                access_count=result.access_count,
-                last_accessed=result.last_accessed,
-                relevance_score=relevance,
-                token_count=token_count,
-                anchor_file=result.anchor_file,
-                anchor_symbol=result.anchor_symbol,
-                anchor_score=result.anchor_score,
-                anchor_metadata=anchor_metadata,
-                valid_modes=getattr(result, 'valid_modes', None),
-                mode_priority=getattr(result, 'mode_priority', None)
-            ))
-
-        # Sort by relevance (highest first)
-        retrieved.sort(key=lambda m: m.relevance_score, reverse=True)
-
-        # Apply token budget
-        budgeted = self._apply_budget(retrieved, token_budget)
-
-        return budgeted
+        # Update access tracking for what is actually injected
+        self.search_engine._update_access([memory.id for memory in retrieved])
+
+        return retrieved
+
+    def get_all(self, scope: Optional[str] = None) -> List[RetrievedMemory]:
+        """
+        Load every memory (optionally within a scope), oldest first.
+
+        No relevance scoring, budget or access tracking - used by maintenance
+        tasks such as conflict detection.
+
+        Args:
+            scope: Optional scope filter (exact, or prefix with trailing "*")
+
+        Returns:
+            List of RetrievedMemory objects
+        """
+        if not self.db_path.exists():
+            return []
+
+        where = ""
+        params: List[str] = []
+        if scope:
+            if scope.endswith("*"):
+                where = "WHERE s.scope LIKE ?"
+                params.append(scope.replace("*", "%"))
+            else:
+                where = "WHERE s.scope = ?"
+                params.append(scope)
+
+        conn = sqlite3.connect(str(self.db_path))
+        conn.row_factory = sqlite3.Row
+        try:
+            rows = conn.execute(f"""
+                SELECT
+                    s.id, f.content, s.category, s.scope, s.confidence,
+                    s.created_at, s.last_accessed, s.access_count, s.metadata,
+                    s.anchor_file, s.anchor_symbol, s.anchor_score, s.anchor_metadata,
+                    s.valid_modes, s.mode_priority,
+                    NULL AS token_count, 0.0 AS relevance
+                FROM memory_store s
+                JOIN memory_fts f ON s.id = f.id
+                {where}
+                ORDER BY s.created_at
+            """, params).fetchall()
+        except sqlite3.OperationalError:
+            return []
+        finally:
+            conn.close()
+
+        return [self._to_retrieved_memory(row, 0) for row in rows]
 
     def _build_scope_pattern(
         self,
@@ -213,107 +299,139 @@ class MemoryRetrieval:
         if explicit_scope:
             return explicit_scope
 
-        # No explicit scope: match multiple scopes using SQL OR logic
-        # We'll handle this in the search method by running multiple queries
+        # No explicit scope: every scope is a candidate, relevance scoring
+        # drops mismatched language/project scopes to 0.0
         return None
 
-    def _calculate_relevance(
+    def _build_query(
         self,
-        result: SearchResult,
+        scope_pattern: Optional[str],
+        category: Optional[str],
         language: Optional[str],
-        project: Optional[str]
-    ) -> float:
+        project: Optional[str],
+        min_relevance: float
+    ) -> Tuple[str, Dict]:
         """
-        Calculate relevance score for a memory.
+        Build the relevance-ordered retrieval query.
 
-        Formula: scope_factor * recency_score * confidence_weight
+        Relevance formula: scope_factor * recency_score * confidence
 
-        Args:
-            result: SearchResult from database
-            language: Current language context
-            project: Current project context
+        scope_factor: universal 1.0, matching language 0.8, matching project
+        1.0, mismatched language/project 0.0, unknown scope 0.5.
+        recency_score follows each memory's relevance_decay_days (default 90):
+        < 7 days 1.0, < 30 days 0.8, < decay_days 0.6, < 2*decay_days 0.4,
+        otherwise (or unparsable timestamp) 0.2.
 
         Returns:
-            Relevance score (0.0-1.0+)
+            (sql, named parameters)
         """
-        # Scope factor
-        scope = result.scope
-        if scope == "universal":
-            scope_factor = self.SCOPE_FACTORS["universal"]
-        elif scope.startswith("language:"):
-            memory_lang = scope.split(":", 1)[1]
-            # Higher relevance if matches current language
-            if language and memory_lang == language:
-                scope_factor = self.SCOPE_FACTORS["language"]
-            else:
-                scope_factor = 0.0  # Language mismatch - not relevant
-        elif scope.startswith("project:"):
-            memory_project = scope.split(":", 1)[1]
-            # Higher relevance if matches current project
-            if project and memory_project == project:
-                scope_factor = self.SCOPE_FACTORS["project"]
-            else:
-                scope_factor = 0.0  # Project mismatch - not relevant
-        else:
-            scope_factor = 0.5  # Unknown scope
-
-        if scope_factor == 0.0:
-            return 0.0
-
-        # Recency score with custom decay threshold
-        decay_days = getattr(result, 'relevance_decay_days', 90)
-        recency_score = self._calculate_recency(result.created_at, decay_days)
+        where_clauses = []
+        params = {
+            "encoding": self.encoding,
+            "language": language,
+            "project": project,
+            "now": datetime.now().isoformat(),
+            "min_relevance": min_relevance,
+            "universal": self.SCOPE_FACTORS["universal"],
+            "language_factor": self.SCOPE_FACTORS["language"],
+            "project_factor": self.SCOPE_FACTORS["project"],
+        }
 
-        # Confidence weight
-        confidence = result.confidence
+        if scope_pattern:
+            if scope_pattern.endswith("*"):
+                # Prefix match: "project:hydra*" matches "project:hydra:task:X"
+                where_clauses.append("s.scope LIKE :scope")
+                params["scope"] = scope_pattern.replace("*", "%")
+            else:
+                where_clauses.append("s.scope = :scope")
+                params["scope"] = scope_pattern
 
-        # Final relevance score
-        relevance = scope_factor * recency_score * confidence
+        if category:
+            where_clauses.append("s.category = :category")
+            params["category"] = category
 
-        return relevance
+        where = ("WHERE " + " AND ".join(where_clauses)) if where_clauses else ""
+        days = "CAST(julianday(:now) - julianday(s.created_at) AS INTEGER)"
+        decay = "COALESCE(s.relevance_decay_days, 90)"
 
-    def _calculate_recency(self, timestamp: str, decay_days: int = 90) -> float:
+        sql = f"""
+            SELECT * FROM (
+                SELECT
+                    s.id, f.content, s.category, s.scope, s.confidence,
+                    s.created_at, s.last_accessed, s.access_count, s.metadata,
+                    s.anchor_file, s.anchor_symbol, s.anchor_score, s.anchor_metadata,
+                    s.valid_modes, s.mode_priority,
+                    t.token_count,
+                    (CASE
+                        WHEN s.scope = 'universal' THEN :universal
+                        WHEN substr(s.scope, 1, 9) = 'language:' THEN
+                            CASE WHEN substr(s.scope, 10) = :language THEN :language_factor ELSE 0.0 END
+                        WHEN substr(s.scope, 1, 8) = 'project:' THEN
+                            CASE WHEN substr(s.scope, 9) = :project THEN :project_factor ELSE 0.0 END
+                        ELSE 0.5
+                    END)
+                    * (CASE
+                        WHEN {days} IS NULL THEN 0.2
+                        WHEN {days} < 7 THEN 1.0
+                        WHEN {days} < 30 THEN 0.8
+                        WHEN {days} < {decay} THEN 0.6
+                        WHEN {days} < {decay} * 2 THEN 0.4
+                        ELSE 0.2
+                    END)
+                    * COALESCE(s.confidence, 0.0) AS relevance
+                FROM memory_store s
+                JOIN memory_fts f ON s.id = f.id
+                LEFT JOIN memory_token_counts t
+                    ON t.memory_id = s.id AND t.encoding = :encoding
+                {where}
+            )
+            WHERE relevance >= :min_relevance
+            ORDER BY relevance DESC, created_at DESC
         """
-        Calculate recency score with configurable decay threshold.
-
-        Hybrid format enhancement: Each memory has custom relevance_decay_days.
-        - Architectural decisions: decay_days=180 (stay relevant longer)
-        - Bug fixes: decay_days=30 (become stale quickly)
-        - Universal preferences: decay_days=365 (nearly permanent)
-
-        Default decay curve (decay_days=90):
-        - < 7 days: 1.0 (very recent)
-        - < 30 days: 0.8 (recent)
-        - < decay_days: 0.6 (moderate)
-        - < 2*decay_days: 0.4 (old)
-        - >= 2*decay_days: 0.2 (stale)
+        return sql, params
+
+    def _to_retrieved_memory(self, row: sqlite3.Row, token_count: int) -> RetrievedMemory:
+        """Build a RetrievedMemory from a retrieval query row."""
+        metadata = json.loads(row["metadata"]) if row["metadata"] else {}
+
+        # Parse anchor metadata if present
+        anchor_metadata = None
+        if row["anchor_metadata"]:
+            try:
+                anchor_metadata = json.loads(row["anchor_metadata"])
+            except (json.JSONDecodeError, TypeError):
+                anchor_metadata = None
+
+        return RetrievedMemory(
+            id=row["id"],
+            category=row["category"],
+            scope=row["scope"],
+            content=row["content"],
+            rationale=metadata.get("rationale", ""),
+            confidence=row["confidence"],
+            timestamp=row["created_at"],
+            access_count=row["access_count"],
+            last_accessed=row["last_accessed"],
+            relevance_score=row["relevance"],
+            token_count=token_count,
+            anchor_file=row["anchor_file"],
+            anchor_symbol=row["anchor_symbol"],
+            anchor_score=row["anchor_score"],
+            anchor_metadata=anchor_metadata,
+            valid_modes=row["valid_modes"],
+            mode_priority=row["mode_priority"]
+        )
 
-        Args:
-            timestamp: ISO format timestamp string
-            decay_days: Custom decay threshold (default: 90)
+    def _ensure_token_counts_table(self, conn: sqlite3.Connection) -> None:
+        """Create memory_token_counts on databases created before it existed."""
+        if not self._token_table_ready:
+            conn.execute(TOKEN_COUNTS_SCHEMA_SQL)
+            self._token_table_ready = True
 
-        Returns:
-            Recency score (0.2-1.0)
-        """
-        try:
-            created = datetime.fromisoformat(timestamp)
-            now = datetime.now()
-            days_ago = (now - created).days
-
-            # Standardized thresholds relative to decay_days
-            if days_ago < 7:
-                return 1.0  # Always 1.0 for very recent (< 1 week)
-            elif days_ago < 30:
-                return 0.8  # Always 0.8 for recent (< 1 month)
-            elif days_ago < decay_days:
-                return 0.6  # Moderate (within decay threshold)
-            elif days_ago < (decay_days * 2):
-                return 0.4  # Old (beyond decay threshold)
-            else:
-                return 0.2  # Stale (way beyond threshold)
-        except (ValueError, TypeError):
-            # Invalid timestamp - return lowest score
-            return 0.2
+    @property
+    def tokenizer(self):
+        """Tokenizer for ``self.encoding`` (loaded on first use), or None if unavailable."""
+        return get_tokenizer(self.encoding)
 
     def _count_tokens(self, text: str) -> int:
         """
@@ -325,45 +443,7 @@ class MemoryRetrieval:
         Returns:
             Token count
         """
-        try:
-            return len(self.tokenizer.encode(text))
-        except Exception:
-            # Fallback: rough estimate (1 token ≈ 4 chars)
-            return len(text) // 4
-
-    def _apply_budget(
-        self,
-        memories: List[RetrievedMemory],
-        token_budget: int
-    ) -> List[RetrievedMemory]:
-        """
-        Apply token budget to retrieved memories.
-
-        Memories are already sorted by relevance (high to low).
-        Takes as many high-relevance memories as fit in budget.
-
-        Args:
-            memories: List of RetrievedMemory sorted by relevance
-            token_budget: Maximum tokens to retrieve
-
-        Returns:
-            List of memories within budget
-        """
-        if not memories:
-            return []
-
-        budgeted = []
-        total_tokens = 0
-
-        for memory in memories:
-            if total_tokens + memory.token_count <= token_budget:
-                budgeted.append(memory)
-                total_tokens += memory.token_count
-            else:
-                # Budget exhausted
-                break
-
-        return budgeted
+        return count_tokens(text, self.tokenizer)
 
     def get_stats(self) -> Dict:
         """
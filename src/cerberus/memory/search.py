@@ -6,13 +6,18 @@ FTS5-powered memory search with relevance scoring, snippet extraction, and acces
 Zero token cost (pure search, no LLM).
 """
 
+import atexit
 import sqlite3
 import json
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple, Any
 from dataclasses import dataclass
 
+from . import config as memory_config
+
 
 @dataclass
 class SearchQuery:
@@ -74,6 +79,121 @@ class SearchResult:
         }
 
 
+class AccessTracker:
+    """
+    Write-behind buffer for memory access counters.
+
+    Searches only record which memories they returned; counters are merged
+    into memory_store in one batched UPDATE when the buffer grows past
+    ``access_flush_threshold`` ids, when it is older than
+    ``access_flush_interval_seconds``, on explicit flush() and at exit.
+    Read paths therefore never take the database write lock.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        flush_threshold: Optional[int] = None,
+        flush_interval: Optional[float] = None
+    ):
+        self.db_path = db_path
+        self.flush_threshold = flush_threshold or memory_config.get("access_flush_threshold")
+        self.flush_interval = flush_interval or memory_config.get("access_flush_interval_seconds")
+        self._pending: Dict[str, Tuple[int, str]] = {}  # id -> (count, last_accessed)
+        self._oldest: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def record(self, memory_ids: List[str]) -> None:
+        """Buffer one access for each memory id."""
+        if not memory_ids:
+            return
+
+        now = datetime.now().isoformat()
+        with self._lock:
+            for memory_id in memory_ids:
+                count, _ = self._pending.get(memory_id, (0, now))
+                self._pending[memory_id] = (count + 1, now)
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            due = (
+                len(self._pending) >= self.flush_threshold
+                or time.monotonic() - self._oldest >= self.flush_interval
+            )
+
+        if due:
+            self.flush()
+
+    def pending(self) -> int:
+        """Number of memories with buffered accesses."""
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        """
+        Write buffered accesses in a single transaction.
+
+        If the database is busy the accesses stay buffered for the next flush.
+
+        Returns:
+            Number of memories updated
+        """
+        with self._lock:
+            if not self._pending:
+                return 0
+            pending, self._pending = self._pending, {}
+            self._oldest = None
+
+        try:
+            conn = sqlite3.connect(str(self.db_path))
+            try:
+                conn.executemany("""
+                    UPDATE memory_store
+                    SET last_accessed = ?,
+                        access_count = access_count + ?
+                    WHERE id = ?
+                """, [(last, count, memory_id) for memory_id, (count, last) in pending.items()])
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            self._requeue(pending)
+            return 0
+
+        return len(pending)
+
+    def _requeue(self, pending: Dict[str, Tuple[int, str]]) -> None:
+        """Merge accesses from a failed flush back into the buffer."""
+        with self._lock:
+            for memory_id, (count, last) in pending.items():
+                newer_count, newer_last = self._pending.get(memory_id, (0, last))
+                self._pending[memory_id] = (count + newer_count, max(last, newer_last))
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+
+
+_access_trackers: Dict[str, AccessTracker] = {}
+_access_trackers_lock = threading.Lock()
+
+
+def get_access_tracker(db_path: Path) -> AccessTracker:
+    """Get the process-wide access tracker for a memory database."""
+    key = str(Path(db_path).resolve())
+    with _access_trackers_lock:
+        tracker = _access_trackers.get(key)
+        if tracker is None:
+            tracker = _access_trackers[key] = AccessTracker(Path(db_path))
+        return tracker
+
+
+@atexit.register
+def flush_access_trackers() -> None:
+    """Flush buffered accesses of every tracker (also runs at exit)."""
+    with _access_trackers_lock:
+        trackers = list(_access_trackers.values())
+    for tracker in trackers:
+        tracker.flush()
+
+
 class MemorySearchEngine:
     """
     FTS5-powered memory search.
@@ -83,11 +203,12 @@ class MemorySearchEngine:
     - Scope/category/confidence filtering
     - Relevance scoring from FTS5 rank
     - Snippet extraction showing match context
-    - Access tracking (last_accessed, access_count)
+    - Access tracking (last_accessed, access_count), buffered write-behind
     """
 
     def __init__(self, db_path: Path):
         self.db_path = db_path
+        self.access_tracker = get_access_tracker(db_path)
 
     def search(self, query: SearchQuery) -> List[SearchResult]:
         """
@@ -312,26 +433,18 @@ class MemorySearchEngine:
 
     def _update_access(self, memory_ids: List[str]):
         """
-        Update last_accessed and access_count for retrieved memories.
+        Record access (last_accessed, access_count) for retrieved memories.
+
+        Buffered in the access tracker; see AccessTracker for when it is written.
 
         Args:
             memory_ids: List of memory IDs to update
         """
-        if not memory_ids:
-            return
-
-        conn = sqlite3.connect(str(self.db_path))
-
-        for memory_id in memory_ids:
-            conn.execute("""
-                UPDATE memory_store
-                SET last_accessed = ?,
-                    access_count = access_count + 1
-                WHERE id = ?
-            """, (datetime.now().isoformat(), memory_id))
+        self.access_tracker.record(memory_ids)
 
-        conn.commit()
-        conn.close()
+    def flush_access(self) -> int:
+        """Write buffered access counters now. Returns memories updated."""
+        return self.access_tracker.flush()
 
 
 class BudgetAwareSearch:
@@ -7,12 +7,22 @@ Target: 60%+ compression ratio (10 corrections → 4 clusters).
 Zero token cost - local TF-IDF computation, no model downloads.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.preprocessing import normalize
+
+
+# Rows per block when computing sparse similarity graphs
+SIMILARITY_BLOCK_SIZE = 1024
+
+# Hashed vectors kept for pairwise similarity() calls
+HASHED_VECTOR_CACHE_SIZE = 4096
 
 
 @dataclass
@@ -65,6 +75,10 @@ class SimilarityEngine:
 
     Lightweight: ~1MB dependency, no model downloads.
     Good for short correction phrases (5-15 words).
+
+    Batch operations fit one vocabulary for the whole batch. Pairwise
+    similarity() uses hashed n-gram vectors instead, which need no fitting
+    and are cached per text.
     """
 
     def __init__(self):
@@ -80,11 +94,56 @@ class SimilarityEngine:
             # Use sublinear TF scaling for better normalization
             sublinear_tf=True
         )
+        # Same n-grams without a vocabulary (TF only, normalized below)
+        self.hasher = HashingVectorizer(
+            lowercase=True,
+            analyzer='char',
+            ngram_range=(3, 5),
+            n_features=2 ** 18,
+            alternate_sign=False,
+            norm=None
+        )
+        self._hashed: "OrderedDict[str, sparse.csr_matrix]" = OrderedDict()
+
+    def vectorize(self, texts: List[str]) -> sparse.csr_matrix:
+        """
+        Fit one vocabulary on the batch and return L2-normalized TF-IDF rows.
+
+        Raises:
+            ValueError: If no text yields any n-gram
+        """
+        return self.vectorizer.fit_transform(texts).tocsr()
+
+    def hashed_vectors(self, texts: List[str]) -> sparse.csr_matrix:
+        """
+        Hashed, L2-normalized sublinear-TF vectors for texts (cached per text).
+
+        Args:
+            texts: List of text strings
+
+        Returns:
+            Sparse matrix with one row per text
+        """
+        missing = list(dict.fromkeys(t for t in texts if t not in self._hashed))
+        if missing:
+            counts = self.hasher.transform(missing).tocsr()
+            counts.data = 1.0 + np.log(counts.data)
+            for text, row in zip(missing, normalize(counts)):
+                self._hashed[text] = row
+        for text in texts:
+            self._hashed.move_to_end(text)
+
+        rows = sparse.vstack([self._hashed[text] for text in texts]).tocsr()
+        while len(self._hashed) > HASHED_VECTOR_CACHE_SIZE:
+            self._hashed.popitem(last=False)
+        return rows
 
     def compute_similarity_matrix(self, texts: List[str]) -> np.ndarray:
         """
         Compute pairwise cosine similarity between texts.
 
+        Dense n x n - prefer similarity_graph() for large batches.
+
         Args:
             texts: List of text strings
 
@@ -95,13 +154,57 @@ class SimilarityEngine:
             return np.array([[1.0]])
 
         # Fit and transform texts to TF-IDF vectors
-        tfidf_matrix = self.vectorizer.fit_transform(texts)
+        tfidf_matrix = self.vectorize(texts)
 
         # Compute cosine similarity
         similarity_matrix = cosine_similarity(tfidf_matrix)
 
         return similarity_matrix
 
+    def similarity_graph(
+        self,
+        texts: List[str],
+        threshold: float,
+        block_size: int = SIMILARITY_BLOCK_SIZE
+    ) -> sparse.csr_matrix:
+        """
+        Sparse matrix of text pairs (i < j) with similarity above threshold.
+
+        Similarities are computed in row blocks against one TF-IDF fit, so
+        memory stays proportional to the number of similar pairs.
+
+        Args:
+            texts: List of text strings
+            threshold: Keep pairs with similarity strictly above this
+            block_size: Rows per block
+
+        Returns:
+            Upper-triangular n x n sparse matrix of similarities
+        """
+        n = len(texts)
+        if n < 2:
+            return sparse.csr_matrix((n, n))
+
+        try:
+            vectors = self.vectorize(texts)
+        except ValueError:
+            # No n-grams at all (only very short texts) - nothing is similar
+            return sparse.csr_matrix((n, n))
+
+        rows, cols, values = [], [], []
+        for start in range(0, n, block_size):
+            block = (vectors[start:start + block_size] @ vectors.T).tocoo()
+            row = block.row + start
+            keep = (block.col > row) & (block.data > threshold)
+            rows.append(row[keep])
+            cols.append(block.col[keep])
+            values.append(block.data[keep])
+
+        return sparse.csr_matrix(
+            (np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(n, n)
+        )
+
     def similarity(self, text1: str, text2: str) -> float:
         """
         Compute similarity between two texts.
@@ -113,8 +216,8 @@ class SimilarityEngine:
         Returns:
             Similarity score (0.0-1.0)
         """
-        matrix = self.compute_similarity_matrix([text1, text2])
-        return float(matrix[0, 1])
+        vectors = self.hashed_vectors([text1, text2])
+        return float(vectors[0].multiply(vectors[1]).sum())
 
 
 class CanonicalExtractor:
@@ -292,11 +395,13 @@ class SemanticAnalyzer:
         # Extract messages
         messages = [c.user_message for c in candidates]
 
-        # Compute similarity matrix
-        similarity_matrix = self.similarity_engine.compute_similarity_matrix(messages)
+        # Sparse graph of sufficiently similar pairs
+        similarity_graph = self.similarity_engine.similarity_graph(
+            messages, self.similarity_threshold
+        )
 
         # Cluster using threshold-based grouping
-        cluster_indices = self._threshold_clustering(similarity_matrix)
+        cluster_indices = self._threshold_clustering(similarity_graph)
 
         # Extract canonical form for each cluster
         canonical_clusters = [
@@ -318,20 +423,29 @@ class SemanticAnalyzer:
             compression_ratio=compression_ratio
         )
 
-    def _threshold_clustering(self, similarity_matrix: np.ndarray) -> List[List[int]]:
+    def _threshold_clustering(
+        self,
+        similarity: Union[np.ndarray, sparse.spmatrix]
+    ) -> List[List[int]]:
         """
         Cluster indices where similarity > threshold.
 
-        Uses greedy clustering: each item joins the first cluster
-        where similarity exceeds threshold.
+        Uses greedy clustering: each unvisited item starts a cluster and
+        takes every later unvisited item similar to it. Only the sparse
+        neighbor lists are walked, never the full n x n matrix.
 
         Args:
-            similarity_matrix: Pairwise similarity matrix (n x n)
+            similarity: Pairwise similarities (n x n), dense or sparse
 
         Returns:
             List of clusters, where each cluster is a list of indices
         """
-        n = similarity_matrix.shape[0]
+        n = similarity.shape[0]
+        graph = sparse.triu(sparse.csr_matrix(similarity), k=1).tocsr()
+        graph.data = (graph.data > self.similarity_threshold).astype(np.int8)
+        graph.eliminate_zeros()
+        graph.sort_indices()
+
         visited = [False] * n
         clusters = []
 
@@ -343,9 +457,9 @@ class SemanticAnalyzer:
             cluster = [i]
             visited[i] = True
 
-            # Find all similar messages
-            for j in range(i + 1, n):
-                if not visited[j] and similarity_matrix[i, j] > self.similarity_threshold:
+            # Take all similar messages not claimed yet
+            for j in graph.indices[graph.indptr[i]:graph.indptr[i + 1]].tolist():
+                if not visited[j]:
                     cluster.append(j)
                     visited[j] = True
 
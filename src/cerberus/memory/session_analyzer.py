@@ -7,13 +7,16 @@ Uses 4 detection patterns: direct negation, repetition, post-action, multi-turn.
 Zero token cost - pure regex and keyword matching.
 """
 
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 import json
 import os
 import re
+import sqlite3
 
 
 @dataclass
@@ -37,6 +40,18 @@ class CorrectionCandidate:
             "context": self.context_before
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "CorrectionCandidate":
+        """Create from a dictionary produced by to_dict()."""
+        return cls(
+            turn_number=data["turn"],
+            user_message=data["user_message"],
+            ai_response=data["ai_response"],
+            correction_type=data["correction_type"],
+            confidence=data["confidence"],
+            context_before=list(data.get("context", []))
+        )
+
 
 @dataclass
 class SessionCorrections:
@@ -75,6 +90,10 @@ class SessionAnalyzer:
         self.conversation_buffer: List[Tuple[str, str]] = []  # (role, message)
         self.candidates: List[CorrectionCandidate] = []
 
+        # Keyword -> buffer positions of user messages (see _find_similar_messages)
+        self._keyword_index: Dict[str, List[int]] = {}
+        self._indexed_upto = 0
+
         # Detection patterns
         self.negation_words = {
             "don't", "dont", "never", "stop", "avoid", "not",
@@ -449,41 +468,52 @@ class SessionAnalyzer:
 
         Simple Jaccard similarity for Phase 1.
         Phase 2 will use TF-IDF for better semantic matching.
+        Only messages sharing a keyword (found via an inverted index over
+        the conversation buffer) are compared.
         """
         similar = []
 
-        # Extract keywords (words > 3 chars, excluding common words)
-        stop_words = {"this", "that", "with", "from", "have", "been", "were", "will"}
-        keywords = set(
-            word.lower() for word in msg.split()
-            if len(word) > 3 and word.lower() not in stop_words
-        )
+        keywords = _message_keywords(msg)
 
         if not keywords:
             return similar
 
         # Check previous user messages (skip last 2 entries which are current turn)
-        for role, prev_msg in self.conversation_buffer[:-2]:
-            if role == "user":
-                prev_keywords = set(
-                    word.lower() for word in prev_msg.split()
-                    if len(word) > 3 and word.lower() not in stop_words
-                )
+        history = len(self.conversation_buffer) - 2
+        self._sync_keyword_index(history)
 
-                if not prev_keywords:
-                    continue
+        positions = set()
+        for keyword in keywords:
+            positions.update(self._keyword_index.get(keyword, ()))
 
-                # Jaccard similarity
-                union = keywords | prev_keywords
-                if len(union) == 0:
-                    continue
+        for position in sorted(positions):
+            if position >= history:
+                continue
+            prev_msg = self.conversation_buffer[position][1]
+            prev_keywords = _message_keywords(prev_msg)
 
-                overlap = len(keywords & prev_keywords) / len(union)
-                if overlap > threshold:
-                    similar.append(prev_msg)
+            # Jaccard similarity
+            shared = len(keywords & prev_keywords)
+            overlap = shared / (len(keywords) + len(prev_keywords) - shared)
+            if overlap > threshold:
+                similar.append(prev_msg)
 
         return similar
 
+    def _sync_keyword_index(self, upto: int) -> None:
+        """Index keywords of user messages in conversation_buffer[:upto]."""
+        if upto < self._indexed_upto:
+            # Buffer was cleared or replaced - start over
+            self._keyword_index = {}
+            self._indexed_upto = 0
+
+        for position in range(self._indexed_upto, max(upto, 0)):
+            role, message = self.conversation_buffer[position]
+            if role == "user":
+                for keyword in _message_keywords(message):
+                    self._keyword_index.setdefault(keyword, []).append(position)
+        self._indexed_upto = max(upto, self._indexed_upto)
+
     def _ai_took_action(self, ai_msg: str) -> bool:
         """Check if AI response indicates an action was taken."""
         action_markers = [
@@ -543,6 +573,8 @@ class SessionAnalyzer:
         """Clear session state (call at session end)."""
         self.conversation_buffer.clear()
         self.candidates.clear()
+        self._keyword_index = {}
+        self._indexed_upto = 0
 
     def get_candidates(self) -> List[CorrectionCandidate]:
         """
@@ -559,6 +591,18 @@ class SessionAnalyzer:
 
 # Module-level convenience functions
 
+_SIMILARITY_STOP_WORDS = frozenset({"this", "that", "with", "from", "have", "been", "were", "will"})
+
+
+@lru_cache(maxsize=16384)
+def _message_keywords(msg: str) -> frozenset:
+    """Keywords (words > 3 chars, excluding common words) of a user message."""
+    return frozenset(
+        word.lower() for word in msg.split()
+        if len(word) > 3 and word.lower() not in _SIMILARITY_STOP_WORDS
+    )
+
+
 def analyze_conversation(
     conversation: List[Tuple[str, str]],
     session_id: str,
@@ -632,75 +676,455 @@ def create_test_scenarios() -> List[Tuple[str, str, Optional[str]]]:
 # Transcript Parsing (Session End Analysis)
 # ============================================================================
 
-def parse_claude_code_transcript(transcript_path: Path) -> List[Tuple[str, str]]:
+# Bump when the checkpointed state layout changes so old checkpoints are ignored
+TRANSCRIPT_STATE_VERSION = 3
+
+# Tool parameters the session extractors use; everything else (file contents,
+# diffs) is dropped when tool calls are read back
+TOOL_PARAM_KEYS = ("file_path", "command", "notebook_path")
+
+# Checkpoints not updated for this long, or beyond the newest N, are pruned
+TRANSCRIPT_CHECKPOINT_MAX_AGE_DAYS = 30
+TRANSCRIPT_CHECKPOINT_LIMIT = 200
+
+# Transcript states a reader keeps in memory (least recently read are evicted)
+TRANSCRIPT_STATE_CACHE_SIZE = 16
+
+# Repetition detection compares against user messages of the last 1-2 windows
+# of turns; older keyword index entries are dropped so the checkpoint stays small
+TRANSCRIPT_KEYWORD_WINDOW = 200
+
+# Conversation buffer entries held in memory (detectors look back at most 8)
+TRANSCRIPT_RECENT_ENTRIES = 16
+
+
+def _parse_entry(
+    entry: Any,
+    tool_param_keys: Optional[Tuple[str, ...]] = TOOL_PARAM_KEYS
+) -> Tuple[Optional[str], Optional[str], List[Dict[str, Any]]]:
     """
-    Parse Claude Code transcript JSONL file for user/assistant messages.
+    Extract (role, text, tool calls) from one transcript entry.
+
+    Role is None for entries that are not user/assistant messages; text is
+    None for messages without text blocks.
+    """
+    # Claude Code format: {"message": {"role": ..., "content": ...}}
+    message = entry.get('message') if isinstance(entry, dict) else None
+    if not message or not isinstance(message, dict):
+        return None, None, []
+
+    role = message.get('role')
+    if role not in ('user', 'assistant'):
+        return None, None, []
+
+    content = message.get('content', [])
+    tool_calls = []
+    if isinstance(content, str):
+        # Simple user messages
+        text = content
+    elif isinstance(content, list):
+        # Assistant messages with tool use, thinking, etc
+        text_parts = []
+        for block in content:
+            if not isinstance(block, dict):
+                continue
+            if block.get('type') == 'text':
+                text_parts.append(block.get('text', ''))
+            elif block.get('type') == 'tool_use' and role == 'assistant':
+                params = block.get('input', {})
+                if tool_param_keys is not None and isinstance(params, dict):
+                    params = {k: v for k, v in params.items() if k in tool_param_keys}
+                tool_calls.append({
+                    'tool': block.get('name', ''),
+                    'params': params
+                })
+        text = '\n'.join(text_parts) if text_parts else None
+    else:
+        text = None
+
+    return role, text, tool_calls
+
+
+@dataclass
+class TranscriptState:
+    """
+    Where reading a transcript stopped, and what was derived from it so far.
+
+    ``update()`` reads only the lines appended since ``offset`` and feeds
+    each entry to every detector in one pass: user/assistant pairing,
+    correction detection and the work-summary digest behind
+    ``extract_session_codes()`` / ``extract_session_details()``. The state
+    keeps byte offsets of turns and tool calls rather than their text;
+    ``conversations`` and ``tool_calls`` read the text back on access.
+    """
+    path: str
+    offset: int = 0
+    inode: int = 0
+    turn_offsets: List[Tuple[int, int]] = field(default_factory=list)  # (user, assistant) entries
+    tool_call_offsets: List[int] = field(default_factory=list)
+    pending_user: Optional[int] = None  # Offset of a user entry still waiting for a reply
+    analyzed_turns: int = 0
+    candidates: List[CorrectionCandidate] = field(default_factory=list)
+    keyword_index: Dict[str, List[int]] = field(default_factory=dict)  # See SessionAnalyzer
+    indexed_upto: int = 0
+    digest: "_SessionDigest" = field(default_factory=lambda: _SessionDigest())
+    tool_param_keys: Optional[Tuple[str, ...]] = TOOL_PARAM_KEYS  # None keeps all
+    run_detectors: bool = True  # False only pairs turns and records tool calls
+
+    def __post_init__(self):
+        self._pending_text: Optional[str] = None
+        self._analyzer: Optional[SessionAnalyzer] = None
+
+    def update(self) -> int:
+        """
+        Read entries appended to the transcript since the last update.
+
+        A trailing line without newline is only consumed if it is complete
+        JSON, so a line being written concurrently is picked up next time.
+
+        Returns:
+            Number of bytes consumed
+        """
+        start = self.offset
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(self.offset)
+                for raw in f:
+                    try:
+                        entry = json.loads(raw)
+                    except ValueError:
+                        if not raw.endswith(b'\n'):
+                            break
+                        entry = None
+                    position = self.offset
+                    self.offset += len(raw)
+                    if isinstance(entry, dict):
+                        self.feed(entry, position)
+        except FileNotFoundError:
+            pass
+        return self.offset - start
+
+    def feed(self, entry: dict, position: int) -> None:
+        """Process one transcript entry, found at byte ``position``."""
+        role, text, tool_calls = _parse_entry(entry, self.tool_param_keys)
+        if tool_calls:
+            self.tool_call_offsets.append(position)
+            if self.run_detectors:
+                for call in tool_calls:
+                    self.digest.add_tool_call(call)
+
+        if text is None:
+            return
+
+        # Pair each user message with the next assistant message; further
+        # user messages before that reply are dropped
+        if role == 'user':
+            if self.pending_user is None:
+                self.pending_user = position
+                self._pending_text = text
+        elif self.pending_user is not None:
+            user_msg = self._pending_text
+            if user_msg is None:
+                # Pending since the checkpoint was loaded - read it back
+                user_msg = _parse_entry(self._read_entries([self.pending_user]).get(self.pending_user))[1] or ''
+            self.turn_offsets.append((self.pending_user, position))
+            self.pending_user = None
+            self._pending_text = None
+            if self.run_detectors:
+                self._detect(user_msg, text)
+
+    def _detect(self, user_msg: str, ai_response: str) -> None:
+        """Run correction detection and the session digest over a new turn."""
+        analyzer = self._analyzer
+        if analyzer is None:
+            analyzer = self._analyzer = SessionAnalyzer()
+            analyzer.conversation_buffer = _TranscriptBuffer(self)
+            analyzer.candidates = self.candidates
+            analyzer._keyword_index = self.keyword_index
+            analyzer._indexed_upto = self.indexed_upto
+
+        analyzer.analyze_turn(user_msg, ai_response)
+        self.analyzed_turns += 1
+
+        if self.analyzed_turns % TRANSCRIPT_KEYWORD_WINDOW == 0:
+            oldest = 2 * (self.analyzed_turns - TRANSCRIPT_KEYWORD_WINDOW)
+            pruned = {}
+            for keyword, positions in analyzer._keyword_index.items():
+                recent = [p for p in positions if p >= oldest]
+                if recent:
+                    pruned[keyword] = recent
+            analyzer._keyword_index = pruned
+        self.keyword_index = analyzer._keyword_index
+        self.indexed_upto = analyzer._indexed_upto
+
+        self.digest.add_turn(user_msg, ai_response)
+
+    def _read_entries(self, positions: List[int]) -> Dict[int, Any]:
+        """Parse the transcript entries starting at the given byte offsets."""
+        entries: Dict[int, Any] = {}
+        try:
+            with open(self.path, 'rb') as f:
+                for position in sorted(set(positions)):
+                    f.seek(position)
+                    try:
+                        entries[position] = json.loads(f.readline())
+                    except ValueError:
+                        entries[position] = None
+        except OSError:
+            pass
+        return entries
+
+    def _read_turns(self, turn_offsets: List[Tuple[int, int]]) -> List[Tuple[str, str]]:
+        """Read the (user, assistant) text of turns back from the transcript."""
+        entries = self._read_entries([position for turn in turn_offsets for position in turn])
+        return [
+            (
+                _parse_entry(entries.get(user))[1] or '',
+                _parse_entry(entries.get(assistant))[1] or '',
+            )
+            for user, assistant in turn_offsets
+        ]
+
+    @property
+    def conversations(self) -> List[Tuple[str, str]]:
+        """All (user, assistant) message pairs, read from the transcript."""
+        return self._read_turns(self.turn_offsets)
+
+    @property
+    def tool_calls(self) -> List[Dict[str, Any]]:
+        """All tool calls, read from the transcript."""
+        entries = self._read_entries(self.tool_call_offsets)
+        return [
+            call
+            for position in self.tool_call_offsets
+            for call in _parse_entry(entries.get(position), self.tool_param_keys)[2]
+        ]
+
+    def analyze(self) -> List[CorrectionCandidate]:
+        """
+        Correction candidates detected in the session so far.
+
+        Turns are analyzed as ``update()`` reads them; earlier turns are only
+        read back from the transcript where a detector looks at them.
+        """
+        return self.candidates
+
+    def to_json(self) -> str:
+        """Serialize for the checkpoint table."""
+        return json.dumps({
+            "version": TRANSCRIPT_STATE_VERSION,
+            "offset": self.offset,
+            "inode": self.inode,
+            "turn_offsets": self.turn_offsets,
+            "tool_call_offsets": self.tool_call_offsets,
+            "pending_user": self.pending_user,
+            "analyzed_turns": self.analyzed_turns,
+            "candidates": [c.to_dict() for c in self.candidates],
+            "keyword_index": self.keyword_index,
+            "indexed_upto": self.indexed_upto,
+            "digest": asdict(self.digest),
+        })
+
+    @classmethod
+    def from_json(cls, path: str, data: str) -> Optional["TranscriptState"]:
+        """Restore from the checkpoint table (None if unusable)."""
+        try:
+            raw = json.loads(data)
+            if raw.get("version") != TRANSCRIPT_STATE_VERSION:
+                return None
+            return cls(
+                path=path,
+                offset=raw["offset"],
+                inode=raw["inode"],
+                turn_offsets=[tuple(pair) for pair in raw["turn_offsets"]],
+                tool_call_offsets=raw["tool_call_offsets"],
+                pending_user=raw["pending_user"],
+                analyzed_turns=raw["analyzed_turns"],
+                candidates=[CorrectionCandidate.from_dict(c) for c in raw["candidates"]],
+                keyword_index=raw["keyword_index"],
+                indexed_upto=raw["indexed_upto"],
+                digest=_SessionDigest(**raw["digest"]),
+            )
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+
+class _TranscriptBuffer:
+    """
+    SessionAnalyzer.conversation_buffer backed by the transcript.
+
+    Only the most recent entries are held; earlier ones are read back (via
+    the turn offsets) when a detector looks at them.
+    """
+
+    def __init__(self, state: TranscriptState):
+        self._state = state
+        self._length = state.analyzed_turns * 2
+        self._recent: "OrderedDict[int, Tuple[str, str]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> Tuple[str, str]:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+
+        entry = self._recent.get(index)
+        if entry is None:
+            user_msg, ai_response = self._state._read_turns([self._state.turn_offsets[index // 2]])[0]
+            entry = ("user", user_msg) if index % 2 == 0 else ("assistant", ai_response)
+        return entry
+
+    def append(self, item: Tuple[str, str]) -> None:
+        self._recent[self._length] = item
+        self._length += 1
+        while len(self._recent) > TRANSCRIPT_RECENT_ENTRIES:
+            self._recent.popitem(last=False)
+
+
+class TranscriptReader:
+    """
+    Incremental transcript reader with checkpoints in memory.db.
+
+    Each read resumes at the byte offset stored for the transcript, so
+    mid-session calls only parse lines written since the previous call. The
+    checkpoint is discarded when the file is replaced (new inode) or shrinks.
+    Checkpoints hold offsets and derived state only (see TranscriptState).
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, cache_size: int = TRANSCRIPT_STATE_CACHE_SIZE):
+        """
+        Args:
+            db_path: Checkpoint database (default: ~/.cerberus/memory.db)
+            cache_size: Transcript states kept in memory between reads
+        """
+        self.db_path = Path(db_path) if db_path else Path.home() / ".cerberus" / "memory.db"
+        self.cache_size = cache_size
+        self._states: "OrderedDict[str, TranscriptState]" = OrderedDict()
+
+    def read(self, transcript_path: Path) -> TranscriptState:
+        """
+        Bring the state for a transcript up to date.
+
+        Args:
+            transcript_path: Path to .jsonl transcript file
+
+        Returns:
+            TranscriptState covering the whole transcript
+        """
+        path = str(Path(transcript_path).resolve())
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return TranscriptState(path=path)
+
+        state = self._states.get(path) or self._load(path)
+        if state is None or state.inode != stat.st_ino or state.offset > stat.st_size:
+            state = TranscriptState(path=path, inode=stat.st_ino)
+
+        if state.offset < stat.st_size and state.update():
+            self._save(state)
+
+        self._states[path] = state
+        self._states.move_to_end(path)
+        while len(self._states) > self.cache_size:
+            self._states.popitem(last=False)
+        return state
+
+    def _connect(self) -> sqlite3.Connection:
+        from cerberus.memory.indexing import TRANSCRIPT_CHECKPOINTS_SCHEMA_SQL
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path))
+        conn.execute(TRANSCRIPT_CHECKPOINTS_SCHEMA_SQL)
+        return conn
+
+    def _load(self, path: str) -> Optional[TranscriptState]:
+        """Load the stored checkpoint for a transcript."""
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT state FROM transcript_checkpoints WHERE transcript_path = ?",
+                    (path,)
+                ).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return None
+        return TranscriptState.from_json(path, row[0]) if row else None
+
+    def _save(self, state: TranscriptState) -> None:
+        """
+        Store the checkpoint and prune stale ones (best effort - a lost
+        checkpoint means a re-read).
+        """
+        try:
+            conn = self._connect()
+            try:
+                conn.execute("""
+                    INSERT INTO transcript_checkpoints (transcript_path, state, updated_at)
+                    VALUES (?, ?, CURRENT_TIMESTAMP)
+                    ON CONFLICT(transcript_path) DO UPDATE SET
+                        state = excluded.state,
+                        updated_at = excluded.updated_at
+                """, (state.path, state.to_json()))
+                conn.execute(
+                    "DELETE FROM transcript_checkpoints WHERE updated_at < datetime('now', ?)",
+                    (f"-{TRANSCRIPT_CHECKPOINT_MAX_AGE_DAYS} days",)
+                )
+                # Keep this checkpoint plus the newest others, up to the limit
+                conn.execute("""
+                    DELETE FROM transcript_checkpoints
+                    WHERE transcript_path != :path AND transcript_path NOT IN (
+                        SELECT transcript_path FROM transcript_checkpoints
+                        WHERE transcript_path != :path
+                        ORDER BY updated_at DESC, rowid DESC LIMIT :keep
+                    )
+                """, {"path": state.path, "keep": max(TRANSCRIPT_CHECKPOINT_LIMIT - 1, 0)})
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass
+
+
+_transcript_readers: Dict[str, TranscriptReader] = {}
+
+
+def read_transcript(transcript_path: Path, db_path: Optional[Path] = None) -> TranscriptState:
+    """
+    Read a transcript incrementally, resuming from its stored checkpoint.
 
     Args:
         transcript_path: Path to .jsonl transcript file
+        db_path: Checkpoint database (default: ~/.cerberus/memory.db)
 
     Returns:
-        List of (user_msg, assistant_msg) tuples
+        Up-to-date TranscriptState
     """
-    messages = []
+    db_path = Path(db_path) if db_path else Path.home() / ".cerberus" / "memory.db"
+    reader = _transcript_readers.get(str(db_path))
+    if reader is None:
+        reader = _transcript_readers[str(db_path)] = TranscriptReader(db_path)
+    return reader.read(transcript_path)
 
-    try:
-        with open(transcript_path, 'r') as f:
-            for line in f:
-                try:
-                    entry = json.loads(line)
-
-                    # Check if entry has a message field (Claude Code format)
-                    message = entry.get('message')
-                    if not message:
-                        continue
-
-                    role = message.get('role')
-                    if role not in ('user', 'assistant'):
-                        continue
-
-                    content = message.get('content', [])
-
-                    # Handle string content (simple user messages)
-                    if isinstance(content, str):
-                        messages.append((role, content))
-                        continue
-
-                    # Handle array content (assistant messages with tool use, thinking, etc)
-                    text_parts = []
-                    for block in content:
-                        if isinstance(block, dict) and block.get('type') == 'text':
-                            text_parts.append(block.get('text', ''))
-
-                    if text_parts:
-                        message_text = '\n'.join(text_parts)
-                        messages.append((role, message_text))
-
-                except json.JSONDecodeError:
-                    continue
-    except FileNotFoundError:
-        return []
 
-    # Pair user messages with following assistant messages
-    conversations = []
-    i = 0
-    while i < len(messages):
-        role, text = messages[i]
-        if role == 'user':
-            # Look for next assistant message
-            for j in range(i + 1, len(messages)):
-                next_role, next_text = messages[j]
-                if next_role == 'assistant':
-                    conversations.append((text, next_text))
-                    i = j + 1
-                    break
-            else:
-                # No assistant response found
-                i += 1
-        else:
-            i += 1
+def parse_claude_code_transcript(transcript_path: Path) -> List[Tuple[str, str]]:
+    """
+    Parse Claude Code transcript JSONL file for user/assistant messages.
 
-    return conversations
+    Args:
+        transcript_path: Path to .jsonl transcript file
+
+    Returns:
+        List of (user_msg, assistant_msg) tuples
+    """
+    state = TranscriptState(path=str(transcript_path), run_detectors=False)
+    state.update()
+    return state.conversations
 
 
 def find_current_transcript() -> Optional[Path]:
@@ -737,7 +1161,8 @@ def analyze_session_from_transcript() -> List[CorrectionCandidate]:
     Analyze current session from transcript at session end.
 
     This is called by propose_hook() to detect corrections from the
-    conversation history.
+    conversation history. Only turns added since the last call are analyzed;
+    candidates from earlier turns come from the transcript checkpoint.
 
     Returns:
         List of detected CorrectionCandidate objects
@@ -747,20 +1172,12 @@ def analyze_session_from_transcript() -> List[CorrectionCandidate]:
     if not transcript:
         return []
 
-    # Parse conversations
-    conversations = parse_claude_code_transcript(transcript)
-    if not conversations:
-        return []
-
-    # Replay through analyzer
-    analyzer = SessionAnalyzer()
-    for user_msg, ai_response in conversations:
-        analyzer.analyze_turn(user_msg, ai_response)
+    candidates = read_transcript(transcript).analyze()
 
     # Deduplicate by turn number and message content
     seen = set()
     unique_candidates = []
-    for candidate in analyzer.candidates:
+    for candidate in candidates:
         key = (candidate.turn_number, candidate.user_message[:100])
         if key not in seen:
             seen.add(key)
@@ -780,572 +1197,565 @@ def extract_tool_calls_from_transcript(transcript_path: Path) -> List[Dict[str,
     Returns:
         List of {tool: str, params: dict} dicts
     """
-    tool_calls = []
+    state = TranscriptState(path=str(transcript_path), tool_param_keys=None, run_detectors=False)
+    state.update()
+    return state.tool_calls
 
-    try:
-        with open(transcript_path, 'r') as f:
-            for line in f:
-                try:
-                    entry = json.loads(line)
-                    message = entry.get('message', {})
-                    content = message.get('content', [])
-
-                    # Look for tool_use blocks in assistant messages
-                    if message.get('role') == 'assistant':
-                        for block in content:
-                            if isinstance(block, dict) and block.get('type') == 'tool_use':
-                                tool_calls.append({
-                                    'tool': block.get('name', ''),
-                                    'params': block.get('input', {})
-                                })
-                except json.JSONDecodeError:
-                    continue
-    except FileNotFoundError:
-        pass
-
-    return tool_calls
-
-
-def extract_session_codes() -> List[str]:
-    """
-    Extract FULL session context from transcript (AI-only format).
 
-    Hierarchical codes with context:
-    - migrate:what:from-to (major work streams)
-    - impl:file:what-was-added (file modifications with context)
-    - fix:system:issue:solution (bug fixes with details)
-    - dec:decision:reason (decisions with rationale)
-    - block:what:detail (blockers with specifics)
-    - next:action:context (next steps with context)
-    - done:what:detail (completions with context)
+# Codes kept per category by the session digest - well past the 150 a summary
+# keeps, so codes dropped later as near-duplicates do not leave gaps
+SESSION_CODE_LIMIT = 500
 
-    Target: 80-120 codes = ~1000-1500 tokens (full session context)
+# Items shown per section of the session details
+SESSION_DETAIL_LIMITS = {'bugs': 8, 'investigations': 5, 'files': 10}
 
-    Strategy: Hierarchical context, no prose, AI-readable.
-    """
-    transcript = find_current_transcript()
-    if not transcript:
-        return []
+_CODE_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'this',
+    'that', 'these', 'those', 'am', 'is', 'are', 'was', 'were', 'be', 'been',
+    'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'should', 'could', 'may', 'might', 'must', 'can', 'just', 'also', 'now',
+    'so', 'then', 'very', 'too', 'i', 'you', 'we', 'me', 'us', 'my', 'our',
+    'it', 'its', 'there', 'their', 'them', 'they'
+})
+
+
+def _code_keywords(text: str, max_words: int = 6) -> str:
+    """Extract key words/phrases, remove filler and special chars."""
+    # Clean text: remove special chars, keep only alphanumeric and spaces
+    cleaned = re.sub(r'[^\w\s-]', ' ', text.lower())
+
+    words = cleaned.split()
+    keywords = [w for w in words if w not in _CODE_STOP_WORDS and len(w) > 2][:max_words]
+    return '-'.join(keywords) if keywords else ''
 
+
+def _work_stream_codes(combined: str) -> List[str]:
+    """MAJOR WORK STREAM codes for one turn (lowercased user + assistant text)."""
     codes = []
 
-    # Parse conversations first (needed for context)
-    conversations = parse_claude_code_transcript(transcript)
-
-    # Helper: Extract keywords from text (remove stop words, keep meaningful terms)
-    def extract_keywords(text: str, max_words: int = 6) -> str:
-        """Extract key words/phrases, remove filler and special chars."""
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'this',
-            'that', 'these', 'those', 'am', 'is', 'are', 'was', 'were', 'be', 'been',
-            'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-            'should', 'could', 'may', 'might', 'must', 'can', 'just', 'also', 'now',
-            'so', 'then', 'very', 'too', 'i', 'you', 'we', 'me', 'us', 'my', 'our',
-            'it', 'its', 'there', 'their', 'them', 'they'
-        }
+    # Session tracking migration (JSON to SQLite)
+    if ('session' in combined and 'sqlite' in combined) or \
+       ('session' in combined and 'json' in combined and ('remove' in combined or 'migrate' in combined)):
+        codes.append("migrate:session-tracking:json-to-sqlite")
+
+    # Search/Cerberus fix
+    if ('search' in combined or 'cerberus' in combined) and \
+       ('broken' in combined or 'failing' in combined or 'empty' in combined) and \
+       ('fts5' in combined or 'index' in combined or 'file' in combined):
+        codes.append("fix:cerberus-search:empty-results:added-filepath-fts5")
+
+    # Config system implementation
+    if 'config' in combined and 'hierarchical' in combined:
+        codes.append("implement:hierarchical-config:global-and-project")
+
+    # Session extraction implementation
+    if ('transcript' in combined and 'parsing' in combined) or \
+       ('nlp' in combined and 'extraction' in combined) or \
+       ('comprehensive' in combined and 'extraction' in combined):
+        codes.append("implement:session-extraction:transcript-nlp-codes")
+
+    return codes
+
+
+def _work_contexts(msg_text: str) -> List[str]:
+    """What work a turn (lowercased user + assistant text) is discussing."""
+    work_contexts = []
+    if 'transcript' in msg_text and 'parsing' in msg_text:
+        work_contexts.append('transcript-parsing')
+    if 'nlp' in msg_text or 'extraction' in msg_text or 'keyword' in msg_text:
+        work_contexts.append('nlp-extraction')
+    if 'quality' in msg_text and ('filter' in msg_text or 'check' in msg_text):
+        work_contexts.append('quality-filter')
+    if 'dedupe' in msg_text or 'duplicate' in msg_text:
+        work_contexts.append('deduplication')
+    if 'delete' in msg_text and 'read' in msg_text:
+        work_contexts.append('delete-on-read')
+    if 'semantic' in msg_text:
+        work_contexts.append('semantic-analysis')
+    if 'fts5' in msg_text or 'index' in msg_text:
+        work_contexts.append('fts5-index')
+    if 'config' in msg_text and ('user' in msg_text or 'hierarchical' in msg_text):
+        work_contexts.append('config-system')
+    if 'hook' in msg_text and 'session' in msg_text:
+        work_contexts.append('session-hooks')
+    if 'sqlite' in msg_text:
+        work_contexts.append('sqlite-backend')
+    if 'comprehensive' in msg_text:
+        work_contexts.append('comprehensive-extraction')
+    if 'pattern' in msg_text:
+        work_contexts.append('pattern-matching')
+    return work_contexts
+
+
+def _bash_code(cmd: str) -> Optional[str]:
+    """Completion code for a bash command, if any."""
+    cmd_lower = cmd.lower()
+    if 'pytest' in cmd_lower or 'test' in cmd_lower:
+        return "done:tests:pytest"
+    elif 'git commit' in cmd_lower:
+        return "done:git:commit"
+    elif 'git push' in cmd_lower:
+        return "done:git:push"
+    elif 'build' in cmd_lower or 'compile' in cmd_lower:
+        return "done:build"
+    return None
+
+
+# DECISIONS with context and rationale
+_DECISION_PATTERNS = [
+    # With reason/alternative
+    (r'use\s+(\w+(?:\s+\w+){0,2})\s+instead\s+of\s+(\w+(?:\s+\w+){0,2})',
+     lambda m: f"dec:use-{_code_keywords(m.group(1), 2)}:not-{_code_keywords(m.group(2), 2)}"),
+    (r'(?:removed|deleted)\s+(?:completely\s+)?after\s+(?:being\s+)?(?:read|injected)',
+     lambda m: f"dec:delete-on-read:prevent-bloat"),
+    (r"(?:make\s+sure\s+)?(?:no|there'?s\s+no)\s+more\s+(.{5,30}?)(?:\s+files?|\s+or|\.|$)",
+     lambda m: f"dec:remove-{_code_keywords(m.group(1), 2)}:cleanup"),
+    (r'(?:within|under)\s+(?:the\s+)?(\d+(?:-\d+)?k?)\s+tokens?',
+     lambda m: f"dec:token-limit:{m.group(1)}"),
+    (r'compact.*ai\s+only',
+     lambda m: f"dec:ai-only-format:no-human-prose"),
+    (r'sqlite\s+(?:for|database|backend)',
+     lambda m: f"dec:sqlite-backend:not-json"),
+    (r'needs?\s+to\s+be\s+(perfect|accurate|compact|clear)',
+     lambda m: f"dec:quality-{m.group(1)}"),
+    (r'hierarchical.*config',
+     lambda m: f"dec:hierarchical-config:global-and-project"),
+    (r'(?:config|configuration)\s+option',
+     lambda m: f"dec:add-config-option:user-control"),
+]
+
+# FIXES from assistant messages (what was fixed + how)
+_FIX_PATTERNS = [
+    (r'fixed\s+(.{10,40}?)\s+by\s+(.{10,50}?)(?:\.|$)',
+     lambda m: f"fix:{_code_keywords(m.group(1), 3)}:{_code_keywords(m.group(2), 4)}"),
+    (r'(?:search|cerberus)\s+(?:was\s+)?(?:failing|broken).*(?:added|fixed)\s+(.{10,40}?)(?:\.|$)',
+     lambda m: f"fix:search:{_code_keywords(m.group(1), 4)}"),
+]
+
+# BLOCKERS with specifics
+_BLOCKER_PATTERNS = [
+    (r'(?:session\s+)?end\s+hook.*error(?:ing)?',
+     'block:session-end-hook:erroring'),
+    (r'(?:cerberus|search)\s+(?:is\s+)?broken.*(?:search|empty|failing)',
+     'block:cerberus-search:empty-results'),
+    (r"can'?t\s+(.{10,40}?)\s+(?:because|until)\s+(.{10,40}?)(?:\.|$)",
+     lambda m: f"block:{_code_keywords(m.group(1), 3)}:needs-{_code_keywords(m.group(2), 3)}"),
+]
+
+# NEXT ACTIONS with context
+_NEXT_PATTERNS = [
+    (r'(?:we\s+)?need\s+to\s+(.{10,50}?)(?:\.|,|$)',
+     lambda m: f"next:{_code_keywords(m.group(1), 5)}"),
+    (r'figure\s+out\s+(.{10,50}?)(?:\.|$)',
+     lambda m: f"next:investigate-{_code_keywords(m.group(1), 5)}"),
+    (r'(?:run\s+through|audit)\s+(.{10,40}?)(?:\.|$)',
+     lambda m: f"next:audit-{_code_keywords(m.group(1), 4)}"),
+]
+
+# COMPLETIONS with context
+_COMPLETION_PATTERNS = [
+    (r'(?:awesome|great).*(?:now|so)\s+(.{10,40}?)\s+(?:is\s+)?(?:working|functional)',
+     lambda m: f"done:{_code_keywords(m.group(1), 3)}:working"),
+    (r'(?:so\s+)?memories\s+(?:are\s+)?working',
+     'done:memories:functional'),
+]
+
+# Completions from AI messages
+_AI_COMPLETION_PATTERNS = [
+    (r'(?:successfully\s+)?(?:implemented|migrated|fixed|removed)\s+(.{10,50}?)(?:\.|$)',
+     lambda m: f"done:{_code_keywords(m.group(1), 5)}"),
+    (r'removed\s+all\s+(.{10,40}?)(?:\s+references|\s+code|\.| $)',
+     lambda m: f"done:removed-{_code_keywords(m.group(1), 3)}"),
+]
+
+
+def _turn_codes(user_msg: str, ai_msg: str) -> List[str]:
+    """Decision, fix, blocker, next-action and completion codes for one turn."""
+    codes = []
+    if len(user_msg) < 20:
+        return codes
+
+    msg_lower = user_msg.lower()
+    ai_lower = ai_msg.lower() if ai_msg else ''
+
+    # (patterns, searched text, minimum code length)
+    for patterns, text, min_len in (
+        (_DECISION_PATTERNS, msg_lower, 11),
+        (_FIX_PATTERNS, ai_lower, 13),
+        (_BLOCKER_PATTERNS, msg_lower, 13),
+        (_NEXT_PATTERNS, msg_lower, 11),
+        (_COMPLETION_PATTERNS, msg_lower, 1),
+        (_AI_COMPLETION_PATTERNS, ai_lower, 11),
+    ):
+        for pattern, formatter in patterns:
+            match = re.search(pattern, text, re.IGNORECASE)
+            if not match:
+                continue
+            if not callable(formatter):
+                codes.append(formatter)
+                continue
+            try:
+                code = formatter(match)
+                if code and len(code) >= min_len:
+                    codes.append(code)
+            except Exception:
+                pass
 
-        # Clean text: remove special chars, keep only alphanumeric and spaces
-        cleaned = re.sub(r'[^\w\s-]', ' ', text.lower())
+    return codes
 
-        words = cleaned.split()
-        keywords = [w for w in words if w not in stop_words and len(w) > 2][:max_words]
-        return '-'.join(keywords) if keywords else ''
 
-    # 1. Extract MAJOR WORK STREAMS from conversations
-    # Look for the big picture work across multiple messages
-    major_work_found = {
-        'session_migration': False,
-        'search_fix': False,
-        'config_system': False,
-        'extraction_impl': False
-    }
+def _is_meaningful_code(code: str) -> bool:
+    """Filter out fragmented or meaningless codes."""
+    if not code or ':' not in code:
+        return False
 
-    for user_msg, ai_msg in conversations:
-        combined = (user_msg + ' ' + ai_msg).lower()
+    # Minimum length
+    if len(code) < 12:
+        return False
 
-        # Session tracking migration (JSON to SQLite)
-        if not major_work_found['session_migration']:
-            if ('session' in combined and 'sqlite' in combined) or \
-               ('session' in combined and 'json' in combined and ('remove' in combined or 'migrate' in combined)):
-                codes.append("migrate:session-tracking:json-to-sqlite")
-                major_work_found['session_migration'] = True
-
-        # Search/Cerberus fix
-        if not major_work_found['search_fix']:
-            if ('search' in combined or 'cerberus' in combined) and \
-               ('broken' in combined or 'failing' in combined or 'empty' in combined) and \
-               ('fts5' in combined or 'index' in combined or 'file' in combined):
-                codes.append("fix:cerberus-search:empty-results:added-filepath-fts5")
-                major_work_found['search_fix'] = True
-
-        # Config system implementation
-        if not major_work_found['config_system']:
-            if 'config' in combined and 'hierarchical' in combined:
-                codes.append("implement:hierarchical-config:global-and-project")
-                major_work_found['config_system'] = True
-
-        # Session extraction implementation
-        if not major_work_found['extraction_impl']:
-            if ('transcript' in combined and 'parsing' in combined) or \
-               ('nlp' in combined and 'extraction' in combined) or \
-               ('comprehensive' in combined and 'extraction' in combined):
-                codes.append("implement:session-extraction:transcript-nlp-codes")
-                major_work_found['extraction_impl'] = True
-
-    # 2. Extract tool calls WITH CONTEXT from surrounding messages
-    tool_calls = extract_tool_calls_from_transcript(transcript)
-    file_context = {}  # Maps filename -> list of contexts
-
-    # Build context map from conversations
-    for i, (user_msg, ai_msg) in enumerate(conversations):
-        msg_text = (user_msg + ' ' + ai_msg).lower()
-
-        # Extract what work is being discussed
-        work_contexts = []
-        if 'transcript' in msg_text and 'parsing' in msg_text:
-            work_contexts.append('transcript-parsing')
-        if 'nlp' in msg_text or 'extraction' in msg_text or 'keyword' in msg_text:
-            work_contexts.append('nlp-extraction')
-        if 'quality' in msg_text and ('filter' in msg_text or 'check' in msg_text):
-            work_contexts.append('quality-filter')
-        if 'dedupe' in msg_text or 'duplicate' in msg_text:
-            work_contexts.append('deduplication')
-        if 'delete' in msg_text and 'read' in msg_text:
-            work_contexts.append('delete-on-read')
-        if 'semantic' in msg_text:
-            work_contexts.append('semantic-analysis')
-        if 'fts5' in msg_text or 'index' in msg_text:
-            work_contexts.append('fts5-index')
-        if 'config' in msg_text and ('user' in msg_text or 'hierarchical' in msg_text):
-            work_contexts.append('config-system')
-        if 'hook' in msg_text and 'session' in msg_text:
-            work_contexts.append('session-hooks')
-        if 'sqlite' in msg_text:
-            work_contexts.append('sqlite-backend')
-        if 'comprehensive' in msg_text:
-            work_contexts.append('comprehensive-extraction')
-        if 'pattern' in msg_text:
-            work_contexts.append('pattern-matching')
-
-        # Map contexts to files mentioned
-        for context in work_contexts:
-            # Look for file mentions in next few tool calls
-            for j in range(max(0, i-2), min(len(tool_calls), i+3)):
-                if j < len(tool_calls):
-                    call = tool_calls[j]
-                    if call['tool'] in ('Edit', 'Write'):
-                        file_path = call['params'].get('file_path', '')
-                        if file_path:
-                            filename = Path(file_path).name
-                            if filename not in file_context:
-                                file_context[filename] = []
-                            if context not in file_context[filename]:
-                                file_context[filename].append(context)
-
-    # Generate impl: codes with context
-    files_processed = set()
-    for call in tool_calls:
-        tool = call['tool']
-        params = call['params']
-
-        if tool in ('Edit', 'Write'):
-            file_path = params.get('file_path', '')
-            if file_path:
-                filename = Path(file_path).name
-                if filename in files_processed:
-                    continue
-                files_processed.add(filename)
-
-                # Add context if we have it
-                contexts = file_context.get(filename, [])
-                if contexts:
-                    for ctx in contexts[:3]:  # Max 3 contexts per file
-                        codes.append(f"impl:{filename}:{ctx}")
-                else:
-                    # Fallback: just filename
-                    codes.append(f"impl:{filename}")
-
-    # Analyze bash commands for completions
-    bash_commands = [call['params'].get('command', '') for call in tool_calls if call['tool'] == 'Bash']
-    for cmd in bash_commands:
-        cmd_lower = cmd.lower()
-        if 'pytest' in cmd_lower or 'test' in cmd_lower:
-            codes.append("done:tests:pytest")
-        elif 'git commit' in cmd_lower:
-            codes.append("done:git:commit")
-        elif 'git push' in cmd_lower:
-            codes.append("done:git:push")
-        elif 'build' in cmd_lower or 'compile' in cmd_lower:
-            codes.append("done:build")
-
-    # 3. Extract DECISIONS with context and rationale
-    decision_patterns_contextual = [
-        # With reason/alternative
-        (r'use\s+(\w+(?:\s+\w+){0,2})\s+instead\s+of\s+(\w+(?:\s+\w+){0,2})',
-         lambda m: f"dec:use-{extract_keywords(m.group(1), 2)}:not-{extract_keywords(m.group(2), 2)}"),
-        (r'(?:removed|deleted)\s+(?:completely\s+)?after\s+(?:being\s+)?(?:read|injected)',
-         lambda m: f"dec:delete-on-read:prevent-bloat"),
-        (r"(?:make\s+sure\s+)?(?:no|there'?s\s+no)\s+more\s+(.{5,30}?)(?:\s+files?|\s+or|\.|$)",
-         lambda m: f"dec:remove-{extract_keywords(m.group(1), 2)}:cleanup"),
-        (r'(?:within|under)\s+(?:the\s+)?(\d+(?:-\d+)?k?)\s+tokens?',
-         lambda m: f"dec:token-limit:{m.group(1)}"),
-        (r'compact.*ai\s+only',
-         lambda m: f"dec:ai-only-format:no-human-prose"),
-        (r'sqlite\s+(?:for|database|backend)',
-         lambda m: f"dec:sqlite-backend:not-json"),
-        (r'needs?\s+to\s+be\s+(perfect|accurate|compact|clear)',
-         lambda m: f"dec:quality-{m.group(1)}"),
-        (r'hierarchical.*config',
-         lambda m: f"dec:hierarchical-config:global-and-project"),
-        (r'(?:config|configuration)\s+option',
-         lambda m: f"dec:add-config-option:user-control"),
+    # Filter codes with question marks (not actual actions)
+    if '?' in code:
+        return False
+
+    # Filter meaningless single-word fragments
+    meaningless_patterns = [
+        ':now:', ':then:', ':ok:', ':yes:', ':no:', ':fix:',
+        ':what:', ':this:', ':that:'
     ]
+    if any(pattern in code for pattern in meaningless_patterns):
+        return False
+
+    return True
+
 
-    for user_msg, ai_msg in conversations:
-        if len(user_msg) < 20:
+def _semantic_dedupe(codes_list: List[str]) -> List[str]:
+    """Remove semantically duplicate codes."""
+    unique = []
+    seen = set()
+
+    for code in codes_list:
+        if ':' not in code:
             continue
 
-        msg_lower = user_msg.lower()
-        ai_lower = ai_msg.lower() if ai_msg else ''
-
-        # Extract DECISIONS with context
-        for pattern, formatter in decision_patterns_contextual:
-            match = re.search(pattern, msg_lower, re.IGNORECASE)
-            if match:
-                try:
-                    code = formatter(match)
-                    if code and len(code) > 10:
-                        codes.append(code)
-                except:
-                    pass
-
-        # Extract FIXES from assistant messages (what was fixed + how)
-        fix_patterns = [
-            (r'fixed\s+(.{10,40}?)\s+by\s+(.{10,50}?)(?:\.|$)',
-             lambda m: f"fix:{extract_keywords(m.group(1), 3)}:{extract_keywords(m.group(2), 4)}"),
-            (r'(?:search|cerberus)\s+(?:was\s+)?(?:failing|broken).*(?:added|fixed)\s+(.{10,40}?)(?:\.|$)',
-             lambda m: f"fix:search:{extract_keywords(m.group(1), 4)}"),
-        ]
+        # Exact duplicate check
+        if code in seen:
+            continue
 
-        for pattern, formatter in fix_patterns:
-            match = re.search(pattern, ai_lower, re.IGNORECASE)
-            if match:
-                try:
-                    code = formatter(match)
-                    if code and len(code) > 12:
-                        codes.append(code)
-                except:
-                    pass
-
-        # Extract BLOCKERS with specifics
-        blocker_patterns_contextual = [
-            (r'(?:session\s+)?end\s+hook.*error(?:ing)?',
-             'block:session-end-hook:erroring'),
-            (r'(?:cerberus|search)\s+(?:is\s+)?broken.*(?:search|empty|failing)',
-             'block:cerberus-search:empty-results'),
-            (r"can'?t\s+(.{10,40}?)\s+(?:because|until)\s+(.{10,40}?)(?:\.|$)",
-             lambda m: f"block:{extract_keywords(m.group(1), 3)}:needs-{extract_keywords(m.group(2), 3)}"),
-        ]
+        # For hierarchical codes, check for semantic duplicates
+        # E.g., "impl:file.py:feature-a" vs "impl:file.py:feature-a" (exact)
+        # But allow "impl:file.py:feature-a" and "impl:file.py:feature-b" (different)
 
-        for pattern, formatter in blocker_patterns_contextual:
-            match = re.search(pattern, msg_lower, re.IGNORECASE)
-            if match:
-                if callable(formatter):
-                    try:
-                        code = formatter(match)
-                        if len(code) > 12:
-                            codes.append(code)
-                    except:
-                        pass
-                else:
-                    codes.append(formatter)
-
-        # Extract NEXT ACTIONS with context
-        next_patterns_contextual = [
-            (r'(?:we\s+)?need\s+to\s+(.{10,50}?)(?:\.|,|$)',
-             lambda m: f"next:{extract_keywords(m.group(1), 5)}"),
-            (r'figure\s+out\s+(.{10,50}?)(?:\.|$)',
-             lambda m: f"next:investigate-{extract_keywords(m.group(1), 5)}"),
-            (r'(?:run\s+through|audit)\s+(.{10,40}?)(?:\.|$)',
-             lambda m: f"next:audit-{extract_keywords(m.group(1), 4)}"),
-        ]
+        # Get normalized form (lowercase, collapse multiple colons)
+        normalized = code.lower().strip()
 
-        for pattern, formatter in next_patterns_contextual:
-            match = re.search(pattern, msg_lower, re.IGNORECASE)
-            if match:
-                try:
-                    code = formatter(match)
-                    if code and len(code) > 10:
-                        codes.append(code)
-                except:
-                    pass
-
-        # Extract COMPLETIONS with context
-        completion_patterns_contextual = [
-            (r'(?:awesome|great).*(?:now|so)\s+(.{10,40}?)\s+(?:is\s+)?(?:working|functional)',
-             lambda m: f"done:{extract_keywords(m.group(1), 3)}:working"),
-            (r'(?:so\s+)?memories\s+(?:are\s+)?working',
-             'done:memories:functional'),
-        ]
+        # Check if very similar code exists
+        is_duplicate = False
+        for existing in seen:
+            # If 90%+ character overlap and same category, likely duplicate
+            if existing.split(':')[0] == normalized.split(':')[0]:  # Same category
+                existing_content = ':'.join(existing.split(':')[1:])
+                current_content = ':'.join(normalized.split(':')[1:])
 
-        for pattern, formatter in completion_patterns_contextual:
-            match = re.search(pattern, msg_lower, re.IGNORECASE)
-            if match:
-                if callable(formatter):
-                    try:
-                        code = formatter(match)
-                        if code:
-                            codes.append(code)
-                    except:
-                        pass
-                else:
-                    codes.append(formatter)
-
-        # Extract completions from AI messages
-        ai_completion_patterns = [
-            (r'(?:successfully\s+)?(?:implemented|migrated|fixed|removed)\s+(.{10,50}?)(?:\.|$)',
-             lambda m: f"done:{extract_keywords(m.group(1), 5)}"),
-            (r'removed\s+all\s+(.{10,40}?)(?:\s+references|\s+code|\.| $)',
-             lambda m: f"done:removed-{extract_keywords(m.group(1), 3)}"),
-        ]
+                if existing_content and current_content:
+                    # Character-level similarity
+                    longer = max(len(existing_content), len(current_content))
 
-        for pattern, formatter in ai_completion_patterns:
-            match = re.search(pattern, ai_lower, re.IGNORECASE)
-            if match:
-                try:
-                    code = formatter(match)
-                    if code and len(code) > 10:
-                        codes.append(code)
-                except:
-                    pass
-
-    # 4. Quality filter and deduplicate
-    def is_meaningful(code: str) -> bool:
-        """Filter out fragmented or meaningless codes."""
-        if not code or ':' not in code:
-            return False
+                    # Count matching characters
+                    matches = sum(1 for a, b in zip(existing_content, current_content) if a == b)
+                    similarity = matches / longer if longer > 0 else 0
 
-        parts = code.split(':')
-        category = parts[0]
+                    if similarity > 0.85:
+                        is_duplicate = True
+                        break
 
-        # Minimum length
-        if len(code) < 12:
-            return False
+        if not is_duplicate:
+            unique.append(code)
+            seen.add(normalized)
 
-        # Filter codes with question marks (not actual actions)
-        if '?' in code:
-            return False
+    return unique
 
-        # Filter meaningless single-word fragments
-        meaningless_patterns = [
-            ':now:', ':then:', ':ok:', ':yes:', ':no:', ':fix:',
-            ':what:', ':this:', ':that:'
-        ]
-        if any(pattern in code for pattern in meaningless_patterns):
-            return False
 
-        return True
+def _clean_detail(text: str, max_len: int) -> Optional[str]:
+    """Clean a details line, or None if it is not a meaningful explanation."""
+    text = text.strip()
+    if not text or len(text) < 10:
+        return None
 
-    def semantic_dedupe(codes_list: List[str]) -> List[str]:
-        """Remove semantically duplicate codes."""
-        unique = []
-        seen = set()
+    # Remove markdown and special chars
+    text = re.sub(r'[*_#`]', '', text)
+    text = re.sub(r'\s+', ' ', text)
+    text = text[:max_len]
+
+    # Filter out code-like patterns after cleaning (word:word:word)
+    # These are semantic codes, not explanations
+    code_pattern = re.search(r'[\w-]+:[\w-]+:[\w-]+', text)
+    if code_pattern:
+        # If the code takes up most of the text, skip it
+        code_ratio = len(code_pattern.group(0)) / len(text)
+        if code_ratio > 0.5:
+            return None
 
-        for code in codes_list:
-            if ':' not in code:
-                continue
+    # Skip lines that are mostly file paths
+    if text.count('/') > 2 or text.endswith(('.py', '.md', '.txt', '.json')):
+        return None
 
-            # Exact duplicate check
-            if code in seen:
-                continue
+    return text
 
-            # For hierarchical codes, check for semantic duplicates
-            # E.g., "impl:file.py:feature-a" vs "impl:file.py:feature-a" (exact)
-            # But allow "impl:file.py:feature-a" and "impl:file.py:feature-b" (different)
 
-            # Get normalized form (lowercase, collapse multiple colons)
-            normalized = code.lower().strip()
+def _bug_details(user_msg: str, ai_msg: str) -> List[str]:
+    """Root causes and fixes explained in a turn about a bug."""
+    details = []
+    combined_lower = (user_msg + ' ' + ai_msg).lower()
 
-            # Check if very similar code exists
-            is_duplicate = False
-            for existing in seen:
-                # If 90%+ character overlap and same category, likely duplicate
-                if existing.split(':')[0] == normalized.split(':')[0]:  # Same category
-                    existing_content = ':'.join(existing.split(':')[1:])
-                    current_content = ':'.join(normalized.split(':')[1:])
+    # Only process conversations about bugs/fixes
+    if not any(keyword in combined_lower for keyword in ['bug', 'fix', 'broken', 'issue', 'error', 'fail']):
+        return details
 
-                    if existing_content and current_content:
-                        # Character-level similarity
-                        shorter = min(len(existing_content), len(current_content))
-                        longer = max(len(existing_content), len(current_content))
+    for line in ai_msg.split('\n'):
+        line_clean = line.strip()
+        if not line_clean or len(line_clean) < 15:
+            continue
 
-                        # Count matching characters
-                        matches = sum(1 for a, b in zip(existing_content, current_content) if a == b)
-                        similarity = matches / longer if longer > 0 else 0
+        line_lower = line_clean.lower()
 
-                        if similarity > 0.85:
-                            is_duplicate = True
-                            break
+        # Extract root causes
+        if any(marker in line_lower for marker in ['root cause:', 'why it', 'because', 'the problem']):
+            # Clean up and format
+            text = re.sub(r'^[-*•]\s*', '', line_clean)
+            if not text.lower().startswith('root'):
+                text = f"Root: {text}"
+            details.append(_clean_detail(text, 120))
+
+        # Extract solutions/fixes
+        elif any(marker in line_lower for marker in ['fix:', 'solution:', 'added', 'modified']):
+            text = re.sub(r'^[-*•]\s*', '', line_clean)
+            if not text.lower().startswith(('fix', 'solution')):
+                text = f"Fix: {text}"
+            details.append(_clean_detail(text, 120))
 
-            if not is_duplicate:
-                unique.append(code)
-                seen.add(normalized)
+    return [text for text in details if text]
 
-        return unique
 
-    # Apply quality filter
-    quality_codes = [c for c in codes if is_meaningful(c)]
+def _investigation_details(ai_msg: str) -> List[str]:
+    """Investigation results/conclusions stated in an assistant message."""
+    details = []
+    ai_lower = ai_msg.lower()
 
-    # Deduplicate
-    unique_codes = semantic_dedupe(quality_codes)
+    # Look for conclusion patterns
+    if any(marker in ai_lower for marker in ['conclusion:', 'working as designed', 'verified:', 'confirmed:']):
+        for line in ai_msg.split('\n'):
+            line_clean = line.strip()
+            if not line_clean or len(line_clean) < 15:
+                continue
+
+            line_lower = line_clean.lower()
+            if any(marker in line_lower for marker in ['conclusion:', 'working as', 'verified', 'confirmed']):
+                text = _clean_detail(re.sub(r'^[-*•]\s*', '', line_clean), 150)
+                if text:
+                    details.append(text)
 
-    # Limit to 150 codes (~1500 tokens target)
-    return unique_codes[:150]
+    return details
 
 
-def extract_session_details() -> str:
+@dataclass
+class _SessionDigest:
     """
-    Extract structured details for hybrid session summary.
+    Work-summary state behind extract_session_codes() and
+    extract_session_details(), fed turn by turn and tool call by tool call
+    from TranscriptState's single pass.
+
+    Only what the summaries can show is kept: codes (deduplicated, capped),
+    the first few detail lines and file contexts. Turn contexts and edits
+    are matched within a window of two turns / tool calls, so only recent
+    ones are held until a match can no longer arrive.
+    """
+    turns: int = 0
+    tool_calls: int = 0
+    work_streams: List[str] = field(default_factory=list)
+    edited_files: List[str] = field(default_factory=list)  # Edit/Write targets, first edit order
+    file_contexts: Dict[str, Dict[str, List[int]]] = field(default_factory=dict)  # file -> context -> [turn, rank]
+    recent_contexts: List[Tuple[int, List[str]]] = field(default_factory=list)  # (turn, contexts)
+    recent_edits: List[Tuple[int, str]] = field(default_factory=list)  # (tool call, file)
+    done_codes: List[str] = field(default_factory=list)
+    turn_codes: List[str] = field(default_factory=list)
+    bugs: List[str] = field(default_factory=list)
+    investigations: List[str] = field(default_factory=list)
+    modified_files: List[str] = field(default_factory=list)  # Sorted
+
+    def add_turn(self, user_msg: str, ai_msg: str) -> None:
+        """Feed one user/assistant turn."""
+        turn = self.turns
+        self.turns += 1
+        combined = (user_msg + ' ' + ai_msg).lower()
 
-    Provides why/how/where context to complement semantic codes.
-    Format: Clean structured bullets focusing on explanations.
-    Target: ~500-800 tokens (vs 2500+ prose, 200 codes-only).
+        for code in _work_stream_codes(combined):
+            if code not in self.work_streams:
+                self.work_streams.append(code)
+
+        # Contexts apply to files edited by tool calls turn-2 .. turn+2
+        contexts = _work_contexts(combined)
+        if contexts:
+            for call, filename in self.recent_edits:
+                if turn - 2 <= call <= turn + 2:
+                    self._add_file_contexts(filename, turn, contexts)
+            self.recent_contexts.append((turn, contexts))
+        self.recent_edits = [(call, f) for call, f in self.recent_edits if call >= self.turns - 2]
+
+        for code in _turn_codes(user_msg, ai_msg):
+            if (_is_meaningful_code(code) and code not in self.turn_codes
+                    and len(self.turn_codes) < SESSION_CODE_LIMIT):
+                self.turn_codes.append(code)
+
+        for text in _bug_details(user_msg, ai_msg):
+            self._add_detail('bugs', text)
+        for text in _investigation_details(ai_msg):
+            self._add_detail('investigations', text)
+
+    def add_tool_call(self, call: Dict[str, Any]) -> None:
+        """Feed one tool call ({tool, params})."""
+        index = self.tool_calls
+        self.tool_calls += 1
+        tool = call['tool']
+        params = call['params'] if isinstance(call['params'], dict) else {}
+        file_path = params.get('file_path', '')
+
+        if tool in ('Edit', 'Write') and file_path:
+            filename = Path(file_path).name
+            if filename not in self.edited_files and len(self.edited_files) < SESSION_CODE_LIMIT:
+                self.edited_files.append(filename)
+            for turn, contexts in self.recent_contexts:
+                if turn - 2 <= index <= turn + 2:
+                    self._add_file_contexts(filename, turn, contexts)
+            self.recent_edits.append((index, filename))
+        elif tool == 'Bash':
+            code = _bash_code(params.get('command', ''))
+            if code and code not in self.done_codes:
+                self.done_codes.append(code)
+        self.recent_contexts = [(turn, c) for turn, c in self.recent_contexts if turn >= self.tool_calls - 2]
+
+        if tool in ('Edit', 'Write', 'NotebookEdit') and file_path:
+            filename = file_path.split('/')[-1]
+            if filename not in self.modified_files:
+                self.modified_files = sorted(self.modified_files + [filename])[:SESSION_DETAIL_LIMITS['files']]
+
+    def _add_file_contexts(self, filename: str, turn: int, contexts: List[str]) -> None:
+        ranked = self.file_contexts.setdefault(filename, {})
+        for rank, context in enumerate(contexts):
+            if context not in ranked or [turn, rank] < ranked[context]:
+                ranked[context] = [turn, rank]
+
+    def _add_detail(self, section: str, text: str) -> None:
+        normalized = text.lower()
+        if section == 'bugs':
+            # Bugs are listed first, so they win over an equal investigation
+            self.investigations = [item for item in self.investigations if item.lower() != normalized]
+        if any(item.lower() == normalized for item in self.bugs + self.investigations):
+            return
+        items = getattr(self, section)
+        if len(items) < SESSION_DETAIL_LIMITS[section]:
+            items.append(text)
+
+    def codes(self) -> List[str]:
+        """Session codes, in extraction order, filtered and deduplicated."""
+        codes = list(self.work_streams)
+
+        # impl: codes with the contexts the file was edited in
+        for filename in self.edited_files:
+            ranked = self.file_contexts.get(filename)
+            if ranked:
+                for context in sorted(ranked, key=ranked.get)[:3]:  # Max 3 contexts per file
+                    codes.append(f"impl:{filename}:{context}")
+            else:
+                # Fallback: just filename
+                codes.append(f"impl:{filename}")
 
-    Returns:
-        Structured text with bullets explaining key work
+        codes.extend(self.done_codes)
+        codes.extend(self.turn_codes)
+
+        # Limit to 150 codes (~1500 tokens target)
+        return _semantic_dedupe([c for c in codes if _is_meaningful_code(c)])[:150]
+
+    def details(self) -> str:
+        """Structured details text (bugs/fixes, investigations, files)."""
+        output = []
+
+        # Bugs/Fixes section
+        if self.bugs:
+            output.append("Bugs/Fixes:")
+            for item in self.bugs:
+                output.append(f"- {item}")
+
+        # Investigations section
+        if self.investigations:
+            if output:
+                output.append("")
+            output.append("Investigations:")
+            for item in self.investigations:
+                output.append(f"- {item}")
+
+        # Files section
+        if self.modified_files:
+            if output:
+                output.append("")
+            output.append("Files Modified:")
+            for filename in self.modified_files:
+                output.append(f"- {filename}")
+
+        return '\n'.join(output) if output else ""
+
+
+def extract_session_codes(state: Optional[TranscriptState] = None) -> List[str]:
     """
-    transcript = find_current_transcript()
-    if not transcript:
-        return ""
+    Extract FULL session context from transcript (AI-only format).
 
-    conversations = parse_claude_code_transcript(transcript)
-    tool_calls = extract_tool_calls_from_transcript(transcript)
+    Hierarchical codes with context:
+    - migrate:what:from-to (major work streams)
+    - impl:file:what-was-added (file modifications with context)
+    - fix:system:issue:solution (bug fixes with details)
+    - dec:decision:reason (decisions with rationale)
+    - block:what:detail (blockers with specifics)
+    - next:action:context (next steps with context)
+    - done:what:detail (completions with context)
 
-    sections = {
-        'bugs': [],
-        'investigations': [],
-        'files': set()
-    }
+    Target: 80-120 codes = ~1000-1500 tokens (full session context)
 
-    # Track what's been documented
-    seen = set()
+    Strategy: Hierarchical context, no prose, AI-readable. Codes are
+    collected by the state's digest while the transcript is read.
 
-    # Helper: Clean and deduplicate line
-    def add_unique(category: str, text: str, max_len: int = 100):
-        """Add text to section if unique and meaningful."""
-        text = text.strip()
-        if not text or len(text) < 10:
-            return
+    Args:
+        state: Transcript state to use (default: read the current transcript)
+    """
+    if state is None:
+        transcript = find_current_transcript()
+        if not transcript:
+            return []
+        state = read_transcript(transcript)
 
-        # Remove markdown and special chars
-        text = re.sub(r'[*_#`]', '', text)
-        text = re.sub(r'\s+', ' ', text)
-        text = text[:max_len]
-
-        # Filter out code-like patterns after cleaning (word:word:word)
-        # These are semantic codes, not explanations
-        code_pattern = re.search(r'[\w-]+:[\w-]+:[\w-]+', text)
-        if code_pattern:
-            # If the code takes up most of the text, skip it
-            code_ratio = len(code_pattern.group(0)) / len(text)
-            if code_ratio > 0.5:
-                return
-
-        # Skip lines that are mostly file paths
-        if text.count('/') > 2 or text.endswith(('.py', '.md', '.txt', '.json')):
-            return
+    return state.digest.codes()
 
-        # Deduplicate
-        normalized = text.lower()
-        if normalized not in seen:
-            sections[category].append(text)
-            seen.add(normalized)
 
-    # Extract bug fixes and their context
-    for user_msg, ai_msg in conversations:
-        combined_lower = (user_msg + ' ' + ai_msg).lower()
+def extract_session_details(state: Optional[TranscriptState] = None) -> str:
+    """
+    Extract structured details for hybrid session summary.
 
-        # Only process conversations about bugs/fixes
-        if not any(keyword in combined_lower for keyword in ['bug', 'fix', 'broken', 'issue', 'error', 'fail']):
-            continue
+    Provides why/how/where context to complement semantic codes.
+    Format: Clean structured bullets focusing on explanations.
+    Target: ~500-800 tokens (vs 2500+ prose, 200 codes-only).
 
-        lines = ai_msg.split('\n')
-        for line in lines:
-            line_clean = line.strip()
-            if not line_clean or len(line_clean) < 15:
-                continue
+    Args:
+        state: Transcript state to use (default: read the current transcript)
 
-            line_lower = line_clean.lower()
+    Returns:
+        Structured text with bullets explaining key work
+    """
+    if state is None:
+        transcript = find_current_transcript()
+        if not transcript:
+            return ""
+        state = read_transcript(transcript)
 
-            # Extract root causes
-            if any(marker in line_lower for marker in ['root cause:', 'why it', 'because', 'the problem']):
-                # Clean up and format
-                text = re.sub(r'^[-*•]\s*', '', line_clean)
-                if not text.lower().startswith('root'):
-                    text = f"Root: {text}"
-                add_unique('bugs', text, 120)
-
-            # Extract solutions/fixes
-            elif any(marker in line_lower for marker in ['fix:', 'solution:', 'added', 'modified']):
-                text = re.sub(r'^[-*•]\s*', '', line_clean)
-                if not text.lower().startswith(('fix', 'solution')):
-                    text = f"Fix: {text}"
-                add_unique('bugs', text, 120)
-
-    # Extract investigation results/conclusions
-    for user_msg, ai_msg in conversations:
-        ai_lower = ai_msg.lower()
-
-        # Look for conclusion patterns
-        if any(marker in ai_lower for marker in ['conclusion:', 'working as designed', 'verified:', 'confirmed:']):
-            lines = ai_msg.split('\n')
-            for line in lines:
-                line_clean = line.strip()
-                if not line_clean or len(line_clean) < 15:
-                    continue
-
-                line_lower = line_clean.lower()
-                if any(marker in line_lower for marker in ['conclusion:', 'working as', 'verified', 'confirmed']):
-                    text = re.sub(r'^[-*•]\s*', '', line_clean)
-                    add_unique('investigations', text, 150)
-
-    # Extract modified files
-    for call in tool_calls:
-        if call.get('name') in ['Edit', 'Write', 'NotebookEdit']:
-            params = call.get('params', {})
-            file_path = params.get('file_path', '')
-            if file_path:
-                # Get just filename
-                filename = file_path.split('/')[-1]
-                sections['files'].add(filename)
-
-    # Format output
-    output = []
-
-    # Bugs/Fixes section
-    if sections['bugs']:
-        output.append("Bugs/Fixes:")
-        for item in sections['bugs'][:8]:  # Limit to 8 items
-            output.append(f"- {item}")
-
-    # Investigations section
-    if sections['investigations']:
-        if output:
-            output.append("")
-        output.append("Investigations:")
-        for item in sections['investigations'][:5]:  # Limit to 5 items
-            output.append(f"- {item}")
-
-    # Files section
-    if sections['files']:
-        if output:
-            output.append("")
-        output.append("Files Modified:")
-        for filename in sorted(sections['files'])[:10]:  # Limit to 10 files
-            output.append(f"- {filename}")
-
-    return '\n'.join(output) if output else ""
+    return state.digest.details()
 
 
 def save_session_context_to_db():
@@ -1358,7 +1768,12 @@ def save_session_context_to_db():
     import sqlite3
     import uuid
 
-    codes = extract_session_codes()
+    transcript = find_current_transcript()
+    if not transcript:
+        return
+    state = read_transcript(transcript)
+
+    codes = extract_session_codes(state)
     if not codes:
         return
 
@@ -1439,7 +1854,7 @@ def save_session_context_to_db():
     context_data["next_actions"] = filtered_next_actions
 
     # Extract structured details (hybrid format)
-    details = extract_session_details()
+    details = extract_session_details(state)
 
     # Store in sessions table
     db_path = Path.home() / ".cerberus" / "memory.db"
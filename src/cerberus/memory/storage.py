@@ -5,17 +5,23 @@ Write approved proposals to SQLite database using Phase 12 infrastructure.
 This is Phase Beta implementation - replaces JSON storage from Phase Alpha.
 
 Phase 14 Integration: Discovers and stores code anchors for memories.
+Anchors are discovered for the whole batch after it is committed, optionally
+in a background thread (``anchor_in_background``).
 Phase 15 Integration: Auto-tags memories with valid modes.
 
 Zero token cost (pure storage).
 """
 
+import atexit
 import sqlite3
 import json
+import threading
 import uuid
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Union
+from typing import List, Dict, Optional, Tuple, Union
+
+from . import config as memory_config
 
 # Phase 14: Dynamic Anchoring
 from .anchoring import AnchorEngine, extract_language_from_scope, extract_project_from_scope
@@ -23,6 +29,22 @@ from .anchoring import AnchorEngine, extract_language_from_scope, extract_projec
 # Phase 15: Mode-Aware Context
 from .mode_detection import auto_tag_memory
 
+from .indexing import TOKEN_COUNTS_SCHEMA_SQL
+from .retrieval import DEFAULT_TOKEN_ENCODING, count_tokens, get_tokenizer
+
+# Background anchoring threads still running
+_anchor_threads: List[threading.Thread] = []
+_anchor_threads_lock = threading.Lock()
+
+
+@atexit.register
+def wait_for_anchoring(timeout: Optional[float] = None) -> None:
+    """Wait for background anchor discovery to finish (also runs at exit)."""
+    with _anchor_threads_lock:
+        threads = list(_anchor_threads)
+    for thread in threads:
+        thread.join(timeout)
+
 
 class MemoryStorage:
     """
@@ -72,7 +94,15 @@ class MemoryStorage:
         total_stored = 0
         by_scope = {}
 
+        # Token counts are computed once here so retrieval never re-tokenizes
+        tokenizer = get_tokenizer(DEFAULT_TOKEN_ENCODING)
+
+        # (memory_id, content, scope) anchored after the batch is committed
+        to_anchor: List[Tuple[str, str, str]] = []
+
         try:
+            conn.execute(TOKEN_COUNTS_SCHEMA_SQL)
+
             for proposal in proposals:
                 # Use proposal's ID directly (MemoryProposal always has id)
                 memory_id = proposal.id
@@ -85,28 +115,9 @@ class MemoryStorage:
                     "source_variants": getattr(proposal, "source_variants", [])
                 }
 
-                # Phase 14: Discover code anchor
-                anchor = None
+                # Phase 14: Code anchors are discovered after commit
                 if self._anchor_engine and proposal.scope != "universal":
-                    try:
-                        anchor = self._anchor_engine.anchor_memory(
-                            memory_id=memory_id,
-                            content=proposal.content,
-                            scope=proposal.scope
-                        )
-                    except Exception:
-                        # Anchor discovery failed - continue without anchor
-                        pass
-
-                # Prepare anchor metadata
-                anchor_file = anchor.file_path if anchor else None
-                anchor_symbol = anchor.symbol_name if anchor else None
-                anchor_score = anchor.quality_score if anchor else None
-                anchor_metadata = json.dumps({
-                    "file_size": anchor.file_size,
-                    "match_score": anchor.match_score,
-                    "recency_score": anchor.recency_score
-                }) if anchor else None
+                    to_anchor.append((memory_id, proposal.content, proposal.scope))
 
                 # Phase 15: Auto-tag modes
                 valid_modes, mode_priority = auto_tag_memory(proposal.content)
@@ -116,10 +127,9 @@ class MemoryStorage:
                     INSERT INTO memory_store (
                         id, category, scope, confidence,
                         created_at, last_accessed, access_count, metadata,
-                        anchor_file, anchor_symbol, anchor_score, anchor_metadata,
                         valid_modes, mode_priority,
                         details, relevance_decay_days
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """, (
                     memory_id,
                     proposal.category,
@@ -129,10 +139,6 @@ class MemoryStorage:
                     now,
                     0,
                     json.dumps(metadata),
-                    anchor_file,
-                    anchor_symbol,
-                    anchor_score,
-                    anchor_metadata,
                     json.dumps(valid_modes),
                     json.dumps(mode_priority),
                     getattr(proposal, "details", None),
@@ -145,6 +151,12 @@ class MemoryStorage:
                     VALUES (?, ?)
                 """, (memory_id, proposal.content))
 
+                if tokenizer is not None:
+                    conn.execute("""
+                        INSERT OR REPLACE INTO memory_token_counts (memory_id, encoding, token_count)
+                        VALUES (?, ?, ?)
+                    """, (memory_id, DEFAULT_TOKEN_ENCODING, count_tokens(proposal.content, tokenizer)))
+
                 total_stored += 1
                 by_scope[proposal.scope] = by_scope.get(proposal.scope, 0) + 1
 
@@ -156,12 +168,70 @@ class MemoryStorage:
         finally:
             conn.close()
 
+        if to_anchor:
+            if memory_config.get("anchor_in_background"):
+                thread = threading.Thread(
+                    target=self._apply_anchors, args=(to_anchor,), daemon=True
+                )
+                with _anchor_threads_lock:
+                    _anchor_threads[:] = [t for t in _anchor_threads if t.is_alive()]
+                    _anchor_threads.append(thread)
+                thread.start()
+            else:
+                self._apply_anchors(to_anchor)
+
         return {
             "total_stored": total_stored,
             "by_scope": by_scope,
             "memory_id": memory_id  # Return last stored ID for single store() calls
         }
 
+    def _apply_anchors(self, memories: List[Tuple[str, str, str]]) -> None:
+        """
+        Discover code anchors for stored memories and write them back.
+
+        Anchor discovery is best effort: failures leave memories unanchored.
+
+        Args:
+            memories: (memory_id, content, scope) tuples
+        """
+        try:
+            anchors = self._anchor_engine.anchor_memories(memories)
+        except Exception:
+            # Anchor discovery failed - continue without anchors
+            return
+
+        rows = [
+            (
+                anchor.file_path,
+                anchor.symbol_name,
+                anchor.quality_score,
+                json.dumps({
+                    "file_size": anchor.file_size,
+                    "match_score": anchor.match_score,
+                    "recency_score": anchor.recency_score
+                }),
+                memory_id
+            )
+            for memory_id, anchor in anchors.items()
+            if anchor
+        ]
+        if not rows:
+            return
+
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            conn.executemany("""
+                UPDATE memory_store
+                SET anchor_file = ?, anchor_symbol = ?, anchor_score = ?, anchor_metadata = ?
+                WHERE id = ?
+            """, rows)
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+        finally:
+            conn.close()
+
     def store(self, proposal) -> str:
         """
         Store single approved proposal to SQLite.
@@ -204,6 +274,8 @@ class MemoryStorage:
             # Delete from both tables
             conn.execute("DELETE FROM memory_store WHERE id = ?", (memory_id,))
             conn.execute("DELETE FROM memory_fts WHERE id = ?", (memory_id,))
+            conn.execute(TOKEN_COUNTS_SCHEMA_SQL)
+            conn.execute("DELETE FROM memory_token_counts WHERE memory_id = ?", (memory_id,))
 
             conn.commit()
             return True
@@ -12,6 +12,7 @@ from datetime import datetime
 from typing import Optional, Tuple, List
 
 from cerberus.logging_config import logger
+from cerberus.parser.tree_cache import get_tree_cache
 from cerberus.schemas import SymbolLocation
 from .config import MUTATION_CONFIG
 
@@ -319,6 +320,14 @@ class CodeEditor:
                 # Atomic rename
                 os.replace(temp_path, str(path))
                 logger.debug(f"Atomic write completed: {file_path}")
+
+                # Incrementally reparse the cached tree so follow-up
+                # locate/skeletonize calls do not start from scratch
+                try:
+                    get_tree_cache().update(str(path), content)
+                except Exception as e:
+                    logger.debug(f"Tree cache update failed for {file_path}: {e}")
+                    get_tree_cache().invalidate(str(path))
                 return True
 
             except Exception as e:
@@ -15,6 +15,7 @@ from typing import Tuple, List, Dict, Any, Optional
 
 from cerberus.logging_config import logger
 from cerberus.storage.sqlite_store import SQLiteIndexStore
+from cerberus.watcher.command_server import run_cerberus_command
 
 
 class SymbolGuard:
@@ -229,12 +230,8 @@ class SymbolGuard:
                 "--index", self.index_path
             ]
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            # Runs in the warm daemon when one serves this project
+            result = run_cerberus_command(cmd[1:], timeout=10)
 
             if result.returncode != 0:
                 logger.debug(f"Failed to query stability: {result.stderr}")
@@ -320,12 +317,8 @@ class SymbolGuard:
                 "--json"
             ]
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            # Runs in the warm daemon when one serves this project
+            result = run_cerberus_command(cmd[1:], timeout=10)
 
             if result.returncode != 0:
                 logger.warning(f"Failed to query references: {result.stderr}")
@@ -5,18 +5,15 @@ Phase 11: Core component for surgical editing.
 """
 
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List
 
 try:
-    from tree_sitter import Parser, Language, Node
-    import tree_sitter_python as tspython
-    import tree_sitter_javascript as tsjavascript
-    import tree_sitter_typescript as tstypescript
-    TREE_SITTER_AVAILABLE = True
+    from tree_sitter import Node
 except ImportError:
-    TREE_SITTER_AVAILABLE = False
+    pass
 
 from cerberus.logging_config import logger
+from cerberus.parser.tree_cache import TREE_SITTER_AVAILABLE, ParserPool, get_tree_cache
 from cerberus.storage.sqlite_store import SQLiteIndexStore
 from cerberus.schemas import SymbolLocation, CodeSymbol
 
@@ -36,35 +33,11 @@ class SymbolLocator:
             store: SQLite index store for symbol queries
         """
         self.store = store
-        self.parsers: Dict[str, Parser] = {}
-        if TREE_SITTER_AVAILABLE:
-            self._init_parsers()
-        else:
+        # Per-thread pooled parsers shared with the other tree-sitter consumers
+        self.parsers = ParserPool()
+        if not TREE_SITTER_AVAILABLE:
             logger.warning("tree-sitter not available, symbol location disabled")
 
-    def _init_parsers(self):
-        """Initialize tree-sitter parsers for supported languages."""
-        try:
-            # Python parser
-            python_parser = Parser()
-            python_parser.language = Language(tspython.language())
-            self.parsers["python"] = python_parser
-
-            # JavaScript parser
-            js_parser = Parser()
-            js_parser.language = Language(tsjavascript.language())
-            self.parsers["javascript"] = js_parser
-
-            # TypeScript parser
-            ts_parser = Parser()
-            ts_parser.language = Language(tstypescript.language_typescript())
-            self.parsers["typescript"] = ts_parser
-
-            logger.debug(f"SymbolLocator initialized parsers: {list(self.parsers.keys())}")
-        except Exception as e:
-            logger.error(f"Failed to initialize parsers: {e}")
-            self.parsers = {}
-
     def locate_symbol(
         self,
         file_path: str,
@@ -107,24 +80,21 @@ class SymbolLocator:
             logger.warning(f"Symbol '{symbol_name}' not found in index for {file_path}")
             return None
 
-        # Read file content
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                source_code = f.read()
-        except Exception as e:
-            logger.error(f"Failed to read file {file_path}: {e}")
-            return None
-
         # Detect language
         language = self._detect_language(path.suffix)
         if not language or language not in self.parsers:
             logger.error(f"Unsupported language for {file_path}")
             return None
 
-        # Parse file with tree-sitter
-        parser = self.parsers[language]
-        tree = parser.parse(bytes(source_code, "utf8"))
-        root_node = tree.root_node
+        # Parse file with tree-sitter (shared cache, reused across tools)
+        try:
+            parsed = get_tree_cache().get(file_path, language)
+        except Exception as e:
+            logger.error(f"Failed to read file {file_path}: {e}")
+            return None
+
+        source_code = parsed.source
+        root_node = parsed.tree.root_node
 
         # Find the AST node for this symbol
         target_node = self._find_symbol_node(
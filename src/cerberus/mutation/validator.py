@@ -7,15 +7,12 @@ Phase 11: Pillars 2-4 - Syntax, Semantic, Import validation.
 from typing import Tuple, List, Optional
 
 try:
-    from tree_sitter import Parser, Language, Node
-    import tree_sitter_python as tspython
-    import tree_sitter_javascript as tsjavascript
-    import tree_sitter_typescript as tstypescript
-    TREE_SITTER_AVAILABLE = True
+    from tree_sitter import Node
 except ImportError:
-    TREE_SITTER_AVAILABLE = False
+    pass
 
 from cerberus.logging_config import logger
+from cerberus.parser.tree_cache import TREE_SITTER_AVAILABLE, ParserPool
 from cerberus.storage.sqlite_store import SQLiteIndexStore
 
 
@@ -38,32 +35,11 @@ class CodeValidator:
             store: SQLite index store for semantic checks
         """
         self.store = store
-        self.parsers = {}
-        if TREE_SITTER_AVAILABLE:
-            self._init_parsers()
-        else:
+        # Per-thread pooled parsers shared with the other tree-sitter consumers
+        self.parsers = ParserPool()
+        if not TREE_SITTER_AVAILABLE:
             logger.warning("tree-sitter not available, validation limited")
 
-    def _init_parsers(self):
-        """Initialize tree-sitter parsers."""
-        try:
-            python_parser = Parser()
-            python_parser.language = Language(tspython.language())
-            self.parsers["python"] = python_parser
-
-            js_parser = Parser()
-            js_parser.language = Language(tsjavascript.language())
-            self.parsers["javascript"] = js_parser
-
-            ts_parser = Parser()
-            ts_parser.language = Language(tstypescript.language_typescript())
-            self.parsers["typescript"] = ts_parser
-
-            logger.debug(f"CodeValidator initialized parsers")
-        except Exception as e:
-            logger.error(f"Failed to initialize parsers: {e}")
-            self.parsers = {}
-
     def dry_run_validation(
         self,
         file_path: str,
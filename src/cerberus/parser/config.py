@@ -28,6 +28,12 @@ SUPPORTED_LANGUAGES = {
     ".bash": "shell",
 }
 
+# Shared tree-sitter parse-tree cache (parser/tree_cache.py)
+TREE_CACHE_CONFIG = {
+    "max_entries": 256,               # Parsed files kept in memory
+    "max_bytes": 64 * 1024 * 1024,    # Upper bound on cached source bytes
+}
+
 # Regex patterns for finding symbols.
 # We use re.MULTILINE to allow ^ to match the start of each line.
 LANGUAGE_QUERIES = {
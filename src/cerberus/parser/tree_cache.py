@@ -0,0 +1,382 @@
+"""
+Shared tree-sitter parse-tree cache.
+
+Skeletonization, symbol location and mutation validation often parse the same
+file back to back. This module keeps one bounded LRU cache of tree-sitter
+trees keyed by (path, mtime, size), pools Parser objects per thread (parsers
+are not thread-safe), and reparses incrementally via ``tree.edit()`` when a
+file is rewritten by the mutation layer.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+try:
+    from tree_sitter import Parser, Language, Tree
+    import tree_sitter_python as tspython
+    import tree_sitter_javascript as tsjavascript
+    import tree_sitter_typescript as tstypescript
+    TREE_SITTER_AVAILABLE = True
+except ImportError:
+    TREE_SITTER_AVAILABLE = False
+
+from cerberus.logging_config import logger
+from cerberus.parser.config import TREE_CACHE_CONFIG
+
+TREE_SITTER_EXTENSIONS = {
+    ".py": "python",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+}
+
+_languages: Dict[str, "Language"] = {}
+_languages_lock = threading.Lock()
+_thread_parsers = threading.local()
+
+
+def detect_language(file_path: str) -> Optional[str]:
+    """Return the tree-sitter language name for a file path, if supported."""
+    return TREE_SITTER_EXTENSIONS.get(Path(file_path).suffix.lower())
+
+
+def _load_language(language: str) -> Optional["Language"]:
+    """Load (once per process) the tree-sitter Language for a language name."""
+    if language in _languages:
+        return _languages[language]
+
+    loaders = {
+        "python": lambda: tspython.language(),
+        "javascript": lambda: tsjavascript.language(),
+        "typescript": lambda: tstypescript.language_typescript(),
+    }
+    if language not in loaders:
+        return None
+
+    with _languages_lock:
+        if language not in _languages:
+            _languages[language] = Language(loaders[language]())
+    return _languages[language]
+
+
+def get_parser(language: str) -> Optional["Parser"]:
+    """
+    Get a tree-sitter parser for the current thread.
+
+    Parsers are created once per (thread, language) and reused.
+
+    Args:
+        language: Language name ("python", "javascript", "typescript")
+
+    Returns:
+        Parser or None if tree-sitter or the language is unavailable
+    """
+    if not TREE_SITTER_AVAILABLE:
+        return None
+
+    parsers = getattr(_thread_parsers, "parsers", None)
+    if parsers is None:
+        parsers = _thread_parsers.parsers = {}
+
+    parser = parsers.get(language)
+    if parser is None:
+        try:
+            lang = _load_language(language)
+        except Exception as e:
+            logger.error(f"Failed to load tree-sitter language '{language}': {e}")
+            return None
+        if lang is None:
+            return None
+        parser = Parser()
+        parser.language = lang
+        parsers[language] = parser
+    return parser
+
+
+class ParserPool:
+    """
+    Mapping-style view over the per-thread parser pool.
+
+    Drop-in replacement for the ``self.parsers`` dicts components used to
+    build per instance: ``pool["python"]`` returns the calling thread's parser.
+    """
+
+    LANGUAGES = ("python", "javascript", "typescript")
+
+    def __contains__(self, language: object) -> bool:
+        return TREE_SITTER_AVAILABLE and language in self.LANGUAGES
+
+    def __getitem__(self, language: str) -> "Parser":
+        parser = get_parser(language) if language in self else None
+        if parser is None:
+            raise KeyError(language)
+        return parser
+
+    def get(self, language: str, default: Any = None) -> Any:
+        try:
+            return self[language]
+        except KeyError:
+            return default
+
+    def keys(self) -> Tuple[str, ...]:
+        return self.LANGUAGES if TREE_SITTER_AVAILABLE else ()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+
+@dataclass
+class ParsedFile:
+    """
+    A parsed source file held by the tree cache.
+
+    ``source`` has universal newlines (as a text-mode read would), and the
+    tree is parsed from its UTF-8 encoding, so node offsets line up with the
+    content CodeEditor reads and slices.
+    """
+
+    path: str
+    language: str
+    source: str
+    source_bytes: bytes
+    tree: Any
+    mtime_ns: int = 0
+    size: int = 0
+
+
+def _universal_newlines(source: str) -> str:
+    """Translate CRLF and CR line endings to LF, like open(..., 'r') does."""
+    return source.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _common_prefix(a: bytes, b: bytes) -> int:
+    """Length of the common prefix of two byte strings (binary search on memcmp)."""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix(a: bytes, b: bytes, limit: int) -> int:
+    """Length of the common suffix of two byte strings, at most ``limit``."""
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid:] == b[len(b) - mid:]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _point(data: bytes, offset: int) -> Tuple[int, int]:
+    """tree-sitter (row, byte column) point for a byte offset."""
+    row = data.count(b"\n", 0, offset)
+    return row, offset - (data.rfind(b"\n", 0, offset) + 1)
+
+
+class TreeCache:
+    """
+    Bounded LRU cache of tree-sitter parse trees.
+
+    Entries are validated against the file's mtime and size on every lookup,
+    so external edits are picked up automatically. Trees handed out are shared
+    and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached files
+            max_bytes: Maximum total size of cached sources
+        """
+        self.max_entries = max_entries or TREE_CACHE_CONFIG["max_entries"]
+        self.max_bytes = max_bytes or TREE_CACHE_CONFIG["max_bytes"]
+        self._entries: "OrderedDict[str, ParsedFile]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.incremental_parses = 0
+
+    def get(self, file_path: str, language: Optional[str] = None) -> Optional[ParsedFile]:
+        """
+        Get the parsed tree for a file, parsing it on a miss.
+
+        Args:
+            file_path: Path to source file
+            language: Optional language override (detected from extension)
+
+        Returns:
+            ParsedFile, or None if the language is unsupported
+
+        Raises:
+            OSError: If the file cannot be read
+            UnicodeDecodeError: If the file is not valid UTF-8
+        """
+        language = language or detect_language(file_path)
+        parser = get_parser(language) if language else None
+        if parser is None:
+            return None
+
+        key = str(Path(file_path).resolve())
+        stat = Path(key).stat()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if (entry and entry.language == language
+                    and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        source = _universal_newlines(Path(key).read_bytes().decode("utf-8"))
+        source_bytes = source.encode("utf-8")
+        tree = parser.parse(source_bytes)
+
+        entry = ParsedFile(
+            path=key,
+            language=language,
+            source=source,
+            source_bytes=source_bytes,
+            tree=tree,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+        )
+        self._store(entry)
+        return entry
+
+    def update(self, file_path: str, new_source: str) -> Optional[ParsedFile]:
+        """
+        Refresh a cached file after it was rewritten with ``new_source``.
+
+        The cached tree is edited to cover the changed byte range and reparsed
+        incrementally, so unchanged subtrees are reused. Call this right after
+        writing the file; files that are not cached are left alone.
+
+        Args:
+            file_path: Path of the rewritten file
+            new_source: Content that was written
+
+        Returns:
+            Updated ParsedFile, or None if the file was not cached
+        """
+        key = str(Path(file_path).resolve())
+        with self._lock:
+            old = self._entries.get(key)
+        if old is None:
+            return None
+
+        parser = get_parser(old.language)
+        try:
+            stat = Path(key).stat()
+        except OSError:
+            self.invalidate(key)
+            return None
+
+        if parser is None or stat.st_size != len(new_source.encode("utf-8")):
+            # Not the content we were told about - let the next get() reparse
+            self.invalidate(key)
+            return None
+
+        new_source = _universal_newlines(new_source)
+        new_bytes = new_source.encode("utf-8")
+
+        old_bytes = old.source_bytes
+        start = _common_prefix(old_bytes, new_bytes)
+        suffix = _common_suffix(old_bytes, new_bytes, min(len(old_bytes), len(new_bytes)) - start)
+        old_end = len(old_bytes) - suffix
+        new_end = len(new_bytes) - suffix
+
+        tree = old.tree.copy()
+        tree.edit(
+            start_byte=start,
+            old_end_byte=old_end,
+            new_end_byte=new_end,
+            start_point=_point(old_bytes, start),
+            old_end_point=_point(old_bytes, old_end),
+            new_end_point=_point(new_bytes, new_end),
+        )
+        new_tree = parser.parse(new_bytes, tree)
+
+        entry = ParsedFile(
+            path=key,
+            language=old.language,
+            source=new_source,
+            source_bytes=new_bytes,
+            tree=new_tree,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+        )
+        self._store(entry)
+        with self._lock:
+            self.incremental_parses += 1
+        return entry
+
+    def invalidate(self, file_path: Optional[str] = None) -> None:
+        """Drop one file (or everything, if no path is given) from the cache."""
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+                self._total_bytes = 0
+                return
+            entry = self._entries.pop(str(Path(file_path).resolve()), None)
+            if entry:
+                self._total_bytes -= len(entry.source_bytes)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return cache size and hit/miss counters."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "incremental_parses": self.incremental_parses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            }
+
+    def _store(self, entry: ParsedFile) -> None:
+        """Insert an entry and evict least recently used ones beyond the bounds."""
+        with self._lock:
+            previous = self._entries.pop(entry.path, None)
+            if previous:
+                self._total_bytes -= len(previous.source_bytes)
+
+            self._entries[entry.path] = entry
+            self._total_bytes += len(entry.source_bytes)
+
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= len(evicted.source_bytes)
+
+
+_tree_cache: Optional[TreeCache] = None
+_tree_cache_lock = threading.Lock()
+
+
+def get_tree_cache() -> TreeCache:
+    """Get the process-wide tree cache."""
+    global _tree_cache
+    if _tree_cache is None:
+        with _tree_cache_lock:
+            if _tree_cache is None:
+                _tree_cache = TreeCache()
+    return _tree_cache
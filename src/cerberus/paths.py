@@ -10,6 +10,8 @@ Directory Structure:
 ├── vectors.faiss        # FAISS vector index
 ├── vector_id_map.pkl    # Vector ID mapping
 ├── ledger.db            # Mutation ledger
+├── summary_cache.db     # LLM summary cache
+├── style_cache.db       # Style check results cache
 ├── session.json         # Agent session metrics
 ├── dev_session.json     # Dev session metrics (when in Cerberus repo)
 ├── backups/             # Mutation backups
@@ -39,6 +41,8 @@ class CerberusPaths:
     VECTORS_NAME = "vectors.faiss"
     VECTOR_MAP_NAME = "vector_id_map.pkl"
     LEDGER_DB_NAME = "ledger.db"
+    SUMMARY_CACHE_NAME = "summary_cache.db"
+    STYLE_CACHE_NAME = "style_cache.db"
     SESSION_NAME = "session.json"
     DEV_SESSION_NAME = "dev_session.json"
 
@@ -88,6 +92,16 @@ class CerberusPaths:
         """Get the mutation ledger database path."""
         return self.cerberus_dir / self.LEDGER_DB_NAME
 
+    @property
+    def summary_cache_db(self) -> Path:
+        """Get the LLM summary cache database path."""
+        return self.cerberus_dir / self.SUMMARY_CACHE_NAME
+
+    @property
+    def style_cache_db(self) -> Path:
+        """Get the style check results cache database path."""
+        return self.cerberus_dir / self.STYLE_CACHE_NAME
+
     @property
     def session_file(self) -> Path:
         """Get the session file path."""
@@ -0,0 +1,142 @@
+"""
+Persistent style check results.
+
+Results are stored per file together with the content hash and the rule-set
+version (STYLE_RULES_VERSION) they were computed with, so directory checks
+only re-run the rules on files that changed since the last run.
+"""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from cerberus.logging_config import logger
+from cerberus.quality.style_guard import STYLE_RULES_VERSION, StyleIssue
+
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS style_results (
+    file_path TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    rules_version TEXT NOT NULL,
+    issues_json TEXT NOT NULL,
+    checked_at REAL NOT NULL
+);
+"""
+
+# Keep IN (...) lists well below SQLite's variable limit
+LOOKUP_CHUNK_SIZE = 500
+
+
+class StyleResultCache:
+    """
+    SQLite-backed style results, one row per file.
+
+    Each operation uses its own short-lived connection. Failures are logged
+    and treated as cache misses.
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize cache, creating the database if needed.
+
+        Args:
+            db_path: Path to the cache database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+        conn = self._connect()
+        try:
+            conn.executescript(CACHE_SCHEMA)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=10.0)
+        conn.execute("PRAGMA journal_mode = WAL")
+        return conn
+
+    def lookup(self, content_hashes: Dict[str, str]) -> Dict[str, List[StyleIssue]]:
+        """
+        Fetch cached issues for files whose content and rules are unchanged.
+
+        Args:
+            content_hashes: Dict mapping file paths to their current content hash
+
+        Returns:
+            Dict mapping file paths to cached issues (hits only)
+        """
+        found: Dict[str, List[StyleIssue]] = {}
+        paths = list(content_hashes)
+        try:
+            conn = self._connect()
+            try:
+                for start in range(0, len(paths), LOOKUP_CHUNK_SIZE):
+                    chunk = paths[start:start + LOOKUP_CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT file_path, content_hash, issues_json FROM style_results "
+                        f"WHERE rules_version = ? AND file_path IN ({placeholders})",
+                        [STYLE_RULES_VERSION, *chunk]
+                    )
+                    for file_path, content_hash, issues_json in rows:
+                        if content_hashes[file_path] == content_hash:
+                            found[file_path] = [
+                                StyleIssue.from_dict(issue) for issue in json.loads(issues_json)
+                            ]
+            finally:
+                conn.close()
+        except (sqlite3.Error, ValueError, KeyError) as e:
+            logger.warning(f"Style cache read failed: {e}")
+            found = {}
+
+        self.hits += len(found)
+        self.misses += len(paths) - len(found)
+        return found
+
+    def store(self, results: List[Tuple[str, str, List[StyleIssue]]]) -> None:
+        """
+        Persist check results, replacing older entries for the same files.
+
+        Args:
+            results: (file_path, content_hash, issues) tuples
+        """
+        if not results:
+            return
+
+        now = time.time()
+        try:
+            conn = self._connect()
+            try:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO style_results
+                        (file_path, content_hash, rules_version, issues_json, checked_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (file_path, content_hash, STYLE_RULES_VERSION,
+                         json.dumps([issue.to_dict() for issue in issues]), now)
+                        for file_path, content_hash, issues in results
+                    ]
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Style cache write failed: {e}")
+
+    def clear(self) -> int:
+        """Remove all cached results. Returns number of entries removed."""
+        conn = self._connect()
+        try:
+            removed = conn.execute("DELETE FROM style_results").rowcount
+            conn.commit()
+            return removed
+        finally:
+            conn.close()
@@ -0,0 +1,13 @@
+"""
+Configuration for directory-level style checks.
+"""
+
+STYLE_CHECK_CONFIG = {
+    "extensions": [".py", ".js", ".ts", ".jsx", ".tsx"],  # Files checked in directories
+    "cache_enabled": True,  # Persist per-file results keyed by content hash and rules version
+    "cache_path": None,  # None = .cerberus/style_cache.db
+    "max_workers": 4,  # Worker processes for directory checks
+    "start_method": "forkserver",  # Never fork: the MCP server is multithreaded (spawn where unavailable)
+    "parallel_min_files": 16,  # Fewer uncached files are checked in-process
+    "cache_write_batch": 200,  # Results persisted per cache transaction
+}
@@ -2,14 +2,85 @@
 StyleDetector - Phase 14.1: Style Issue Detection
 
 Detects style issues without making changes (style-check operation).
+
+Directory checks skip files whose content and rule set are unchanged since
+the last run (StyleResultCache), check the remaining files on a process pool
+and stream results back as they complete.
 """
 
-from typing import List
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+from cerberus.quality.config import STYLE_CHECK_CONFIG
 from cerberus.quality.style_guard import StyleGuardV2, StyleIssue
 from cerberus.logging_config import logger
 
+# Style guard of a pool worker process
+_worker_guard: Optional[StyleGuardV2] = None
+
+
+def _pool_context(config: Dict[str, Any]) -> multiprocessing.context.BaseContext:
+    """
+    Start method for style check workers.
+
+    Forking a multithreaded process (the MCP server) can deadlock children on
+    inherited locks, so workers are started fresh; they build their own guard.
+    """
+    method = config["start_method"]
+    if method not in multiprocessing.get_all_start_methods():
+        method = "spawn"
+    return multiprocessing.get_context(method)
+
+
+def list_source_files(
+    directory: str,
+    recursive: bool = False,
+    extensions: Optional[List[str]] = None
+) -> List[Path]:
+    """
+    List files to style-check in a directory, sorted by path.
+
+    Args:
+        directory: Directory path
+        recursive: Include subdirectories
+        extensions: File extensions to include (default: STYLE_CHECK_CONFIG)
+
+    Returns:
+        Matching file paths
+    """
+    if extensions is None:
+        extensions = STYLE_CHECK_CONFIG["extensions"]
+
+    dir_path = Path(directory)
+    candidates = dir_path.rglob('*') if recursive else dir_path.glob('*')
+    return sorted(f for f in candidates if f.suffix in extensions and f.is_file())
+
+
+def _check_path(file_path: str) -> Tuple[str, Optional[str], List[StyleIssue]]:
+    """
+    Check one file in a pool worker.
+
+    Returns:
+        (file_path, content hash or None if unreadable, issues)
+    """
+    global _worker_guard
+    if _worker_guard is None:
+        _worker_guard = StyleGuardV2()
+
+    try:
+        raw = Path(file_path).read_bytes()
+        # Same newline translation as reading in text mode (check_file)
+        content = raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    except Exception as e:
+        logger.error(f"Failed to check {file_path}: {e}")
+        return file_path, None, []
+
+    issues = _worker_guard.detect_issues(content, file_path)
+    return file_path, hashlib.sha256(raw).hexdigest(), issues
+
 
 class StyleDetector:
     """
@@ -18,11 +89,33 @@ class StyleDetector:
     This is the engine behind `cerberus quality style-check`.
     """
 
-    def __init__(self):
-        """Initialize detector."""
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize detector.
+
+        Args:
+            config: Optional overrides of STYLE_CHECK_CONFIG
+        """
+        self.config = {**STYLE_CHECK_CONFIG, **(config or {})}
         self.style_guard = StyleGuardV2()
+        self._cache = None
         logger.debug("StyleDetector initialized")
 
+    @property
+    def cache(self):
+        """Persistent results cache, opened on first directory check (None if disabled)."""
+        if self._cache is None and self.config["cache_enabled"]:
+            from cerberus.paths import get_paths
+            from cerberus.quality.cache import StyleResultCache
+
+            cache_path = self.config["cache_path"] or get_paths().style_cache_db
+            try:
+                self._cache = StyleResultCache(Path(cache_path))
+            except Exception as e:
+                logger.warning(f"Style cache unavailable, continuing without it: {e}")
+                self.config["cache_enabled"] = False
+        return self._cache
+
     def check_file(self, file_path: str) -> List[StyleIssue]:
         """
         Check a single file for style issues.
@@ -60,32 +153,110 @@ class StyleDetector:
             extensions: File extensions to check (default: .py, .js, .ts)
 
         Returns:
-            Dict mapping file paths to their issues
+            Dict mapping file paths to their issues (sorted by path)
         """
-        if extensions is None:
-            extensions = ['.py', '.js', '.ts', '.jsx', '.tsx']
+        checked = 0
+        found = {}
+        for file_path, issues in self.iter_directory(directory, recursive, extensions):
+            checked += 1
+            if issues:
+                found[file_path] = issues
+
+        results = {file_path: found[file_path] for file_path in sorted(found)}
+        logger.info(f"Checked {checked} files, found issues in {len(results)}")
+        return results
+
+    def iter_directory(
+        self,
+        directory: str,
+        recursive: bool = False,
+        extensions: List[str] = None
+    ) -> Iterator[Tuple[str, List[StyleIssue]]]:
+        """
+        Check all files in a directory, yielding results as they are available.
+
+        Cached results (unchanged content and rules) are yielded first; the
+        remaining files are checked on a process pool and yielded in
+        completion order. Unreadable files are logged and skipped.
+
+        Args:
+            directory: Directory path
+            recursive: Recursively check subdirectories
+            extensions: File extensions to check (default: .py, .js, .ts)
+
+        Yields:
+            (file_path, issues) for every checked file, including clean ones
+        """
+        files = [str(f) for f in list_source_files(directory, recursive, extensions)]
+        cache = self.cache
 
-        dir_path = Path(directory)
-        results = {}
+        misses = files
+        if cache is not None:
+            hashes = {}
+            for file_path in files:
+                try:
+                    hashes[file_path] = hashlib.sha256(Path(file_path).read_bytes()).hexdigest()
+                except OSError as e:
+                    logger.error(f"Failed to check {file_path}: {e}")
+
+            cached = cache.lookup({self._cache_key(path): digest for path, digest in hashes.items()})
+            misses = []
+            for file_path in hashes:
+                issues = cached.get(self._cache_key(file_path))
+                if issues is None:
+                    misses.append(file_path)
+                else:
+                    yield file_path, issues
+
+        pending = []
+        try:
+            for file_path, content_hash, issues in self._check_files(misses):
+                if content_hash is None:
+                    continue
+                if cache is not None:
+                    pending.append((self._cache_key(file_path), content_hash, issues))
+                    if len(pending) >= self.config["cache_write_batch"]:
+                        cache.store(pending)
+                        pending = []
+                yield file_path, issues
+        finally:
+            # Keep what was checked even if the caller stops early
+            if cache is not None:
+                cache.store(pending)
 
-        if recursive:
-            files = [
-                f for f in dir_path.rglob('*')
-                if f.is_file() and f.suffix in extensions
-            ]
+    @staticmethod
+    def _cache_key(file_path: str) -> str:
+        return str(Path(file_path).resolve())
+
+    def _check_files(self, files: List[str]) -> Iterator[Tuple[str, Optional[str], List[StyleIssue]]]:
+        """Check files on a process pool, or in-process for small batches."""
+        workers = min(self.config["max_workers"], len(files))
+        if workers <= 1 or len(files) < self.config["parallel_min_files"]:
+            for file_path in files:
+                yield _check_path(file_path)
+            return
+
+        remaining = set(files)
+        try:
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context(self.config))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Process pool unavailable, checking in-process: {e}")
         else:
-            files = [
-                f for f in dir_path.glob('*')
-                if f.is_file() and f.suffix in extensions
-            ]
+            try:
+                futures = [executor.submit(_check_path, file_path) for file_path in files]
+                for future in as_completed(futures):
+                    result = future.result()
+                    remaining.discard(result[0])
+                    yield result
+            except Exception as e:
+                # Broken pool (e.g. worker killed) - finish in-process
+                logger.warning(f"Style check pool failed, continuing in-process: {e}")
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
 
         for file_path in files:
-            issues = self.check_file(str(file_path))
-            if issues:
-                results[str(file_path)] = issues
-
-        logger.info(f"Checked {len(files)} files, found issues in {len(results)}")
-        return results
+            if file_path in remaining:
+                yield _check_path(file_path)
 
     def format_issues(
         self,
@@ -6,9 +6,10 @@ Applies style fixes with Symbol Guard integration and ledger logging.
 
 import os
 import json
-from typing import List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
 from pathlib import Path
 
+from cerberus.quality.detector import StyleDetector
 from cerberus.quality.style_guard import StyleGuardV2, StyleIssue, StyleFix
 from cerberus.logging_config import logger
 
@@ -26,9 +27,15 @@ class StyleFixer:
     - Verification support (--verify flag)
     """
 
-    def __init__(self):
-        """Initialize fixer."""
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize fixer.
+
+        Args:
+            config: Optional overrides of STYLE_CHECK_CONFIG for directory runs
+        """
         self.style_guard = StyleGuardV2()
+        self.detector = StyleDetector(config)
         logger.debug("StyleFixer initialized")
 
     def fix_file(
@@ -112,6 +119,9 @@ class StyleFixer:
         """
         Fix style issues in all files in a directory.
 
+        Files are checked with StyleDetector.iter_directory (cached, parallel);
+        only files with issues are read again and fixed.
+
         Args:
             directory: Directory path
             recursive: Recursively fix subdirectories
@@ -122,33 +132,20 @@ class StyleFixer:
         Returns:
             Dict mapping file paths to (success, fixes) tuples
         """
-        if extensions is None:
-            extensions = ['.py', '.js', '.ts', '.jsx', '.tsx']
-
-        dir_path = Path(directory)
         results = {}
 
-        if recursive:
-            files = [
-                f for f in dir_path.rglob('*')
-                if f.is_file() and f.suffix in extensions
-            ]
-        else:
-            files = [
-                f for f in dir_path.glob('*')
-                if f.is_file() and f.suffix in extensions
-            ]
-
-        for file_path in files:
-            success, fixes = self.fix_file(
-                str(file_path),
-                preview=preview,
-                force=force
-            )
-            results[str(file_path)] = (success, fixes)
+        for file_path, issues in self.detector.iter_directory(directory, recursive, extensions):
+            if issues:
+                results[file_path] = self.fix_file(file_path, preview=preview, force=force)
+            elif not force and self._check_file_risk(file_path) == "HIGH":
+                # Same outcome fix_file reports for guarded files
+                results[file_path] = (False, [])
+            else:
+                results[file_path] = (True, [])
 
+        results = {file_path: results[file_path] for file_path in sorted(results)}
         total_fixes = sum(len(fixes) for _, fixes in results.values())
-        logger.info(f"Fixed {len(files)} files, applied {total_fixes} total fixes")
+        logger.info(f"Fixed {len(results)} files, applied {total_fixes} total fixes")
 
         return results
 
@@ -10,14 +10,113 @@ Key Principles:
 - Deterministic: Every suggestion must be explainable by code structure
 """
 
-import json
-import os
-import sqlite3
-import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 
+from cerberus.analysis.test_index import TestIndex
+from cerberus.storage.sqlite_store import SQLiteIndexStore
+
+# Keep IN (...) lists well below SQLite's variable limit
+LOOKUP_CHUNK_SIZE = 500
+
+# Risk of files outside the index (no relationship data)
+DEFAULT_RISK_SCORE = 0.5
+
+# Number of importing files at which a file counts as maximum risk
+RISK_IMPORTER_SATURATION = 10
+
+# How a caller relates to the edited symbol, by reference type
+REFERENCE_VERBS = {
+    "inherits": "inherits from",
+    "instance_of": "instantiates",
+    "type_annotation": "is annotated with",
+    "return_type": "returns",
+}
+
+# Callers, dependencies and tests of one symbol in a single statement.
+# Every branch is an exact match on an indexed column: calls.callee,
+# import_links(definition_file, definition_symbol), symbol_references
+# (target_file, target_symbol), calls(caller_file, line), symbols.name and
+# test_links(target, link_type). Import links resolve one definition per
+# statement, so the other names of a resolved ``from x import a, b`` are
+# matched against imported_symbols. Call sites map to their innermost
+# enclosing function (other references to their innermost symbol) through
+# symbols(file_path, start_line, end_line).
+RELATIONSHIPS_SQL = """
+WITH edited AS (
+    SELECT start_line, end_line FROM symbols
+    WHERE name = :symbol AND file_path = :file
+),
+caller_sites AS (
+    SELECT c.caller_file AS file, c.line AS line, 'call' AS kind
+    FROM calls c
+    WHERE c.callee = :symbol
+      AND (c.caller_file = :file OR c.caller_file IN (
+          SELECT l.importer_file FROM import_links l
+          WHERE l.definition_file = :file AND (
+              l.definition_symbol = :symbol
+              OR EXISTS (SELECT 1 FROM json_each(l.imported_symbols) WHERE value = :symbol)
+          )
+      ))
+    UNION
+    SELECT r.source_file, r.source_line, r.reference_type
+    FROM symbol_references r
+    WHERE r.target_file = :file AND r.target_symbol = :symbol
+),
+dependency_sites AS (
+    SELECT c.callee AS name, NULL AS file, 'call' AS kind
+    FROM edited e
+    JOIN calls c ON c.caller_file = :file AND c.line BETWEEN e.start_line AND e.end_line
+    UNION
+    SELECT r.target_symbol, r.target_file, r.reference_type
+    FROM edited e
+    JOIN symbol_references r ON r.source_file = :file
+        AND r.source_line BETWEEN e.start_line AND e.end_line
+    WHERE r.target_file IS NOT NULL
+)
+SELECT 'caller' AS relation, s.name, s.file_path, s.start_line AS line, site.kind
+FROM caller_sites site
+JOIN symbols s ON s.id = (
+    SELECT id FROM symbols
+    WHERE file_path = site.file AND start_line <= site.line AND end_line >= site.line
+      AND (type IN ('function', 'method') OR site.kind NOT IN ('call', 'method_call'))
+    ORDER BY start_line DESC
+    LIMIT 1
+)
+WHERE NOT (s.name = :symbol AND s.file_path = :file)
+
+UNION ALL
+
+SELECT 'dependency', d.name, d.file_path, d.start_line, site.kind
+FROM dependency_sites site
+JOIN symbols d ON d.name = site.name
+WHERE NOT (d.name = :symbol AND d.file_path = :file)
+  AND (
+      d.file_path = site.file
+      OR (site.file IS NULL AND (d.file_path = :file OR d.file_path IN (
+          SELECT l.definition_file FROM import_links l
+          WHERE l.importer_file = :file AND l.definition_file IS NOT NULL AND (
+              l.definition_symbol = site.name
+              OR EXISTS (SELECT 1 FROM json_each(l.imported_symbols) WHERE value = site.name)
+          )
+      )))
+  )
+
+UNION ALL
+
+SELECT 'test', t.test_name, t.test_file, t.test_line, t.link_type
+FROM test_links t
+WHERE t.target = :symbol AND t.link_type IN ('call', 'reference')
+  AND (
+      t.test_file IN (SELECT l.importer_file FROM import_links l WHERE l.definition_file = :file)
+      OR EXISTS (
+          SELECT 1 FROM test_links i
+          WHERE i.test_file = t.test_file AND i.link_type = 'import' AND i.target = :module
+      )
+  )
+"""
+
 
 @dataclass
 class Prediction:
@@ -27,7 +126,7 @@ class Prediction:
     symbol: str
     file: str
     line: int
-    reason: str  # "direct_caller", "direct_dependency", "test_file_pattern_match"
+    reason: str  # "direct_caller", "direct_dependency", "test_reference"
     relationship: str  # Human-readable explanation
     anchor: Optional[Dict[str, Any]] = None  # Context anchor metadata
     command: Optional[str] = None  # Suggested cerberus command
@@ -53,18 +152,24 @@ class PredictionEngine:
     - Every suggestion must be explainable by code structure
     """
 
-    def __init__(self, index_path: str = "cerberus.db", confidence_threshold: float = 0.9):
+    def __init__(
+        self,
+        index_path: str = "cerberus.db",
+        confidence_threshold: float = 0.9,
+        store: Optional[SQLiteIndexStore] = None
+    ):
         """
         Initialize the prediction engine.
 
         Args:
             index_path: Path to Cerberus SQLite index
             confidence_threshold: Minimum confidence score (default: 0.9)
+            store: Optional open index store (default: opened from index_path)
         """
         self.index_path = index_path
         self.confidence_threshold = confidence_threshold
-        self.conn = sqlite3.connect(index_path)
-        self.conn.row_factory = sqlite3.Row
+        self.store = store or SQLiteIndexStore(Path(index_path))
+        self.test_index = TestIndex(self.store)
 
     def predict_related_changes(
         self,
@@ -83,22 +188,8 @@ class PredictionEngine:
         Returns:
             Tuple of (predictions, stats)
         """
-        all_suggestions = []
-
-        # 1. Direct Callers (Confidence: 1.0)
-        # Who calls this symbol? They might need updates.
-        caller_suggestions = self._find_direct_callers(edited_symbol, file_path)
-        all_suggestions.extend(caller_suggestions)
-
-        # 2. Direct Dependencies (Confidence: 1.0)
-        # What does this symbol call? Signature changes might propagate.
-        dependency_suggestions = self._find_direct_dependencies(edited_symbol, file_path)
-        all_suggestions.extend(dependency_suggestions)
-
-        # 3. Test File Pattern Match (Confidence: 0.95)
-        # Exact pattern: test_<symbol>.py or test_<module>.py with verified imports
-        test_suggestions = self._find_test_files(edited_symbol, file_path)
-        all_suggestions.extend(test_suggestions)
+        # Callers (1.0), dependencies (1.0) and tests (0.95) in one query
+        all_suggestions = self._find_relationships(edited_symbol, file_path)
 
         # Filter by confidence threshold
         high_confidence = [s for s in all_suggestions if s.confidence_score >= self.confidence_threshold]
@@ -119,170 +210,131 @@ class PredictionEngine:
 
         return shown, stats
 
-    def _find_direct_callers(self, symbol: str, file_path: str) -> List[Prediction]:
+    def _find_relationships(self, symbol: str, file_path: str) -> List[Prediction]:
         """
-        Find direct callers using AST call graph (Phase 5 symbolic intelligence).
+        Find callers, dependencies and tests of a symbol in one indexed query.
 
-        Confidence: 1.0 (AST-verified)
-        """
-        predictions = []
+        Callers are functions whose calls resolve to the symbol (same file or
+        a resolved import) plus resolved symbol references. Dependencies are
+        resolved callees and references inside the symbol's body. Tests are
+        test functions that call or reference the symbol and import its module.
+        A symbol that is both a caller and a test is reported once, as a test.
 
+        Confidence: 1.0 (callers, dependencies), 0.95 (tests)
+        """
         try:
-            # Use symbolic deps command to get callers
-            result = subprocess.run(
-                ["cerberus", "symbolic", "deps", "--symbol", symbol, "--json"],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                callers = data.get("callers", [])
-
-                for caller in callers:
-                    caller_file = caller.get("caller_file", "")
-                    line = caller.get("line", 0)
-
-                    # Extract symbol name from caller context if available
-                    # For now, use file name as symbol hint
-                    caller_symbol = Path(caller_file).stem
-
-                    predictions.append(Prediction(
-                        confidence="HIGH",
-                        confidence_score=1.0,
-                        symbol=caller_symbol,
-                        file=caller_file,
-                        line=line,
-                        reason="direct_caller",
-                        relationship=f"calls {symbol} (AST-verified)",
-                        command=f"cerberus retrieval get-symbol {caller_symbol}"
-                    ))
-        except Exception as e:
+            self.test_index.ensure_built()
+            conn = self.store._get_connection()
+            try:
+                rows = conn.execute(RELATIONSHIPS_SQL, {
+                    "symbol": symbol,
+                    "file": file_path,
+                    "module": Path(file_path).stem,
+                }).fetchall()
+            finally:
+                conn.close()
+        except Exception:
             # Fail gracefully, don't crash on errors
-            pass
-
-        return predictions
+            return []
 
-    def _find_direct_dependencies(self, symbol: str, file_path: str) -> List[Prediction]:
-        """
-        Find direct dependencies (what this symbol calls).
-
-        Confidence: 1.0 (AST-verified)
-        """
-        predictions = []
+        predictions: Dict[Tuple[str, str], Prediction] = {}
+        for relation, name, related_file, line, kind in rows:
+            key = (related_file, name)
+            if key in predictions and relation != "test":
+                continue
 
-        try:
-            # Query the calls table for what this symbol calls
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                SELECT DISTINCT
-                    c.callee_name,
-                    c.file_path,
-                    c.line_number
-                FROM calls c
-                WHERE c.caller_name = ?
-                  AND c.file_path = ?
-                LIMIT 10
-            """, (symbol, file_path))
-
-            for row in cursor.fetchall():
-                callee_name = row["callee_name"]
-                callee_file = row["file_path"]
-                line = row["line_number"]
-
-                predictions.append(Prediction(
+            if relation == "caller":
+                prediction = Prediction(
+                    confidence="HIGH",
+                    confidence_score=1.0,
+                    symbol=name,
+                    file=related_file,
+                    line=line,
+                    reason="direct_caller",
+                    relationship=f"{REFERENCE_VERBS.get(kind, 'calls')} {symbol} (AST-verified)",
+                    command=f"cerberus retrieval get-symbol {name}"
+                )
+            elif relation == "dependency":
+                prediction = Prediction(
                     confidence="HIGH",
                     confidence_score=1.0,
-                    symbol=callee_name,
-                    file=callee_file,
+                    symbol=name,
+                    file=related_file,
                     line=line,
                     reason="direct_dependency",
                     relationship=f"{symbol} calls this (signature change propagation)",
-                    command=f"cerberus retrieval get-symbol {callee_name}"
-                ))
-        except Exception as e:
-            # Fail gracefully
-            pass
+                    command=f"cerberus retrieval get-symbol {name}"
+                )
+            else:
+                prediction = Prediction(
+                    confidence="HIGH",
+                    confidence_score=0.95,
+                    symbol=name,
+                    file=related_file,
+                    line=line,
+                    reason="test_reference",
+                    relationship=f"test for {symbol} ({kind} + verified import)",
+                    command=f"cerberus retrieval get-symbol {name}"
+                )
+            predictions[key] = prediction
 
-        return predictions
+        return list(predictions.values())
 
-    def _find_test_files(self, symbol: str, file_path: str) -> List[Prediction]:
+    def _find_direct_callers(self, symbol: str, file_path: str) -> List[Prediction]:
         """
-        Find test files using exact pattern matching + import verification.
-
-        Patterns:
-        - test_<symbol>.py
-        - test_<module>.py
-        - tests/test_<symbol>.py
+        Find direct callers using the resolved call graph.
 
-        Confidence: 0.95 (exact pattern + verified import)
+        Confidence: 1.0 (AST-verified)
         """
-        predictions = []
+        return [
+            p for p in self._find_relationships(symbol, file_path)
+            if p.reason == "direct_caller"
+        ]
 
-        # Extract module name from file path
-        module_name = Path(file_path).stem
+    def _find_direct_dependencies(self, symbol: str, file_path: str) -> List[Prediction]:
+        """
+        Find direct dependencies (what this symbol calls).
 
-        # Generate test file patterns
-        patterns = [
-            f"test_{symbol}.py",
-            f"test_{module_name}.py",
-            f"tests/test_{symbol}.py",
-            f"tests/test_{module_name}.py",
+        Confidence: 1.0 (AST-verified)
+        """
+        return [
+            p for p in self._find_relationships(symbol, file_path)
+            if p.reason == "direct_dependency"
         ]
 
-        # Get project root (directory containing the index)
-        project_root = Path(self.index_path).parent
-
-        for pattern in patterns:
-            # Check if test file exists
-            test_file_path = project_root / pattern
-
-            if test_file_path.exists():
-                # Verify it actually imports the edited file
-                if self._imports_file(str(test_file_path), file_path):
-                    # Extract test function name (convention: test_<symbol>)
-                    test_symbol = f"test_{symbol}"
-
-                    predictions.append(Prediction(
-                        confidence="HIGH",
-                        confidence_score=0.95,
-                        symbol=test_symbol,
-                        file=str(test_file_path),
-                        line=1,  # We don't have exact line, use 1
-                        reason="test_file_pattern_match",
-                        relationship=f"test file for {symbol} (exact match + verified import)",
-                        command=f"cerberus retrieval get-symbol {test_symbol}"
-                    ))
-                    break  # Only suggest one test file to avoid duplicates
-
-        return predictions
+    def _find_test_files(self, symbol: str, file_path: str) -> List[Prediction]:
+        """
+        Find tests that call or reference the symbol and import its module.
+
+        Confidence: 0.95 (test index link + verified import)
+        """
+        return [
+            p for p in self._find_relationships(symbol, file_path)
+            if p.reason == "test_reference"
+        ]
 
     def _imports_file(self, test_file: str, target_file: str) -> bool:
         """
         Verify that test_file imports target_file.
 
-        Uses index to check import relationships.
+        Uses resolved import links, then the test index import links
+        (exact module name match).
         """
         try:
-            cursor = self.conn.cursor()
-
-            # Get module name from target file
-            target_module = Path(target_file).stem
-
-            # Check if test file has imports from target
-            cursor.execute("""
-                SELECT COUNT(*) as count
-                FROM imports
-                WHERE file_path = ?
-                  AND (
-                      import_name LIKE ? OR
-                      module_path LIKE ?
-                  )
-            """, (test_file, f"%{target_module}%", f"%{target_module}%"))
-
-            row = cursor.fetchone()
-            return row["count"] > 0 if row else False
+            conn = self.store._get_connection()
+            try:
+                row = conn.execute("""
+                    SELECT EXISTS (
+                        SELECT 1 FROM import_links
+                        WHERE importer_file = ? AND definition_file = ?
+                    ) OR EXISTS (
+                        SELECT 1 FROM test_links
+                        WHERE test_file = ? AND link_type = 'import' AND target = ?
+                    )
+                """, (test_file, target_file, test_file, Path(target_file).stem)).fetchone()
+            finally:
+                conn.close()
+            return bool(row[0])
         except Exception:
             # If we can't verify, assume false (safe default)
             return False
@@ -291,20 +343,12 @@ class PredictionEngine:
         """
         Prioritize predictions by stability score (SAFE > MEDIUM > HIGH RISK).
 
-        Uses Phase 13.2 stability scoring.
+        Risk scores for all files are fetched in one pass.
         """
-        # For each prediction, get stability score
-        scored_predictions = []
+        risk_scores = self._get_risk_scores([pred.file for pred in predictions])
 
-        for pred in predictions:
-            risk_score = self._get_risk_score(pred.file)
-            scored_predictions.append((pred, risk_score))
-
-        # Sort by risk score (lower is better = more stable)
-        scored_predictions.sort(key=lambda x: x[1])
-
-        # Return sorted predictions
-        return [pred for pred, _ in scored_predictions]
+        # Sort by risk score (lower is better = more stable); sort is stable
+        return sorted(predictions, key=lambda pred: risk_scores[pred.file])
 
     def _get_risk_score(self, file_path: str) -> float:
         """
@@ -315,13 +359,43 @@ class PredictionEngine:
         - 0.34-0.66: MEDIUM
         - 0.67-1.0: HIGH RISK
         """
+        return self._get_risk_scores([file_path])[file_path]
+
+    def _get_risk_scores(self, file_paths: List[str]) -> Dict[str, float]:
+        """
+        Get risk scores for many files.
+
+        The score grows with the number of files importing a file (its fan-in
+        in the resolved import graph), saturating at RISK_IMPORTER_SATURATION
+        importers. Files outside the index get DEFAULT_RISK_SCORE.
+        """
+        unique = list(dict.fromkeys(file_paths))
+        scores = {path: DEFAULT_RISK_SCORE for path in unique}
+        if not unique:
+            return scores
+
         try:
-            # Try to get from git churn and coverage data
-            # For now, return default medium risk
-            # TODO: Integrate with StabilityScorer from Phase 13.2
-            return 0.5
+            conn = self.store._get_connection()
+            try:
+                for start in range(0, len(unique), LOOKUP_CHUNK_SIZE):
+                    chunk = unique[start:start + LOOKUP_CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(f"""
+                        SELECT f.path, (
+                            SELECT COUNT(DISTINCT l.importer_file) FROM import_links l
+                            WHERE l.definition_file = f.path AND l.importer_file != f.path
+                        ) AS importers
+                        FROM files f
+                        WHERE f.path IN ({placeholders})
+                    """, chunk)
+                    for path, importers in rows:
+                        scores[path] = min(importers / RISK_IMPORTER_SATURATION, 1.0)
+            finally:
+                conn.close()
         except Exception:
-            return 0.5  # Default to medium risk
+            pass  # Keep default medium risk
+
+        return scores
 
     def to_json(self, predictions: List[Prediction], stats: PredictionStats) -> Dict[str, Any]:
         """
@@ -369,8 +443,3 @@ class PredictionEngine:
                 lines.append(f"     Command: {pred.command}")
 
         return "\n".join(lines)
-
-    def __del__(self):
-        """Close database connection on cleanup."""
-        if hasattr(self, 'conn'):
-            self.conn.close()
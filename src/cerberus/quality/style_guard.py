@@ -14,6 +14,20 @@ from enum import Enum
 
 from cerberus.logging_config import logger
 
+# Bump when detection or fix rules change so cached style results are recomputed
+STYLE_RULES_VERSION = "1"
+
+LANGUAGE_MAP = {
+    ".py": "python",
+    ".js": "javascript",
+    ".ts": "typescript",
+    ".jsx": "javascript",
+    ".tsx": "typescript",
+    ".go": "go",
+    ".java": "java",
+    ".rs": "rust",
+}
+
 
 class IssueType(Enum):
     """Types of style issues that can be detected."""
@@ -49,6 +63,18 @@ class StyleIssue:
             "auto_fixable": self.auto_fixable,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "StyleIssue":
+        """Rebuild an issue from to_dict() output."""
+        return cls(
+            issue_type=IssueType(data["type"]),
+            line=data.get("line"),
+            lines=tuple(data["lines"]) if data.get("lines") else None,
+            description=data.get("description", ""),
+            suggestion=data.get("suggestion", ""),
+            auto_fixable=data.get("auto_fixable", True),
+        )
+
 
 @dataclass
 class StyleFix:
@@ -175,20 +201,7 @@ class StyleGuardV2:
         Returns:
             Language identifier
         """
-        ext = Path(file_path).suffix.lower()
-
-        language_map = {
-            ".py": "python",
-            ".js": "javascript",
-            ".ts": "typescript",
-            ".jsx": "javascript",
-            ".tsx": "typescript",
-            ".go": "go",
-            ".java": "java",
-            ".rs": "rust",
-        }
-
-        return language_map.get(ext, "unknown")
+        return LANGUAGE_MAP.get(Path(file_path).suffix.lower(), "unknown")
 
     def _detect_basic_issues(self, content: str) -> List[StyleIssue]:
         """
@@ -313,11 +313,10 @@ class ContextAssembler:
         In production, this would use the synthesis package.
         """
         try:
-            # Try to use the synthesis package
-            from cerberus.synthesis import Skeletonizer
+            # Try to use the synthesis package (skeletons cached in the index)
+            from cerberus.synthesis import SkeletonCache
 
-            skel = Skeletonizer()
-            result = skel.skeletonize_file(symbol.file_path, preserve_symbols=[])
+            result = SkeletonCache(self.store).get(symbol.file_path, preserve_symbols=[])
 
             # Extract just this class from the skeletonized content
             # For simplicity, return the full skeletonized file
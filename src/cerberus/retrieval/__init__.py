@@ -4,7 +4,18 @@ Retrieval module for hybrid search (BM25 + Vector).
 Public API for searching code symbols with keyword and semantic search.
 """
 
-from .facade import hybrid_search, find_symbol, read_range
+from typing import TYPE_CHECKING
+
+from cerberus.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .facade import hybrid_search, find_symbol, read_range
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "hybrid_search": ".facade",
+    "find_symbol": ".facade",
+    "read_range": ".facade",
+})
 
 __all__ = [
     "hybrid_search",
@@ -4,9 +4,10 @@ BM25 keyword search implementation.
 Okapi BM25 algorithm for ranking documents by keyword relevance.
 """
 
+import heapq
 import math
 import re
-from typing import List, Dict, Set
+from typing import List, Dict, Tuple
 from collections import Counter
 from loguru import logger
 
@@ -34,6 +35,10 @@ def tokenize(text: str) -> List[str]:
 class BM25Index:
     """
     BM25 index for keyword search.
+
+    Documents are tokenized once into an inverted index (term -> postings of
+    document index and term frequency), so a search only scores documents
+    that contain a query term.
     """
 
     def __init__(
@@ -57,22 +62,23 @@ class BM25Index:
         # Build index
         self.doc_count = len(documents)
         self.doc_lengths: List[int] = []
-        self.doc_tokens: List[List[str]] = []
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}  # Term -> [(doc_idx, tf)]
         self.term_doc_freq: Dict[str, int] = Counter()  # Term -> number of docs containing it
         self.idf_cache: Dict[str, float] = {}
 
         # Index documents
         total_length = 0
-        for doc in documents:
+        for doc_idx, doc in enumerate(documents):
             tokens = tokenize(doc["snippet_text"])
-            self.doc_tokens.append(tokens)
             self.doc_lengths.append(len(tokens))
             total_length += len(tokens)
 
-            # Track term document frequency
-            unique_tokens = set(tokens)
-            for token in unique_tokens:
-                self.term_doc_freq[token] += 1
+            for token, tf in Counter(tokens).items():
+                self.postings.setdefault(token, []).append((doc_idx, tf))
+
+        # Track term document frequency
+        for term, postings in self.postings.items():
+            self.term_doc_freq[term] = len(postings)
 
         # Average document length
         self.avg_doc_length = total_length / self.doc_count if self.doc_count > 0 else 0
@@ -105,7 +111,7 @@ class BM25Index:
         denominator = doc_freq + 0.5
         return math.log((numerator / denominator) + 1.0)
 
-    def _compute_term_score(self, term: str, doc_idx: int) -> float:
+    def _compute_term_score(self, idf: float, tf: int, doc_length: int) -> float:
         """
         Compute BM25 score for a term in a document.
 
@@ -119,37 +125,20 @@ class BM25Index:
         - k1, b = tuning parameters
 
         Args:
-            term: Search term
-            doc_idx: Document index
+            idf: IDF of the term
+            tf: Term frequency in the document
+            doc_length: Document length in tokens
 
         Returns:
             BM25 score for term in document
         """
-        # Get IDF (precomputed)
-        if term not in self.idf_cache:
-            return 0.0
-
-        idf = self.idf_cache[term]
-
-        # Get term frequency in document
-        doc_tokens = self.doc_tokens[doc_idx]
-        tf = doc_tokens.count(term)
-
-        if tf == 0:
-            return 0.0
-
-        # Get document length
-        doc_length = self.doc_lengths[doc_idx]
-
         # Compute length normalization
         length_norm = 1 - self.b + self.b * (doc_length / self.avg_doc_length)
 
         # Compute BM25 score
         numerator = tf * (self.k1 + 1)
         denominator = tf + self.k1 * length_norm
-        score = idf * (numerator / denominator)
-
-        return score
+        return idf * (numerator / denominator)
 
     def search(self, query: str, top_k: int = 10) -> List[SearchResult]:
         """
@@ -169,25 +158,24 @@ class BM25Index:
             logger.debug("Empty query after tokenization")
             return []
 
-        # Score each document
-        scores: List[tuple] = []  # (score, doc_idx)
-
-        for doc_idx in range(self.doc_count):
-            doc_score = 0.0
-
-            # Sum BM25 scores for each query term
-            for term in query_tokens:
-                doc_score += self._compute_term_score(term, doc_idx)
-
-            if doc_score > 0:
-                scores.append((doc_score, doc_idx))
-
-        # Sort by score (descending)
-        scores.sort(reverse=True, key=lambda x: x[0])
+        # Sum BM25 scores for each query term over the documents containing it
+        doc_scores: Dict[int, float] = {}
+        for term in query_tokens:
+            idf = self.idf_cache.get(term)
+            if idf is None:
+                continue
+            for doc_idx, tf in self.postings[term]:
+                doc_scores[doc_idx] = doc_scores.get(doc_idx, 0.0) + self._compute_term_score(
+                    idf, tf, self.doc_lengths[doc_idx]
+                )
+
+        # Top K by score; equal scores keep document order
+        scores = [(score, doc_idx) for doc_idx, score in sorted(doc_scores.items()) if score > 0]
+        top = heapq.nlargest(top_k, scores, key=lambda x: x[0])
 
         # Get top K results
         results: List[SearchResult] = []
-        for score, doc_idx in scores[:top_k]:
+        for score, doc_idx in top:
             doc = self.documents[doc_idx]
             symbol = doc["symbol"]
 
@@ -0,0 +1,123 @@
+"""
+In-process cache of hybrid search results.
+
+Agents repeat the same searches many times within a session. Results are
+keyed by the normalized query, the search options and the index generation,
+which every build and incremental update (including watcher refreshes)
+bumps, so a cached result is never served for a changed index.
+"""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from ..index.columnar_store import ColumnarIndexStore
+from ..index.index_loader import is_columnar_index, is_sqlite_index
+from ..schemas import HybridSearchResult
+from ..storage.sqlite.persistence import read_generation
+from .config import HYBRID_SEARCH_CONFIG
+
+
+def normalize_query(query: str) -> str:
+    """Collapse whitespace so trivially different queries share an entry."""
+    return " ".join(query.split())
+
+
+def index_version(index_path: Path) -> Optional[Tuple[str, Hashable]]:
+    """
+    Identify the current contents of an index.
+
+    SQLite and columnar indexes are identified by their path and generation
+    counter, JSON indexes by their path, size and modification time.
+
+    Args:
+        index_path: Path to the index (.db file, directory, .cidx or .json file)
+
+    Returns:
+        Hashable version, or None if the index cannot be identified
+    """
+    try:
+        if is_sqlite_index(index_path):
+            db_path = index_path if index_path.suffix == ".db" else index_path / "cerberus.db"
+            generation = read_generation(db_path)
+            if generation is None:
+                return None
+            return str(db_path.resolve()), generation
+
+        if is_columnar_index(index_path):
+            generation = ColumnarIndexStore(index_path).generation()
+            if generation is None:
+                return None
+            return str(index_path.resolve()), generation
+
+        stat = index_path.stat()
+        return str(index_path.resolve()), (stat.st_size, stat.st_mtime_ns)
+    except OSError:
+        return None
+
+
+class SearchResultCache:
+    """Thread-safe LRU cache of hybrid search results."""
+
+    def __init__(self, max_size: int):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached searches (0 disables caching)
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, List[HybridSearchResult]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[List[HybridSearchResult]]:
+        """Return copies of the cached results for a key, or None on a miss."""
+        with self._lock:
+            results = self._entries.get(key)
+            if results is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return [result.model_copy() for result in results]
+
+    def put(self, key: Hashable, results: List[HybridSearchResult]) -> None:
+        """Store results for a key, evicting the least recently used entries."""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = [result.model_copy() for result in results]
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return size and hit/miss counters."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            }
+
+
+# Process-wide cache used by hybrid_search()
+result_cache = SearchResultCache(HYBRID_SEARCH_CONFIG["result_cache_size"])
+
+
+def clear_search_cache() -> None:
+    """Drop all cached hybrid search results."""
+    result_cache.clear()
@@ -9,6 +9,8 @@ HYBRID_SEARCH_CONFIG = {
     "top_k_per_method": 20,  # Retrieve top K from each method before fusion
     "final_top_k": 10,  # Return top K after fusion
     "min_score_threshold": 0.1,  # Minimum score to include in results
+    "result_cache_size": 256,  # Searches cached per process, keyed by index generation (0 = off)
+    "legacy_index_cache_size": 2,  # Loaded JSON indexes kept with their search structures (0 = off)
 }
 
 BM25_CONFIG = {
@@ -7,21 +7,26 @@ Optimized for Phase 4 Aegis-Scale with streaming support for SQLite indices.
 """
 
 from pathlib import Path
-from typing import List, Literal, Optional, Union
+from typing import List, Literal, Optional, Tuple, Union
+import numpy as np
 from loguru import logger
 
-from ..schemas import ScanResult, SearchResult, HybridSearchResult, CodeSymbol, CodeSnippet
-from ..index.index_loader import load_index
+from ..schemas import ScanResult, SearchResult, HybridSearchResult, CodeSymbol
+from ..index.index_loader import is_sqlite_index, load_index
 from ..storage import ScanResultAdapter, SQLiteIndexStore, FAISSVectorStore
-from .bm25_search import BM25Index
-from .vector_search import vector_search, vector_search_faiss
+from ..storage.sqlite.symbols import SymbolRow
+from .legacy_index import LegacySearchIndex, load_legacy_index
+from .vector_search import vector_search_ids
 from .hybrid_ranker import (
     detect_query_type,
+    fuse_ids,
     reciprocal_rank_fusion,
+    to_hybrid_results,
     weighted_score_fusion,
 )
 from .utils import find_symbol, read_range
-from .config import HYBRID_SEARCH_CONFIG, BM25_CONFIG, VECTOR_CONFIG
+from .cache import index_version, normalize_query, result_cache
+from .config import HYBRID_SEARCH_CONFIG, VECTOR_CONFIG
 
 
 # Re-export utilities for backward compatibility
@@ -42,7 +47,8 @@ def hybrid_search(
     Perform hybrid search combining BM25 keyword and vector semantic search.
 
     Optimized for Phase 4: Uses streaming queries for SQLite indices to maintain
-    constant memory usage regardless of project size.
+    constant memory usage regardless of project size. Results are cached per
+    process and reused until the index generation changes.
 
     Args:
         query: Search query
@@ -80,37 +86,74 @@ def hybrid_search(
             keyword_weight = 0.3
             semantic_weight = 0.7
 
-    # Load index
-    scan_result = load_index(index_path)
-
-    # Detect if SQLite index and use optimized streaming path
-    is_sqlite = isinstance(scan_result, ScanResultAdapter)
-
-    if is_sqlite:
-        logger.info("Using streaming SQLite optimized search path")
-        return _hybrid_search_streaming(
-            query=query,
-            scan_result=scan_result,
-            mode=mode,
-            top_k=top_k,
-            keyword_weight=keyword_weight,
-            semantic_weight=semantic_weight,
-            fusion_method=fusion_method,
-            padding=padding,
+    # Repeated searches on an unchanged index are served from the cache
+    version = index_version(Path(index_path))
+    cache_key = None
+    if version is not None:
+        cache_key = (
+            normalize_query(query), mode, top_k, keyword_weight, semantic_weight,
+            fusion_method, padding, version,
         )
-    else:
+        cached = result_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Search cache hit for '{query}'")
+            return cached
+
+    results = _run_hybrid_search(
+        query=query,
+        index_path=index_path,
+        mode=mode,
+        top_k=top_k,
+        keyword_weight=keyword_weight,
+        semantic_weight=semantic_weight,
+        fusion_method=fusion_method,
+        padding=padding,
+    )
+
+    if cache_key is not None:
+        result_cache.put(cache_key, results)
+    return results
+
+
+def _run_hybrid_search(
+    query: str,
+    index_path: Path,
+    mode: str,
+    top_k: int,
+    keyword_weight: float,
+    semantic_weight: float,
+    fusion_method: str,
+    padding: int,
+) -> List[HybridSearchResult]:
+    """Load the index and run the search path matching its format."""
+    index_path = Path(index_path)
+
+    if not is_sqlite_index(index_path):
         logger.info("Using legacy in-memory search path (Legacy memory-load index)")
         return _hybrid_search_legacy(
             query=query,
-            scan_result=scan_result,
+            legacy_index=load_legacy_index(index_path, padding),
             mode=mode,
             top_k=top_k,
             keyword_weight=keyword_weight,
             semantic_weight=semantic_weight,
             fusion_method=fusion_method,
-            padding=padding,
         )
 
+    # SQLite index: use the optimized streaming path
+    scan_result = load_index(index_path)
+    logger.info("Using streaming SQLite optimized search path")
+    return _hybrid_search_streaming(
+        query=query,
+        scan_result=scan_result,
+        mode=mode,
+        top_k=top_k,
+        keyword_weight=keyword_weight,
+        semantic_weight=semantic_weight,
+        fusion_method=fusion_method,
+        padding=padding,
+    )
+
 
 def _hybrid_search_streaming(
     query: str,
@@ -125,152 +168,108 @@ def _hybrid_search_streaming(
     """
     Streaming search for SQLite indices (constant memory).
 
-    Key optimization: Defer snippet loading until after we identify top candidates.
+    Key optimization: the SQLite symbol rowid is the candidate ID from FTS5
+    and FAISS through fusion. Keyword hits stay lightweight SymbolRows,
+    vector hits stay ID arrays, and only the final top_k vector hits are
+    looked up (in one batched query) before CodeSymbol / HybridSearchResult
+    models are built.
     """
     store = scan_result._store
     top_k_per_method = HYBRID_SEARCH_CONFIG["top_k_per_method"]
 
-    bm25_results: List[SearchResult] = []
-    vector_results: List[SearchResult] = []
+    keyword_rows: List[SymbolRow] = []
+    vector_ids = np.empty(0, dtype=np.int64)
+    vector_scores = np.empty(0)
 
     # Phase 7: FTS5 keyword search (zero RAM overhead - SQLite C-engine handles BM25)
     if mode in ["keyword", "balanced"]:
         logger.info(f"Performing FTS5 keyword search for '{query}'")
-
-        # Use SQLite FTS5 for zero-memory keyword search
-        # No need to load symbols into memory - SQLite handles everything
-        fts5_results = []
-        for symbol, score in store.fts5_search(query, top_k=top_k_per_method):
-            snippet = CodeSnippet(
-                file_path=symbol.file_path,
-                start_line=symbol.start_line,
-                end_line=symbol.end_line,
-                content="",  # Loaded lazily later
-            )
-            fts5_results.append(SearchResult(
-                symbol=symbol,
-                score=score,
-                snippet=snippet,
-            ))
-
-        bm25_results = fts5_results
-        logger.debug(f"FTS5 search returned {len(bm25_results)} results")
+        keyword_rows = store.fts5_search_rows(query, top_k=top_k_per_method)
+        logger.debug(f"FTS5 search returned {len(keyword_rows)} results")
 
     # Vector semantic search (query FAISS directly)
-    has_embeddings = False
     if mode in ["semantic", "balanced"]:
         logger.info(f"Performing streaming vector search for '{query}'")
 
         # Check if FAISS store is available
         if store._faiss_store and len(store._faiss_store) > 0:
             logger.debug("Using FAISS direct query (streaming)")
-            has_embeddings = True
-            vector_results = vector_search_faiss(
-                query=query,
-                sqlite_store=store,
-                faiss_store=store._faiss_store,
-                top_k=top_k_per_method,
-                model_name=VECTOR_CONFIG["model"],
-                padding=padding,
-            )
+            try:
+                vector_ids, vector_scores = vector_search_ids(
+                    query=query,
+                    faiss_store=store._faiss_store,
+                    top_k=top_k_per_method,
+                    model_name=VECTOR_CONFIG["model"],
+                )
+            except Exception as e:
+                logger.error(f"FAISS vector search failed: {e}")
         else:
             logger.warning("No FAISS store available, falling back to keyword search")
 
     # Handle single-method modes
     if mode == "keyword":
-        # Load snippets for top results only
-        return _finalize_results(bm25_results[:top_k], "keyword", padding)
+        return _finalize_results(_row_hits(keyword_rows[:top_k]), "keyword")
 
     if mode == "semantic":
         # FALLBACK: If no embeddings, use keyword search instead
-        if not has_embeddings or not vector_results:
+        if not len(vector_ids):
             logger.warning("Semantic search requested but no embeddings available - falling back to keyword search")
-            if not bm25_results:
+            if not keyword_rows:
                 # Need to run keyword search since it wasn't done
                 logger.info(f"Performing FTS5 keyword search for fallback")
-                fts5_results = []
-                for symbol, score in store.fts5_search(query, top_k=top_k_per_method):
-                    snippet = CodeSnippet(
-                        file_path=symbol.file_path,
-                        start_line=symbol.start_line,
-                        end_line=symbol.end_line,
-                        content="",  # Loaded lazily later
-                    )
-                    fts5_results.append(SearchResult(
-                        symbol=symbol,
-                        score=score,
-                        snippet=snippet,
-                    ))
-                bm25_results = fts5_results
-            return _finalize_results(bm25_results[:top_k], "keyword_fallback", padding)
-
-        return _finalize_results(vector_results[:top_k], "semantic", padding)
+                keyword_rows = store.fts5_search_rows(query, top_k=top_k_per_method)
+            return _finalize_results(_row_hits(keyword_rows[:top_k]), "keyword_fallback")
+
+        rows = store.get_symbol_rows(vector_ids[:top_k].tolist())
+        hits = [
+            (rows[symbol_id], score)
+            for symbol_id, score in zip(vector_ids[:top_k].tolist(), vector_scores.tolist())
+            if symbol_id in rows  # Orphaned FAISS entries are skipped
+        ]
+        return _finalize_results(hits, "semantic")
 
     # Balanced mode - fuse results
     # FALLBACK: If no embeddings, use keyword search only
-    if not has_embeddings or not vector_results:
+    if not len(vector_ids):
         logger.warning("Balanced mode requested but no embeddings available - falling back to keyword search")
-        return _finalize_results(bm25_results[:top_k], "keyword_fallback", padding)
+        return _finalize_results(_row_hits(keyword_rows[:top_k]), "keyword_fallback")
 
     logger.info(f"Fusing results using {fusion_method} method")
 
-    if fusion_method == "rrf":
-        hybrid_results = reciprocal_rank_fusion(bm25_results, vector_results)
-    else:
-        hybrid_results = weighted_score_fusion(
-            bm25_results,
-            vector_results,
-            keyword_weight=keyword_weight,
-            semantic_weight=semantic_weight,
-        )
+    fused = fuse_ids(
+        [row.id for row in keyword_rows],
+        [row.score for row in keyword_rows],
+        vector_ids,
+        vector_scores,
+        method="rrf" if fusion_method == "rrf" else "weighted",
+        keyword_weight=keyword_weight,
+        semantic_weight=semantic_weight,
+        top_k=top_k,
+    )
 
-    # Load full snippets for final top-K results only (lazy loading optimization)
-    final_results = hybrid_results[:top_k]
-    for result in final_results:
-        # Load actual file snippet if not already loaded
-        if not hasattr(result, 'snippet') or not result.snippet:
-            snippet_obj = read_range(
-                Path(result.symbol.file_path),
-                result.symbol.start_line,
-                result.symbol.end_line,
-                padding=padding,
-            )
-            # Note: HybridSearchResult doesn't have snippet field, but we ensure SearchResults do
+    # Only vector-only hits among the final top-K need a lookup
+    rows = {row.id: row for row in keyword_rows}
+    rows.update(store.get_symbol_rows([hit.id for hit in fused if hit.id not in rows]))
+    fused = [hit for hit in fused if hit.id in rows]  # Orphaned FAISS entries are skipped
 
-    return final_results
+    return to_hybrid_results(fused, lambda symbol_id: rows[symbol_id].to_symbol())
 
 
 def _hybrid_search_legacy(
     query: str,
-    scan_result: ScanResult,
+    legacy_index: LegacySearchIndex,
     mode: str,
     top_k: int,
     keyword_weight: float,
     semantic_weight: float,
     fusion_method: str,
-    padding: int,
 ) -> List[HybridSearchResult]:
     """
     Legacy search for JSON indices (full memory load).
 
-    Maintains backward compatibility with existing code.
+    Maintains backward compatibility with existing code. Snippets, the BM25
+    index and the vector store come from the cached LegacySearchIndex.
     """
-    # Build document snippets (legacy full-load approach)
-    snippets = []
-    for symbol in scan_result.symbols:
-        snippet_obj = read_range(
-            Path(symbol.file_path),
-            symbol.start_line,
-            symbol.end_line,
-            padding=padding,
-        )
-        snippets.append({
-            "symbol": symbol,
-            "snippet_text": snippet_obj.content,
-        })
-
-    logger.info(f"Built {len(snippets)} document snippets for search")
-
     # Perform searches based on mode
     bm25_results: List[SearchResult] = []
     vector_results: List[SearchResult] = []
@@ -279,23 +278,16 @@ def _hybrid_search_legacy(
 
     if mode in ["keyword", "balanced"]:
         logger.info(f"Performing BM25 keyword search for '{query}'")
-        bm25_index = BM25Index(
-            documents=snippets,
-            k1=BM25_CONFIG["k1"],
-            b=BM25_CONFIG["b"],
-        )
-        bm25_results = bm25_index.search(query, top_k=top_k_per_method)
+        bm25_results = legacy_index.keyword_search(query, top_k=top_k_per_method)
 
     has_embeddings = False
     if mode in ["semantic", "balanced"]:
         logger.info(f"Performing vector semantic search for '{query}'")
         # Check if embeddings are available
-        if scan_result.embeddings:
+        if legacy_index.scan_result.embeddings:
             has_embeddings = True
-            vector_results = vector_search(
-                query=query,
-                scan_result=scan_result,
-                snippets=snippets,
+            vector_results = legacy_index.vector_search(
+                query,
                 top_k=top_k_per_method,
                 model_name=VECTOR_CONFIG["model"],
             )
@@ -324,12 +316,7 @@ def _hybrid_search_legacy(
             if not bm25_results:
                 # Need to run keyword search since it wasn't done
                 logger.info(f"Performing BM25 keyword search for fallback")
-                bm25_index = BM25Index(
-                    documents=snippets,
-                    k1=BM25_CONFIG["k1"],
-                    b=BM25_CONFIG["b"],
-                )
-                bm25_results = bm25_index.search(query, top_k=top_k_per_method)
+                bm25_results = legacy_index.keyword_search(query, top_k=top_k_per_method)
 
             return [
                 HybridSearchResult(
@@ -389,56 +376,48 @@ def _hybrid_search_legacy(
     return hybrid_results[:top_k]
 
 
+def _row_hits(rows: List[SymbolRow]) -> List[Tuple[SymbolRow, float]]:
+    return [(row, row.score) for row in rows]
+
+
 def _finalize_results(
-    results: List[SearchResult],
+    hits: List[Tuple[SymbolRow, float]],
     match_type: str,
-    padding: int,
 ) -> List[HybridSearchResult]:
     """
-    Convert SearchResults to HybridSearchResults with proper scoring.
+    Convert single-method hits to HybridSearchResults with proper scoring.
 
     Args:
-        results: List of SearchResult objects
-        match_type: "keyword" or "semantic"
-        padding: Snippet padding
+        hits: (SymbolRow, score) pairs, best first
+        match_type: "keyword", "keyword_fallback" or "semantic"
 
     Returns:
         List of HybridSearchResult objects
     """
     hybrid_results = []
     seen = set()
-    for idx, r in enumerate(results):
-        key = (r.symbol.file_path, r.symbol.name, r.symbol.start_line, r.symbol.end_line, r.symbol.type)
-        if key in seen:
+    for idx, (row, score) in enumerate(hits):
+        if row.key in seen:
             continue
-        seen.add(key)
-        # Ensure snippet is loaded
-        if not r.snippet or not r.snippet.content:
-            snippet_obj = read_range(
-                Path(r.symbol.file_path),
-                r.symbol.start_line,
-                r.symbol.end_line,
-                padding=padding,
-            )
-            r.snippet.content = snippet_obj.content
+        seen.add(row.key)
 
         # Handle keyword and keyword_fallback modes (both use BM25 scores)
         if match_type in ["keyword", "keyword_fallback"]:
             hybrid_result = HybridSearchResult(
-                symbol=r.symbol,
-                bm25_score=r.score,
+                symbol=row.to_symbol(),
+                bm25_score=score,
                 vector_score=0.0,
-                hybrid_score=r.score,
+                hybrid_score=score,
                 rank=idx + 1,
                 match_type=match_type,  # Preserve the actual match_type
             )
         else:
             # Semantic mode (uses vector scores)
             hybrid_result = HybridSearchResult(
-                symbol=r.symbol,
+                symbol=row.to_symbol(),
                 bm25_score=0.0,
-                vector_score=r.score,
-                hybrid_score=r.score,
+                vector_score=score,
+                hybrid_score=score,
                 rank=idx + 1,
                 match_type="semantic",
             )
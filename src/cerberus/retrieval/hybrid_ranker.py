@@ -2,16 +2,39 @@
 Hybrid ranking fusion (BM25 + Vector).
 
 Uses Reciprocal Rank Fusion (RRF) to combine rankings from multiple methods.
+
+Fusion runs on integer ID arrays (SQLite symbol rowids on the streaming
+path) and returns FusedHit records for the kept candidates only;
+HybridSearchResult models are built for the results handed back to the
+caller (see to_hybrid_results).
 """
 
 import re
-from typing import List, Dict, Literal
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
 from loguru import logger
 
 from ..schemas import SearchResult, HybridSearchResult, CodeSymbol
 from .config import HYBRID_SEARCH_CONFIG, QUERY_DETECTION
 
 
+@dataclass(slots=True)
+class FusedHit:
+    """One fused candidate, identified by its integer ID."""
+    id: int
+    bm25_score: float
+    vector_score: float
+    hybrid_score: float
+    match_type: str
+
+
+def symbol_key(symbol: CodeSymbol) -> Tuple[str, str, int]:
+    """Identity of a symbol across search methods (file + name + line is stable)."""
+    return (symbol.file_path, symbol.name, symbol.start_line)
+
+
 def detect_query_type(query: str) -> Literal["keyword", "semantic"]:
     """
     Detect whether a query is keyword-based or semantic.
@@ -45,102 +68,158 @@ def detect_query_type(query: str) -> Literal["keyword", "semantic"]:
     return "semantic"
 
 
-def reciprocal_rank_fusion(
-    bm25_results: List[SearchResult],
-    vector_results: List[SearchResult],
+def fuse_ids(
+    keyword_ids: Sequence[int],
+    keyword_scores: Sequence[float],
+    vector_ids: Sequence[int],
+    vector_scores: Sequence[float],
+    method: Literal["rrf", "weighted"] = "rrf",
     k: int = 60,
-) -> List[HybridSearchResult]:
+    keyword_weight: float = 0.5,
+    semantic_weight: float = 0.5,
+    top_k: Optional[int] = None,
+) -> List[FusedHit]:
     """
-    Combine rankings using Reciprocal Rank Fusion (RRF).
+    Fuse two ranked ID lists with vectorized RRF or weighted scoring.
 
-    RRF score for a document = sum over all rankings of: 1 / (k + rank)
+    RRF score = sum over rankings of 1 / (k + rank); weighted score =
+    keyword_weight * bm25_score + semantic_weight * vector_score. Candidates
+    with equal scores keep the order they were first seen in (keyword hits
+    first).
 
     Args:
-        bm25_results: Results from BM25 search
-        vector_results: Results from vector search
+        keyword_ids: IDs from keyword search, best first
+        keyword_scores: Scores of keyword_ids
+        vector_ids: IDs from vector search, best first
+        vector_scores: Scores of vector_ids
+        method: "rrf" or "weighted"
         k: Constant for RRF (default 60, standard value)
+        keyword_weight: Weight for BM25 score (weighted fusion)
+        semantic_weight: Weight for vector score (weighted fusion)
+        top_k: Keep only the best top_k candidates (default: all)
 
     Returns:
-        List of HybridSearchResult sorted by fused score
+        FusedHits sorted by fused score
     """
-    # Build RRF scores with deduplication across both sources
-    rrf_scores: Dict[str, Dict] = {}  # symbol_id -> {symbol, bm25_score, vector_score, rrf_score, ranks}
-
-    # Helper to create unique symbol ID (file+name+line is stable across sources)
-    def symbol_id(symbol: CodeSymbol) -> str:
-        return f"{symbol.file_path}:{symbol.name}:{symbol.start_line}"
-
-    # Process BM25 results
-    for rank, result in enumerate(bm25_results, start=1):
-        sid = symbol_id(result.symbol)
-        if sid not in rrf_scores:
-            rrf_scores[sid] = {
-                "symbol": result.symbol,
-                "snippet": result.snippet,
-                "bm25_score": result.score,
-                "vector_score": 0.0,
-                "bm25_rank": rank,
-                "vector_rank": None,
-            }
-        else:
-            rrf_scores[sid]["bm25_score"] = result.score
-            rrf_scores[sid]["bm25_rank"] = rank
-
-    # Process vector results
-    for rank, result in enumerate(vector_results, start=1):
-        sid = symbol_id(result.symbol)
-        if sid not in rrf_scores:
-            rrf_scores[sid] = {
-                "symbol": result.symbol,
-                "snippet": result.snippet,
-                "bm25_score": 0.0,
-                "vector_score": result.score,
-                "bm25_rank": None,
-                "vector_rank": rank,
-            }
+    keyword_ids = np.asarray(keyword_ids, dtype=np.int64)
+    vector_ids = np.asarray(vector_ids, dtype=np.int64)
+    all_ids = np.concatenate((keyword_ids, vector_ids))
+    if not len(all_ids):
+        return []
+
+    ids, first_seen, slots = np.unique(all_ids, return_index=True, return_inverse=True)
+    keyword_slots, vector_slots = slots[:len(keyword_ids)], slots[len(keyword_ids):]
+
+    # Per unique ID; rank 0 = not returned by that method. Repeated IDs keep
+    # their last occurrence.
+    bm25 = np.zeros(len(ids))
+    vector = np.zeros(len(ids))
+    bm25_rank = np.zeros(len(ids), dtype=np.int64)
+    vector_rank = np.zeros(len(ids), dtype=np.int64)
+    bm25[keyword_slots] = keyword_scores
+    bm25_rank[keyword_slots] = np.arange(1, len(keyword_ids) + 1)
+    vector[vector_slots] = vector_scores
+    vector_rank[vector_slots] = np.arange(1, len(vector_ids) + 1)
+
+    if method == "rrf":
+        fused = (np.where(bm25_rank > 0, 1.0 / (k + bm25_rank), 0.0)
+                 + np.where(vector_rank > 0, 1.0 / (k + vector_rank), 0.0))
+        in_keyword, in_vector = bm25_rank > 0, vector_rank > 0
+    else:
+        fused = keyword_weight * bm25 + semantic_weight * vector
+        in_keyword, in_vector = bm25 > 0, vector > 0
+
+    # Best score first, ties in first-seen order
+    order = np.lexsort((first_seen, -fused))
+    if top_k is not None:
+        order = order[:top_k]
+
+    hits = []
+    for i in order.tolist():
+        if in_keyword[i] and in_vector[i]:
+            match_type = "both"
+        elif in_keyword[i]:
+            match_type = "keyword"
         else:
-            rrf_scores[sid]["vector_score"] = result.score
-            rrf_scores[sid]["vector_rank"] = rank
+            match_type = "semantic"
+        hits.append(FusedHit(int(ids[i]), float(bm25[i]), float(vector[i]), float(fused[i]), match_type))
+    return hits
 
-    # Compute RRF scores
-    for sid, data in rrf_scores.items():
-        rrf_score = 0.0
 
-        if data["bm25_rank"] is not None:
-            rrf_score += 1.0 / (k + data["bm25_rank"])
+def to_hybrid_results(
+    fused: List[FusedHit],
+    to_symbol: Callable[[int], CodeSymbol],
+) -> List[HybridSearchResult]:
+    """
+    Build HybridSearchResult models for fused hits, ranked in order.
 
-        if data["vector_rank"] is not None:
-            rrf_score += 1.0 / (k + data["vector_rank"])
+    Args:
+        fused: Fused hits, best first
+        to_symbol: Returns the CodeSymbol of a hit ID
 
-        data["rrf_score"] = rrf_score
+    Returns:
+        List of HybridSearchResult
+    """
+    return [
+        HybridSearchResult(
+            symbol=to_symbol(hit.id),
+            bm25_score=hit.bm25_score,
+            vector_score=hit.vector_score,
+            hybrid_score=hit.hybrid_score,
+            rank=rank,
+            match_type=hit.match_type,
+        )
+        for rank, hit in enumerate(fused, start=1)
+    ]
 
-    # Sort by RRF score
-    sorted_results = sorted(
-        rrf_scores.values(),
-        key=lambda x: x["rrf_score"],
-        reverse=True
+
+def _fuse_results(
+    bm25_results: List[SearchResult],
+    vector_results: List[SearchResult],
+    **options,
+) -> List[HybridSearchResult]:
+    """Fuse SearchResults by numbering their symbol keys (same symbol = same ID)."""
+    codes: Dict[Tuple[str, str, int], int] = {}
+    symbols: List[CodeSymbol] = []
+
+    def encode(results: List[SearchResult]) -> List[int]:
+        ids = []
+        for result in results:
+            code = codes.setdefault(symbol_key(result.symbol), len(symbols))
+            if code == len(symbols):
+                symbols.append(result.symbol)
+            ids.append(code)
+        return ids
+
+    bm25_ids = encode(bm25_results)
+    vector_ids = encode(vector_results)
+    fused = fuse_ids(
+        bm25_ids, [r.score for r in bm25_results],
+        vector_ids, [r.score for r in vector_results],
+        **options,
     )
+    return to_hybrid_results(fused, symbols.__getitem__)
 
-    # Create HybridSearchResult objects
-    hybrid_results: List[HybridSearchResult] = []
-    for rank, data in enumerate(sorted_results, start=1):
-        # Determine match type
-        if data["bm25_rank"] and data["vector_rank"]:
-            match_type = "both"
-        elif data["bm25_rank"]:
-            match_type = "keyword"
-        else:
-            match_type = "semantic"
 
-        result = HybridSearchResult(
-            symbol=data["symbol"],
-            bm25_score=data["bm25_score"],
-            vector_score=data["vector_score"],
-            hybrid_score=data["rrf_score"],
-            rank=rank,
-            match_type=match_type,
-        )
-        hybrid_results.append(result)
+def reciprocal_rank_fusion(
+    bm25_results: List[SearchResult],
+    vector_results: List[SearchResult],
+    k: int = 60,
+) -> List[HybridSearchResult]:
+    """
+    Combine rankings using Reciprocal Rank Fusion (RRF).
+
+    RRF score for a document = sum over all rankings of: 1 / (k + rank)
+
+    Args:
+        bm25_results: Results from BM25 search
+        vector_results: Results from vector search
+        k: Constant for RRF (default 60, standard value)
+
+    Returns:
+        List of HybridSearchResult sorted by fused score
+    """
+    hybrid_results = _fuse_results(bm25_results, vector_results, method="rrf", k=k)
 
     logger.info(f"RRF fusion combined {len(bm25_results)} BM25 + {len(vector_results)} vector = {len(hybrid_results)} results")
 
@@ -167,72 +246,14 @@ def weighted_score_fusion(
     Returns:
         List of HybridSearchResult sorted by hybrid score
     """
-    # Build score map
-    scores: Dict[str, Dict] = {}
-
-    # Helper to create unique symbol ID
-    def symbol_id(symbol: CodeSymbol) -> str:
-        return f"{symbol.file_path}:{symbol.name}:{symbol.start_line}"
-
-    # Process BM25 results
-    for result in bm25_results:
-        sid = symbol_id(result.symbol)
-        scores[sid] = {
-            "symbol": result.symbol,
-            "snippet": result.snippet,
-            "bm25_score": result.score,
-            "vector_score": 0.0,
-        }
-
-    # Process vector results
-    for result in vector_results:
-        sid = symbol_id(result.symbol)
-        if sid in scores:
-            scores[sid]["vector_score"] = result.score
-        else:
-            scores[sid] = {
-                "symbol": result.symbol,
-                "snippet": result.snippet,
-                "bm25_score": 0.0,
-                "vector_score": result.score,
-            }
-
-    # Compute weighted scores
-    for sid, data in scores.items():
-        hybrid_score = (
-            keyword_weight * data["bm25_score"] +
-            semantic_weight * data["vector_score"]
-        )
-        data["hybrid_score"] = hybrid_score
-
-    # Sort by hybrid score
-    sorted_results = sorted(
-        scores.values(),
-        key=lambda x: x["hybrid_score"],
-        reverse=True
+    hybrid_results = _fuse_results(
+        bm25_results,
+        vector_results,
+        method="weighted",
+        keyword_weight=keyword_weight,
+        semantic_weight=semantic_weight,
     )
 
-    # Create HybridSearchResult objects
-    hybrid_results: List[HybridSearchResult] = []
-    for rank, data in enumerate(sorted_results, start=1):
-        # Determine match type
-        if data["bm25_score"] > 0 and data["vector_score"] > 0:
-            match_type = "both"
-        elif data["bm25_score"] > 0:
-            match_type = "keyword"
-        else:
-            match_type = "semantic"
-
-        result = HybridSearchResult(
-            symbol=data["symbol"],
-            bm25_score=data["bm25_score"],
-            vector_score=data["vector_score"],
-            hybrid_score=data["hybrid_score"],
-            rank=rank,
-            match_type=match_type,
-        )
-        hybrid_results.append(result)
-
     logger.info(f"Weighted fusion: {len(hybrid_results)} results (weights: {keyword_weight}/{semantic_weight})")
 
     return hybrid_results
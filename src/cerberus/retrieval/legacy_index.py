@@ -0,0 +1,162 @@
+"""
+Search structures for legacy JSON and columnar indexes.
+
+A JSON index is loaded fully into memory; a columnar index is memory-mapped.
+Their symbol snippets, BM25 inverted index and embedding matrix are built
+once per loaded index and reused by every query until the index changes
+(see cache.index_version).
+"""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Hashable, List, Optional
+
+from loguru import logger
+
+from ..index.index_loader import load_index
+from ..schemas import ScanResult, SearchResult
+from ..semantic.embeddings import embed_query
+from ..semantic.vector_store import InMemoryVectorStore
+from .bm25_search import BM25Index
+from .cache import index_version
+from .config import BM25_CONFIG, HYBRID_SEARCH_CONFIG, VECTOR_CONFIG
+from .utils import read_range
+from .vector_search import build_vector_documents
+
+
+class LegacySearchIndex:
+    """Snippets, BM25 index and vector store of one loaded JSON or columnar index."""
+
+    def __init__(self, scan_result: ScanResult, padding: int = 3):
+        """
+        Read the snippet of every symbol; search structures are built on first use.
+
+        Args:
+            scan_result: Loaded JSON or columnar index
+            padding: Context padding for snippets
+        """
+        self.scan_result = scan_result
+        self.padding = padding
+        self.snippets: List[Dict] = []
+        for symbol in scan_result.symbols:
+            snippet_obj = read_range(
+                Path(symbol.file_path),
+                symbol.start_line,
+                symbol.end_line,
+                padding=padding,
+            )
+            self.snippets.append({
+                "symbol": symbol,
+                "snippet_text": snippet_obj.content,
+            })
+        logger.info(f"Built {len(self.snippets)} document snippets for search")
+
+        self._bm25: Optional[BM25Index] = None
+        self._vector_stores: Dict[str, InMemoryVectorStore] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def bm25(self) -> BM25Index:
+        """BM25 inverted index over the snippets."""
+        with self._lock:
+            if self._bm25 is None:
+                self._bm25 = BM25Index(
+                    documents=self.snippets,
+                    k1=BM25_CONFIG["k1"],
+                    b=BM25_CONFIG["b"],
+                )
+            return self._bm25
+
+    def keyword_search(self, query: str, top_k: int) -> List[SearchResult]:
+        """BM25 keyword search."""
+        return self.bm25.search(query, top_k=top_k)
+
+    def vector_search(self, query: str, top_k: int, model_name: str = None) -> List[SearchResult]:
+        """
+        Vector semantic search over the index's embeddings.
+
+        Args:
+            query: Search query
+            top_k: Number of top results
+            model_name: Embedding model name (default from config)
+
+        Returns:
+            List of SearchResult above the minimum similarity
+        """
+        if model_name is None:
+            model_name = VECTOR_CONFIG["model"]
+
+        if not self.snippets:
+            return []
+
+        try:
+            store = self._vector_store(model_name)
+            results = store.search(embed_query(query, model_name=model_name), limit=top_k)
+        except Exception as e:
+            logger.error(f"Vector search failed: {e}")
+            return []
+
+        min_sim = VECTOR_CONFIG["min_similarity"]
+        results = [r for r in results if r.score >= min_sim]
+
+        logger.info(f"Vector search for '{query}' returned {len(results)} results")
+        return results
+
+    def _vector_store(self, model_name: str) -> InMemoryVectorStore:
+        with self._lock:
+            store = self._vector_stores.get(model_name)
+            if store is None:
+                documents = build_vector_documents(self.scan_result, self.snippets, model_name=model_name)
+                store = self._vector_stores[model_name] = InMemoryVectorStore(documents)
+            return store
+
+
+_indexes: "OrderedDict[Hashable, LegacySearchIndex]" = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def load_legacy_index(index_path: Path, padding: int = 3) -> LegacySearchIndex:
+    """
+    Get the search structures of a JSON or columnar index, loading it on first use.
+
+    Loaded indexes are kept (up to legacy_index_cache_size) until the index
+    file changes.
+
+    Args:
+        index_path: Path to the .json or .cidx index
+        padding: Context padding for snippets
+
+    Returns:
+        LegacySearchIndex for the current index contents
+
+    Raises:
+        FileNotFoundError: If the index doesn't exist
+    """
+    index_path = Path(index_path)
+    version = index_version(index_path)
+    key = (version, padding)
+
+    if version is not None:
+        with _indexes_lock:
+            index = _indexes.get(key)
+            if index is not None:
+                _indexes.move_to_end(key)
+                return index
+
+    index = LegacySearchIndex(load_index(index_path), padding)
+
+    max_size = HYBRID_SEARCH_CONFIG["legacy_index_cache_size"]
+    if version is not None and max_size > 0:
+        with _indexes_lock:
+            _indexes[key] = index
+            _indexes.move_to_end(key)
+            while len(_indexes) > max_size:
+                _indexes.popitem(last=False)
+    return index
+
+
+def clear_legacy_indexes() -> None:
+    """Drop all loaded legacy indexes."""
+    with _indexes_lock:
+        _indexes.clear()
@@ -5,12 +5,12 @@ Optimized for Phase 4: Direct FAISS queries for streaming SQLite indices.
 """
 
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple
 import numpy as np
 from loguru import logger
 
 from ..schemas import CodeSymbol, SearchResult, CodeSnippet, ScanResult
-from ..semantic.embeddings import embed_texts
+from ..semantic.embeddings import embed_query, embed_texts
 from ..semantic.vector_store import InMemoryVectorStore, VectorDocument, build_faiss_store
 from ..storage import SQLiteIndexStore, FAISSVectorStore
 from .utils import read_range
@@ -46,90 +46,17 @@ def vector_search(
         return []
 
     try:
-        # Check if we have precomputed embeddings in the index
-        if scan_result.embeddings:
-            logger.debug(f"Using {len(scan_result.embeddings)} precomputed embeddings")
-
-            # Build vector documents from precomputed embeddings
-            vector_docs = []
-            for embed_entry in scan_result.embeddings:
-                # Find matching symbol
-                symbol = next(
-                    (s for s in scan_result.symbols
-                     if s.name == embed_entry.name and s.file_path == embed_entry.file_path),
-                    None
-                )
-
-                if not symbol:
-                    continue
-
-                # Find snippet text
-                snippet_doc = next(
-                    (d for d in snippets
-                     if d["symbol"].name == symbol.name and d["symbol"].file_path == symbol.file_path),
-                    None
-                )
-
-                if not snippet_doc:
-                    continue
-
-                # Create code snippet
-                snippet = CodeSnippet(
-                    file_path=symbol.file_path,
-                    start_line=symbol.start_line,
-                    end_line=symbol.end_line,
-                    content=snippet_doc["snippet_text"],
-                )
-
-                vector_docs.append(
-                    VectorDocument(
-                        embedding=np.array(embed_entry.vector, dtype=float),
-                        symbol=symbol,
-                        snippet=snippet,
-                    )
-                )
+        vector_docs = build_vector_documents(scan_result, snippets, model_name=model_name)
 
-            # Embed query
-            query_vec = embed_texts([query], model_name=model_name)[0]
-
-            # Search
-            if backend == "faiss":
-                results = build_faiss_store(vector_docs, query_vec, limit=top_k)
-            else:
-                store = InMemoryVectorStore(vector_docs)
-                results = store.search(query_vec, limit=top_k)
+        # Embed query
+        query_vec = embed_query(query, model_name=model_name)
 
+        # Search
+        if backend == "faiss":
+            results = build_faiss_store(vector_docs, query_vec, limit=top_k)
         else:
-            # No precomputed embeddings - compute on the fly
-            logger.debug("Computing embeddings on the fly")
-
-            texts = [doc["snippet_text"] for doc in snippets]
-            embeddings = embed_texts(texts, model_name=model_name)
-            query_vec = embed_texts([query], model_name=model_name)[0]
-
-            vector_docs = []
-            for i, doc in enumerate(snippets):
-                symbol = doc["symbol"]
-                snippet = CodeSnippet(
-                    file_path=symbol.file_path,
-                    start_line=symbol.start_line,
-                    end_line=symbol.end_line,
-                    content=doc["snippet_text"],
-                )
-                vector_docs.append(
-                    VectorDocument(
-                        embedding=embeddings[i],
-                        symbol=symbol,
-                        snippet=snippet,
-                    )
-                )
-
-            # Search
-            if backend == "faiss":
-                results = build_faiss_store(vector_docs, query_vec, limit=top_k)
-            else:
-                store = InMemoryVectorStore(vector_docs)
-                results = store.search(query_vec, limit=top_k)
+            store = InMemoryVectorStore(vector_docs)
+            results = store.search(query_vec, limit=top_k)
 
         # Filter by minimum similarity
         min_sim = VECTOR_CONFIG["min_similarity"]
@@ -143,6 +70,127 @@ def vector_search(
         return []
 
 
+def build_vector_documents(
+    scan_result: ScanResult,
+    snippets: List[Dict],  # List of {symbol, snippet_text}
+    model_name: str = None,
+) -> List[VectorDocument]:
+    """
+    Pair each symbol snippet with its embedding.
+
+    Uses the index's precomputed embeddings when present (matched to symbols
+    and snippets through dict lookups), otherwise embeds every snippet.
+
+    Args:
+        scan_result: Scan result with symbols and optional embeddings
+        snippets: List of document snippets
+        model_name: Embedding model name (default from config)
+
+    Returns:
+        List of VectorDocument
+    """
+    if model_name is None:
+        model_name = VECTOR_CONFIG["model"]
+
+    vector_docs = []
+
+    # Check if we have precomputed embeddings in the index
+    if scan_result.embeddings:
+        logger.debug(f"Using {len(scan_result.embeddings)} precomputed embeddings")
+
+        # First symbol and snippet for each (name, file_path)
+        symbols_by_key: Dict[Tuple[str, str], CodeSymbol] = {}
+        for symbol in scan_result.symbols:
+            symbols_by_key.setdefault((symbol.name, symbol.file_path), symbol)
+        snippets_by_key: Dict[Tuple[str, str], Dict] = {}
+        for doc in snippets:
+            snippets_by_key.setdefault((doc["symbol"].name, doc["symbol"].file_path), doc)
+
+        # Columnar indexes expose their vectors as one memory-mapped matrix
+        embeddings = scan_result.embeddings
+        if getattr(embeddings, "matrix", None) is not None:
+            entries = zip(embeddings.keys(), embeddings.matrix)
+        else:
+            entries = (((e.name, e.file_path), e.vector) for e in embeddings)
+
+        # Build vector documents from precomputed embeddings
+        for key, vector in entries:
+            symbol = symbols_by_key.get(key)
+            snippet_doc = snippets_by_key.get(key)
+            if not symbol or not snippet_doc:
+                continue
+
+            snippet = CodeSnippet(
+                file_path=symbol.file_path,
+                start_line=symbol.start_line,
+                end_line=symbol.end_line,
+                content=snippet_doc["snippet_text"],
+            )
+            vector_docs.append(
+                VectorDocument(
+                    embedding=np.array(vector, dtype=float),
+                    symbol=symbol,
+                    snippet=snippet,
+                )
+            )
+        return vector_docs
+
+    # No precomputed embeddings - compute on the fly
+    logger.debug("Computing embeddings on the fly")
+
+    texts = [doc["snippet_text"] for doc in snippets]
+    embeddings = embed_texts(texts, model_name=model_name)
+
+    for i, doc in enumerate(snippets):
+        symbol = doc["symbol"]
+        snippet = CodeSnippet(
+            file_path=symbol.file_path,
+            start_line=symbol.start_line,
+            end_line=symbol.end_line,
+            content=doc["snippet_text"],
+        )
+        vector_docs.append(
+            VectorDocument(
+                embedding=embeddings[i],
+                symbol=symbol,
+                snippet=snippet,
+            )
+        )
+    return vector_docs
+
+
+def vector_search_ids(
+    query: str,
+    faiss_store: FAISSVectorStore,
+    top_k: int = 10,
+    model_name: str = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vector semantic search returning SQLite symbol IDs (no hydration).
+
+    Args:
+        query: Search query
+        faiss_store: FAISS vector store
+        top_k: Number of top results
+        model_name: Embedding model name (default from config)
+
+    Returns:
+        Tuple of (symbol_ids, scores) arrays, best first, filtered by the
+        minimum similarity
+    """
+    if model_name is None:
+        model_name = VECTOR_CONFIG["model"]
+
+    logger.debug(f"Embedding query: '{query}'")
+    query_vec = embed_query(query, model_name=model_name)
+
+    logger.debug(f"Querying FAISS index ({len(faiss_store)} vectors)")
+    scores, symbol_ids = faiss_store.search_symbols(query_vec, k=top_k)
+
+    keep = scores >= VECTOR_CONFIG["min_similarity"]
+    return symbol_ids[keep], scores[keep].astype(np.float64)
+
+
 def vector_search_faiss(
     query: str,
     sqlite_store: SQLiteIndexStore,
@@ -155,7 +203,8 @@ def vector_search_faiss(
     Perform vector semantic search using FAISS directly (Phase 4 streaming).
 
     This function queries FAISS index directly and then fetches matching symbols
-    from SQLite, achieving constant memory usage regardless of index size.
+    from SQLite in one batched ID lookup, achieving constant memory usage
+    regardless of index size.
 
     Args:
         query: Search query
@@ -168,87 +217,42 @@ def vector_search_faiss(
     Returns:
         List of SearchResult objects
     """
-    if model_name is None:
-        model_name = VECTOR_CONFIG["model"]
-
     try:
-        # Embed query
-        logger.debug(f"Embedding query: '{query}'")
-        query_vec = embed_texts([query], model_name=model_name)[0]
-
-        # Query FAISS directly
-        logger.debug(f"Querying FAISS index ({len(faiss_store)} vectors)")
-        scores, faiss_ids = faiss_store.search(query_vec, k=top_k)
+        symbol_ids, scores = vector_search_ids(query, faiss_store, top_k=top_k, model_name=model_name)
 
-        if len(faiss_ids) == 0:
+        if len(symbol_ids) == 0:
             logger.info("No FAISS results found")
             return []
 
-        logger.debug(f"FAISS returned {len(faiss_ids)} candidates")
+        logger.debug(f"FAISS returned {len(symbol_ids)} candidates")
+        rows = sqlite_store.get_symbol_rows(symbol_ids.tolist())
 
-        # Get symbol IDs from FAISS IDs
-        symbol_ids = [faiss_store.get_symbol_id(fid) for fid in faiss_ids]
-
-        # Fetch symbols from SQLite by querying for each symbol ID
-        # (SQLite doesn't have a direct "get by ID" query, so we need to match by symbol metadata)
         results: List[SearchResult] = []
-
-        # Query embedding metadata to get symbol names and file paths
-        conn = sqlite_store._get_connection()
-        try:
-            for faiss_id, score, symbol_id in zip(faiss_ids, scores, symbol_ids):
-                # Get symbol info from embeddings_metadata
-                cursor = conn.execute("""
-                    SELECT s.*, em.name, em.file_path
-                    FROM embeddings_metadata em
-                    JOIN symbols s ON s.id = em.symbol_id
-                    WHERE em.symbol_id = ?
-                """, (symbol_id,))
-
-                row = cursor.fetchone()
-                if not row:
-                    logger.warning(f"Symbol {symbol_id} not found in SQLite (orphaned FAISS entry)")
-                    continue
-
-                # Build CodeSymbol
-                symbol = CodeSymbol(
-                    name=row['name'],
-                    type=row['type'],
-                    file_path=row['file_path'],
-                    start_line=row['start_line'],
-                    end_line=row['end_line'],
-                    signature=row['signature'],
-                    return_type=row['return_type'],
-                    parameters=__import__('json').loads(row['parameters']) if row['parameters'] else None,
-                    parent_class=row['parent_class'],
+        for symbol_id, score in zip(symbol_ids.tolist(), scores.tolist()):
+            row = rows.get(symbol_id)
+            if row is None:
+                logger.warning(f"Symbol {symbol_id} not found in SQLite (orphaned FAISS entry)")
+                continue
+
+            symbol = row.to_symbol()
+
+            # Load snippet (lazy loading - only for results that passed FAISS filter)
+            try:
+                snippet_obj = read_range(
+                    Path(symbol.file_path),
+                    symbol.start_line,
+                    symbol.end_line,
+                    padding=padding,
                 )
-
-                # Load snippet (lazy loading - only for results that passed FAISS filter)
-                try:
-                    snippet_obj = read_range(
-                        Path(symbol.file_path),
-                        symbol.start_line,
-                        symbol.end_line,
-                        padding=padding,
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to load snippet for {symbol.name}: {e}")
-                    continue
-
-                # Create SearchResult
-                result = SearchResult(
-                    symbol=symbol,
-                    score=float(score),  # FAISS cosine similarity (0-1)
-                    snippet=snippet_obj,
-                )
-                results.append(result)
-
-        finally:
-            conn.close()
-
-        # Filter by minimum similarity
-        min_sim = VECTOR_CONFIG["min_similarity"]
-        results = [r for r in results if r.score >= min_sim]
+            except Exception as e:
+                logger.warning(f"Failed to load snippet for {symbol.name}: {e}")
+                continue
+
+            results.append(SearchResult(
+                symbol=symbol,
+                score=score,  # FAISS cosine similarity (0-1)
+                snippet=snippet_obj,
+            ))
 
         logger.info(f"Vector search (FAISS) for '{query}' returned {len(results)} results")
         return results
@@ -18,6 +18,7 @@ from cerberus.parser.dependencies import extract_imports, extract_calls, extract
 from cerberus.parser.type_resolver import extract_types_from_file
 from cerberus.schemas import CallReference, CodeSymbol, FileObject, ImportReference, TypeInfo, ImportLink, MethodCall
 from cerberus.limits import get_limits_config
+from cerberus.tracing import span
 from .config import DEFAULT_IGNORE_PATTERNS, is_workflow_markdown
 
 
@@ -141,10 +142,12 @@ def scan_files_streaming(
             # Parse file
             try:
                 # Read file content
-                content = file_path.read_text(encoding="utf-8", errors="ignore")
+                with span("scanner.read", "scanner"):
+                    content = file_path.read_text(encoding="utf-8", errors="ignore")
 
                 # Parse symbols
-                symbols = parse_file(file_path)
+                with span("scanner.parse", "scanner"):
+                    symbols = parse_file(file_path)
                 if not symbols:
                     # Not a code file or no symbols found - skip
                     continue
@@ -154,11 +157,12 @@ def scan_files_streaming(
                     symbol.file_path = str(file_path.resolve())
 
                 # Extract additional info (all take file_path and content)
-                imports = extract_imports(file_path, content)
-                calls = extract_calls(file_path, content)
-                type_infos = extract_types_from_file(file_path, content)
-                import_links = extract_import_links(file_path, content)
-                method_calls = extract_method_calls(file_path, content)  # Phase 5.1
+                with span("scanner.extract", "scanner"):
+                    imports = extract_imports(file_path, content)
+                    calls = extract_calls(file_path, content)
+                    type_infos = extract_types_from_file(file_path, content)
+                    import_links = extract_import_links(file_path, content)
+                    method_calls = extract_method_calls(file_path, content)  # Phase 5.1
 
                 # Normalize file paths in related data to absolute resolved
                 for imp in imports:
@@ -294,6 +294,20 @@ class SymbolReference(BaseModel):
     resolution_method: Optional[str] = None  # How it was resolved: "import_trace", "type_annotation", "inference"
 
 
+class TestLink(BaseModel):
+    """
+    Represents a link from a test (or test file) to a symbol or module it exercises.
+    Used by the persistent test index shared by impact analysis and test mapping.
+    """
+    __test__ = False  # Not a pytest test class
+
+    test_file: str  # Test file containing the link
+    test_name: Optional[str] = None  # Test function name (None for file-level import links)
+    test_line: int = 0  # Start line of the test function
+    target: str  # Called/referenced symbol name or imported module name
+    link_type: Literal["call", "reference", "import"]
+
+
 # Phase 11: Symbolic Editing (Mutation) Schemas
 
 class SymbolLocation(BaseModel):
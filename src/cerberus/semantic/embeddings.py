@@ -8,6 +8,9 @@ from cerberus.logging_config import logger
 if TYPE_CHECKING:
     from sentence_transformers import SentenceTransformer
 
+# Number of query embeddings kept by embed_query()
+QUERY_EMBEDDING_CACHE_SIZE = 512
+
 
 @lru_cache(maxsize=1)
 def get_model(model_name: str = "all-MiniLM-L6-v2") -> "SentenceTransformer":
@@ -48,6 +51,28 @@ def embed_texts(texts: List[str], model_name: str = "all-MiniLM-L6-v2") -> np.nd
     return np.array(model.encode(texts, convert_to_numpy=True, normalize_embeddings=True))
 
 
+def embed_query(query: str, model_name: str = "all-MiniLM-L6-v2") -> np.ndarray:
+    """
+    Embed a search query, reusing the vectors of recent queries.
+
+    Agents repeat queries often; a cache hit skips the model forward pass.
+
+    Args:
+        query: Query text
+        model_name: Model identifier (default: all-MiniLM-L6-v2)
+
+    Returns:
+        Normalized embedding vector (a copy the caller may modify)
+    """
+    return _embed_query_cached(query, model_name).copy()
+
+
+@lru_cache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)
+def _embed_query_cached(query: str, model_name: str) -> np.ndarray:
+    """Embed one query (cached by text and model)."""
+    return embed_texts([query], model_name=model_name)[0]
+
+
 def clear_model_cache():
     """
     Phase 7: Clear the embedding model from memory.
@@ -56,4 +81,5 @@ def clear_model_cache():
     The model will be reloaded on next semantic search.
     """
     get_model.cache_clear()
+    _embed_query_cached.cache_clear()
     logger.info("Cleared embedding model cache. Freed ~400MB RAM.")
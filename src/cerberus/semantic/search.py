@@ -10,7 +10,7 @@ from cerberus.tracing import trace
 from cerberus.index.index_loader import load_index
 from cerberus.retrieval.utils import read_range
 from cerberus.schemas import CodeSymbol, SearchResult
-from cerberus.semantic.embeddings import embed_texts
+from cerberus.semantic.embeddings import embed_query, embed_texts
 from cerberus.semantic.vector_store import (
     InMemoryVectorStore,
     VectorDocument,
@@ -72,7 +72,7 @@ def semantic_search(
                             snippet=read_range(Path(match.symbol.file_path), match.symbol.start_line, match.symbol.end_line, padding=padding),
                         )
                     )
-                query_vec = embed_texts([query], model_name=model_name)[0]
+                query_vec = embed_query(query, model_name=model_name)
                 if backend == "faiss":
                     results = build_faiss_store(vector_docs, query_vec, limit=limit)
                 else:
@@ -81,7 +81,7 @@ def semantic_search(
             else:
                 texts = [doc.snippet_text for doc in documents]
                 embeddings = embed_texts(texts, model_name=model_name)
-                query_vec = embed_texts([query], model_name=model_name)[0]
+                query_vec = embed_query(query, model_name=model_name)
                 vector_docs = [
                     VectorDocument(embedding=embeddings[i], symbol=doc.symbol, snippet=read_range(Path(doc.symbol.file_path), doc.symbol.start_line, doc.symbol.end_line, padding=padding))
                     for i, doc in enumerate(documents)
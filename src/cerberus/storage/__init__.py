@@ -5,9 +5,20 @@ This package provides SQLite-backed storage with FAISS vector search integration
 replacing the legacy JSON-based storage for improved memory efficiency and performance.
 """
 
-from .sqlite_store import SQLiteIndexStore
-from .faiss_store import FAISSVectorStore
-from .adapter import ScanResultAdapter
+from typing import TYPE_CHECKING
+
+from cerberus.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .sqlite_store import SQLiteIndexStore
+    from .faiss_store import FAISSVectorStore
+    from .adapter import ScanResultAdapter
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "SQLiteIndexStore": ".sqlite_store",
+    "FAISSVectorStore": ".faiss_store",
+    "ScanResultAdapter": ".adapter",
+})
 
 __all__ = [
     "SQLiteIndexStore",
@@ -7,7 +7,7 @@ L2-normalized vectors for cosine similarity.
 
 import pickle
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -90,6 +90,9 @@ class FAISSVectorStore:
         else:
             self.id_map = {}
 
+        # faiss_id -> symbol_id array (-1 = unmapped), rebuilt after changes
+        self._symbol_ids: Optional[np.ndarray] = None
+
     def add_vector(self, symbol_id: int, vector: np.ndarray) -> int:
         """
         Add embedding vector to FAISS index.
@@ -123,6 +126,7 @@ class FAISSVectorStore:
 
         # Update mapping
         self.id_map[symbol_id] = faiss_id
+        self._symbol_ids = None
 
         logger.debug(f"Added vector for symbol_id={symbol_id} at faiss_id={faiss_id}")
         return faiss_id
@@ -160,6 +164,7 @@ class FAISSVectorStore:
         faiss_ids = list(range(start_faiss_id, start_faiss_id + len(symbol_ids)))
         for symbol_id, faiss_id in zip(symbol_ids, faiss_ids):
             self.id_map[symbol_id] = faiss_id
+        self._symbol_ids = None
 
         logger.debug(f"Batch added {len(symbol_ids)} vectors (faiss_ids: {start_faiss_id} to {faiss_ids[-1]})")
         return faiss_ids
@@ -237,6 +242,53 @@ class FAISSVectorStore:
 
         # Rebuild ID map with new sequential FAISS IDs
         self.id_map = {sid: i for i, sid in enumerate(remaining_symbol_ids)}
+        self._symbol_ids = None
+
+    def search_symbols(self, query_vector: np.ndarray, k: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Search for k nearest neighbors, returning SQLite symbol IDs.
+
+        Args:
+            query_vector: Query embedding (will be normalized)
+            k: Number of results to return
+
+        Returns:
+            Tuple of (scores, symbol_ids), best first; vectors without a
+            symbol mapping are dropped
+        """
+        scores, faiss_ids = self.search(query_vector, k)
+        symbol_ids = self.symbol_ids_for(faiss_ids)
+        found = symbol_ids >= 0
+        return scores[found], symbol_ids[found]
+
+    def symbol_ids_for(self, faiss_ids: np.ndarray) -> np.ndarray:
+        """
+        Map FAISS IDs to symbol IDs in one vectorized lookup.
+
+        Args:
+            faiss_ids: FAISS index positions
+
+        Returns:
+            int64 array of symbol IDs (-1 where a FAISS ID is not mapped)
+        """
+        faiss_ids = np.asarray(faiss_ids, dtype=np.int64)
+        table = self._reverse_map()
+        valid = (faiss_ids >= 0) & (faiss_ids < len(table))
+        symbol_ids = np.full(len(faiss_ids), -1, dtype=np.int64)
+        symbol_ids[valid] = table[faiss_ids[valid]]
+        return symbol_ids
+
+    def _reverse_map(self) -> np.ndarray:
+        """faiss_id -> symbol_id table, built from id_map on first use after a change."""
+        if self._symbol_ids is None:
+            size = max(self.index.ntotal, max(self.id_map.values(), default=-1) + 1)
+            table = np.full(size, -1, dtype=np.int64)
+            if self.id_map:
+                table[np.fromiter(self.id_map.values(), dtype=np.int64)] = np.fromiter(
+                    self.id_map.keys(), dtype=np.int64
+                )
+            self._symbol_ids = table
+        return self._symbol_ids
 
     def get_symbol_id(self, faiss_id: int) -> int:
         """
@@ -251,11 +303,10 @@ class FAISSVectorStore:
         Raises:
             KeyError: If faiss_id not found
         """
-        # Reverse lookup (inefficient, but needed for search results)
-        for symbol_id, fid in self.id_map.items():
-            if fid == faiss_id:
-                return symbol_id
-        raise KeyError(f"FAISS ID {faiss_id} not found in ID map")
+        symbol_id = int(self.symbol_ids_for([faiss_id])[0])
+        if symbol_id < 0:
+            raise KeyError(f"FAISS ID {faiss_id} not found in ID map")
+        return symbol_id
 
     def save(self):
         """
@@ -297,6 +348,7 @@ class FAISSVectorStore:
         """
         self.index.reset()
         self.id_map = {}
+        self._symbol_ids = None
         logger.info("Cleared FAISS index and ID map")
 
     def __len__(self) -> int:
@@ -9,7 +9,9 @@ Public API:
 Internal Modules:
 - schema: Database schema definitions and initialization
 - persistence: Connection management, transactions, metadata
+- generations: Shadow databases and atomic publishing of index updates
 - symbols: File and symbol CRUD operations
+- tokens: Identifier sub-tokens for FTS5 search
 - resolution: Phase 5/6 symbolic intelligence operations
 - config: Configuration constants
 """
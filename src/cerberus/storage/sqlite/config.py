@@ -8,9 +8,23 @@ Centralized configuration for the SQLite storage subsystem.
 DEFAULT_CHUNK_SIZE = 1000
 DEFAULT_BATCH_SIZE = 100
 
+# IDs per "WHERE id IN (...)" lookup (below SQLite's 999 variable limit)
+ID_LOOKUP_CHUNK_SIZE = 500
+
+# Searches combined into one UNION ALL statement by fts5_search_batch
+FTS5_QUERIES_PER_STATEMENT = 100
+
+# Trigram substring matching: shortest searchable word, and the score factor
+# for symbols that only match as substrings (they rank after token matches)
+FTS5_TRIGRAM_MIN_LENGTH = 3
+FTS5_TRIGRAM_SCORE_WEIGHT = 0.5
+
 # Connection settings
 DEFAULT_TIMEOUT = 30.0
 ENABLE_WAL_MODE = True
 
+# Longest wait for another process's index update to publish (seconds)
+WRITE_LOCK_TIMEOUT = 300.0
+
 # Schema version
 SCHEMA_VERSION = "1.1"
@@ -16,13 +16,16 @@ from cerberus.schemas import (
     ImportReference,
     MethodCall,
     SymbolReference,
+    TestLink,
     TypeInfo,
 )
 from cerberus.storage.sqlite.persistence import SQLitePersistence
 from cerberus.storage.sqlite.symbols import SQLiteSymbolsOperations
 from cerberus.storage.sqlite.resolution import SQLiteResolutionOperations
+from cerberus.tracing import trace_methods
 
 
+@trace_methods("sqlite", exclude=("transaction",))
 class SQLiteIndexStore:
     """
     SQLite-backed index store with streaming support.
@@ -37,6 +40,7 @@ class SQLiteIndexStore:
     - FAISS integration for vector search
     - Transactional writes with rollback support
     - Foreign key cascades for automatic cleanup
+    - Every public operation is traced as a ``sqlite.<method>`` span
 
     Args:
         index_path: Path to index directory or .db file
@@ -101,6 +105,18 @@ class SQLiteIndexStore:
         """Phase 7: FTS5-based keyword search with zero RAM overhead."""
         return self.symbols.fts5_search(query, top_k, batch_size)
 
+    def fts5_search_rows(self, query: str, top_k: int = 20):
+        """FTS5 keyword search returning lightweight SymbolRows (no CodeSymbol models)."""
+        return self.symbols.fts5_search_rows(query, top_k)
+
+    def get_symbol_rows(self, symbol_ids: List[int]):
+        """Look up SymbolRows by symbol ID in batched queries."""
+        return self.symbols.get_symbol_rows(symbol_ids)
+
+    def fts5_search_batch(self, queries: List[str], top_k: int = 20):
+        """Run many FTS5 keyword searches in batched statements on one connection."""
+        return self.symbols.fts5_search_batch(queries, top_k)
+
     def find_symbol_by_line(self, file_path: str, line: int):
         """Find symbol containing a specific line."""
         return self.symbols.find_symbol_by_line(file_path, line)
@@ -167,6 +183,19 @@ class SQLiteIndexStore:
             source_file, target_file, batch_size
         )
 
+    def write_test_links_batch(self, links: List[TestLink], conn=None):
+        """Batch write test index links."""
+        return self.resolution.write_test_links_batch(links, conn)
+
+    def delete_test_links(self, test_files: Optional[List[str]] = None, conn=None):
+        """Delete test index links for the given test files (all if None)."""
+        return self.resolution.delete_test_links(test_files, conn)
+
+    def query_test_links(self, targets: List[str], link_types: Optional[List[str]] = None,
+                         batch_size: int = 100):
+        """Stream test index links pointing at the given symbols/modules."""
+        return self.resolution.query_test_links(targets, link_types, batch_size)
+
     # ========== METADATA & STATS ==========
 
     def get_metadata(self, key: str):
@@ -177,6 +206,14 @@ class SQLiteIndexStore:
         """Set metadata key-value pair."""
         return self.persistence.set_metadata(key, value, conn)
 
+    def get_generation(self) -> int:
+        """Get the index generation counter (bumped on every content change)."""
+        return self.persistence.get_generation()
+
+    def bump_generation(self, conn=None) -> int:
+        """Increment the index generation counter."""
+        return self.persistence.bump_generation(conn)
+
     def get_stats(self):
         """Get index statistics."""
         return self.persistence.get_stats()
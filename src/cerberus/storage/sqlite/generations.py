@@ -0,0 +1,169 @@
+"""
+SQLite Index Generations
+
+Writers never modify the live index database piecemeal. A full build writes
+a fresh shadow database; an incremental update copies the live database
+into a shadow and applies all of its changes there. The finished shadow is
+published over the live database with SQLite's online backup API as one
+write transaction, and the index generation moves past the live one.
+
+Readers therefore see either the previous generation or the next one, never
+a half-applied update: each read transaction keeps the WAL snapshot it
+started on until it ends. Updates are serialized across processes (MCP
+server, watcher daemon, CLI) by an exclusive lock file next to the database.
+
+Cost: an incremental update copies the whole database twice under the
+lock (live -> shadow, then shadow -> live), so it is O(database size) no
+matter how small the change. Readers are not blocked while the shadow is
+built; the publish is one write transaction. Callers should skip the shadow
+entirely when there is nothing to apply (update_index_incrementally does).
+
+FAISS vector files live beside the database and are still updated in place.
+"""
+
+import fcntl
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+from cerberus.logging_config import logger
+from cerberus.storage.sqlite.config import DEFAULT_TIMEOUT, WRITE_LOCK_TIMEOUT
+from cerberus.storage.sqlite.persistence import GENERATION_METADATA_KEY, read_generation
+
+
+def shadow_path(db_path: Path, purpose: str) -> Path:
+    """
+    Path of a shadow database next to the live one.
+
+    Example: shadow_path(Path(".cerberus/cerberus.db"), "building")
+             -> .cerberus/cerberus.building.db
+    """
+    return db_path.with_suffix(f".{purpose}.db")
+
+
+def remove_database(db_path: Path) -> None:
+    """Delete a SQLite database file with its WAL and shared-memory files."""
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+
+
+def copy_database(source: Path, target: Path) -> None:
+    """Copy a consistent snapshot of one database into another."""
+    src = sqlite3.connect(str(source), timeout=DEFAULT_TIMEOUT)
+    dst = sqlite3.connect(str(target), timeout=DEFAULT_TIMEOUT)
+    try:
+        src.backup(dst)
+    finally:
+        src.close()
+        dst.close()
+
+
+def publish_database(source: Path, target: Path) -> int:
+    """
+    Replace the contents of one index database with another in one step.
+
+    The published generation is set above the target's, so caches keyed by
+    generation never mistake the new contents for the old.
+
+    Args:
+        source: Fully built or updated database to publish
+        target: Live database (created if missing)
+
+    Returns:
+        Generation number of the published index
+    """
+    generation = (read_generation(target) or 0) + 1
+
+    src = sqlite3.connect(str(source), timeout=DEFAULT_TIMEOUT)
+    try:
+        src.execute("""
+            INSERT INTO metadata (key, value) VALUES (?, ?)
+            ON CONFLICT(key) DO UPDATE SET
+                value=excluded.value,
+                updated_at=julianday('now')
+        """, (GENERATION_METADATA_KEY, str(generation)))
+        src.commit()
+    finally:
+        src.close()
+
+    copy_database(source, target)
+    logger.info(f"Published index {source} -> {target} (generation {generation})")
+    return generation
+
+
+@contextmanager
+def index_write_lock(db_path: Path, timeout: float = WRITE_LOCK_TIMEOUT) -> Iterator[None]:
+    """
+    Hold the exclusive update lock of an index database.
+
+    Args:
+        db_path: Live database path
+        timeout: Maximum time to wait for the lock (seconds)
+
+    Raises:
+        TimeoutError: If another update holds the lock for longer than timeout
+    """
+    lock_file = open(f"{db_path}.lock", "w")
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Could not acquire update lock on {db_path}")
+                time.sleep(0.05)
+
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    finally:
+        lock_file.close()
+
+
+@dataclass
+class ShadowUpdate:
+    """A shadow copy of a live index being updated; set publish=False to discard it."""
+    path: Path
+    publish: bool = True
+
+
+@contextmanager
+def shadow_update(db_path: Path) -> Iterator[ShadowUpdate]:
+    """
+    Update an index database through a shadow copy.
+
+    Usage:
+        with shadow_update(db_path) as update:
+            apply_changes(update.path)
+        # Published atomically (unless update.publish was set to False)
+
+    The shadow is discarded if the block raises.
+
+    Args:
+        db_path: Live database path
+
+    Yields:
+        ShadowUpdate whose path is the copy to modify
+
+    Raises:
+        FileNotFoundError: If the live database does not exist
+    """
+    if not db_path.exists():
+        raise FileNotFoundError(f"Index database not found: {db_path}")
+
+    update = ShadowUpdate(path=shadow_path(db_path, "updating"))
+    with index_write_lock(db_path):
+        remove_database(update.path)
+        try:
+            copy_database(db_path, update.path)
+            yield update
+            if update.publish:
+                publish_database(update.path, db_path)
+        finally:
+            remove_database(update.path)
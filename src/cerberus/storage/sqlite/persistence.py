@@ -14,6 +14,35 @@ from cerberus.exceptions import IndexCorruptionError
 from cerberus.storage.sqlite.schema import init_schema
 from cerberus.storage.sqlite.config import DEFAULT_TIMEOUT, ENABLE_WAL_MODE
 
+# Metadata key of the counter bumped whenever index content changes
+GENERATION_METADATA_KEY = "index_generation"
+
+
+def read_generation(db_path: Path) -> Optional[int]:
+    """
+    Read the index generation counter without opening a store.
+
+    Uses a read-only connection and skips schema initialization, so it is
+    cheap enough to run before every cached lookup.
+
+    Args:
+        db_path: Path to the SQLite database file
+
+    Returns:
+        Generation number (0 if never bumped), or None if it cannot be read
+    """
+    try:
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, timeout=DEFAULT_TIMEOUT)
+        try:
+            row = conn.execute(
+                "SELECT value FROM metadata WHERE key = ?", (GENERATION_METADATA_KEY,)
+            ).fetchone()
+        finally:
+            conn.close()
+        return int(row[0]) if row else 0
+    except (sqlite3.Error, ValueError):
+        return None
+
 
 class SQLitePersistence:
     """
@@ -127,6 +156,48 @@ class SQLitePersistence:
             if not conn:
                 _conn.close()
 
+    def get_generation(self) -> int:
+        """
+        Get the index generation counter.
+
+        The generation increases every time index content changes (full build,
+        incremental update), so derived data can be cached against it.
+        """
+        value = self.get_metadata(GENERATION_METADATA_KEY)
+        try:
+            return int(value) if value is not None else 0
+        except ValueError:
+            return 0
+
+    def bump_generation(self, conn: Optional[sqlite3.Connection] = None) -> int:
+        """
+        Increment the index generation counter.
+
+        Args:
+            conn: Optional connection to bump inside an existing transaction
+
+        Returns:
+            New generation number
+        """
+        _conn = conn or self._get_connection()
+        try:
+            _conn.execute("""
+                INSERT INTO metadata (key, value) VALUES (?, '1')
+                ON CONFLICT(key) DO UPDATE SET
+                    value=CAST(CAST(value AS INTEGER) + 1 AS TEXT),
+                    updated_at=julianday('now')
+            """, (GENERATION_METADATA_KEY,))
+            row = _conn.execute(
+                "SELECT value FROM metadata WHERE key = ?", (GENERATION_METADATA_KEY,)
+            ).fetchone()
+
+            if not conn:
+                _conn.commit()
+            return int(row[0])
+        finally:
+            if not conn:
+                _conn.close()
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get index statistics.
@@ -16,6 +16,7 @@ from cerberus.schemas import (
     ImportReference,
     MethodCall,
     SymbolReference,
+    TestLink,
     TypeInfo,
 )
 from cerberus.storage.sqlite.config import DEFAULT_BATCH_SIZE
@@ -180,6 +181,57 @@ class SQLiteResolutionOperations:
             if not conn:
                 _conn.close()
 
+    def write_test_links_batch(self, links: List[TestLink], conn: Optional[sqlite3.Connection] = None):
+        """
+        Batch write test index links.
+
+        Args:
+            links: List of TestLink objects
+            conn: Optional connection from transaction context
+        """
+        if not links:
+            return
+
+        _conn = conn or self._get_connection()
+        try:
+            _conn.executemany("""
+                INSERT INTO test_links (test_file, test_name, test_line, target, link_type)
+                VALUES (?, ?, ?, ?, ?)
+            """, [(link.test_file, link.test_name, link.test_line, link.target, link.link_type)
+                  for link in links])
+
+            if not conn:
+                _conn.commit()
+                logger.debug(f"Wrote {len(links)} test_links")
+        finally:
+            if not conn:
+                _conn.close()
+
+    def delete_test_links(self, test_files: Optional[List[str]] = None,
+                          conn: Optional[sqlite3.Connection] = None):
+        """
+        Delete test index links for the given test files (all links if None).
+
+        Args:
+            test_files: Test file paths to clear, or None to clear the whole table
+            conn: Optional connection from transaction context
+        """
+        _conn = conn or self._get_connection()
+        try:
+            if test_files is None:
+                _conn.execute("DELETE FROM test_links")
+            elif test_files:
+                _conn.executemany(
+                    "DELETE FROM test_links WHERE test_file = ?",
+                    [(path,) for path in test_files]
+                )
+
+            if not conn:
+                _conn.commit()
+        finally:
+            if not conn:
+                _conn.close()
+
     # ========== QUERY OPERATIONS ==========
 
     def query_import_links(
@@ -492,3 +544,50 @@ class SQLiteResolutionOperations:
                     )
         finally:
             conn.close()
+
+    def query_test_links(
+        self,
+        targets: List[str],
+        link_types: Optional[List[str]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[TestLink]:
+        """
+        Stream test index links pointing at any of the given targets.
+
+        Args:
+            targets: Symbol or module names to look up (exact match, indexed)
+            link_types: Optional filter on link type ('call', 'reference', 'import')
+            batch_size: Rows per iteration
+
+        Yields:
+            TestLink objects ordered by test file and line
+        """
+        if not targets:
+            return
+
+        conn = self._get_connection()
+        try:
+            params: List[Any] = list(targets)
+            query = f"SELECT * FROM test_links WHERE target IN ({','.join('?' * len(targets))})"
+            if link_types:
+                query += f" AND link_type IN ({','.join('?' * len(link_types))})"
+                params.extend(link_types)
+            query += " ORDER BY test_file, test_line"
+
+            cursor = conn.execute(query, tuple(params))
+
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+
+                for row in rows:
+                    yield TestLink(
+                        test_file=row['test_file'],
+                        test_name=row['test_name'],
+                        test_line=row['test_line'],
+                        target=row['target'],
+                        link_type=row['link_type'],
+                    )
+        finally:
+            conn.close()
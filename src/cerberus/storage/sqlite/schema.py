@@ -5,8 +5,11 @@ Contains all table definitions, indices, triggers, and schema initialization log
 """
 
 import sqlite3
+from functools import lru_cache
+
 from cerberus.logging_config import logger
 from cerberus.exceptions import IndexCorruptionError
+from cerberus.storage.sqlite.tokens import name_tokens
 
 
 # SQLite schema for Cerberus index
@@ -37,6 +40,7 @@ CREATE TABLE IF NOT EXISTS symbols (
     parameters TEXT,  -- JSON array serialized as TEXT
     parameter_types TEXT,  -- Phase 16.4: JSON dict {param_name: type_name}
     parent_class TEXT,
+    name_tokens TEXT,  -- camelCase/snake_case sub-tokens of name, space-separated
 
     FOREIGN KEY (file_path) REFERENCES files(path) ON DELETE CASCADE
 );
@@ -50,11 +54,13 @@ CREATE INDEX IF NOT EXISTS idx_symbols_file_range ON symbols(file_path, start_li
 -- Phase 7: FTS5 virtual table for zero-RAM keyword search
 -- Indexes symbol name, type, signature, and file_path using SQLite's full-text search engine
 -- file_path is now indexed to support filename searches (e.g., "cli.py", "main.go")
+-- name_tokens makes camelCase words searchable ("parse" finds parseConfigFile)
 CREATE VIRTUAL TABLE IF NOT EXISTS symbols_fts USING fts5(
     name,
     type,
     signature,
     file_path,
+    name_tokens,
     start_line UNINDEXED,
     end_line UNINDEXED,
     content='symbols',
@@ -63,20 +69,20 @@ CREATE VIRTUAL TABLE IF NOT EXISTS symbols_fts USING fts5(
 
 -- Triggers to keep FTS5 table synchronized with symbols table
 CREATE TRIGGER IF NOT EXISTS symbols_ai AFTER INSERT ON symbols BEGIN
-    INSERT INTO symbols_fts(rowid, name, type, signature, file_path, start_line, end_line)
-    VALUES (new.id, new.name, new.type, COALESCE(new.signature, ''), new.file_path, new.start_line, new.end_line);
+    INSERT INTO symbols_fts(rowid, name, type, signature, file_path, name_tokens, start_line, end_line)
+    VALUES (new.id, new.name, new.type, COALESCE(new.signature, ''), new.file_path, COALESCE(new.name_tokens, ''), new.start_line, new.end_line);
 END;
 
 CREATE TRIGGER IF NOT EXISTS symbols_ad AFTER DELETE ON symbols BEGIN
-    INSERT INTO symbols_fts(symbols_fts, rowid, name, type, signature, file_path, start_line, end_line)
-    VALUES ('delete', old.id, old.name, old.type, COALESCE(old.signature, ''), old.file_path, old.start_line, old.end_line);
+    INSERT INTO symbols_fts(symbols_fts, rowid, name, type, signature, file_path, name_tokens, start_line, end_line)
+    VALUES ('delete', old.id, old.name, old.type, COALESCE(old.signature, ''), old.file_path, COALESCE(old.name_tokens, ''), old.start_line, old.end_line);
 END;
 
 CREATE TRIGGER IF NOT EXISTS symbols_au AFTER UPDATE ON symbols BEGIN
-    INSERT INTO symbols_fts(symbols_fts, rowid, name, type, signature, file_path, start_line, end_line)
-    VALUES ('delete', old.id, old.name, old.type, COALESCE(old.signature, ''), old.file_path, old.start_line, old.end_line);
-    INSERT INTO symbols_fts(rowid, name, type, signature, file_path, start_line, end_line)
-    VALUES (new.id, new.name, new.type, COALESCE(new.signature, ''), new.file_path, new.start_line, new.end_line);
+    INSERT INTO symbols_fts(symbols_fts, rowid, name, type, signature, file_path, name_tokens, start_line, end_line)
+    VALUES ('delete', old.id, old.name, old.type, COALESCE(old.signature, ''), old.file_path, COALESCE(old.name_tokens, ''), old.start_line, old.end_line);
+    INSERT INTO symbols_fts(rowid, name, type, signature, file_path, name_tokens, start_line, end_line)
+    VALUES (new.id, new.name, new.type, COALESCE(new.signature, ''), new.file_path, COALESCE(new.name_tokens, ''), new.start_line, new.end_line);
 END;
 
 -- Embeddings metadata table (actual vectors stored in FAISS)
@@ -195,6 +201,22 @@ CREATE INDEX IF NOT EXISTS idx_symbol_refs_target ON symbol_references(target_fi
 CREATE INDEX IF NOT EXISTS idx_symbol_refs_type ON symbol_references(reference_type);
 CREATE INDEX IF NOT EXISTS idx_symbol_refs_source_symbol ON symbol_references(source_symbol);
 
+-- Test index: maps test functions to the symbols they call/reference and
+-- test files to the modules they import (shared by impact analysis and test mapping)
+CREATE TABLE IF NOT EXISTS test_links (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    test_file TEXT NOT NULL,
+    test_name TEXT,  -- NULL for file-level import links
+    test_line INTEGER NOT NULL DEFAULT 0,
+    target TEXT NOT NULL,
+    link_type TEXT NOT NULL CHECK(link_type IN ('call', 'reference', 'import')),
+
+    FOREIGN KEY (test_file) REFERENCES files(path) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_test_links_target ON test_links(target, link_type);
+CREATE INDEX IF NOT EXISTS idx_test_links_file ON test_links(test_file);
+
 -- Metadata table
 CREATE TABLE IF NOT EXISTS metadata (
     key TEXT PRIMARY KEY,
@@ -216,11 +238,88 @@ CREATE TABLE IF NOT EXISTS blueprint_cache (
 CREATE INDEX IF NOT EXISTS idx_blueprint_cache_file ON blueprint_cache(file_path);
 CREATE INDEX IF NOT EXISTS idx_blueprint_cache_expires ON blueprint_cache(expires_at);
 
+-- Skeleton cache: skeletonized files keyed by content hash + skeleton options
+CREATE TABLE IF NOT EXISTS skeleton_cache (
+    cache_key TEXT PRIMARY KEY,  -- sha256(content_hash, variant)
+    file_path TEXT NOT NULL,
+    variant TEXT NOT NULL,  -- Hash of skeleton config + preserved symbols
+    content_hash TEXT NOT NULL,
+    skeleton_json TEXT NOT NULL,  -- Serialized SkeletonizedCode
+    created_at REAL DEFAULT (julianday('now'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_skeleton_cache_file ON skeleton_cache(file_path, variant);
+
 -- Initialize schema version
-INSERT OR IGNORE INTO metadata (key, value) VALUES ('schema_version', '1.3.0');
+INSERT OR IGNORE INTO metadata (key, value) VALUES ('schema_version', '1.4.0');
 INSERT OR IGNORE INTO metadata (key, value) VALUES ('created_at', strftime('%s', 'now'));
 """
 
+# Trigram index over symbol names for substring matches ("Parse" in ConfigParser).
+# Needs SQLite >= 3.34; created only where the tokenizer is available.
+TRIGRAM_SCHEMA_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS symbols_trigram USING fts5(
+    name,
+    content='symbols',
+    content_rowid='id',
+    tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS symbols_trigram_ai AFTER INSERT ON symbols BEGIN
+    INSERT INTO symbols_trigram(rowid, name) VALUES (new.id, new.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS symbols_trigram_ad AFTER DELETE ON symbols BEGIN
+    INSERT INTO symbols_trigram(symbols_trigram, rowid, name) VALUES ('delete', old.id, old.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS symbols_trigram_au AFTER UPDATE OF name ON symbols BEGIN
+    INSERT INTO symbols_trigram(symbols_trigram, rowid, name) VALUES ('delete', old.id, old.name);
+    INSERT INTO symbols_trigram(rowid, name) VALUES (new.id, new.name);
+END;
+"""
+
+TRIGRAM_TRIGGERS = ("symbols_trigram_ai", "symbols_trigram_ad", "symbols_trigram_au")
+
+
+@lru_cache(maxsize=None)
+def trigram_supported() -> bool:
+    """
+    Check whether the linked SQLite has the FTS5 trigram tokenizer (3.34+).
+
+    Older system libraries (e.g. 3.31 on Ubuntu 20.04) raise on the trigram
+    table, so substring search is skipped there instead of failing the index.
+    """
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.execute("CREATE VIRTUAL TABLE probe USING fts5(name, tokenize='trigram')")
+        return True
+    except sqlite3.Error:
+        logger.warning(
+            f"SQLite {sqlite3.sqlite_version} has no FTS5 trigram tokenizer; "
+            "substring symbol search is disabled"
+        )
+        return False
+    finally:
+        conn.close()
+
+
+def _init_trigram(conn: sqlite3.Connection) -> None:
+    """Create the trigram table and triggers, rebuilding it if it was not kept in sync."""
+    if not trigram_supported():
+        # Writes must not fire triggers into a table this SQLite cannot open
+        for trigger in TRIGRAM_TRIGGERS:
+            conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        return
+
+    synced = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = ?", (TRIGRAM_TRIGGERS[0],)
+    ).fetchone()
+    conn.executescript(TRIGRAM_SCHEMA_SQL)
+    if not synced:
+        conn.execute("INSERT INTO symbols_trigram(symbols_trigram) VALUES ('rebuild')")
+        conn.commit()
+
 
 def init_schema(conn: sqlite3.Connection, db_path: str) -> None:
     """
@@ -236,6 +335,7 @@ def init_schema(conn: sqlite3.Connection, db_path: str) -> None:
     try:
         conn.executescript(SCHEMA_SQL)
         _run_migrations(conn)
+        _init_trigram(conn)
         logger.debug(f"Initialized SQLite schema at {db_path}")
     except Exception as e:
         raise IndexCorruptionError(f"Failed to initialize database schema: {e}")
@@ -247,6 +347,7 @@ def _run_migrations(conn: sqlite3.Connection) -> None:
 
     - 1.2.0: purge duplicate symbols and enforce uniqueness.
     - 1.3.0: rebuild FTS5 table with file_path indexed for filename searches.
+    - 1.4.0: add identifier sub-tokens to FTS5 and a trigram table for substrings.
     """
     # Fetch current version (default to 1.1.0 if unset)
     cur = conn.execute("SELECT value FROM metadata WHERE key = 'schema_version'")
@@ -339,3 +440,33 @@ def _run_migrations(conn: sqlite3.Connection) -> None:
         conn.commit()
 
         logger.info("Migration to 1.3.0 complete: file_path is now searchable in FTS5")
+
+    # Migration to 1.4.0: identifier sub-tokens and trigram substring search
+    if current_version < "1.4.0":
+        logger.info("Migrating to schema 1.4.0: adding identifier sub-tokens and trigram search")
+
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(symbols)")}
+        if "name_tokens" not in columns:
+            conn.execute("ALTER TABLE symbols ADD COLUMN name_tokens TEXT")
+
+        # Drop search tables and triggers; SCHEMA_SQL (and _init_trigram) recreate them
+        for trigger in ("symbols_ai", "symbols_ad", "symbols_au") + TRIGRAM_TRIGGERS:
+            conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        conn.execute("DROP TABLE IF EXISTS symbols_fts")
+        conn.execute("DROP TABLE IF EXISTS symbols_trigram")
+
+        rows = conn.execute("SELECT id, name FROM symbols").fetchall()
+        conn.executemany(
+            "UPDATE symbols SET name_tokens = ? WHERE id = ?",
+            [(name_tokens(row[1]), row[0]) for row in rows]
+        )
+
+        conn.executescript(SCHEMA_SQL)
+        conn.execute("INSERT INTO symbols_fts(symbols_fts) VALUES ('rebuild')")
+
+        conn.execute(
+            "INSERT OR REPLACE INTO metadata (key, value) VALUES ('schema_version', '1.4.0')"
+        )
+        conn.commit()
+
+        logger.info(f"Migration to 1.4.0 complete: {len(rows)} symbols tokenized")
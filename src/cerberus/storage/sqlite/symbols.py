@@ -7,11 +7,21 @@ Handles CRUD operations for files, symbols, and embeddings metadata.
 import json
 import re
 import sqlite3
-from typing import Any, Dict, Iterator, List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from cerberus.logging_config import logger
 from cerberus.schemas import CodeSymbol, FileObject
-from cerberus.storage.sqlite.config import DEFAULT_CHUNK_SIZE, DEFAULT_BATCH_SIZE
+from cerberus.storage.sqlite.config import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_BATCH_SIZE,
+    FTS5_QUERIES_PER_STATEMENT,
+    FTS5_TRIGRAM_MIN_LENGTH,
+    FTS5_TRIGRAM_SCORE_WEIGHT,
+    ID_LOOKUP_CHUNK_SIZE,
+)
+from cerberus.storage.sqlite.schema import trigram_supported
+from cerberus.storage.sqlite.tokens import identifier_subtokens, name_tokens
 
 
 def escape_fts5_query(query: str) -> str:
@@ -52,6 +62,157 @@ def escape_fts5_query(query: str) -> str:
     return query
 
 
+def build_fts5_queries(query: str) -> Tuple[str, Optional[str]]:
+    """
+    Build the MATCH expressions that fts5_search() runs for a query.
+
+    Plain queries also match the camelCase/snake_case sub-tokens of their
+    words ("parseConfig" finds ``parse_config_file``), and every word of at
+    least FTS5_TRIGRAM_MIN_LENGTH characters is matched as a substring of
+    symbol names through the trigram table. Advanced queries (AND, OR, NOT)
+    run unchanged against symbols_fts only.
+
+    Args:
+        query: Raw search query
+
+    Returns:
+        Tuple of (symbols_fts expression, symbols_trigram expression or None)
+    """
+    match = escape_fts5_query(query)
+    if re.search(r'\b(AND|OR|NOT)\b', query, re.IGNORECASE):
+        return match, None
+
+    words = query.split()
+    if match == query:
+        subtokens = [token for word in words for token in identifier_subtokens(word)]
+        if subtokens and subtokens != [word.lower() for word in words]:
+            match = f"({match}) OR name_tokens : ({' '.join(subtokens)})"
+
+    substrings = [
+        '"' + word.replace('"', '""') + '"'
+        for word in words if len(word) >= FTS5_TRIGRAM_MIN_LENGTH
+    ]
+    return match, " ".join(substrings) or None
+
+
+# Symbol columns in SymbolRow field order
+SYMBOL_ROW_COLUMNS = """
+    s.id, s.name, s.type, s.file_path, s.start_line, s.end_line,
+    s.signature, s.return_type, s.parameters, s.parameter_types, s.parent_class
+"""
+
+
+def ranked_search_sql(query: str, top_k: int) -> Tuple[str, List[Any]]:
+    """
+    Build the single statement that ranks symbols for a keyword query.
+
+    Token matches (BM25 over symbols_fts) come first, then symbols that only
+    match as substrings (BM25 over symbols_trigram, scaled down by
+    FTS5_TRIGRAM_SCORE_WEIGHT). Each source keeps its own top_k before the
+    merge, so FTS5 can stop early. Substring matches are skipped when SQLite
+    has no trigram tokenizer.
+
+    Args:
+        query: Raw search query
+        top_k: Maximum number of rows
+
+    Returns:
+        Tuple of (SQL, parameters); rows carry the symbol columns and ``score``
+    """
+    match, trigram = build_fts5_queries(query)
+    hits = """
+        SELECT id, 0 AS tier, score FROM (
+            SELECT rowid AS id, -rank AS score FROM symbols_fts
+            WHERE symbols_fts MATCH ? ORDER BY rank LIMIT ?
+        )
+    """
+    params: List[Any] = [match, top_k]
+    if trigram and trigram_supported():
+        hits += f"""
+            UNION ALL
+            SELECT id, 1, score * {FTS5_TRIGRAM_SCORE_WEIGHT} FROM (
+                SELECT rowid AS id, -rank AS score FROM symbols_trigram
+                WHERE symbols_trigram MATCH ? ORDER BY rank LIMIT ?
+            )
+        """
+        params.extend((trigram, top_k))
+
+    # With a single MIN() aggregate, SQLite takes the bare ``score`` column
+    # from the row with the lowest tier - the token match when there is one
+    sql = f"""
+        SELECT {SYMBOL_ROW_COLUMNS}, h.score
+        FROM (SELECT id, MIN(tier) AS tier, score FROM ({hits}) GROUP BY id) h
+        JOIN symbols s ON s.id = h.id
+        ORDER BY h.tier, h.score DESC
+        LIMIT ?
+    """
+    params.append(top_k)
+    return sql, params
+
+
+@dataclass(slots=True)
+class SymbolRow:
+    """
+    One ranked symbol row, kept as plain columns.
+
+    Search and fusion work on these records; the CodeSymbol model (and the
+    JSON decoding of parameters) is only built by to_symbol() for results
+    that are actually returned. Fields follow the column order of
+    ranked_search_sql(), with the score normalized to 0-1 (rows looked up by
+    ID carry no score).
+    """
+    id: int
+    name: str
+    type: str
+    file_path: str
+    start_line: int
+    end_line: int
+    signature: Optional[str]
+    return_type: Optional[str]
+    parameters: Optional[str]  # JSON, decoded by to_symbol()
+    parameter_types: Optional[str]  # JSON, decoded by to_symbol()
+    parent_class: Optional[str]
+    score: float = 0.0
+
+    @classmethod
+    def from_ranked(cls, row: tuple) -> "SymbolRow":
+        """Build from a plain ranked_search_sql() row, normalizing its score."""
+        # FTS5 scores are typically 0-10
+        return cls(*row[:-1], min(row[-1] / 10.0, 1.0))
+
+    @property
+    def key(self) -> Tuple[str, str, int, int, str]:
+        """Identity used to drop duplicate symbol rows."""
+        return (self.file_path, self.name, self.start_line, self.end_line, self.type)
+
+    def to_symbol(self) -> CodeSymbol:
+        """Materialize the CodeSymbol model."""
+        return CodeSymbol(
+            name=self.name,
+            type=self.type,
+            file_path=self.file_path,
+            start_line=self.start_line,
+            end_line=self.end_line,
+            signature=self.signature,
+            return_type=self.return_type,
+            parameters=json.loads(self.parameters) if self.parameters else None,
+            parameter_types=json.loads(self.parameter_types) if self.parameter_types else None,
+            parent_class=self.parent_class,
+        )
+
+
+def _unique_rows(rows) -> List[SymbolRow]:
+    """Drop repeated symbol rows, keeping the first (best ranked) one."""
+    seen = set()
+    unique = []
+    for row in rows:
+        key = row.key
+        if key not in seen:
+            seen.add(key)
+            unique.append(row)
+    return unique
+
+
 class SQLiteSymbolsOperations:
     """
     Symbol and file CRUD operations.
@@ -142,13 +303,14 @@ class SQLiteSymbolsOperations:
 
                     cursor = _conn.execute("""
                         INSERT OR IGNORE INTO symbols (name, type, file_path, start_line, end_line,
-                                           signature, return_type, parameters, parameter_types, parent_class)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                                           signature, return_type, parameters, parameter_types, parent_class,
+                                           name_tokens)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """, (s.name, s.type, s.file_path, s.start_line, s.end_line,
                          s.signature, s.return_type,
                          json.dumps(s.parameters) if s.parameters else None,
                          json.dumps(s.parameter_types) if s.parameter_types else None,
-                         s.parent_class))
+                         s.parent_class, name_tokens(s.name)))
                     if cursor.rowcount:
                         chunk_ids.append(cursor.lastrowid)
 
@@ -329,69 +491,141 @@ class SQLiteSymbolsOperations:
 
         Uses SQLite's native full-text search engine to rank results by BM25
         without loading all symbols into memory. Offloads scoring to SQLite's
-        C-engine for maximum performance.
+        C-engine for maximum performance. Identifier sub-tokens and trigram
+        substrings are matched in the same statement (see ranked_search_sql).
 
         Args:
             query: Search query (supports FTS5 syntax like "function AND parse")
             top_k: Maximum number of results to return
-            batch_size: Rows per fetch iteration
+            batch_size: Unused, kept for API compatibility (at most top_k rows are fetched)
 
         Yields:
             Tuples of (CodeSymbol, relevance_score) ordered by relevance
         """
+        for row in self.fts5_search_rows(query, top_k):
+            yield (row.to_symbol(), row.score)
+
+    def fts5_search_rows(self, query: str, top_k: int = 20) -> List[SymbolRow]:
+        """
+        FTS5 keyword search returning lightweight rows.
+
+        Same ranking and deduplication as fts5_search(), without building a
+        CodeSymbol per hit.
+
+        Args:
+            query: Search query
+            top_k: Maximum number of results to return
+
+        Returns:
+            SymbolRows ordered by relevance (score normalized to 0-1)
+        """
         conn = self._get_connection()
         try:
-            seen = set()
-            # Escape FTS5 special characters to prevent syntax errors
-            safe_query = escape_fts5_query(query)
-
-            # FTS5 query with BM25 ranking
-            # The bm25() function returns negative scores (more negative = better match)
-            # We negate it to get positive scores (higher = better)
-            fts_query = """
-                SELECT
-                    s.id, s.name, s.type, s.file_path, s.start_line, s.end_line,
-                    s.signature, s.return_type, s.parameters, s.parameter_types, s.parent_class,
-                    -fts.rank as score
-                FROM symbols_fts fts
-                JOIN symbols s ON s.id = fts.rowid
-                WHERE symbols_fts MATCH ?
-                ORDER BY fts.rank
-                LIMIT ?
-            """
-
-            cursor = conn.execute(fts_query, (safe_query, top_k))
+            # Token, sub-token and substring matches in one ranked statement.
+            # bm25() returns negative scores (more negative = better match);
+            # they are negated so higher is better.
+            sql, params = ranked_search_sql(query, top_k)
+            cursor = conn.cursor()
+            cursor.row_factory = None  # Plain tuples, in SymbolRow field order
+            return _unique_rows(map(SymbolRow.from_ranked, cursor.execute(sql, params)))
+        finally:
+            conn.close()
 
-            # Yield in batches
-            while True:
-                rows = cursor.fetchmany(batch_size)
-                if not rows:
-                    break
+    def fts5_search_batch(
+        self,
+        queries: List[str],
+        top_k: int = 20
+    ) -> List[List[tuple[CodeSymbol, float]]]:
+        """
+        Run many FTS5 keyword searches on one connection.
+
+        Searches are combined into UNION ALL statements, each branch being the
+        ranked statement of fts5_search() with its own order and LIMIT, so
+        results match calling fts5_search() once per query. A query with invalid FTS5 syntax returns no results
+        instead of failing the batch.
+
+        Args:
+            queries: Search queries
+            top_k: Maximum number of results per query
+
+        Returns:
+            One list of (CodeSymbol, relevance_score) per query, in query order
+        """
+        results: List[List[tuple[CodeSymbol, float]]] = [[] for _ in queries]
+        if not queries:
+            return results
+
+        def run(items):
+            branches = []
+            params: List[Any] = []
+            for index, query in items:
+                sql, query_params = ranked_search_sql(query, top_k)
+                branches.append(f"SELECT * FROM (SELECT ? AS query_index, r.* FROM ({sql}) r)")
+                params.append(index)
+                params.extend(query_params)
+            sql = " UNION ALL ".join(branches)
+            return conn.execute(sql, params).fetchall()
 
+        conn = self._get_connection()
+        try:
+            indexed = list(enumerate(queries))
+            for start in range(0, len(indexed), FTS5_QUERIES_PER_STATEMENT):
+                chunk = indexed[start:start + FTS5_QUERIES_PER_STATEMENT]
+                try:
+                    rows = run(chunk)
+                except sqlite3.OperationalError:
+                    # Find the offending queries by running them one by one
+                    rows = []
+                    for item in chunk:
+                        try:
+                            rows.extend(run([item]))
+                        except sqlite3.OperationalError as e:
+                            logger.debug(f"FTS5 query {item[1]!r} failed: {e}")
+
+                seen = set()
                 for row in rows:
-                    key = (row['file_path'], row['name'], row['start_line'], row['end_line'], row['type'])
+                    symbol_row = SymbolRow.from_ranked(tuple(row)[1:])
+                    key = (row['query_index'], symbol_row.key)
                     if key in seen:
                         continue
                     seen.add(key)
+                    results[row['query_index']].append((symbol_row.to_symbol(), symbol_row.score))
+        finally:
+            conn.close()
 
-                    symbol = CodeSymbol(
-                        name=row['name'],
-                        type=row['type'],
-                        file_path=row['file_path'],
-                        start_line=row['start_line'],
-                        end_line=row['end_line'],
-                        signature=row['signature'],
-                        return_type=row['return_type'],
-                        parameters=json.loads(row['parameters']) if row['parameters'] else None,
-                        parameter_types=json.loads(row['parameter_types']) if row['parameter_types'] else None,
-                        parent_class=row['parent_class'],
-                    )
-                    # Normalize score to 0-1 range (FTS5 scores are typically 0-10)
-                    normalized_score = min(row['score'] / 10.0, 1.0)
-                    yield (symbol, normalized_score)
+        return results
+
+    def get_symbol_rows(self, symbol_ids: List[int]) -> Dict[int, SymbolRow]:
+        """
+        Look up symbols by ID with batched ``WHERE id IN (...)`` queries.
+
+        Args:
+            symbol_ids: Symbol row IDs (unknown IDs are skipped)
+
+        Returns:
+            Dict of symbol ID -> SymbolRow
+        """
+        ids = list(dict.fromkeys(int(i) for i in symbol_ids))
+        rows: Dict[int, SymbolRow] = {}
+        if not ids:
+            return rows
 
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.row_factory = None  # Plain tuples, in SymbolRow field order
+            for start in range(0, len(ids), ID_LOOKUP_CHUNK_SIZE):
+                chunk = ids[start:start + ID_LOOKUP_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"SELECT {SYMBOL_ROW_COLUMNS} FROM symbols s WHERE s.id IN ({placeholders})",
+                    chunk,
+                )
+                for row in cursor:
+                    rows[row[0]] = SymbolRow(*row)
         finally:
             conn.close()
+        return rows
 
     def find_symbol_by_line(self, file_path: str, line: int) -> Optional[CodeSymbol]:
         """
@@ -432,3 +666,4 @@ class SQLiteSymbolsOperations:
             return None
         finally:
             conn.close()
+
@@ -0,0 +1,35 @@
+"""
+SQLite Identifier Tokenization
+
+Splits identifiers into the sub-tokens stored in ``symbols.name_tokens``.
+FTS5's unicode61 tokenizer keeps ``parseConfigFile`` as one token, so
+``name_tokens`` holds ``parse config file`` to make each word searchable.
+"""
+
+import re
+from typing import List
+
+# Acronyms ("HTTP" in "HTTPServer"), capitalized or lowercase words, and digit runs
+SUBTOKEN_RE = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+")
+
+
+def identifier_subtokens(identifier: str) -> List[str]:
+    """
+    Split an identifier on camelCase, snake_case and punctuation boundaries.
+
+    Examples:
+        parseConfigFile -> ["parse", "config", "file"]
+        HTTPServer_v2   -> ["http", "server", "v", "2"]
+
+    Args:
+        identifier: Identifier or other text to split
+
+    Returns:
+        Lowercase sub-tokens in order of appearance
+    """
+    return [token.lower() for token in SUBTOKEN_RE.findall(identifier)]
+
+
+def name_tokens(identifier: str) -> str:
+    """Return the ``symbols.name_tokens`` value for a symbol name."""
+    return " ".join(identifier_subtokens(identifier))
@@ -7,6 +7,7 @@ Follows the self-similarity mandate: clean facade, modular structure.
 
 from .facade import SummarizationFacade, get_summarization_facade
 from .local_llm import LocalLLMClient, SummaryParser
+from .cache import SummaryCache
 from .config import (
     LLM_CONFIG,
     SUMMARIZATION_CONFIG,
@@ -23,6 +24,9 @@ __all__ = [
     "LocalLLMClient",
     "SummaryParser",
 
+    # Summary cache
+    "SummaryCache",
+
     # Configuration
     "LLM_CONFIG",
     "SUMMARIZATION_CONFIG",
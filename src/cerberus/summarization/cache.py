@@ -0,0 +1,157 @@
+"""
+Persistent, content-addressed cache for LLM summaries.
+
+Summaries are keyed by (content hash, prompt template, model) so re-asking
+about unchanged code skips the LLM entirely, regardless of where the code
+lives or how often the server restarts.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+from ..schemas import CodeSummary
+from .config import PROMPT_TEMPLATES
+
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS summary_cache (
+    cache_key TEXT PRIMARY KEY,
+    summary_type TEXT NOT NULL,
+    model TEXT NOT NULL,
+    summary_json TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+
+class SummaryCache:
+    """
+    SQLite-backed summary cache shared across facade instances and threads.
+
+    Each operation uses its own short-lived connection, so the cache is safe
+    to use from the architecture worker pool.
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize cache, creating the database if needed.
+
+        Args:
+            db_path: Path to the cache database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        conn = self._connect()
+        try:
+            conn.executescript(CACHE_SCHEMA)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=10.0)
+        conn.execute("PRAGMA journal_mode = WAL")
+        return conn
+
+    @staticmethod
+    def make_key(content: str, template_type: str, model: str) -> str:
+        """
+        Build a cache key from the prompt, its template and model.
+
+        The template text is hashed too, so editing a prompt invalidates
+        the summaries generated with the old one.
+
+        Args:
+            content: Prompt sent to the LLM
+            template_type: Prompt template name ("file", "symbol", ...)
+            model: LLM model identifier
+
+        Returns:
+            Hex digest cache key
+        """
+        template = PROMPT_TEMPLATES.get(template_type, "")
+        digest = hashlib.sha256()
+        for part in (content, template_type, template, model):
+            digest.update(part.encode("utf-8", errors="ignore"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, cache_key: str) -> Optional[CodeSummary]:
+        """Return the cached summary for a key, or None on miss."""
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT summary_json FROM summary_cache WHERE cache_key = ?",
+                    (cache_key,)
+                ).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Summary cache read failed: {e}")
+            row = None
+
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        return CodeSummary(**json.loads(row[0]))
+
+    def set(self, cache_key: str, summary: CodeSummary) -> None:
+        """Store a summary under a key (replacing any previous entry)."""
+        try:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO summary_cache
+                        (cache_key, summary_type, model, summary_json, created_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (cache_key, summary.summary_type, summary.model_used,
+                     summary.model_dump_json(), time.time())
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Summary cache write failed: {e}")
+
+    def clear(self) -> int:
+        """Remove all cached summaries. Returns number of entries removed."""
+        conn = self._connect()
+        try:
+            removed = conn.execute("DELETE FROM summary_cache").rowcount
+            conn.commit()
+            return removed
+        finally:
+            conn.close()
+
+    def get_stats(self) -> dict:
+        """Return hit/miss counters and entry count."""
+        conn = self._connect()
+        try:
+            entries = conn.execute("SELECT COUNT(*) FROM summary_cache").fetchone()[0]
+        finally:
+            conn.close()
+
+        total = self.hits + self.misses
+        return {
+            "entries": entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "path": str(self.db_path),
+        }
@@ -10,6 +10,7 @@ LLM_CONFIG = {
     "max_tokens": 500,  # Maximum tokens in response
     "timeout": 30,  # Request timeout in seconds
     "api_base": "http://localhost:11434",  # Ollama default endpoint
+    "pool_size": 4,  # Pooled HTTP connections kept alive to the backend
 }
 
 # Summarization behavior configuration
@@ -20,6 +21,10 @@ SUMMARIZATION_CONFIG = {
     "include_key_points": True,
     "max_key_points": 5,
     "include_dependencies": True,
+    "cache_enabled": True,  # Persistent summary cache keyed by (content, template, model)
+    "cache_path": None,  # None = .cerberus/summary_cache.db
+    "max_workers": 4,  # Concurrent LLM requests for architecture fan-out
+    "max_architecture_files": 20,  # Files summarized per architecture request
 }
 
 # Prompt templates for different summary types
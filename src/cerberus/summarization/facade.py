@@ -3,11 +3,14 @@ Facade for code summarization using local LLMs.
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from loguru import logger
 
+from ..paths import get_paths
 from ..schemas import CodeSummary, CodeSymbol, ScanResult
+from .cache import SummaryCache
 from .local_llm import LocalLLMClient, SummaryParser
 from .config import SUMMARIZATION_CONFIG
 
@@ -15,20 +18,42 @@ from .config import SUMMARIZATION_CONFIG
 class SummarizationFacade:
     """
     Main facade for code summarization operations.
+
+    LLM responses are cached persistently by (content hash, prompt template,
+    model), and architecture summaries fan out per-file summaries over a
+    bounded worker pool before a single combining request.
     """
 
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        llm_config: Optional[Dict[str, Any]] = None
+    ):
         """
         Initialize summarization facade.
 
         Args:
             config: Optional configuration overrides
+            llm_config: Optional LLM client configuration overrides
         """
         self.config = {**SUMMARIZATION_CONFIG, **(config or {})}
-        self.llm_client = LocalLLMClient()
+        self.llm_client = LocalLLMClient(config=llm_config)
         self.parser = SummaryParser()
+        self.cache = self._create_cache()
         logger.debug("SummarizationFacade initialized")
 
+    def _create_cache(self) -> Optional[SummaryCache]:
+        """Open the persistent summary cache (None if disabled or no LLM to cache)."""
+        if not self.config["cache_enabled"] or not self.llm_client.is_available():
+            return None
+
+        cache_path = self.config["cache_path"] or get_paths().summary_cache_db
+        try:
+            return SummaryCache(Path(cache_path))
+        except Exception as e:
+            logger.warning(f"Summary cache unavailable, continuing without it: {e}")
+            return None
+
     def summarize_file(
         self,
         file_path: str,
@@ -61,40 +86,45 @@ class SummarizationFacade:
 
             # Detect language
             language = self._detect_language(Path(file_path).suffix)
+            truncated = code_content[:10000]  # Limit content size
 
-            # Format prompt
-            prompt = self.parser.format_prompt(
-                "file",
-                file_path=file_path,
-                language=language,
-                code_content=code_content[:10000]  # Limit content size
-            )
-
-            # Generate summary
             logger.info(f"Summarizing file: {file_path}")
-            response = self.llm_client.generate(prompt)
-
-            if not response:
-                return self._create_simple_summary(file_path, code_content, "file")
-
-            # Parse response
-            parsed = self.parser.parse_summary_response(response)
-
-            return CodeSummary(
+            return self._generate_summary(
                 target=file_path,
                 summary_type="file",
-                summary_text=parsed["purpose"],
-                key_points=parsed["key_points"],
-                dependencies=parsed["dependencies"],
-                complexity_score=parsed["complexity"],
-                generated_at=time.time(),
-                model_used=self.llm_client.config["model"]
+                prompt_kwargs={
+                    "file_path": file_path,
+                    "language": language,
+                    "code_content": truncated,
+                },
+                fallback_content=code_content,
             )
 
         except Exception as e:
             logger.error(f"Failed to summarize file {file_path}: {e}")
             return None
 
+    def summarize_files(self, files: List[str]) -> Dict[str, Optional[CodeSummary]]:
+        """
+        Summarize many files concurrently over a bounded worker pool.
+
+        Cached files return immediately; misses are sent to the LLM with at
+        most ``max_workers`` requests in flight.
+
+        Args:
+            files: File paths to summarize
+
+        Returns:
+            Dict mapping each file path to its summary (None on failure)
+        """
+        if not files:
+            return {}
+
+        workers = max(1, min(int(self.config["max_workers"]), len(files)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cerberus-summarize") as pool:
+            futures = {file_path: pool.submit(self.summarize_file, file_path) for file_path in files}
+            return {file_path: future.result() for file_path, future in futures.items()}
+
     def summarize_symbol(
         self,
         symbol: CodeSymbol,
@@ -120,33 +150,17 @@ class SummarizationFacade:
 
             symbol_code = "".join(lines[symbol.start_line - 1:symbol.end_line])
 
-            # Format prompt
-            prompt = self.parser.format_prompt(
-                "symbol",
-                symbol_name=symbol.name,
-                symbol_type=symbol.type,
-                file_path=symbol.file_path,
-                code_content=symbol_code
-            )
-
-            # Generate
             logger.info(f"Summarizing symbol: {symbol.name}")
-            response = self.llm_client.generate(prompt)
-
-            if not response:
-                return self._create_simple_summary(symbol.name, symbol_code, "symbol")
-
-            parsed = self.parser.parse_summary_response(response)
-
-            return CodeSummary(
+            return self._generate_summary(
                 target=symbol.name,
                 summary_type="symbol",
-                summary_text=parsed["purpose"],
-                key_points=parsed["key_points"],
-                dependencies=parsed["dependencies"],
-                complexity_score=parsed["complexity"],
-                generated_at=time.time(),
-                model_used=self.llm_client.config["model"]
+                prompt_kwargs={
+                    "symbol_name": symbol.name,
+                    "symbol_type": symbol.type,
+                    "file_path": symbol.file_path,
+                    "code_content": symbol_code,
+                },
+                fallback_content=symbol_code,
             )
 
         except Exception as e:
@@ -162,6 +176,10 @@ class SummarizationFacade:
         """
         Summarize an architectural subsystem or layer.
 
+        Each file is summarized first (concurrently, cache-aware), then the
+        per-file summaries are combined in one architecture request. Files
+        too small for an LLM summary contribute a truncated code excerpt.
+
         Args:
             target: Name of the subsystem/layer
             files: List of file paths in this subsystem
@@ -174,50 +192,92 @@ class SummarizationFacade:
             return None
 
         try:
-            # Collect code from files
-            code_snippets = []
-            for file_path in files[:10]:  # Limit to first 10 files
+            selected = files[:self.config["max_architecture_files"]]
+            file_summaries = self.summarize_files(selected)
+
+            sections = []
+            for file_path in selected:
+                summary = file_summaries.get(file_path)
+                if summary and summary.model_used != "fallback":
+                    points = "\n".join(f"- {point}" for point in summary.key_points)
+                    sections.append(f"### {file_path}\n{summary.summary_text}\n{points}".rstrip())
+                    continue
                 try:
                     with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        code_snippets.append(f"### {file_path}\n{content[:500]}")  # Truncate
+                        sections.append(f"### {file_path}\n{f.read()[:500]}")  # Truncate
                 except Exception as e:
                     logger.warning(f"Could not read {file_path}: {e}")
 
-            code_overview = "\n\n".join(code_snippets)
+            code_overview = "\n\n".join(sections)[:8000]  # Limit
 
-            # Format prompt
-            prompt = self.parser.format_prompt(
-                "architecture",
-                target=target,
-                file_count=len(files),
-                code_content=code_overview[:8000]  # Limit
-            )
-
-            # Generate
             logger.info(f"Summarizing architecture: {target}")
-            response = self.llm_client.generate(prompt)
-
-            if not response:
-                return self._create_simple_summary(target, code_overview, "architecture")
-
-            parsed = self.parser.parse_summary_response(response)
-
-            return CodeSummary(
+            return self._generate_summary(
                 target=target,
                 summary_type="architecture",
-                summary_text=parsed["purpose"],
-                key_points=parsed["key_points"],
-                dependencies=parsed["dependencies"],
-                complexity_score=parsed["complexity"],
-                generated_at=time.time(),
-                model_used=self.llm_client.config["model"]
+                prompt_kwargs={
+                    "target": target,
+                    "file_count": len(files),
+                    "code_content": code_overview,
+                },
+                fallback_content=code_overview,
             )
 
         except Exception as e:
             logger.error(f"Failed to summarize architecture {target}: {e}")
             return None
 
+    def _generate_summary(
+        self,
+        target: str,
+        summary_type: str,
+        prompt_kwargs: Dict[str, Any],
+        fallback_content: str
+    ) -> CodeSummary:
+        """
+        Return a cached summary or generate one with the LLM.
+
+        Args:
+            target: The target being summarized
+            summary_type: Summary/prompt template type
+            prompt_kwargs: Template variables for the prompt (the formatted
+                prompt is hashed for the cache key, so every input counts)
+            fallback_content: Content for the non-LLM fallback summary
+
+        Returns:
+            CodeSummary (fallback summaries are never cached)
+        """
+        model = self.llm_client.config["model"]
+        prompt = self.parser.format_prompt(summary_type, **prompt_kwargs)
+        cache_key = None
+        if self.cache is not None:
+            cache_key = SummaryCache.make_key(prompt, summary_type, model)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Summary cache hit: {target}")
+                return cached.model_copy(update={"target": target})
+
+        response = self.llm_client.generate(prompt)
+
+        if not response:
+            return self._create_simple_summary(target, fallback_content, summary_type)
+
+        parsed = self.parser.parse_summary_response(response)
+        summary = CodeSummary(
+            target=target,
+            summary_type=summary_type,
+            summary_text=parsed["purpose"],
+            key_points=parsed["key_points"],
+            dependencies=parsed["dependencies"],
+            complexity_score=parsed["complexity"],
+            generated_at=time.time(),
+            model_used=model
+        )
+
+        if cache_key is not None:
+            self.cache.set(cache_key, summary)
+
+        return summary
+
     def _detect_language(self, extension: str) -> str:
         """Detect programming language from extension."""
         ext_map = {
@@ -10,6 +10,7 @@ from loguru import logger
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
@@ -22,6 +23,9 @@ class LocalLLMClient:
     """
     Client for interacting with local LLM backends.
     Currently supports ollama.
+
+    Requests go through a pooled ``requests.Session`` so concurrent
+    summaries reuse keep-alive connections instead of reconnecting.
     """
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
@@ -34,6 +38,7 @@ class LocalLLMClient:
         self.config = {**LLM_CONFIG, **(config or {})}
         self.backend = self.config["backend"]
         self.available = False
+        self.session = None
 
         if self.backend == "none":
             logger.info("LLM backend disabled (backend='none')")
@@ -43,16 +48,27 @@ class LocalLLMClient:
             logger.warning("requests library not available, LLM client unavailable")
             return
 
+        self.session = self._create_session()
+
         # Test connection
         if self.backend == "ollama":
             self.available = self._test_ollama_connection()
         else:
             logger.warning(f"Unsupported LLM backend: {self.backend}")
 
+    def _create_session(self) -> "requests.Session":
+        """Create an HTTP session with a connection pool sized for concurrent requests."""
+        session = requests.Session()
+        pool_size = max(1, int(self.config.get("pool_size", 4)))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
     def _test_ollama_connection(self) -> bool:
         """Test if ollama is running and accessible."""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.config['api_base']}/api/tags",
                 timeout=5
             )
@@ -102,7 +118,7 @@ class LocalLLMClient:
             logger.debug(f"Sending request to ollama: {self.config['model']}")
             start_time = time.time()
 
-            response = requests.post(
+            response = self.session.post(
                 url,
                 json=payload,
                 timeout=self.config["timeout"]
@@ -130,6 +146,13 @@ class LocalLLMClient:
         """Check if LLM is available."""
         return self.available
 
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+        self.available = False
+
 
 class SummaryParser:
     """
@@ -7,10 +7,12 @@ Follows the self-similarity mandate: clean facade, modular structure.
 
 from .facade import SynthesisFacade, get_synthesis_facade
 from .skeletonizer import Skeletonizer, skeletonize_file
+from .cache import SkeletonCache
 from .payload import PayloadSynthesizer, build_payload
 from .config import (
     SKELETONIZATION_CONFIG,
     PAYLOAD_CONFIG,
+    SKELETON_CACHE_CONFIG,
     BODY_REPLACEMENTS,
     TOKEN_PRIORITY
 )
@@ -23,6 +25,7 @@ __all__ = [
     # Skeletonization
     "Skeletonizer",
     "skeletonize_file",
+    "SkeletonCache",
 
     # Payload synthesis
     "PayloadSynthesizer",
@@ -31,6 +34,7 @@ __all__ = [
     # Configuration
     "SKELETONIZATION_CONFIG",
     "PAYLOAD_CONFIG",
+    "SKELETON_CACHE_CONFIG",
     "BODY_REPLACEMENTS",
     "TOKEN_PRIORITY",
 ]
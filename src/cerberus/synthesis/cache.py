@@ -0,0 +1,230 @@
+"""
+Skeleton cache backed by the index database.
+
+Skeletons are keyed by a hash of the file content plus the skeleton options
+(skeletonizer config and preserved symbols), so an unchanged file is never
+skeletonized twice - across tool calls, payload builds and server restarts.
+Directory requests look up all files in one query and skeletonize the misses
+in parallel.
+"""
+
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from ..schemas import SkeletonizedCode
+from .config import SKELETON_CACHE_CONFIG
+from .skeletonizer import Skeletonizer
+
+# Bump when skeleton output changes so stale entries are ignored
+SKELETON_CACHE_VERSION = "1"
+
+# Keep IN (...) lists well below SQLite's variable limit
+LOOKUP_CHUNK_SIZE = 500
+
+
+class SkeletonCache:
+    """
+    Content-addressed skeleton cache stored in the ``skeleton_cache`` table.
+
+    Without a store the cache degrades to plain (parallel) skeletonization.
+    """
+
+    def __init__(
+        self,
+        store: Optional[Any] = None,
+        skeletonizer: Optional[Skeletonizer] = None,
+        config: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize skeleton cache.
+
+        Args:
+            store: Optional SQLite index store used for persistence
+            skeletonizer: Skeletonizer to use on cache misses
+            config: Optional configuration overrides
+        """
+        self.config = {**SKELETON_CACHE_CONFIG, **(config or {})}
+        self.store = store if self.config["enabled"] else None
+        self.skeletonizer = skeletonizer or Skeletonizer()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        file_path: str,
+        preserve_symbols: Optional[List[str]] = None
+    ) -> SkeletonizedCode:
+        """
+        Get the skeleton for a file, generating and persisting it on a miss.
+
+        Args:
+            file_path: Path to the source file
+            preserve_symbols: Symbol names to preserve fully
+
+        Returns:
+            SkeletonizedCode for the file
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        if not Path(file_path).exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        results = self.get_many([file_path], {file_path: preserve_symbols or []})
+        if not results:
+            # Generation failed - let the skeletonizer raise the real error
+            return self.skeletonizer.skeletonize_file(file_path, preserve_symbols)
+        return results[0]
+
+    def get_many(
+        self,
+        file_paths: List[str],
+        preserve_symbols: Optional[Dict[str, List[str]]] = None
+    ) -> List[SkeletonizedCode]:
+        """
+        Get skeletons for many files.
+
+        Cached skeletons are fetched in batched queries; misses are
+        skeletonized in parallel and written back in a single transaction.
+        Files that cannot be read or skeletonized are logged and skipped.
+
+        Args:
+            file_paths: Paths of the source files
+            preserve_symbols: Dict mapping file paths to symbols to preserve
+
+        Returns:
+            SkeletonizedCode objects in input order
+        """
+        preserve_symbols = preserve_symbols or {}
+
+        # (file_path, preserve, variant, content_hash, cache_key) per readable file
+        requests: List[Tuple[str, List[str], str, str, str]] = []
+        for file_path in file_paths:
+            preserve = list(preserve_symbols.get(file_path, []))
+            try:
+                content_hash = hashlib.sha256(Path(file_path).read_bytes()).hexdigest()
+            except OSError as e:
+                logger.error(f"Failed to read {file_path}: {e}")
+                continue
+            variant = self._variant(preserve)
+            cache_key = hashlib.sha256(f"{content_hash}:{variant}".encode()).hexdigest()
+            requests.append((file_path, preserve, variant, content_hash, cache_key))
+
+        cached = self._lookup([request[4] for request in requests])
+
+        results: Dict[int, SkeletonizedCode] = {}
+        misses = []
+        for position, (file_path, preserve, _, _, cache_key) in enumerate(requests):
+            if cache_key in cached:
+                skeleton = SkeletonizedCode(**json.loads(cached[cache_key]))
+                results[position] = skeleton.model_copy(update={"file_path": file_path})
+            else:
+                misses.append(position)
+
+        self.hits += len(results)
+        self.misses += len(misses)
+
+        generated = self._generate([requests[position] for position in misses])
+        for position, skeleton in zip(misses, generated):
+            if skeleton is not None:
+                results[position] = skeleton
+
+        self._persist([
+            (requests[position], skeleton)
+            for position, skeleton in zip(misses, generated)
+            if skeleton is not None
+        ])
+
+        return [results[position] for position in sorted(results)]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for this cache instance."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "persistent": self.store is not None,
+        }
+
+    def _variant(self, preserve: List[str]) -> str:
+        """Hash of everything besides content that shapes the skeleton."""
+        payload = json.dumps(
+            [SKELETON_CACHE_VERSION, self.skeletonizer.config, sorted(preserve)],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+    def _lookup(self, cache_keys: List[str]) -> Dict[str, str]:
+        """Fetch cached skeleton JSON for the given keys."""
+        if self.store is None or not cache_keys:
+            return {}
+
+        found: Dict[str, str] = {}
+        try:
+            conn = self.store._get_connection()
+            try:
+                for start in range(0, len(cache_keys), LOOKUP_CHUNK_SIZE):
+                    chunk = cache_keys[start:start + LOOKUP_CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT cache_key, skeleton_json FROM skeleton_cache "
+                        f"WHERE cache_key IN ({placeholders})",
+                        chunk
+                    )
+                    found.update((row[0], row[1]) for row in rows)
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.warning(f"Skeleton cache read failed: {e}")
+        return found
+
+    def _generate(self, requests: List[Tuple[str, List[str], str, str, str]]) -> List[Optional[SkeletonizedCode]]:
+        """Skeletonize cache misses, in parallel when there are several."""
+
+        def skeletonize(request) -> Optional[SkeletonizedCode]:
+            file_path, preserve = request[0], request[1]
+            try:
+                return self.skeletonizer.skeletonize_file(file_path, preserve)
+            except Exception as e:
+                logger.error(f"Failed to skeletonize {file_path}: {e}")
+                return None
+
+        workers = min(self.config["max_workers"], len(requests))
+        if workers <= 1:
+            return [skeletonize(request) for request in requests]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(skeletonize, requests))
+
+    def _persist(self, entries: List[Tuple[Tuple[str, List[str], str, str, str], SkeletonizedCode]]) -> None:
+        """Write generated skeletons, replacing older versions of the same file."""
+        if self.store is None or not entries:
+            return
+
+        try:
+            with self.store.transaction() as conn:
+                conn.executemany(
+                    "DELETE FROM skeleton_cache WHERE file_path = ? AND variant = ?",
+                    [(str(Path(request[0]).resolve()), request[2]) for request, _ in entries]
+                )
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO skeleton_cache
+                        (cache_key, file_path, variant, content_hash, skeleton_json)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (request[4], str(Path(request[0]).resolve()), request[2], request[3],
+                         skeleton.model_dump_json())
+                        for request, skeleton in entries
+                    ]
+                )
+        except Exception as e:
+            logger.warning(f"Skeleton cache write failed: {e}")
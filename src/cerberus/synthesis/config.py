@@ -15,6 +15,12 @@ SKELETONIZATION_CONFIG = {
     "min_lines_to_skeletonize": 3,  # Don't skeletonize very small functions
 }
 
+# Skeleton cache configuration (skeletons persisted in the index DB)
+SKELETON_CACHE_CONFIG = {
+    "enabled": True,
+    "max_workers": 4,  # Parallel skeletonization for directory requests
+}
+
 # Body replacement markers by language
 BODY_REPLACEMENTS = {
     "python": "...",
@@ -14,6 +14,7 @@ from ..schemas import (
     ScanResult
 )
 from .skeletonizer import Skeletonizer
+from .cache import SkeletonCache
 from .payload import PayloadSynthesizer
 from .config import SKELETONIZATION_CONFIG, PAYLOAD_CONFIG
 
@@ -27,7 +28,8 @@ class SynthesisFacade:
     def __init__(
         self,
         skeleton_config: Optional[Dict[str, Any]] = None,
-        payload_config: Optional[Dict[str, Any]] = None
+        payload_config: Optional[Dict[str, Any]] = None,
+        store: Optional[Any] = None
     ):
         """
         Initialize synthesis facade.
@@ -35,7 +37,9 @@ class SynthesisFacade:
         Args:
             skeleton_config: Configuration for skeletonization
             payload_config: Configuration for payload synthesis
+            store: Optional SQLite index store for persisted skeletons
         """
+        self.store = store
         self.skeletonizer = Skeletonizer(config=skeleton_config)
         self.payload_synthesizer = PayloadSynthesizer(config=payload_config)
         logger.debug("SynthesisFacade initialized")
@@ -43,7 +47,8 @@ class SynthesisFacade:
     def skeletonize_file(
         self,
         file_path: str,
-        preserve_symbols: Optional[List[str]] = None
+        preserve_symbols: Optional[List[str]] = None,
+        store: Optional[Any] = None
     ) -> SkeletonizedCode:
         """
         Skeletonize a source code file.
@@ -51,48 +56,53 @@ class SynthesisFacade:
         Args:
             file_path: Path to the source file
             preserve_symbols: Symbol names to preserve fully (not skeletonize)
+            store: Optional index store (overrides self.store) for cached skeletons
 
         Returns:
             SkeletonizedCode with pruned implementation
         """
         logger.info(f"Skeletonizing {file_path}")
-        return self.skeletonizer.skeletonize_file(file_path, preserve_symbols)
+        return self._skeleton_cache(store).get(file_path, preserve_symbols)
 
     def skeletonize_directory(
         self,
         directory: str,
         pattern: str = "**/*.py",
-        preserve_symbols: Optional[Dict[str, List[str]]] = None
+        preserve_symbols: Optional[Dict[str, List[str]]] = None,
+        store: Optional[Any] = None
     ) -> List[SkeletonizedCode]:
         """
         Skeletonize all files matching pattern in a directory.
 
+        Cached skeletons are reused; the remaining files are skeletonized
+        in parallel.
+
         Args:
             directory: Directory to scan
             pattern: Glob pattern for files
             preserve_symbols: Dict mapping file paths to symbols to preserve
+            store: Optional index store (overrides self.store) for cached skeletons
 
         Returns:
             List of SkeletonizedCode objects
         """
-        preserve_symbols = preserve_symbols or {}
         dir_path = Path(directory)
-        results = []
 
         logger.info(f"Skeletonizing directory {directory} with pattern {pattern}")
 
-        for file_path in dir_path.glob(pattern):
-            if file_path.is_file():
-                preserve = preserve_symbols.get(str(file_path), [])
-                try:
-                    skeleton = self.skeletonize_file(str(file_path), preserve)
-                    results.append(skeleton)
-                except Exception as e:
-                    logger.error(f"Failed to skeletonize {file_path}: {e}")
+        file_paths = [
+            str(file_path) for file_path in sorted(dir_path.glob(pattern))
+            if file_path.is_file()
+        ]
+        results = self._skeleton_cache(store).get_many(file_paths, preserve_symbols)
 
         logger.info(f"Skeletonized {len(results)} files")
         return results
 
+    def _skeleton_cache(self, store: Optional[Any] = None) -> SkeletonCache:
+        """Skeleton cache over the given (or default) index store."""
+        return SkeletonCache(store or self.store, self.skeletonizer)
+
     def build_context_payload(
         self,
         target_symbol: CodeSymbol,
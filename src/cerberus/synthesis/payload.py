@@ -16,7 +16,7 @@ from ..schemas import (
     ScanResult
 )
 from ..graph import build_recursive_call_graph
-from .skeletonizer import skeletonize_file
+from .cache import SkeletonCache
 from .config import PAYLOAD_CONFIG, TOKEN_PRIORITY
 
 
@@ -192,8 +192,9 @@ class PayloadSynthesizer:
         skeletons = []
 
         # Skeletonize the containing file, preserving only the target symbol
+        # (read from the index skeleton cache when the scan result has a store)
         try:
-            skeleton = skeletonize_file(
+            skeleton = SkeletonCache(getattr(scan_result, "_store", None)).get(
                 file_path=target_symbol.file_path,
                 preserve_symbols=[target_symbol.name]
             )
@@ -7,19 +7,13 @@ from pathlib import Path
 from typing import Optional, List, Dict, Any
 from loguru import logger
 
-try:
-    from tree_sitter import Parser, Node, Language
-    import tree_sitter_python as tspython
-    import tree_sitter_javascript as tsjavascript
-    import tree_sitter_typescript as tstypescript
-    TREE_SITTER_AVAILABLE = True
-except ImportError:
-    TREE_SITTER_AVAILABLE = False
-    logger.warning("tree-sitter not available, skeletonization will be limited")
-
+from ..parser.tree_cache import TREE_SITTER_AVAILABLE, ParserPool, get_tree_cache
 from ..schemas import SkeletonizedCode
 from .config import SKELETONIZATION_CONFIG, BODY_REPLACEMENTS
 
+if not TREE_SITTER_AVAILABLE:
+    logger.warning("tree-sitter not available, skeletonization will be limited")
+
 
 class Skeletonizer:
     """
@@ -34,36 +28,12 @@ class Skeletonizer:
             config: Optional configuration overrides
         """
         self.config = {**SKELETONIZATION_CONFIG, **(config or {})}
-        self.parsers: Dict[str, Parser] = {}
+        # Per-thread pooled parsers shared with the other tree-sitter consumers
+        self.parsers = ParserPool()
 
-        if TREE_SITTER_AVAILABLE:
-            self._init_parsers()
-        else:
+        if not TREE_SITTER_AVAILABLE:
             logger.warning("Tree-sitter not available, skeletonization disabled")
 
-    def _init_parsers(self):
-        """Initialize tree-sitter parsers for supported languages."""
-        try:
-            # Python parser
-            python_parser = Parser()
-            python_parser.language = Language(tspython.language())
-            self.parsers["python"] = python_parser
-
-            # JavaScript parser
-            js_parser = Parser()
-            js_parser.language = Language(tsjavascript.language())
-            self.parsers["javascript"] = js_parser
-
-            # TypeScript parser
-            ts_parser = Parser()
-            ts_parser.language = Language(tstypescript.language_typescript())
-            self.parsers["typescript"] = ts_parser
-
-            logger.debug(f"Initialized parsers: {list(self.parsers.keys())}")
-        except Exception as e:
-            logger.error(f"Failed to initialize parsers: {e}")
-            self.parsers = {}
-
     def skeletonize_file(
         self,
         file_path: str,
@@ -85,14 +55,17 @@ class Skeletonizer:
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        # Read file content
-        with open(file_path, 'r', encoding='utf-8') as f:
-            source_code = f.read()
-
         # Detect language from extension
         language = self._detect_language(path.suffix)
 
-        if not language or language not in self.parsers:
+        # Parse through the shared tree cache (re-used across tools and calls)
+        parsed = None
+        if language and language in self.parsers:
+            parsed = get_tree_cache().get(file_path, language)
+
+        if parsed is None:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                source_code = f.read()
             logger.warning(f"Unsupported language for {file_path}, returning original")
             return SkeletonizedCode(
                 file_path=file_path,
@@ -104,8 +77,9 @@ class Skeletonizer:
                 compression_ratio=1.0
             )
 
-        # Parse and skeletonize
-        skeleton = self._skeletonize(source_code, language, preserve_symbols)
+        # Skeletonize the cached tree
+        source_code = parsed.source
+        skeleton = self._skeletonize(source_code, language, preserve_symbols, tree=parsed.tree)
 
         skeleton_lines = len(skeleton.splitlines())
         original_lines = len(source_code.splitlines())
@@ -116,7 +90,7 @@ class Skeletonizer:
             skeleton_lines=skeleton_lines,
             content=skeleton,
             preserved_symbols=preserve_symbols,
-            pruned_symbols=self._extract_pruned_symbols(source_code, language),
+            pruned_symbols=self._extract_pruned_symbols(source_code, language, tree=parsed.tree),
             compression_ratio=skeleton_lines / original_lines if original_lines > 0 else 1.0
         )
 
@@ -135,7 +109,8 @@ class Skeletonizer:
         self,
         source_code: str,
         language: str,
-        preserve_symbols: List[str]
+        preserve_symbols: List[str],
+        tree=None
     ) -> str:
         """
         Skeletonize source code using AST.
@@ -144,16 +119,18 @@ class Skeletonizer:
             source_code: Source code to skeletonize
             language: Programming language
             preserve_symbols: Symbols to preserve fully
+            tree: Optional pre-parsed tree for source_code
 
         Returns:
             Skeletonized source code
         """
-        parser = self.parsers.get(language)
-        if not parser:
-            return source_code
+        if tree is None:
+            parser = self.parsers.get(language)
+            if not parser:
+                return source_code
 
-        # Parse source code
-        tree = parser.parse(bytes(source_code, "utf8"))
+            # Parse source code
+            tree = parser.parse(bytes(source_code, "utf8"))
 
         # Process AST and build skeleton
         if language == "python":
@@ -336,13 +313,14 @@ class Skeletonizer:
         """Extract indentation from a line."""
         return line[:len(line) - len(line.lstrip())]
 
-    def _extract_pruned_symbols(self, source_code: str, language: str) -> List[str]:
+    def _extract_pruned_symbols(self, source_code: str, language: str, tree=None) -> List[str]:
         """Extract list of symbols that would be pruned."""
-        parser = self.parsers.get(language)
-        if not parser:
-            return []
+        if tree is None:
+            parser = self.parsers.get(language)
+            if not parser:
+                return []
 
-        tree = parser.parse(bytes(source_code, "utf8"))
+            tree = parser.parse(bytes(source_code, "utf8"))
 
         if language == "python":
             function_types = ["function_definition"]
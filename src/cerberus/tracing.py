@@ -1,72 +1,496 @@
 """
-Performance tracing decorator for critical functions.
+Performance tracing: spans, aggregated timings and trace export.
 
 Part of the Aegis Robustness Model - Layer 3: Performance Tracing.
+
+Every traced call opens a span. Spans nest through a context variable, so a
+single MCP tool call produces a tree (tool -> SQLite query -> ...) that can be
+exported as Chrome trace-event JSON (chrome://tracing, Perfetto). Durations
+are also folded into per-span-name histograms for p50/p95/p99 reporting.
+
+Sampling is decided once per root span (``CERBERUS_TRACE_SAMPLE_RATE``,
+default 1.0); children of an unsampled root cost a context-variable lookup.
 """
 
-import time
 import functools
-from typing import Callable, Any
+import inspect
+import itertools
+import json
+import math
+import os
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
 from cerberus.logging_config import logger
 
 
-def trace(func: Callable) -> Callable:
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+TRACE_CONFIG = {
+    # Fraction of root spans that are recorded (children follow their root)
+    "sample_rate": _env_float("CERBERUS_TRACE_SAMPLE_RATE", 1.0),
+    # Completed spans kept for trace export (oldest dropped first)
+    "max_events": int(_env_float("CERBERUS_TRACE_MAX_EVENTS", 20000)),
+}
+
+# Histogram resolution: 8 buckets per doubling (~9% relative error)
+_BUCKETS_PER_OCTAVE = 8
+
+# Marker stored in the context when the current root span was not sampled
+_UNSAMPLED = object()
+
+_current_span: ContextVar[Any] = ContextVar("cerberus_current_span", default=None)
+_span_ids = itertools.count(1)
+
+
+class Span:
+    """A single timed operation."""
+
+    __slots__ = ("name", "category", "span_id", "parent_id", "start_ns",
+                 "duration_ns", "thread_id", "args", "error")
+
+    def __init__(self, name: str, category: str, parent_id: Optional[int], args: Dict[str, Any]):
+        self.name = name
+        self.category = category
+        self.span_id = next(_span_ids)
+        self.parent_id = parent_id
+        self.thread_id = threading.get_ident()
+        self.args = args
+        self.error: Optional[str] = None
+        self.duration_ns = 0
+        self.start_ns = time.perf_counter_ns()
+
+
+class _Histogram:
+    """Log-bucketed duration histogram with O(1) recording."""
+
+    __slots__ = ("category", "count", "errors", "total_ns", "max_ns", "buckets")
+
+    def __init__(self, category: str):
+        self.category = category
+        self.count = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.buckets: Dict[int, int] = {}
+
+    def record(self, duration_ns: int, error: bool) -> None:
+        self.count += 1
+        self.errors += error
+        self.total_ns += duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        bucket = int(math.log2(duration_ns) * _BUCKETS_PER_OCTAVE) if duration_ns > 1 else 0
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def percentile(self, q: float) -> int:
+        """Approximate duration (ns) at quantile ``q`` (0-1)."""
+        if not self.count:
+            return 0
+        rank = q * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                upper = 2 ** ((bucket + 1) / _BUCKETS_PER_OCTAVE)
+                return min(int(upper), self.max_ns)
+        return self.max_ns
+
+    def summary(self) -> Dict[str, Any]:
+        ms = 1e6
+        return {
+            "category": self.category,
+            "count": self.count,
+            "errors": self.errors,
+            "total_ms": round(self.total_ns / ms, 3),
+            "mean_ms": round(self.total_ns / self.count / ms, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(0.50) / ms, 3),
+            "p95_ms": round(self.percentile(0.95) / ms, 3),
+            "p99_ms": round(self.percentile(0.99) / ms, 3),
+            "max_ms": round(self.max_ns / ms, 3),
+        }
+
+
+class Tracer:
+    """Collects finished spans into histograms and an export buffer."""
+
+    def __init__(self, sample_rate: Optional[float] = None, max_events: Optional[int] = None):
+        """
+        Initialize tracer.
+
+        Args:
+            sample_rate: Fraction of root spans to record (default from TRACE_CONFIG)
+            max_events: Size of the span buffer used for trace export
+        """
+        self.sample_rate = TRACE_CONFIG["sample_rate"] if sample_rate is None else sample_rate
+        self._events: deque = deque(maxlen=max_events or TRACE_CONFIG["max_events"])
+        self._histograms: Dict[str, _Histogram] = {}
+        self._lock = threading.Lock()
+        self._origin_ns = time.perf_counter_ns()
+
+    def start(self, name: str, category: str, args: Optional[Dict[str, Any]] = None) -> Optional[Span]:
+        """
+        Start a span under the current span.
+
+        Returns:
+            The new span, or None if the enclosing trace is not sampled
+        """
+        parent = _current_span.get()
+        if parent is _UNSAMPLED:
+            return None
+        if parent is None and self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return None
+        return Span(name, category, parent.span_id if parent else None, args or {})
+
+    def finish(self, span: Span, error: Optional[BaseException] = None) -> None:
+        """Stop a span and record it."""
+        span.duration_ns = time.perf_counter_ns() - span.start_ns
+        if error is not None:
+            span.error = type(error).__name__
+        with self._lock:
+            histogram = self._histograms.get(span.name)
+            if histogram is None:
+                histogram = self._histograms[span.name] = _Histogram(span.category)
+            histogram.record(span.duration_ns, error is not None)
+            self._events.append(span)
+
+    def get_stats(self, top: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Aggregated timings per span name, slowest total first.
+
+        Args:
+            top: Only include the ``top`` span names by total time
+
+        Returns:
+            Dict with sample_rate, buffered event count and per-span summaries
+        """
+        with self._lock:
+            spans = {name: hist.summary() for name, hist in self._histograms.items()}
+            buffered = len(self._events)
+        ordered = sorted(spans.items(), key=lambda item: item[1]["total_ms"], reverse=True)
+        return {
+            "sample_rate": self.sample_rate,
+            "buffered_events": buffered,
+            "spans": dict(ordered[:top] if top else ordered),
+        }
+
+    def export_chrome_trace(self, path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
+        """
+        Export buffered spans in Chrome trace-event format.
+
+        Args:
+            path: Optional file to write the JSON to
+
+        Returns:
+            Trace document ({"traceEvents": [...]})
+        """
+        with self._lock:
+            spans = list(self._events)
+
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = []
+        for span in spans:
+            args = {key: _json_safe(value) for key, value in span.args.items()}
+            args["span_id"] = span.span_id
+            if span.parent_id is not None:
+                args["parent_id"] = span.parent_id
+            if span.error:
+                args["error"] = span.error
+            events.append({
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": (span.start_ns - self._origin_ns) / 1000,
+                "dur": span.duration_ns / 1000,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": args,
+            })
+
+        document = {"traceEvents": events, "displayTimeUnit": "ms"}
+        if path is not None:
+            Path(path).write_text(json.dumps(document))
+        return document
+
+    def reset(self) -> None:
+        """Drop all recorded spans and histograms."""
+        with self._lock:
+            self._events.clear()
+            self._histograms.clear()
+
+
+def _json_safe(value: Any) -> Any:
+    return value if isinstance(value, (str, int, float, bool, type(None))) else str(value)
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer."""
+    return _tracer
+
+
+def set_sample_rate(rate: float) -> None:
+    """Change the fraction of root spans that are recorded."""
+    _tracer.sample_rate = max(0.0, min(1.0, rate))
+
+
+def get_stats(top: Optional[int] = None) -> Dict[str, Any]:
+    """Aggregated span timings of the process-wide tracer."""
+    return _tracer.get_stats(top)
+
+
+def export_chrome_trace(path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
+    """Export the process-wide tracer's spans as Chrome trace-event JSON."""
+    return _tracer.export_chrome_trace(path)
+
+
+def reset() -> None:
+    """Reset the process-wide tracer."""
+    _tracer.reset()
+
+
+def current_span() -> Optional[Span]:
+    """The innermost active (sampled) span, if any."""
+    span = _current_span.get()
+    return None if span is _UNSAMPLED else span
+
+
+@contextmanager
+def span(name: str, category: str = "function", **args: Any) -> Iterator[Optional[Span]]:
     """
-    Decorator that logs function entry, exit, and execution time.
+    Trace a block of code.
+
+    Usage:
+        with span("scanner.parse", "scanner", file=path):
+            symbols = parse_file(path)
+
+    Yields:
+        The active Span, or None if not sampled
+    """
+    active = _tracer.start(name, category, args)
+    token = _current_span.set(active if active is not None else _UNSAMPLED)
+    try:
+        yield active
+    except BaseException as e:
+        if active is not None:
+            _tracer.finish(active, e)
+            active = None
+        raise
+    finally:
+        _current_span.reset(token)
+        if active is not None:
+            _tracer.finish(active)
+
+
+class _TracedGenerator:
+    """
+    Generator proxy that keeps a traced call's span open until the generator
+    is exhausted, fails or is closed - also when it is garbage collected
+    without ever being started.
+    """
+
+    __slots__ = ("_generator", "_active", "_name", "_start_time", "_log", "_finished")
+
+    def __init__(self, generator: Any, active: Optional[Span], name: str, start_time: float, log: bool):
+        self._generator = generator
+        self._active = active
+        self._name = name
+        self._start_time = start_time
+        self._log = log
+        self._finished = False
+
+    def __iter__(self) -> "_TracedGenerator":
+        return self
+
+    def __next__(self) -> Any:
+        return self.send(None)
+
+    def send(self, value: Any) -> Any:
+        try:
+            return self._generator.send(value)
+        except StopIteration:
+            self._finish()
+            raise
+        except BaseException as e:
+            self._finish(e)
+            raise
+
+    def throw(self, *args: Any) -> Any:
+        try:
+            return self._generator.throw(*args)
+        except StopIteration:
+            self._finish()
+            raise
+        except BaseException as e:
+            self._finish(e)
+            raise
+
+    def close(self) -> None:
+        try:
+            self._generator.close()
+        except BaseException as e:
+            self._finish(e)
+            raise
+        self._finish()
+
+    def __del__(self) -> None:
+        try:
+            self._finish()
+        except Exception:
+            pass
+
+    def _finish(self, error: Optional[BaseException] = None) -> None:
+        if self._finished:
+            return
+        self._finished = True
+        if self._active is not None:
+            _tracer.finish(self._active, error)
+        if self._log:
+            duration = time.perf_counter() - self._start_time
+            if error is None:
+                _log_exit(self._name, duration)
+            elif isinstance(error, Exception):
+                _log_error(self._name, duration, error)
+
+
+def _log_exit(func_name: str, duration: float) -> None:
+    logger.info(
+        f"TRACE_EXIT: {func_name} completed in {duration:.4f}s",
+        extra={
+            "function": func_name,
+            "duration_seconds": duration,
+            "status": "success"
+        }
+    )
+
+
+def _log_error(func_name: str, duration: float, e: BaseException) -> None:
+    logger.error(
+        f"TRACE_EXIT: {func_name} failed after {duration:.4f}s with {type(e).__name__}: {str(e)}",
+        extra={
+            "function": func_name,
+            "duration_seconds": duration,
+            "status": "error",
+            "exception_type": type(e).__name__,
+            "exception_message": str(e)
+        }
+    )
+
+
+def trace(
+    func: Optional[Callable] = None,
+    *,
+    name: Optional[str] = None,
+    category: str = "function",
+    log: bool = True,
+) -> Callable:
+    """
+    Decorator that records a span for every call and logs entry/exit.
 
     Usage:
         @trace
         def my_function(arg1, arg2):
-            # function body
             pass
 
-    Logs:
-        - Entry with function name and arguments
-        - Exit with function name and execution duration
-        - Any exceptions raised during execution
+        @trace(name="sqlite.query", category="sqlite", log=False)
+        def query(...):
+            pass
+
+    Works on plain and async functions. When a call returns a generator,
+    the span stays open (and exit is logged) until the generator is
+    exhausted, fails or is closed.
+
+    Args:
+        func: Function to wrap (when used without arguments)
+        name: Span name (defaults to the function's qualified name)
+        category: Span category shown in trace viewers
+        log: Log entry, exit and duration through the logger
     """
-    @functools.wraps(func)
-    def wrapper(*args: Any, **kwargs: Any) -> Any:
-        func_name = func.__qualname__
+    if func is None:
+        return functools.partial(trace, name=name, category=category, log=log)
 
-        # Log entry
-        logger.debug(f"TRACE_ENTER: {func_name}")
+    span_name = name or func.__qualname__
 
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            if log:
+                logger.debug(f"TRACE_ENTER: {span_name}")
+            start_time = time.perf_counter()
+            try:
+                with span(span_name, category):
+                    result = await func(*args, **kwargs)
+            except Exception as e:
+                if log:
+                    _log_error(span_name, time.perf_counter() - start_time, e)
+                raise
+            if log:
+                _log_exit(span_name, time.perf_counter() - start_time)
+            return result
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if log:
+            logger.debug(f"TRACE_ENTER: {span_name}")
         start_time = time.perf_counter()
 
+        active = _tracer.start(span_name, category)
+        token = _current_span.set(active if active is not None else _UNSAMPLED)
         try:
             result = func(*args, **kwargs)
-            end_time = time.perf_counter()
-            duration = end_time - start_time
-
-            # Log successful exit with duration
-            logger.info(
-                f"TRACE_EXIT: {func_name} completed in {duration:.4f}s",
-                extra={
-                    "function": func_name,
-                    "duration_seconds": duration,
-                    "status": "success"
-                }
-            )
+        except BaseException as e:
+            _current_span.reset(token)
+            if active is not None:
+                _tracer.finish(active, e)
+            if log and isinstance(e, Exception):
+                _log_error(span_name, time.perf_counter() - start_time, e)
+            raise
+        _current_span.reset(token)
 
-            return result
+        if inspect.isgenerator(result):
+            return _TracedGenerator(result, active, span_name, start_time, log)
 
-        except Exception as e:
-            end_time = time.perf_counter()
-            duration = end_time - start_time
-
-            # Log exit with exception
-            logger.error(
-                f"TRACE_EXIT: {func_name} failed after {duration:.4f}s with {type(e).__name__}: {str(e)}",
-                extra={
-                    "function": func_name,
-                    "duration_seconds": duration,
-                    "status": "error",
-                    "exception_type": type(e).__name__,
-                    "exception_message": str(e)
-                }
-            )
-
-            raise
+        if active is not None:
+            _tracer.finish(active)
+        if log:
+            _log_exit(span_name, time.perf_counter() - start_time)
+        return result
 
     return wrapper
+
+
+def trace_methods(category: str, exclude: Iterable[str] = ()) -> Callable[[type], type]:
+    """
+    Class decorator that traces every public method (without logging).
+
+    Spans are named ``<category>.<method>``.
+
+    Args:
+        category: Span category and name prefix
+        exclude: Method names to leave untraced
+    """
+    skipped = set(exclude)
+
+    def decorate(cls: type) -> type:
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or attr in skipped or not inspect.isfunction(value):
+                continue
+            setattr(cls, attr, trace(value, name=f"{category}.{attr}", category=category, log=False))
+        return cls
+
+    return decorate
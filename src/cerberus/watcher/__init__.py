@@ -4,8 +4,21 @@ Background watcher module for real-time index synchronization.
 Public API for starting, stopping, and querying watcher daemon status.
 """
 
-from .facade import start_watcher, stop_watcher, watcher_status, ensure_watcher_running
-from .daemon import is_watcher_running
+from typing import TYPE_CHECKING
+
+from cerberus.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .facade import start_watcher, stop_watcher, watcher_status, ensure_watcher_running
+    from .daemon import is_watcher_running
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "start_watcher": ".facade",
+    "stop_watcher": ".facade",
+    "watcher_status": ".facade",
+    "ensure_watcher_running": ".facade",
+    "is_watcher_running": ".daemon",
+})
 
 __all__ = [
     "start_watcher",
@@ -0,0 +1,298 @@
+"""
+Request/response command server on the watcher socket.
+
+The watcher daemon serves ``cerberus`` CLI invocations over its Unix socket,
+so they run in a warm process where tree-sitter parsers, tokenizer encodings
+and embedding models stay loaded. Clients call forward_command(), which
+returns None when no daemon is listening; callers then run the command
+in-process (or as a subprocess) as before.
+
+Protocol: one JSON object per line in each direction.
+    request:  {"argv": [...], "cwd": "...", "env": {"CERBERUS_...": "..."}}
+    response: {"exit_code": 0, "stdout": "...", "stderr": "..."}
+
+Sockets live in a per-user directory (mode 0700). Clients only connect to a
+socket they own, and both ends check the peer's uid (SO_PEERCRED) where the
+platform supports it, so commands, environment and output never cross users.
+
+This module only uses the standard library on the client side, so forwarding
+adds no import cost to the CLI.
+"""
+
+import io
+import json
+import os
+import socket
+import socketserver
+import stat
+import struct
+import subprocess
+import sys
+import threading
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from .config import IPC_CONFIG, get_socket_file_path
+
+# Prefix of environment variables forwarded with each request
+FORWARDED_ENV_PREFIX = "CERBERUS_"
+
+# Set to disable forwarding (always run in-process)
+NO_DAEMON_ENV = "CERBERUS_NO_DAEMON"
+
+# True inside a process serving commands - it must never forward to itself
+_serving = False
+
+# Held while the process working directory or environment may be switched for
+# a forwarded command; the watcher holds it around its own index updates.
+process_state_lock = threading.RLock()
+
+
+@dataclass
+class CommandResult:
+    """Outcome of a CLI command run by the daemon."""
+    exit_code: int
+    stdout: str
+    stderr: str
+
+
+def find_daemon_socket(start: Optional[Path] = None) -> Optional[Path]:
+    """
+    Find the command socket of a daemon serving ``start`` or a parent directory.
+
+    Args:
+        start: Directory to start from (default: current directory)
+
+    Returns:
+        Socket path, or None if no daemon socket exists
+    """
+    directory = (start or Path.cwd()).resolve()
+    for candidate in (directory, *directory.parents):
+        socket_path = get_socket_file_path(candidate)
+        if _is_own_socket(socket_path):
+            return socket_path
+    return None
+
+
+def _is_own_socket(path: Path) -> bool:
+    """True if path is a socket owned by the current user."""
+    try:
+        st = path.lstat()
+    except OSError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid()
+
+
+def _peer_uid(sock: socket.socket) -> Optional[int]:
+    """uid of the process at the other end of a Unix socket (None if unsupported)."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _, uid, _ = struct.unpack("3i", creds)
+    return uid
+
+
+def _is_trusted_peer(sock: socket.socket) -> bool:
+    uid = _peer_uid(sock)
+    return uid is None or uid == os.getuid()
+
+
+def forward_command(
+    argv: List[str],
+    cwd: Optional[Path] = None,
+    timeout: Optional[float] = None
+) -> Optional[CommandResult]:
+    """
+    Run a CLI command in the daemon, if one is serving this project.
+
+    Args:
+        argv: CLI arguments without the program name (e.g. ["memory", "session-status"])
+        cwd: Working directory of the command (default: current directory)
+        timeout: Seconds to wait for the result (default: IPC_CONFIG["command_timeout"])
+
+    Returns:
+        CommandResult, or None when no daemon is available
+
+    Raises:
+        TimeoutError: If the daemon accepted the command but did not answer in time
+    """
+    if _serving or os.environ.get(NO_DAEMON_ENV):
+        return None
+
+    cwd = Path(cwd or Path.cwd()).resolve()
+    try:
+        socket_path = find_daemon_socket(cwd)
+    except PermissionError:
+        # Socket directory taken by another user - never talk to it
+        return None
+    if socket_path is None:
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(IPC_CONFIG["connect_timeout"])
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            # Stale socket file or daemon not accepting - run locally
+            return None
+        if not _is_trusted_peer(sock):
+            return None
+
+        request = {
+            "argv": list(argv),
+            "cwd": str(cwd),
+            "env": {k: v for k, v in os.environ.items() if k.startswith(FORWARDED_ENV_PREFIX)},
+        }
+        sock.settimeout(timeout if timeout is not None else IPC_CONFIG["command_timeout"])
+        try:
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            response = sock.makefile("rb").readline()
+        except socket.timeout:
+            raise TimeoutError(f"Cerberus daemon did not answer within {sock.gettimeout()}s")
+        except OSError:
+            return None
+    finally:
+        sock.close()
+
+    if not response:
+        return None
+    data = json.loads(response)
+    return CommandResult(
+        exit_code=data["exit_code"],
+        stdout=data["stdout"],
+        stderr=data["stderr"],
+    )
+
+
+def run_cerberus_command(
+    argv: List[str],
+    timeout: Optional[float] = None
+) -> subprocess.CompletedProcess:
+    """
+    Run a ``cerberus`` CLI command, in the daemon when available.
+
+    Falls back to a ``cerberus`` subprocess, so results look the same either way.
+
+    Args:
+        argv: CLI arguments without the program name
+        timeout: Optional timeout in seconds
+
+    Returns:
+        CompletedProcess with text stdout/stderr
+
+    Raises:
+        subprocess.TimeoutExpired: If the command exceeds the timeout
+    """
+    command = ["cerberus", *argv]
+    try:
+        result = forward_command(argv, timeout=timeout)
+    except TimeoutError:
+        raise subprocess.TimeoutExpired(command, timeout)
+
+    if result is None:
+        return subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+    return subprocess.CompletedProcess(command, result.exit_code, result.stdout, result.stderr)
+
+
+def execute_command(argv: List[str]) -> CommandResult:
+    """Run a CLI command in this process, capturing its output and exit code."""
+    from cerberus.cli import main
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code = 0
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            main(argv)
+        except SystemExit as e:
+            if isinstance(e.code, int):
+                exit_code = e.code
+            elif e.code is not None:
+                print(e.code, file=sys.stderr)
+                exit_code = 1
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            exit_code = 1
+    return CommandResult(exit_code=exit_code, stdout=stdout.getvalue(), stderr=stderr.getvalue())
+
+
+class _CommandHandler(socketserver.StreamRequestHandler):
+    """Handles one request line per connection."""
+
+    def handle(self):
+        if not _is_trusted_peer(self.request):
+            return
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+            result = self.server.run(request["argv"], request.get("cwd"), request.get("env") or {})
+        except Exception as e:
+            result = CommandResult(exit_code=1, stdout="", stderr=f"Error: {e}\n")
+        self.wfile.write(json.dumps(result.__dict__).encode("utf-8") + b"\n")
+
+
+class CommandServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Serves CLI commands on a Unix socket.
+
+    Connections are accepted concurrently, but commands run one at a time:
+    they share the process-wide working directory, environment and
+    stdout/stderr, which are switched per request under process_state_lock.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path):
+        self.socket_path = Path(socket_path)
+        self.socket_path.unlink(missing_ok=True)
+        # Created owner-only: no window between bind() and a chmod
+        previous_umask = os.umask(0o177)
+        try:
+            super().__init__(str(self.socket_path), _CommandHandler)
+        finally:
+            os.umask(previous_umask)
+
+    def run(self, argv: List[str], cwd: Optional[str], env: dict) -> CommandResult:
+        """Run a command with the client's working directory and CERBERUS_* environment."""
+        with process_state_lock:
+            saved_cwd = os.getcwd()
+            saved_env = {k: v for k, v in os.environ.items() if k.startswith(FORWARDED_ENV_PREFIX)}
+            try:
+                if cwd:
+                    os.chdir(cwd)
+                for key in saved_env:
+                    os.environ.pop(key, None)
+                os.environ.update({k: v for k, v in env.items() if k.startswith(FORWARDED_ENV_PREFIX)})
+                return execute_command(argv)
+            finally:
+                for key in [k for k in os.environ if k.startswith(FORWARDED_ENV_PREFIX)]:
+                    del os.environ[key]
+                os.environ.update(saved_env)
+                os.chdir(saved_cwd)
+
+    def server_close(self):
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+
+def start_command_server(project_path: Path) -> CommandServer:
+    """
+    Serve CLI commands for a project on its watcher socket, in a background thread.
+
+    Args:
+        project_path: Project the daemon serves
+
+    Returns:
+        Running CommandServer; call shutdown() and server_close() to stop it
+    """
+    global _serving
+    _serving = True
+
+    server = CommandServer(get_socket_file_path(project_path))
+    thread = threading.Thread(target=server.serve_forever, name="cerberus-command-server", daemon=True)
+    thread.start()
+    return server
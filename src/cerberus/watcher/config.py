@@ -2,6 +2,7 @@
 Configuration for the background watcher daemon.
 """
 
+import os
 import tempfile
 from pathlib import Path
 
@@ -36,11 +37,21 @@ MONITORING_CONFIG = {
     "recursive": True,
 }
 
+def _default_socket_dir() -> Path:
+    """Per-user directory for watcher sockets and PID files."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "cerberus"
+    return Path(tempfile.gettempdir()) / f"cerberus-{os.getuid()}"
+
+
 IPC_CONFIG = {
-    "socket_dir": Path(tempfile.gettempdir()) / "cerberus",
+    "socket_dir": _default_socket_dir(),  # Private (0700) to the current user
     "pid_file_pattern": "cerberus_watcher_{project_hash}.pid",
     "socket_file_pattern": "cerberus_watcher_{project_hash}.sock",
     "log_file_pattern": ".cerberus/watcher.log",  # Relative to project root
+    "connect_timeout": 0.5,  # Seconds to wait for the daemon to accept a command
+    "command_timeout": 300,  # Seconds to wait for a forwarded command's result
 }
 
 
@@ -59,20 +70,32 @@ def get_project_hash(project_path: Path) -> str:
     return hashlib.sha256(path_str.encode()).hexdigest()[:8]
 
 
+def ensure_socket_dir() -> Path:
+    """
+    Create the socket directory, private to the current user.
+
+    Raises:
+        PermissionError: If the directory exists and belongs to another user
+    """
+    socket_dir = IPC_CONFIG["socket_dir"]
+    socket_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if socket_dir.stat().st_uid != os.getuid():
+        raise PermissionError(f"Socket directory {socket_dir} is owned by another user")
+    return socket_dir
+
+
 def get_pid_file_path(project_path: Path) -> Path:
     """Get PID file path for a project."""
     project_hash = get_project_hash(project_path)
     filename = IPC_CONFIG["pid_file_pattern"].format(project_hash=project_hash)
-    IPC_CONFIG["socket_dir"].mkdir(parents=True, exist_ok=True)
-    return IPC_CONFIG["socket_dir"] / filename
+    return ensure_socket_dir() / filename
 
 
 def get_socket_file_path(project_path: Path) -> Path:
     """Get socket file path for a project."""
     project_hash = get_project_hash(project_path)
     filename = IPC_CONFIG["socket_file_pattern"].format(project_hash=project_hash)
-    IPC_CONFIG["socket_dir"].mkdir(parents=True, exist_ok=True)
-    return IPC_CONFIG["socket_dir"] / filename
+    return ensure_socket_dir() / filename
 
 
 def get_log_file_path(project_path: Path) -> Path:
@@ -19,6 +19,7 @@ from watchdog.events import FileSystemEventHandler, FileSystemEvent
 
 from ..schemas import FileChange, ModifiedFile, LineRange
 from ..incremental import update_index_incrementally
+from .command_server import process_state_lock, start_command_server
 from .config import WATCHER_CONFIG, MONITORING_CONFIG, get_log_file_path
 
 
@@ -131,6 +132,13 @@ class CerberusEventHandler(FileSystemEventHandler):
         # Debounce delay has passed - trigger update
         logger.info(f"Debounce delay passed, triggering index update ({len(self.pending_events)} events)")
 
+        # Forwarded CLI commands switch the process cwd/environment; never
+        # resolve paths for the daemon's own writes while one is running
+        with process_state_lock:
+            return self._update()
+
+    def _update(self) -> bool:
+        """Detect changes with git and update the index (process_state_lock held)."""
         try:
             # Trigger incremental update
             # We rely on git diff to detect changes, not the filesystem events
@@ -247,6 +255,14 @@ def run_watcher_daemon(
     observer.start()
     logger.info(f"Watching {project_path} for changes...")
 
+    # Serve CLI commands from this warm process
+    command_server = None
+    try:
+        command_server = start_command_server(project_path)
+        logger.info(f"Serving CLI commands on {command_server.socket_path}")
+    except OSError as e:
+        logger.warning(f"Command server unavailable, CLI runs in-process: {e}")
+
     try:
         # Main loop
         while not shutdown_requested:
@@ -258,6 +274,11 @@ def run_watcher_daemon(
     except KeyboardInterrupt:
         logger.info("Keyboard interrupt received")
     finally:
+        # Stop command server
+        if command_server is not None:
+            command_server.shutdown()
+            command_server.server_close()
+
         # Stop observer
         observer.stop()
         observer.join()
@@ -0,0 +1,97 @@
+"""
+Performance benchmarks for memory conflict detection.
+
+Conflict detection only checks TF-IDF candidate pairs once a scope grows past
+a few hundred memories. These benchmarks run it over synthetic corpora and
+check that planted conflicts are still found. Run with:
+    pytest -m benchmark
+
+The 50k corpus takes ~10s and only runs with CERBERUS_BENCH_LARGE=1.
+"""
+
+import os
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+import pytest
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.memory]
+
+from cerberus.memory.conflict_resolver import ConflictType, find_conflicts
+
+
+@dataclass
+class BenchMemory:
+    """Minimal stand-in for RetrievedMemory."""
+    id: str
+    content: str
+    scope: str
+    category: str
+    confidence: float
+    priority: float
+    created_at: datetime
+
+
+MARKERS = ["Use", "Prefer", "Always", "Avoid", "Never", "Keep", "Document", "Check"]
+
+
+def build_corpus(size: int, seed: int = 0):
+    """Random rules over a size/5 word vocabulary, ~10% of them reworded repeats."""
+    rng = random.Random(seed)
+    vocab = [f"term{i}" for i in range(max(500, size // 5))]
+    now = datetime.now()
+    memories = []
+    for i in range(size):
+        if memories and rng.random() < 0.1:
+            words = memories[rng.randrange(len(memories))].content.split()[1:]
+        else:
+            words = rng.sample(vocab, rng.randint(4, 10))
+        memories.append(BenchMemory(
+            id=f"mem-{i}",
+            content=f"{rng.choice(MARKERS)} {' '.join(words)}",
+            scope="universal",
+            category="rule",
+            confidence=rng.random(),
+            priority=1.0,
+            created_at=now - timedelta(days=rng.randint(0, 400)),
+        ))
+
+    # Planted conflicts on words outside the vocabulary
+    memories[size // 3].content = "Always use pathlib for filesystem paths"
+    memories[2 * size // 3].content = "Never use pathlib for filesystem paths"
+    memories[size // 4].content = "Run black before committing python changes"
+    memories[size // 2].content = "Run black before committing python changes"
+    return memories
+
+
+@pytest.mark.parametrize("size, limit", [
+    (1_000, 2.0),
+    (10_000, 15.0),
+    pytest.param(50_000, 90.0, marks=[
+        pytest.mark.slow,
+        pytest.mark.skipif(
+            not os.environ.get("CERBERUS_BENCH_LARGE"),
+            reason="set CERBERUS_BENCH_LARGE=1 to run the 50k benchmark",
+        ),
+    ]),
+])
+def test_conflict_detection_scales(size, limit):
+    """Detection stays well below quadratic time and finds planted conflicts."""
+    memories = build_corpus(size)
+
+    start = time.perf_counter()
+    conflicts = find_conflicts(memories)
+    elapsed = time.perf_counter() - start
+
+    found = {
+        (c.conflict_type, frozenset((c.memory_a.id, c.memory_b.id)))
+        for c in conflicts
+    }
+    contradiction = frozenset((f"mem-{size // 3}", f"mem-{2 * size // 3}"))
+    duplicate = frozenset((f"mem-{size // 4}", f"mem-{size // 2}"))
+
+    assert (ConflictType.CONTRADICTION, contradiction) in found
+    assert any(pair == duplicate for _, pair in found)
+    assert elapsed < limit
@@ -340,6 +340,9 @@ class TestPhase13SearchEngine:
         # Third search
         results3 = engine.search(query)
 
+        # Accesses are buffered (write-behind) until flushed
+        engine.flush_access()
+
         # Check access count in database directly
         conn = sqlite3.connect(str(populated_db / "memory.db"))
         cursor = conn.execute("SELECT access_count FROM memory_store WHERE id = ?", (memory_id,))
@@ -348,6 +351,50 @@ class TestPhase13SearchEngine:
 
         assert access_count >= 3
 
+    def test_access_tracking_is_write_behind(self, populated_db):
+        """Searches buffer access counters and flush them in one batch."""
+        from cerberus.memory.search import AccessTracker
+
+        db_path = populated_db / "memory.db"
+        engine = MemorySearchEngine(db_path)
+        engine.access_tracker = AccessTracker(db_path, flush_threshold=1000, flush_interval=3600)
+
+        def counts():
+            conn = sqlite3.connect(str(db_path))
+            try:
+                return dict(conn.execute("SELECT id, access_count FROM memory_store").fetchall())
+            finally:
+                conn.close()
+
+        before = counts()
+        results = engine.search(SearchQuery(text="Hydra", limit=5))
+        engine.search(SearchQuery(text="Hydra", limit=5))
+
+        assert len(results) == 2
+        assert counts() == before
+        assert engine.access_tracker.pending() == 2
+
+        assert engine.flush_access() == 2
+        after = counts()
+        for result in results:
+            assert after[result.memory_id] == before[result.memory_id] + 2
+        assert engine.access_tracker.pending() == 0
+
+    def test_access_tracker_flushes_at_threshold(self, populated_db):
+        """The buffer is written once it holds flush_threshold memories."""
+        from cerberus.memory.search import AccessTracker
+
+        db_path = populated_db / "memory.db"
+        conn = sqlite3.connect(str(db_path))
+        ids = [row[0] for row in conn.execute("SELECT id FROM memory_store LIMIT 3")]
+        conn.close()
+
+        tracker = AccessTracker(db_path, flush_threshold=3, flush_interval=3600)
+        tracker.record(ids[:2])
+        assert tracker.pending() == 2
+        tracker.record(ids[2:])
+        assert tracker.pending() == 0
+
 
 class TestPhase5Integration:
     """Test Phase 5 storage integration with SQLite."""
@@ -441,6 +488,52 @@ class TestPhase6Integration:
             # Note: This may vary based on test data
             assert savings > 0  # At least some savings
 
+    def test_relevance_scored_in_sql(self, populated_db):
+        """Scope match, recency and confidence combine into the relevance score."""
+        retrieval = MemoryRetrieval(populated_db)
+
+        memories = retrieval.retrieve(language="go", project="hydra", token_budget=10000)
+        by_content = {m.content: m for m in memories}
+
+        assert by_content["Use error handling with defer in Go"].relevance_score == pytest.approx(0.8 * 0.95)
+        assert by_content["Keep files under 500 lines for better readability"].relevance_score == pytest.approx(0.8)
+        assert by_content["Hydra project decision"].relevance_score == pytest.approx(0.9)
+        assert by_content["Use context managers for resources in Python"].relevance_score == 0.0
+        assert by_content["Hydra task-specific note"].relevance_score == 0.0
+
+        scores = [m.relevance_score for m in memories]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_budget_uses_persisted_token_counts(self, populated_db, monkeypatch):
+        """Token counts are computed once, persisted, and drive the budget."""
+        import cerberus.memory.retrieval as retrieval_module
+
+        class WordTokenizer:
+            def encode(self, text):
+                return text.split()
+
+        monkeypatch.setitem(retrieval_module._tokenizers, "cl100k_base", WordTokenizer())
+        retrieval = MemoryRetrieval(populated_db)
+
+        everything = retrieval.retrieve(token_budget=10000)
+        conn = sqlite3.connect(str(populated_db / "memory.db"))
+        try:
+            stored = dict(conn.execute(
+                "SELECT memory_id, token_count FROM memory_token_counts WHERE encoding = 'cl100k_base'"
+            ).fetchall())
+            assert stored == {m.id: len(m.content.split()) for m in everything}
+
+            # A persisted count is trusted over the content
+            top = everything[0]
+            conn.execute("UPDATE memory_token_counts SET token_count = 1000 WHERE memory_id = ?", (top.id,))
+            conn.commit()
+        finally:
+            conn.close()
+
+        budgeted = retrieval.retrieve(token_budget=1000)
+        assert [m.id for m in budgeted] == [top.id]
+        assert budgeted[0].token_count == 1000
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
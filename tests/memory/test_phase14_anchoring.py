@@ -282,7 +282,9 @@ class TestStorageIntegration:
         mock_anchor.file_size = 50
         mock_anchor.match_score = 0.9
         mock_anchor.recency_score = 0.8
-        mock_engine.anchor_memory.return_value = mock_anchor
+        mock_engine.anchor_memories.side_effect = lambda memories, **kwargs: {
+            memory_id: mock_anchor for memory_id, _, _ in memories
+        }
         mock_anchor_engine_class.return_value = mock_engine
 
         # Create storage with anchoring enabled
@@ -535,7 +537,9 @@ class TestEndToEnd:
         mock_anchor.file_size = 50
         mock_anchor.match_score = 0.9
         mock_anchor.recency_score = 0.8
-        mock_engine.anchor_memory.return_value = mock_anchor
+        mock_engine.anchor_memories.side_effect = lambda memories, **kwargs: {
+            memory_id: mock_anchor for memory_id, _, _ in memories
+        }
         mock_anchor_engine_class.return_value = mock_engine
 
         # Step 1: Store memory with anchor
@@ -596,3 +600,121 @@ class TestUtilityFunctions:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestBatchAnchoring:
+    """Test batched anchor discovery against a real SQLite index."""
+
+    @pytest.fixture
+    def code_index(self, tmp_path, temp_project_dir):
+        """SQLite index over the example project."""
+        from cerberus.schemas import CodeSymbol, FileObject
+        from cerberus.storage.sqlite_store import SQLiteIndexStore
+
+        store = SQLiteIndexStore(tmp_path / "index" / "cerberus.db")
+        symbols = [
+            ("repository.py", "UserRepository", "class"),
+            ("validator.py", "validate_input", "function"),
+            ("async_handler.py", "handle_request", "function"),
+        ]
+        for file_name, name, symbol_type in symbols:
+            path = str(temp_project_dir / file_name)
+            store.write_file(FileObject(path=path, abs_path=path, size=100, last_modified=1.0))
+            store.write_symbols_batch([
+                CodeSymbol(name=name, type=symbol_type, file_path=path, start_line=1, end_line=10)
+            ])
+        return store
+
+    @pytest.fixture
+    def index_manager(self, code_index):
+        from cerberus.memory.anchoring import clear_anchor_cache
+
+        clear_anchor_cache()
+        manager = Mock()
+        manager._index_path = code_index.db_path
+        with patch('cerberus.mcp.index_manager.get_index_manager', return_value=manager):
+            yield manager
+        clear_anchor_cache()
+
+    def test_anchor_memories_single_batch_query(self, code_index, index_manager):
+        """All rules are looked up with one FTS5 batch and no hybrid_search calls."""
+        from cerberus.storage.sqlite_store import SQLiteIndexStore
+
+        engine = AnchorEngine()
+        memories = [
+            ("m1", "Use UserRepository for data access", "language:python"),
+            ("m2", "Always validate_input before saving", "language:python"),
+            ("m3", "Prefer descriptive names", "universal"),
+        ]
+
+        with patch('cerberus.retrieval.hybrid_search') as mock_hybrid_search, \
+                patch.object(SQLiteIndexStore, 'fts5_search_batch',
+                             autospec=True, side_effect=SQLiteIndexStore.fts5_search_batch) as mock_batch:
+            anchors = engine.anchor_memories(memories, min_quality=0.0)
+
+        mock_hybrid_search.assert_not_called()
+        assert mock_batch.call_count == 1
+        assert set(anchors) == {"m1", "m2", "m3"}
+        assert anchors["m1"].file_path.endswith("repository.py")
+        assert anchors["m1"].symbol_name == "UserRepository"
+        assert anchors["m2"].file_path.endswith("validator.py")
+        assert anchors["m3"] is None
+
+    def test_anchor_cache_keyed_by_generation(self, code_index, index_manager):
+        """Anchors are reused until the index generation changes."""
+        from cerberus.storage.sqlite_store import SQLiteIndexStore
+
+        engine = AnchorEngine()
+        memories = [("m1", "Use UserRepository for data access", "language:python")]
+        first = engine.anchor_memories(memories, min_quality=0.0)
+
+        with patch.object(SQLiteIndexStore, 'fts5_search_batch') as mock_batch:
+            assert engine.anchor_memories(memories, min_quality=0.0) == first
+            mock_batch.assert_not_called()
+
+        code_index.bump_generation()
+        with patch.object(SQLiteIndexStore, 'fts5_search_batch', return_value=[[]] * 3) as mock_batch:
+            assert engine.anchor_memories(memories, min_quality=0.0) == {"m1": None}
+            mock_batch.assert_called_once()
+
+    @patch('cerberus.memory.storage.AnchorEngine')
+    def test_store_anchors_in_background(self, mock_anchor_engine_class, temp_memory_dir, monkeypatch):
+        """Background anchoring writes anchors after the batch is stored."""
+        from cerberus.memory.storage import wait_for_anchoring
+
+        monkeypatch.setenv("CERBERUS_MEMORY_ANCHOR_IN_BACKGROUND", "1")
+        anchor = AnchorCandidate(
+            file_path="/path/to/example.py",
+            symbol_name="ExampleClass",
+            match_score=0.9,
+            file_size=50,
+            recency_score=0.8,
+            quality_score=0.85,
+        )
+        mock_engine = Mock()
+        mock_engine.anchor_memories.side_effect = lambda memories, **kwargs: {
+            memory_id: anchor for memory_id, _, _ in memories
+        }
+        mock_anchor_engine_class.return_value = mock_engine
+
+        storage = MemoryStorage(base_dir=temp_memory_dir, enable_anchoring=True)
+        proposals = [
+            MemoryProposal(
+                id=f"bg-{i}",
+                category="rule",
+                scope="language:python",
+                content=f"Rule number {i}",
+                confidence=1.0,
+                rationale="",
+                source_variants=[]
+            )
+            for i in range(3)
+        ]
+        assert storage.store_batch(proposals)['total_stored'] == 3
+        wait_for_anchoring(timeout=10)
+
+        mock_engine.anchor_memories.assert_called_once()
+        conn = sqlite3.connect(str(temp_memory_dir / "memory.db"))
+        rows = conn.execute("SELECT id, anchor_file FROM memory_store ORDER BY id").fetchall()
+        conn.close()
+        assert rows == [(f"bg-{i}", "/path/to/example.py") for i in range(3)]
@@ -24,6 +24,8 @@ from cerberus.memory.conflict_resolver import (
     ConflictResolution,
     ConflictResolutionResult,
     detect_conflicts,
+    find_conflicts,
+    _candidate_pairs,
     _is_contradiction,
     _calculate_similarity,
     _calculate_severity,
@@ -634,6 +636,72 @@ def test_delete_nonexistent_memory(temp_storage):
     assert deleted is False  # Should return False for non-existent ID
 
 
+def test_find_conflicts_detects_all_types(sample_memories):
+    """find_conflicts should report contradictions, redundancies and obsolescence."""
+    conflicts = find_conflicts(sample_memories)
+    found = {
+        (c.conflict_type, frozenset((c.memory_a.id, c.memory_b.id)))
+        for c in conflicts
+    }
+
+    assert (ConflictType.CONTRADICTION, frozenset({"mem-001", "mem-002"})) in found
+    assert (ConflictType.REDUNDANCY, frozenset({"mem-001", "mem-003"})) in found
+    assert (ConflictType.OBSOLESCENCE, frozenset({"mem-004", "mem-005"})) in found
+
+
+def test_blocked_candidates_match_exhaustive(sample_memories, monkeypatch):
+    """TF-IDF candidate blocking should keep every strongly related conflict."""
+    from cerberus.memory import conflict_resolver
+
+    def summarize(conflicts):
+        return sorted(
+            (c.conflict_type.value, c.memory_a.id, c.memory_b.id, round(c.similarity, 6))
+            for c in conflicts
+        )
+
+    # Pad with unrelated memories so the blocked path has something to prune
+    now = datetime.now()
+    memories = sample_memories + [
+        MockMemory(f"noise-{i}", f"Document module{i} with example{i} snippets",
+                   "universal", "rule", 0.5, 0.5, now - timedelta(days=i))
+        for i in range(40)
+    ]
+    exhaustive = summarize(find_conflicts(memories))
+
+    monkeypatch.setitem(conflict_resolver.CONFLICT_DETECTION_CONFIG, "exhaustive_below", 0)
+    monkeypatch.setitem(conflict_resolver.CONFLICT_DETECTION_CONFIG, "top_k", 2)
+    pairs = _candidate_pairs(memories)
+
+    blocked = summarize(find_conflicts(memories))
+
+    # Only weakly related pairs may be skipped
+    assert len(pairs) < len(memories) * (len(memories) - 1) // 2
+    assert set(blocked) <= set(exhaustive)
+    assert [c for c in exhaustive if c[3] >= 0.5] == [c for c in blocked if c[3] >= 0.5]
+    assert ("contradiction", "mem-001", "mem-002", 0.75232) in blocked
+
+
+def test_detect_conflicts_loads_stored_memories(tmp_path, monkeypatch):
+    """detect_conflicts should read every stored memory in scope."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    storage = MemoryStorage(base_dir=tmp_path / ".cerberus", enable_anchoring=False)
+    storage.store_batch([
+        MemoryProposal(id="prop-a", category="preference", scope="universal",
+                       content="Always use tabs for indentation", rationale="A",
+                       confidence=0.9, priority=1),
+        MemoryProposal(id="prop-b", category="preference", scope="universal",
+                       content="Never use tabs for indentation", rationale="B",
+                       confidence=0.8, priority=1),
+    ])
+
+    conflicts = detect_conflicts(scope="universal")
+
+    assert [c.conflict_type for c in conflicts] == [ConflictType.CONTRADICTION]
+    assert {c.memory_a.content for c in conflicts} <= {
+        "Always use tabs for indentation", "Never use tabs for indentation"
+    }
+
+
 # ============================================================================
 # Validation Tests
 # ============================================================================
@@ -75,6 +75,43 @@ class TestSimilarityEngine:
         assert matrix.shape == (1, 1)
         assert matrix[0, 0] == 1.0
 
+    def test_similarity_graph_matches_dense_matrix(self):
+        """Blocked sparse graph keeps exactly the pairs above threshold."""
+        engine = SimilarityEngine()
+        texts = [
+            "keep responses short",
+            "keep output short",
+            "never exceed 200 lines",
+            "limit files to 200 lines",
+            "add error handling",
+        ]
+
+        dense = engine.compute_similarity_matrix(texts)
+        graph = engine.similarity_graph(texts, threshold=0.2, block_size=2)
+
+        expected = {
+            (i, j) for i in range(len(texts)) for j in range(i + 1, len(texts))
+            if dense[i, j] > 0.2
+        }
+        rows, cols = graph.nonzero()
+        assert set(zip(rows.tolist(), cols.tolist())) == expected
+        for i, j in expected:
+            assert graph[i, j] == pytest.approx(dense[i, j])
+
+    def test_similarity_reuses_cached_vectors(self, monkeypatch):
+        """Pairwise similarity hashes each text once and needs no fitting."""
+        engine = SimilarityEngine()
+        engine.similarity("keep summaries short", "summaries should be brief")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("unexpected vectorization")
+
+        monkeypatch.setattr(engine.hasher, "transform", fail)
+        monkeypatch.setattr(engine.vectorizer, "fit_transform", fail)
+
+        assert engine.similarity("summaries should be brief", "keep summaries short") > 0.2
+        assert engine.similarity("keep summaries short", "keep summaries short") == pytest.approx(1.0)
+
 
 class TestCanonicalExtractor:
     """Test canonical form extraction."""
@@ -506,3 +506,233 @@ class TestCrossCategoryDeduplication:
 if __name__ == "__main__":
     # Run tests with verbose output
     pytest.main([__file__, "-v", "-s"])
+
+
+class TestTranscriptReader:
+    """Test incremental, checkpointed transcript reading."""
+
+    @staticmethod
+    def _entry(role, content):
+        import json
+        return json.dumps({"type": role, "message": {"role": role, "content": content}}) + "\n"
+
+    def _write(self, path, *entries, mode="a"):
+        with open(path, mode) as f:
+            f.write("".join(entries))
+
+    def test_single_pass_pairs_messages_and_tool_calls(self, tmp_path):
+        """One pass yields the same pairs and tool calls as before."""
+        from cerberus.memory.session_analyzer import (
+            parse_claude_code_transcript,
+            extract_tool_calls_from_transcript,
+            read_transcript,
+        )
+
+        transcript = tmp_path / "session.jsonl"
+        self._write(
+            transcript,
+            self._entry("user", "first question"),
+            self._entry("user", "ignored follow-up"),
+            self._entry("assistant", [
+                {"type": "text", "text": "answer one"},
+                {"type": "tool_use", "name": "Edit", "input": {"file_path": "/x/a.py"}},
+            ]),
+            "not json\n",
+            self._entry("assistant", [{"type": "text", "text": "unpaired reply"}]),
+            self._entry("user", "second question"),
+            self._entry("assistant", "answer two"),
+        )
+
+        expected = [("first question", "answer one"), ("second question", "answer two")]
+        assert parse_claude_code_transcript(transcript) == expected
+        assert extract_tool_calls_from_transcript(transcript) == [
+            {"tool": "Edit", "params": {"file_path": "/x/a.py"}}
+        ]
+
+        state = read_transcript(transcript, db_path=tmp_path / "memory.db")
+        assert state.conversations == expected
+        assert state.offset == transcript.stat().st_size
+
+    def test_resumes_from_checkpoint(self, tmp_path, monkeypatch):
+        """A new reader only processes lines appended after the checkpoint."""
+        from cerberus.memory.session_analyzer import TranscriptReader, TranscriptState
+
+        transcript = tmp_path / "session.jsonl"
+        db_path = tmp_path / "memory.db"
+        self._write(
+            transcript,
+            self._entry("user", "don't use emojis in commit messages"),
+            self._entry("assistant", "I've added emojis to the commit message"),
+        )
+        first = TranscriptReader(db_path).read(transcript)
+        assert len(first.candidates) == 1
+
+        self._write(
+            transcript,
+            self._entry("user", "now add tests"),
+            self._entry("assistant", "Added tests"),
+            '{"message": {"role": "user", "content": "partial',
+        )
+
+        fed = []
+        original_feed = TranscriptState.feed
+        monkeypatch.setattr(
+            TranscriptState, "feed",
+            lambda self, entry, position: (fed.append(entry), original_feed(self, entry, position))
+        )
+        state = TranscriptReader(db_path).read(transcript)
+
+        assert len(fed) == 2
+        assert [pair[0] for pair in state.conversations] == [
+            "don't use emojis in commit messages", "now add tests"
+        ]
+        assert state.analyzed_turns == 2
+        assert len(state.candidates) == 1
+        # Incomplete trailing line is left for the next read
+        assert state.offset < transcript.stat().st_size
+
+    def test_replaced_transcript_is_reread(self, tmp_path):
+        """A shorter or replaced file discards the checkpoint."""
+        from cerberus.memory.session_analyzer import TranscriptReader
+
+        transcript = tmp_path / "session.jsonl"
+        db_path = tmp_path / "memory.db"
+        self._write(
+            transcript,
+            self._entry("user", "old question"),
+            self._entry("assistant", "old answer"),
+        )
+        TranscriptReader(db_path).read(transcript)
+
+        self._write(
+            transcript,
+            self._entry("user", "new"),
+            self._entry("assistant", "reply"),
+            mode="w",
+        )
+        state = TranscriptReader(db_path).read(transcript)
+
+        assert state.conversations == [("new", "reply")]
+
+    def test_checkpoint_holds_offsets_not_text(self, tmp_path):
+        """Stored checkpoints and cached states carry no message text."""
+        import sqlite3
+        from cerberus.memory.session_analyzer import TranscriptReader
+
+        transcript = tmp_path / "session.jsonl"
+        db_path = tmp_path / "memory.db"
+        self._write(
+            transcript,
+            self._entry("user", "please refactor the parser module"),
+            self._entry("assistant", [
+                {"type": "text", "text": "Refactored the parser module"},
+                {"type": "tool_use", "name": "Write", "input": {"file_path": "/x/p.py", "content": "x" * 5000}},
+            ]),
+        )
+        state = TranscriptReader(db_path).read(transcript)
+
+        conn = sqlite3.connect(db_path)
+        (stored,) = conn.execute("SELECT state FROM transcript_checkpoints").fetchone()
+        conn.close()
+        assert "Refactored" not in stored
+        assert "x" * 100 not in stored
+        assert state.conversations == [("please refactor the parser module", "Refactored the parser module")]
+        assert state.tool_calls == [{"tool": "Write", "params": {"file_path": "/x/p.py"}}]
+
+    def test_checkpoints_and_states_are_bounded(self, tmp_path, monkeypatch):
+        """Old checkpoints are pruned and the reader keeps a bounded cache."""
+        import sqlite3
+        from cerberus.memory import session_analyzer
+        from cerberus.memory.session_analyzer import TranscriptReader
+
+        monkeypatch.setattr(session_analyzer, "TRANSCRIPT_CHECKPOINT_LIMIT", 2)
+        db_path = tmp_path / "memory.db"
+        reader = TranscriptReader(db_path, cache_size=2)
+        for i in range(4):
+            transcript = tmp_path / f"session{i}.jsonl"
+            self._write(transcript, self._entry("user", f"question {i}"), self._entry("assistant", "answer"))
+            reader.read(transcript)
+
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT COUNT(*) FROM transcript_checkpoints").fetchone() == (2,)
+        conn.execute(
+            "UPDATE transcript_checkpoints SET updated_at = datetime('now', '-60 days') "
+            "WHERE transcript_path NOT LIKE '%session3.jsonl'"
+        )
+        conn.commit()
+        conn.close()
+        assert len(reader._states) == 2
+
+        self._write(tmp_path / "session3.jsonl", self._entry("user", "more"), self._entry("assistant", "done"))
+        reader.read(tmp_path / "session3.jsonl")
+
+        conn = sqlite3.connect(db_path)
+        paths = [row[0] for row in conn.execute("SELECT transcript_path FROM transcript_checkpoints")]
+        conn.close()
+        assert len(paths) == 1 and paths[0].endswith("session3.jsonl")
+
+    def test_summaries_come_from_the_incremental_pass(self, tmp_path, monkeypatch):
+        """Codes and details are built while reading; extracting them re-reads nothing."""
+        from cerberus.memory.session_analyzer import (
+            TranscriptReader,
+            TranscriptState,
+            extract_session_codes,
+            extract_session_details,
+        )
+
+        transcript = tmp_path / "session.jsonl"
+        db_path = tmp_path / "memory.db"
+        self._write(
+            transcript,
+            self._entry("user", "the sqlite session storage is broken, fix it"),
+            self._entry("assistant", [
+                {"type": "text", "text": "Root cause: the session table was never created"},
+                {"type": "tool_use", "name": "Edit", "input": {"file_path": "/x/storage.py"}},
+            ]),
+        )
+        TranscriptReader(db_path).read(transcript)
+        self._write(
+            transcript,
+            self._entry("user", "use pytest instead of unittest for these tests"),
+            self._entry("assistant", [{"type": "tool_use", "name": "Bash", "input": {"command": "pytest -q"}}]),
+            self._entry("assistant", "Ran the tests"),
+        )
+
+        state = TranscriptReader(db_path).read(transcript)
+
+        def no_rereads(self, positions):
+            raise AssertionError("turns were read back")
+
+        monkeypatch.setattr(TranscriptState, "_read_entries", no_rereads)
+
+        assert extract_session_codes(state) == [
+            "migrate:session-tracking:json-to-sqlite",
+            "impl:storage.py:sqlite-backend",
+            "done:tests:pytest",
+            "dec:use-pytest:not-unittest",
+        ]
+        assert extract_session_details(state) == (
+            "Bugs/Fixes:\n"
+            "- Root cause: the session table was never created\n"
+            "\n"
+            "Files Modified:\n"
+            "- storage.py"
+        )
+
+    def test_keyword_index_is_windowed(self, tmp_path, monkeypatch):
+        """The checkpointed keyword index only covers recent turns."""
+        from cerberus.memory import session_analyzer
+        from cerberus.memory.session_analyzer import TranscriptReader
+
+        monkeypatch.setattr(session_analyzer, "TRANSCRIPT_KEYWORD_WINDOW", 4)
+        transcript = tmp_path / "session.jsonl"
+        self._write(transcript, *[
+            self._entry(role, f"message {i} topic{i}")
+            for i in range(20)
+            for role in ("user", "assistant")
+        ])
+        state = TranscriptReader(tmp_path / "memory.db").read(transcript)
+
+        positions = [p for ps in state.keyword_index.values() for p in ps]
+        assert state.analyzed_turns == 20
+        assert min(positions) >= 2 * (20 - 4)
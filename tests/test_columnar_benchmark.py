@@ -0,0 +1,68 @@
+"""
+Performance benchmarks for loading legacy indexes.
+
+A JSON index is parsed and validated in full on every load; a columnar
+index only reads its manifest and memory-maps its columns. These benchmarks
+compare the two on a synthetic 10k-symbol index. Run with:
+    pytest -m benchmark
+"""
+
+import time
+
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+from cerberus.index import ColumnarIndexStore, JSONIndexStore
+from cerberus.schemas import CodeSymbol, FileObject, ScanResult, SymbolEmbedding
+
+
+@pytest.fixture(scope="module")
+def scan_result():
+    """10k functions over 100 files, each with a 384-dimensional embedding."""
+    files = [
+        FileObject(path=f"pkg/mod_{f}.py", abs_path=f"/pkg/mod_{f}.py", size=1000, last_modified=1.0)
+        for f in range(100)
+    ]
+    symbols = [
+        CodeSymbol(
+            name=f"function_{f}_{i}",
+            type="function",
+            file_path=f"pkg/mod_{f}.py",
+            start_line=i * 3 + 1,
+            end_line=i * 3 + 2,
+            parameters=["value", "options"],
+            parameter_types={"value": "str", "options": "dict"},
+        )
+        for f in range(100)
+        for i in range(100)
+    ]
+    embeddings = [
+        SymbolEmbedding(name=s.name, file_path=s.file_path, vector=[0.01] * 384)
+        for s in symbols
+    ]
+    return ScanResult(total_files=100, files=files, scan_duration=1.0, symbols=symbols, embeddings=embeddings)
+
+
+def _best_time(load, rounds: int = 3) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        load()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_columnar_open_outpaces_json(scan_result, tmp_path):
+    """Opening a columnar index is much faster than reading the JSON index."""
+    json_store = JSONIndexStore(tmp_path / "index.json")
+    json_store.write(scan_result)
+    columnar_store = ColumnarIndexStore(tmp_path / "index.cidx")
+    columnar_store.write(scan_result)
+
+    json_seconds = _best_time(json_store.read)
+    columnar_seconds = _best_time(columnar_store.read)
+    materialize_seconds = _best_time(lambda: list(columnar_store.read().symbols))
+
+    assert columnar_seconds * 10 < json_seconds
+    assert materialize_seconds < json_seconds
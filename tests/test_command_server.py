@@ -0,0 +1,130 @@
+"""Tests for the daemon command server on the watcher socket."""
+
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.fast
+
+from cerberus import cli
+from cerberus.memory.ipc import run_cli_command
+from cerberus.watcher import command_server
+from cerberus.watcher.command_server import (
+    CommandResult,
+    CommandServer,
+    forward_command,
+    start_command_server,
+)
+from cerberus.watcher.config import IPC_CONFIG, get_socket_file_path
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Project directory with sockets kept under tmp_path."""
+    monkeypatch.setitem(IPC_CONFIG, "socket_dir", tmp_path / "run")
+    monkeypatch.delenv("CERBERUS_NO_DAEMON", raising=False)
+    project_dir = tmp_path / "proj"
+    (project_dir / "src").mkdir(parents=True)
+    monkeypatch.chdir(project_dir / "src")
+    return project_dir
+
+
+@pytest.fixture
+def server(project):
+    """Command server for the project, as the watcher daemon runs it."""
+    server = CommandServer(get_socket_file_path(project))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_no_daemon_runs_locally(project):
+    """Without a daemon socket, commands are not forwarded."""
+    assert forward_command(["memory", "session-status"]) is None
+
+
+def test_forward_uses_client_cwd_and_env(server, project, monkeypatch):
+    """Commands run with the client's directory and CERBERUS_* variables."""
+    def fake_execute(argv):
+        payload = {"argv": argv, "cwd": os.getcwd(), "value": os.environ.get("CERBERUS_TEST_VALUE")}
+        return CommandResult(exit_code=3, stdout=json.dumps(payload), stderr="warn")
+
+    monkeypatch.setattr(command_server, "execute_command", fake_execute)
+    monkeypatch.setenv("CERBERUS_TEST_VALUE", "forwarded")
+
+    result = forward_command(["memory", "session-status"])
+
+    assert result.exit_code == 3
+    assert result.stderr == "warn"
+    assert json.loads(result.stdout) == {
+        "argv": ["memory", "session-status"],
+        "cwd": str(project / "src"),
+        "value": "forwarded",
+    }
+    # The daemon's own environment is restored after the command
+    assert os.getcwd() == str(project / "src")
+
+
+def test_cli_output_and_exit_code(server, monkeypatch, capsys):
+    """The CLI prints the daemon's output and exits with its code."""
+    monkeypatch.setattr(sys, "argv", ["cerberus", "memory", "no-such-command"])
+
+    with pytest.raises(SystemExit) as exc:
+        cli.main()
+
+    assert exc.value.code == 2
+    assert "invalid choice" in capsys.readouterr().err
+
+
+def test_run_cli_command_forwards(server):
+    """run_cli_command uses the daemon for cerberus commands."""
+    result = run_cli_command(["cerberus"], check=False)
+
+    assert result.returncode == 1
+    assert "usage: cerberus" in result.stdout
+
+
+def test_daemon_never_forwards_to_itself(project, monkeypatch):
+    """A process serving commands runs nested CLI calls in-process."""
+    monkeypatch.setattr(command_server, "_serving", False)
+    server = start_command_server(project)
+    try:
+        assert get_socket_file_path(project).exists()
+        assert forward_command(["memory", "session-status"]) is None
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert not get_socket_file_path(project).exists()
+
+
+def test_socket_is_private(server, project):
+    """The socket and its directory are accessible to the owner only."""
+    socket_path = get_socket_file_path(project)
+
+    assert socket_path.stat().st_mode & 0o777 == 0o600
+    assert socket_path.parent.stat().st_mode & 0o777 == 0o700
+
+
+def test_untrusted_sockets_are_never_used(server, project, monkeypatch):
+    """Commands are not sent to sockets of other users or non-socket files."""
+    called = []
+    monkeypatch.setattr(command_server, "execute_command", lambda argv: called.append(argv))
+
+    # Daemon running as another user
+    with monkeypatch.context() as m:
+        m.setattr(command_server, "_peer_uid", lambda sock: os.getuid() + 1)
+        assert forward_command(["memory", "session-status"]) is None
+
+    # A regular file planted where the socket would be
+    server.shutdown()
+    server.server_close()
+    get_socket_file_path(project).write_text("")
+    assert forward_command(["memory", "session-status"]) is None
+    assert called == []
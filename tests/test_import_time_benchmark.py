@@ -0,0 +1,86 @@
+"""
+Import-time benchmarks for the CLI and session hook entry points.
+
+Package facades load their exports lazily (PEP 562), so the memory hook
+commands must not import the index, retrieval or MCP stacks. Each check runs
+in a fresh interpreter. Run with:
+    pytest -m benchmark
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+import cerberus
+
+# Modules used by session hooks and `cerberus memory ...`
+HOOK_MODULES = [
+    "cerberus.cli",
+    "cerberus.memory.hooks",
+    "cerberus.memory.session_cli",
+]
+
+# Third-party stacks hooks must not load
+HEAVY_MODULES = ["fastmcp", "numpy", "scipy", "sklearn", "pydantic", "loguru", "tree_sitter"]
+
+# Cumulative import time budget for the hook modules (milliseconds)
+IMPORT_BUDGET_MS = 100
+
+
+def _run_python(code: str, *args: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ)
+    src_dir = str(Path(cerberus.__file__).resolve().parents[1])
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src_dir, env.get("PYTHONPATH")]))
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True, text=True, env=env, check=True,
+    )
+
+
+def test_hook_modules_skip_heavy_imports():
+    """Importing the hook modules loads none of the heavy dependencies."""
+    result = _run_python(
+        f"import sys\n"
+        f"import {', '.join(HOOK_MODULES)}\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_hook_import_time_budget():
+    """Hook modules import within the regression budget."""
+    result = _run_python(f"import {', '.join(HOOK_MODULES)}", "-X", "importtime")
+
+    # Lines look like "import time:  self [us] | cumulative | name"; top-level
+    # imports are unindented and their cumulative time includes children.
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        if name.startswith(" cerberus"):
+            total_us += int(fields[1])
+
+    assert total_us > 0
+    assert total_us / 1000 < IMPORT_BUDGET_MS
+
+
+def test_lazy_exports_resolve():
+    """Lazy facade exports resolve to the implementing objects."""
+    from cerberus.retrieval.facade import hybrid_search
+    from cerberus.storage.sqlite_store import SQLiteIndexStore
+
+    assert cerberus.hybrid_search is hybrid_search
+    assert cerberus.SQLiteIndexStore is SQLiteIndexStore
+    assert set(cerberus.__all__) <= set(dir(cerberus))
+
+    with pytest.raises(AttributeError):
+        cerberus.not_an_export
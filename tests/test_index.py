@@ -5,7 +5,12 @@ from pathlib import Path
 
 pytestmark = pytest.mark.fast
 
-from cerberus.index import build_index, load_index, JSONIndexStore, compute_stats
+from cerberus.index import (
+    build_index, load_index, save_index, JSONIndexStore, ColumnarIndexStore,
+    ColumnarScanResult, compute_stats, convert_json_index,
+)
+from cerberus.index.columnar_store import TABLES
+from cerberus.schemas import SymbolEmbedding
 
 
 TEST_FILES_DIR = Path(__file__).parent / "test_files"
@@ -53,3 +58,74 @@ def test_compute_stats(tmp_path):
     assert stats.symbol_types["class"] >= 3  # At least 3 classes (updated for Phase 5)
     assert stats.symbol_types["function"] >= 7  # At least 7 functions
     assert stats.average_symbols_per_file == len(scan_result.symbols) / scan_result.total_files
+
+
+def test_columnar_index_build_and_load(tmp_path):
+    """
+    A .cidx output path builds a columnar index that loads as a lazy view.
+    """
+    index_path = tmp_path / "index.cidx"
+    scan_result = build_index(TEST_FILES_DIR, index_path, respect_gitignore=False)
+
+    loaded = load_index(index_path)
+
+    assert isinstance(loaded, ColumnarScanResult)
+    assert loaded.total_files == scan_result.total_files
+    assert list(loaded.files) == scan_result.files
+    assert list(loaded.symbols) == scan_result.symbols
+    assert loaded.symbols[-1] == scan_result.symbols[-1]
+    assert loaded.symbols[1:3] == scan_result.symbols[1:3]
+    assert compute_stats(loaded) == compute_stats(scan_result)
+
+
+def test_convert_json_index(tmp_path):
+    """
+    Converting a JSON index keeps every table, the embeddings and the metadata.
+    """
+    json_path = tmp_path / "index.json"
+    scan_result = build_index(TEST_FILES_DIR, json_path, respect_gitignore=False)
+    scan_result.embeddings = [
+        SymbolEmbedding(name=s.name, file_path=s.file_path, vector=[float(i), 0.5, -1.0])
+        for i, s in enumerate(scan_result.symbols[:4])
+    ]
+    scan_result.metadata["git_commit"] = "abc123"
+    JSONIndexStore(json_path).write(scan_result)
+
+    columnar_path = convert_json_index(json_path)
+    loaded = load_index(columnar_path)
+    expected = JSONIndexStore(json_path).read()
+
+    assert columnar_path == tmp_path / "index.cidx"
+    for table in TABLES:
+        assert list(getattr(loaded, table)) == getattr(expected, table)
+    assert list(loaded.embeddings) == expected.embeddings
+    assert loaded.embeddings.matrix.dtype == "float32"
+    assert loaded.metadata == expected.metadata
+    assert loaded.project_root == expected.project_root
+
+
+def test_columnar_rewrite_publishes_new_generation(tmp_path):
+    """
+    Saving a columnar view writes a new generation and drops the old data.
+    """
+    index_path = tmp_path / "index.cidx"
+    build_index(TEST_FILES_DIR, index_path, respect_gitignore=False)
+    store = ColumnarIndexStore(index_path)
+    loaded = store.read()
+
+    loaded.metadata["git_commit"] = "def456"
+    save_index(loaded, index_path)
+
+    assert store.generation() == 2
+    assert [p.name for p in index_path.glob("gen-*")] == ["gen-2"]
+    # The view that was written back stays readable
+    assert list(loaded.symbols) == list(store.read().symbols)
+    assert store.read().metadata["git_commit"] == "def456"
+
+
+def test_columnar_schema_covers_models():
+    """
+    Every model field has a column, so nothing is dropped on write.
+    """
+    for model, kinds in TABLES.values():
+        assert set(kinds) == set(model.model_fields)
@@ -0,0 +1,111 @@
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from cerberus.incremental import update_index_incrementally
+from cerberus.index import build_index
+from cerberus.schemas import FileChange
+from cerberus.storage.sqlite.generations import index_write_lock, shadow_update
+from cerberus.storage.sqlite.persistence import read_generation
+
+
+@pytest.fixture
+def project(tmp_path: Path):
+    src = tmp_path / "proj"
+    src.mkdir()
+    (src / "app.py").write_text("def load_config():\n    return {}\n")
+    db_path = tmp_path / "index" / "cerberus.db"
+    build_index(src, db_path, extensions=[".py"])
+    return src, db_path
+
+
+def _symbol_names(conn: sqlite3.Connection) -> set:
+    return {row[0] for row in conn.execute("SELECT name FROM symbols")}
+
+
+def test_readers_keep_their_snapshot_until_publish(project) -> None:
+    _, db_path = project
+    generation = read_generation(db_path)
+
+    reader = sqlite3.connect(str(db_path))
+    reader.execute("BEGIN")
+    assert _symbol_names(reader) == {"load_config"}
+
+    with shadow_update(db_path) as update:
+        shadow = sqlite3.connect(str(update.path))
+        shadow.execute("UPDATE symbols SET name = 'renamed'")
+        shadow.commit()
+        shadow.close()
+        # Nothing is visible before publishing
+        assert _symbol_names(sqlite3.connect(str(db_path))) == {"load_config"}
+
+    # An open read transaction stays on the generation it started on
+    assert _symbol_names(reader) == {"load_config"}
+    reader.rollback()
+    assert _symbol_names(reader) == {"renamed"}
+    reader.close()
+
+    assert read_generation(db_path) == generation + 1
+    assert not list(db_path.parent.glob("*.updating.db*"))
+
+
+def test_discarded_update_leaves_index_untouched(project) -> None:
+    _, db_path = project
+    generation = read_generation(db_path)
+
+    with shadow_update(db_path) as update:
+        sqlite3.connect(str(update.path)).execute("DELETE FROM symbols").connection.commit()
+        update.publish = False
+
+    with pytest.raises(RuntimeError):
+        with shadow_update(db_path) as update:
+            raise RuntimeError("update failed")
+
+    assert _symbol_names(sqlite3.connect(str(db_path))) == {"load_config"}
+    assert read_generation(db_path) == generation
+    assert not list(db_path.parent.glob("*.updating.db*"))
+
+
+def test_incremental_update_publishes_new_generation(project) -> None:
+    src, db_path = project
+    generation = read_generation(db_path)
+    (src / "extra.py").write_text("def parse_args():\n    return []\n")
+
+    result = update_index_incrementally(
+        db_path,
+        project_path=src,
+        changes=FileChange(added=["extra.py"], modified=[], deleted=[], timestamp=time.time()),
+    )
+
+    assert result.files_reparsed == 1
+    assert _symbol_names(sqlite3.connect(str(db_path))) == {"load_config", "parse_args"}
+    assert read_generation(db_path) == generation + 1
+
+
+def test_updates_are_serialized(project) -> None:
+    _, db_path = project
+
+    with index_write_lock(db_path):
+        with pytest.raises(TimeoutError):
+            with index_write_lock(db_path, timeout=0.1):
+                pass
+
+    with index_write_lock(db_path, timeout=0.1):
+        pass
+
+
+def test_empty_update_keeps_generation(project) -> None:
+    src, db_path = project
+    generation = read_generation(db_path)
+
+    result = update_index_incrementally(
+        db_path,
+        project_path=src,
+        changes=FileChange(added=[], modified=[], deleted=[], timestamp=time.time()),
+    )
+
+    assert result.files_reparsed == 0
+    assert read_generation(db_path) == generation
+    assert not list(db_path.parent.glob("*.updating.db*"))
@@ -1,4 +1,5 @@
 """Tests for indexing MCP tools (index_build, index_status)."""
+import asyncio
 import os
 from pathlib import Path
 
@@ -49,6 +50,83 @@ class TestIndexBuildTool:
         assert "file_count" in result or "files" in result or "symbol_count" in result
 
 
+class TestIndexJobs:
+    """Tests for background index builds (index_build jobs, index_job_status)."""
+
+    @pytest.mark.asyncio
+    async def test_background_build_completes(self, temp_project, mcp_client):
+        os.chdir(temp_project)
+
+        started = unwrap_result(
+            await mcp_client.call_tool(
+                "index_build", {"path": str(temp_project), "extensions": [".py"], "wait_seconds": 0}
+            )
+        )
+        assert started["status"] in ("queued", "running", "success")
+
+        for _ in range(100):
+            status = unwrap_result(
+                await mcp_client.call_tool("index_job_status", {"job_id": started["job_id"]})
+            )
+            if status["status"] in ("success", "failed"):
+                break
+            await asyncio.sleep(0.1)
+
+        assert status["status"] == "success"
+        assert status["files"] == 2
+        assert status["phase"] == "done"
+
+        index_dir = temp_project / ".cerberus"
+        assert (index_dir / "cerberus.db").exists()
+        # The shadow build database is gone once published
+        assert not list(index_dir.glob("*.building.db*"))
+
+        listed = unwrap_result(await mcp_client.call_tool("index_job_status", {}))
+        assert started["job_id"] in [job["job_id"] for job in listed["jobs"]]
+
+    @pytest.mark.asyncio
+    async def test_build_reports_progress(self, temp_project, mcp_client):
+        os.chdir(temp_project)
+        messages = []
+
+        async def on_progress(progress, total, message):
+            messages.append(message)
+
+        result = unwrap_result(
+            await mcp_client.call_tool(
+                "index_build",
+                {"path": str(temp_project), "extensions": [".py"], "wait_seconds": 30},
+                progress_handler=on_progress,
+            )
+        )
+
+        assert result["status"] == "success"
+        assert messages
+        assert messages[-1].startswith("done: 2 files")
+
+    @pytest.mark.asyncio
+    async def test_unknown_job(self, mcp_client):
+        result = unwrap_result(await mcp_client.call_tool("index_job_status", {"job_id": "missing"}))
+        assert "Unknown index job" in result["error"]
+
+    def test_rebuild_publishes_in_place(self, temp_project):
+        from cerberus.mcp.index_manager import get_index_manager
+
+        manager = get_index_manager()
+        manager.rebuild(temp_project, [".py"])
+        old_index = manager.get_index()
+        generation = old_index._store.get_generation()
+
+        (temp_project / "src" / "extra.py").write_text("def extra():\n    return 1\n")
+        phases = []
+        manager.rebuild(temp_project, [".py"], progress=lambda phase, counts: phases.append(phase))
+
+        # Published in place, under a newer generation
+        assert old_index._store.get_generation() > generation
+        assert "extra" in {s.name for s in manager.get_index().symbols}
+        assert phases[0] == "scan" and "resolve_imports" in phases
+
+
 class TestIndexStatusTool:
     """Tests for index_status tool."""
 
@@ -103,3 +103,25 @@ class TestMetricsStatusTool:
 
         assert "enabled" in result
         # Other fields may vary based on tracker state
+
+
+class TestTraceReportTool:
+    """Tests for trace_report tool."""
+
+    @pytest.mark.asyncio
+    async def test_trace_report_includes_tool_spans(self, mcp_client, tmp_path):
+        from cerberus import tracing
+
+        tracing.reset()
+        await mcp_client.call_tool("metrics_status", {})
+
+        export_path = tmp_path / "trace.json"
+        result = unwrap_result(
+            await mcp_client.call_tool(
+                "trace_report", {"export_path": str(export_path)}
+            )
+        )
+
+        assert result["status"] == "ok"
+        assert result["spans"]["tool.metrics_status"]["count"] >= 1
+        assert export_path.exists()
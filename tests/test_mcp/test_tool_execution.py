@@ -0,0 +1,121 @@
+"""Tests for asynchronous tool execution (worker pools, limits, timeouts)."""
+import asyncio
+import threading
+import time
+
+import pytest
+from fastmcp import Client, FastMCP
+from fastmcp.exceptions import ToolError
+
+from cerberus.mcp.execution import ToolExecutor, ToolPolicy, ToolRegistrar, load_tool_executor
+
+from .conftest import unwrap_result
+
+
+def make_server(executor):
+    """Server with a blocking heavy tool and a fast read tool."""
+    mcp = FastMCP("execution-test")
+    tools = ToolRegistrar(mcp, executor)
+    release = threading.Event()
+
+    @tools.tool()
+    def slow_build(path: str = ".") -> dict:
+        release.wait(5)
+        return {"path": path}
+
+    @tools.tool()
+    def quick_read(name: str) -> dict:
+        return {"name": name, "thread": threading.current_thread().name}
+
+    return mcp, release
+
+
+class TestToolExecution:
+    @pytest.mark.asyncio
+    async def test_heavy_tool_does_not_block_reads(self):
+        executor = ToolExecutor(policies={"slow_build": ToolPolicy(heavy=True, max_concurrency=1)})
+        mcp, release = make_server(executor)
+
+        async with Client(mcp) as client:
+            build = asyncio.create_task(client.call_tool("slow_build", {"path": "src"}))
+            await asyncio.sleep(0.05)
+
+            read = unwrap_result(await asyncio.wait_for(client.call_tool("quick_read", {"name": "foo"}), 2))
+            assert read["name"] == "foo"
+            assert read["thread"].startswith("cerberus-tool")
+            assert not build.done()
+
+            release.set()
+            assert unwrap_result(await build) == {"path": "src"}
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises_tool_error(self):
+        executor = ToolExecutor(policies={"slow_build": ToolPolicy(timeout=0.1)})
+        mcp, release = make_server(executor)
+
+        async with Client(mcp) as client:
+            with pytest.raises(ToolError, match="timed out after 0.1s"):
+                await client.call_tool("slow_build", {})
+        release.set()
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        executor = ToolExecutor(default_policy=ToolPolicy(max_concurrency=2))
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def body():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.pop()
+
+        await asyncio.gather(*(executor.run("tool", body) for _ in range(6)))
+
+        assert max(peak) == 2
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_call_never_starts(self):
+        executor = ToolExecutor(default_policy=ToolPolicy(max_concurrency=1))
+        release = threading.Event()
+        ran = []
+
+        first = asyncio.create_task(executor.run("tool", release.wait, 5))
+        queued = asyncio.create_task(executor.run("tool", ran.append, "queued"))
+        await asyncio.sleep(0.05)
+
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+
+        release.set()
+        assert await first is True
+        # The slot is free again for new calls
+        await executor.run("tool", ran.append, "next")
+        assert ran == ["next"]
+        executor.shutdown()
+
+
+def test_load_tool_executor_from_config(tmp_path, monkeypatch):
+    config = tmp_path / "cerberus.toml"
+    config.write_text(
+        "[execution]\n"
+        "workers = 3\n"
+        "timeout_seconds = 0\n"
+        "[execution.tools.search]\n"
+        "max_concurrency = 8\n"
+    )
+    monkeypatch.setenv("CERBERUS_CONFIG", str(config))
+
+    executor = load_tool_executor()
+
+    assert executor.workers == 3
+    assert executor.policy_for("get_symbol") == ToolPolicy(heavy=False, max_concurrency=4, timeout=None)
+    assert executor.policy_for("search").max_concurrency == 8
+    assert executor.policy_for("blueprint") == ToolPolicy(heavy=True, max_concurrency=1, timeout=1800.0)
@@ -291,6 +291,26 @@ def another_function():
                 assert location.start_byte >= 0
                 assert location.end_byte > location.start_byte
 
+    def test_replace_symbol_in_crlf_file(self):
+        """Located byte ranges match the content CodeEditor edits in CRLF files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_file = Path(tmpdir) / "test.py"
+            test_file.write_bytes(b"def a():\r\n    return 1\r\n\r\ndef b():\r\n    return 2\r\n")
+
+            index_path = Path(tmpdir) / "test.db"
+            from cerberus.index import build_index
+            build_index(Path(tmpdir), str(index_path))
+
+            locator = SymbolLocator(SQLiteIndexStore(str(index_path)))
+            location = locator.locate_symbol(str(test_file), "b", symbol_type="function")
+
+            if location:  # Only if tree-sitter is available
+                editor = CodeEditor({"backup_enabled": False})
+                success, _ = editor.replace_symbol(location, "def b():\n    return 3")
+
+                assert success
+                assert test_file.read_text() == "def a():\n    return 1\n\ndef b():\n    return 3\n"
+
 
 class TestMutationConfig:
     """Test mutation configuration."""
@@ -5,13 +5,15 @@ Tests for the prediction engine that suggests related changes based on AST relat
 """
 
 import pytest
-import sqlite3
-import tempfile
 from pathlib import Path
 
 pytestmark = pytest.mark.fast
 
 from cerberus.quality.predictor import PredictionEngine, Prediction, PredictionStats
+from cerberus.schemas import (
+    CallReference, CodeSymbol, FileObject, ImportLink, SymbolReference, TestLink,
+)
+from cerberus.storage.sqlite_store import SQLiteIndexStore
 
 
 class TestPredictionEngine:
@@ -21,58 +23,22 @@ class TestPredictionEngine:
     def temp_index(self, tmp_path):
         """Create a temporary SQLite index for testing."""
         index_path = tmp_path / "test.db"
-        conn = sqlite3.connect(str(index_path))
-        cursor = conn.cursor()
-
-        # Create minimal schema
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS symbols (
-                id INTEGER PRIMARY KEY,
-                name TEXT,
-                file_path TEXT,
-                type TEXT,
-                start_line INTEGER,
-                end_line INTEGER
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS calls (
-                id INTEGER PRIMARY KEY,
-                caller_name TEXT,
-                callee_name TEXT,
-                file_path TEXT,
-                line_number INTEGER
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS imports (
-                id INTEGER PRIMARY KEY,
-                file_path TEXT,
-                import_name TEXT,
-                module_path TEXT
-            )
-        """)
-
-        # Insert test data
-        cursor.execute("""
-            INSERT INTO symbols (name, file_path, type, start_line, end_line)
-            VALUES ('validate_ops', '/test/mutations.py', 'function', 10, 20)
-        """)
-
-        cursor.execute("""
-            INSERT INTO symbols (name, file_path, type, start_line, end_line)
-            VALUES ('batch_edit', '/test/mutations.py', 'function', 50, 100)
-        """)
-
-        cursor.execute("""
-            INSERT INTO calls (caller_name, callee_name, file_path, line_number)
-            VALUES ('batch_edit', 'validate_ops', '/test/mutations.py', 55)
-        """)
-
-        conn.commit()
-        conn.close()
+        store = SQLiteIndexStore(index_path)
+
+        with store.transaction() as conn:
+            store.write_file(FileObject(
+                path="/test/mutations.py", abs_path="/test/mutations.py",
+                size=100, last_modified=0.0
+            ), conn=conn)
+            store.write_symbols_batch([
+                CodeSymbol(name="validate_ops", type="function",
+                           file_path="/test/mutations.py", start_line=10, end_line=20),
+                CodeSymbol(name="batch_edit", type="function",
+                           file_path="/test/mutations.py", start_line=50, end_line=100),
+            ], conn=conn)
+            store.write_calls_batch([
+                CallReference(caller_file="/test/mutations.py", callee="validate_ops", line=55),
+            ], conn=conn)
 
         return index_path
 
@@ -219,6 +185,99 @@ class TestPredictionEngine:
         assert risk_score == 0.5  # Default value
 
 
+class TestIndexedRelationships:
+    """Test relationship discovery over the resolved index tables."""
+
+    CORE = "/proj/pkg/core.py"
+    APP = "/proj/pkg/app.py"
+    TEST = "/proj/tests/test_core.py"
+
+    @pytest.fixture
+    def project_index(self, tmp_path):
+        """Index with a cross-file call, an inheritance reference and a test."""
+        store = SQLiteIndexStore(tmp_path / "index.db")
+
+        with store.transaction() as conn:
+            for path in (self.CORE, self.APP, self.TEST):
+                store.write_file(FileObject(path=path, abs_path=path, size=10, last_modified=0.0), conn=conn)
+            store.write_symbols_batch([
+                CodeSymbol(name="helper", type="function", file_path=self.CORE, start_line=1, end_line=2),
+                CodeSymbol(name="compute", type="function", file_path=self.CORE, start_line=5, end_line=6),
+                CodeSymbol(name="Base", type="class", file_path=self.CORE, start_line=9, end_line=11),
+                CodeSymbol(name="main", type="function", file_path=self.APP, start_line=4, end_line=5),
+                CodeSymbol(name="App", type="class", file_path=self.APP, start_line=8, end_line=9),
+                CodeSymbol(name="test_compute", type="function", file_path=self.TEST, start_line=4, end_line=5),
+            ], conn=conn)
+            store.write_calls_batch([
+                CallReference(caller_file=self.CORE, callee="helper", line=6),
+                CallReference(caller_file=self.CORE, callee="len", line=6),
+                CallReference(caller_file=self.APP, callee="compute", line=5),
+                CallReference(caller_file=self.TEST, callee="compute", line=5),
+            ], conn=conn)
+            # One resolved definition per statement; "compute" is only in imported_symbols
+            store.write_import_links_batch([
+                ImportLink(importer_file=self.APP, imported_module="pkg.core",
+                           imported_symbols=["compute", "Base"], import_line=1,
+                           definition_file=self.CORE, definition_symbol="Base"),
+                ImportLink(importer_file=self.TEST, imported_module="pkg.core",
+                           imported_symbols=["compute"], import_line=1,
+                           definition_file=self.CORE, definition_symbol="compute"),
+            ], conn=conn)
+            store.write_symbol_references_batch([
+                SymbolReference(source_file=self.APP, source_line=8, source_symbol="App",
+                                reference_type="inherits", target_file=self.CORE,
+                                target_symbol="Base", target_type="class"),
+            ], conn=conn)
+
+        from cerberus.analysis.test_index import build_test_index
+        build_test_index(store)  # No readable files: metadata only
+        store.write_test_links_batch([
+            TestLink(test_file=self.TEST, target="core", link_type="import"),
+            TestLink(test_file=self.TEST, test_name="test_compute", test_line=4,
+                     target="compute", link_type="call"),
+        ])
+        return store
+
+    def test_callers_dependencies_and_tests(self, project_index):
+        """Cross-file callers, same-file callees and tests come from the index."""
+        engine = PredictionEngine(str(project_index.db_path), store=project_index)
+        found = {
+            (p.reason, p.symbol, p.file)
+            for p in engine._find_relationships("compute", self.CORE)
+        }
+
+        assert found == {
+            ("direct_caller", "main", self.APP),
+            ("direct_dependency", "helper", self.CORE),
+            ("test_reference", "test_compute", self.TEST),
+        }
+
+    def test_reference_callers(self, project_index):
+        """Resolved symbol references (inheritance) count as callers."""
+        engine = PredictionEngine(str(project_index.db_path), store=project_index)
+        callers = engine._find_direct_callers("Base", self.CORE)
+
+        assert [(p.symbol, p.line) for p in callers] == [("App", 8)]
+        assert callers[0].relationship == "inherits from Base (AST-verified)"
+
+    def test_imports_file_uses_resolved_links(self, project_index):
+        """Import verification is an exact match on resolved links."""
+        engine = PredictionEngine(str(project_index.db_path), store=project_index)
+
+        assert engine._imports_file(self.TEST, self.CORE) is True
+        assert engine._imports_file(self.TEST, self.APP) is False
+
+    def test_risk_scores_prefetched(self, project_index):
+        """Risk follows import fan-in; unindexed files stay at medium risk."""
+        engine = PredictionEngine(str(project_index.db_path), store=project_index)
+        scores = engine._get_risk_scores([self.CORE, self.APP, "/elsewhere.py"])
+
+        assert scores == {self.CORE: 0.2, self.APP: 0.0, "/elsewhere.py": 0.5}
+
+        predictions, _ = engine.predict_related_changes("compute", self.CORE)
+        assert predictions[-1].file == self.CORE  # Most imported file last
+
+
 class TestPredictionDataStructures:
     """Test prediction data structures."""
 
@@ -337,36 +396,7 @@ class TestDeterministicConstraints:
         # This is more of a design constraint test
         # The engine should only use exact AST relationships
         index_path = tmp_path / "test.db"
-        conn = sqlite3.connect(str(index_path))
-        cursor = conn.cursor()
-
-        # Create minimal schema
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS symbols (
-                id INTEGER PRIMARY KEY,
-                name TEXT,
-                file_path TEXT
-            )
-        """)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS calls (
-                id INTEGER PRIMARY KEY,
-                caller_name TEXT,
-                callee_name TEXT,
-                file_path TEXT,
-                line_number INTEGER
-            )
-        """)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS imports (
-                id INTEGER PRIMARY KEY,
-                file_path TEXT,
-                import_name TEXT,
-                module_path TEXT
-            )
-        """)
-        conn.commit()
-        conn.close()
+        SQLiteIndexStore(index_path)
 
         engine = PredictionEngine(str(index_path))
 
@@ -382,35 +412,7 @@ class TestDeterministicConstraints:
     def test_high_confidence_only(self, tmp_path):
         """Ensure only high confidence (>=0.9) predictions are shown."""
         index_path = tmp_path / "test.db"
-        conn = sqlite3.connect(str(index_path))
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS symbols (
-                id INTEGER PRIMARY KEY,
-                name TEXT,
-                file_path TEXT
-            )
-        """)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS calls (
-                id INTEGER PRIMARY KEY,
-                caller_name TEXT,
-                callee_name TEXT,
-                file_path TEXT,
-                line_number INTEGER
-            )
-        """)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS imports (
-                id INTEGER PRIMARY KEY,
-                file_path TEXT,
-                import_name TEXT,
-                module_path TEXT
-            )
-        """)
-        conn.commit()
-        conn.close()
+        SQLiteIndexStore(index_path)
 
         engine = PredictionEngine(str(index_path), confidence_threshold=0.9)
         predictions, stats = engine.predict_related_changes(
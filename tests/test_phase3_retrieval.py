@@ -4,6 +4,7 @@ Unit tests for Phase 3.3: Hybrid Retrieval
 Tests BM25 search, vector search, ranking fusion, and query detection.
 """
 
+import numpy as np
 import pytest
 from pathlib import Path
 
@@ -12,7 +13,9 @@ from cerberus.schemas import CodeSymbol, SearchResult, CodeSnippet
 from cerberus.retrieval.bm25_search import BM25Index
 from cerberus.retrieval.hybrid_ranker import (
     detect_query_type,
+    fuse_ids,
     reciprocal_rank_fusion,
+    to_hybrid_results,
     weighted_score_fusion,
 )
 
@@ -264,4 +267,81 @@ class TestRankingFusion:
         # Fuse with empty vector
         fused2 = reciprocal_rank_fusion(results, empty)
         assert len(fused2) == 1
-        assert fused2[0].match_type == "keyword"
\ No newline at end of file
+        assert fused2[0].match_type == "keyword"
+
+    def test_fuse_ids_scores_and_order(self):
+        """Test vectorized fusion scores, tie order and top_k selection."""
+        keyword_ids = list(range(20))
+        keyword_scores = [1.0 - i / 20 for i in keyword_ids]
+        vector_ids = list(range(10, 30))
+        vector_scores = [0.5] * 20
+
+        full = fuse_ids(keyword_ids, keyword_scores, vector_ids, vector_scores, k=60)
+        assert full[0].id == 10
+        assert full[0].match_type == "both"
+        assert full[0].hybrid_score == pytest.approx(1 / 71 + 1 / 61)
+        assert {hit.match_type for hit in full} == {"both", "keyword", "semantic"}
+
+        for method in ("rrf", "weighted"):
+            everything = fuse_ids(keyword_ids, keyword_scores, vector_ids, vector_scores, method=method)
+            top = fuse_ids(keyword_ids, keyword_scores, vector_ids, vector_scores, method=method, top_k=5)
+            assert [h.id for h in top] == [h.id for h in everything[:5]]
+
+        # Equal scores keep first-seen order, keyword hits first
+        tied = fuse_ids([7, 3], [0.5, 0.5], [9], [0.5], method="weighted", keyword_weight=1, semantic_weight=1)
+        assert [h.id for h in tied] == [7, 3, 9]
+        assert fuse_ids([], [], [], []) == []
+
+        def to_symbol(symbol_id):
+            return CodeSymbol(name=f"s{symbol_id}", type="function", file_path="a.py", start_line=1, end_line=2)
+
+        results = to_hybrid_results(full[:3], to_symbol)
+        assert [r.rank for r in results] == [1, 2, 3]
+        assert results[0].symbol.name == "s10"
+
+
+class TestStreamingFusion:
+    """Test balanced search on SQLite indexes fuses by symbol ID."""
+
+    def test_balanced_search_hydrates_vector_hits_by_id(self, tmp_path, monkeypatch):
+        from cerberus.index import build_index
+        from cerberus.index.index_loader import load_index
+        from cerberus.retrieval import facade
+
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "app.py").write_text(
+            "def parse_config(path):\n    return path\n\n\n"
+            "def open_session():\n    return None\n"
+        )
+        index_path = tmp_path / "cerberus.db"
+        build_index(src, index_path, extensions=[".py"])
+
+        scan_result = load_index(index_path)
+        store = scan_result._store
+        ids = {name: store.fts5_search_rows(name)[0].id for name in ("parse_config", "open_session")}
+
+        # Semantic hits: a keyword hit, a vector-only hit and an orphaned FAISS entry
+        vector_ids = np.array([ids["open_session"], 99999, ids["parse_config"]])
+        monkeypatch.setattr(facade, "vector_search_ids", lambda **kwargs: (vector_ids, np.array([0.9, 0.8, 0.7])))
+        store._faiss_store = [object()]  # Any non-empty vector store
+
+        lookups = []
+        get_symbol_rows = store.get_symbol_rows
+        def recording_lookup(symbol_ids):
+            lookups.append(symbol_ids)
+            return get_symbol_rows(symbol_ids)
+
+        monkeypatch.setattr(store, "get_symbol_rows", recording_lookup)
+
+        results = facade._hybrid_search_streaming(
+            query="parse_config", scan_result=scan_result, mode="balanced", top_k=10,
+            keyword_weight=0.5, semantic_weight=0.5, fusion_method="rrf", padding=0,
+        )
+
+        assert [r.symbol.name for r in results] == ["parse_config", "open_session"]
+        assert results[0].match_type == "both"
+        assert results[1].match_type == "semantic"
+        assert [r.rank for r in results] == [1, 2]
+        # One batched lookup, for the vector-only hits
+        assert lookups == [[ids["open_session"], 99999]]
@@ -81,3 +81,69 @@ requires-python = "3.11"
     assert "Python 3.11" in summary.tech_stack
     assert "FastAPI" in summary.tech_stack
     assert "app.py" in summary.entry_points
+
+
+def _make_indexed_project(root: Path):
+    from cerberus.index import build_index
+
+    (root / "pyproject.toml").write_text(
+        '[project]\nname = "demo"\ndependencies = ["fastapi"]\nrequires-python = "3.11"\n'
+    )
+    (root / "src" / "demo" / "api").mkdir(parents=True)
+    (root / "src" / "demo" / "api" / "routes.py").write_text(
+        "from dataclasses import dataclass\n\n"
+        "@dataclass\nclass Route:\n    path: str\n\n"
+        "def handle(route: Route) -> str:\n    return route.path\n"
+    )
+    (root / "app.py").write_text("import os\n\ndef create_app():\n    return None\n")
+    index = build_index(root, root / ".cerberus" / "cerberus.db", skip_preflight=True)
+    return index._store
+
+
+def test_summary_from_index_is_cached(tmp_path: Path, monkeypatch) -> None:
+    from cerberus.analysis import project_summary
+
+    store = _make_indexed_project(tmp_path)
+    summary = ProjectSummaryAnalyzer(tmp_path, store).generate_summary()
+
+    assert summary.project_type == "FastAPI Application"
+    assert "app.py" in summary.entry_points
+    assert "Use dataclasses for data structures" in summary.coding_patterns
+    assert summary.index_stats["files_by_extension"][".py"] == 2
+    assert summary.index_stats["symbols_by_type"]["function"] == 2
+    assert store.get_metadata(project_summary.SUMMARY_CACHE_METADATA_KEY)
+
+    # Unchanged index and manifests: every section comes from the cache
+    def fail(*args, **kwargs):
+        raise AssertionError("section regenerated")
+
+    for method in ("_list_files", "_extract_coding_patterns", "_parse_dependencies"):
+        monkeypatch.setattr(ProjectSummaryAnalyzer, method, fail)
+    assert ProjectSummaryAnalyzer(tmp_path, store).generate_summary() == summary
+
+
+def test_summary_regenerates_only_changed_sections(tmp_path: Path, monkeypatch) -> None:
+    store = _make_indexed_project(tmp_path)
+    ProjectSummaryAnalyzer(tmp_path, store).generate_summary()
+
+    calls = []
+    original = ProjectSummaryAnalyzer._extract_coding_patterns
+
+    def tracking(self):
+        calls.append("coding_patterns")
+        return original(self)
+
+    monkeypatch.setattr(ProjectSummaryAnalyzer, "_extract_coding_patterns", tracking)
+
+    # Manifest change: dependency sections refresh, index-derived ones do not
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "demo"\ndependencies = ["django"]\nrequires-python = "3.12"\n'
+    )
+    summary = ProjectSummaryAnalyzer(tmp_path, store).generate_summary()
+    assert summary.project_type == "Django Application"
+    assert calls == []
+
+    # Index change: a new generation refreshes index-derived sections
+    store.bump_generation()
+    ProjectSummaryAnalyzer(tmp_path, store).generate_summary()
+    assert calls == ["coding_patterns"]
@@ -0,0 +1,87 @@
+"""
+Performance benchmarks for the keyword search hot path.
+
+FTS5 hits stay SymbolRows through retrieval and fusion; CodeSymbol and
+HybridSearchResult models are only built for the returned top_k. These
+benchmarks compare row and model throughput and check per-query latency on
+a synthetic index. Run with:
+    pytest -m benchmark
+"""
+
+import time
+
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+from cerberus.retrieval import hybrid_search
+from cerberus.retrieval.cache import clear_search_cache
+from cerberus.schemas import CodeSymbol, FileObject
+from cerberus.storage import SQLiteIndexStore
+
+WORDS = ["config", "parse", "load", "user", "session", "cache", "token", "index"]
+QUERIES = ["config", "parse_user", "session cache", "token"]
+
+
+@pytest.fixture(scope="module")
+def index_path(tmp_path_factory):
+    """Index of 10k functions named after word pairs."""
+    db_path = tmp_path_factory.mktemp("search_bench") / "cerberus.db"
+    store = SQLiteIndexStore(db_path)
+    for f in range(100):
+        path = f"pkg/mod_{f}.py"
+        store.write_file(FileObject(path=path, abs_path=f"/{path}", size=1000, last_modified=1.0))
+        store.write_symbols_batch([
+            CodeSymbol(
+                name=f"{WORDS[i % 8]}_{WORDS[(i + f) % 8]}_{i}",
+                type="function",
+                file_path=path,
+                start_line=i * 3 + 1,
+                end_line=i * 3 + 2,
+                parameters=["value", "options"],
+                parameter_types={"value": "str", "options": "dict"},
+            )
+            for i in range(100)
+        ])
+    return db_path
+
+
+def _best_rate(search, rounds: int = 5, repeat: int = 20) -> float:
+    """Best objects/sec over a few rounds."""
+    best = 0.0
+    for _ in range(rounds):
+        count = 0
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for query in QUERIES:
+                count += len(search(query))
+        best = max(best, count / (time.perf_counter() - start))
+    return best
+
+
+def test_rows_outpace_models(index_path):
+    """Search rows are produced faster than CodeSymbol models for the same hits."""
+    store = SQLiteIndexStore(index_path)
+
+    rows_per_sec = _best_rate(lambda q: store.fts5_search_rows(q, top_k=200))
+    models_per_sec = _best_rate(lambda q: list(store.fts5_search(q, top_k=200)))
+
+    print(f"\nrows: {rows_per_sec:,.0f}/s, models: {models_per_sec:,.0f}/s")
+    assert rows_per_sec > models_per_sec
+
+
+def test_keyword_query_latency(index_path):
+    """Uncached keyword searches stay within the latency budget."""
+    timings = []
+    for _ in range(10):
+        for query in QUERIES:
+            clear_search_cache()
+            start = time.perf_counter()
+            results = hybrid_search(query, index_path, mode="keyword", top_k=10)
+            timings.append(time.perf_counter() - start)
+            assert 0 < len(results) <= 10
+
+    timings.sort()
+    median_ms = timings[len(timings) // 2] * 1000
+    print(f"\nkeyword hybrid_search median: {median_ms:.2f} ms")
+    assert median_ms < 50
@@ -0,0 +1,172 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from cerberus.index import ColumnarIndexStore, build_index
+from cerberus.retrieval import cache as cache_module
+from cerberus.retrieval import facade
+from cerberus.retrieval import legacy_index
+from cerberus.retrieval.cache import SearchResultCache, clear_search_cache
+from cerberus.retrieval.legacy_index import clear_legacy_indexes
+from cerberus.retrieval.vector_search import build_vector_documents
+from cerberus.schemas import CodeSymbol, ScanResult, SymbolEmbedding
+from cerberus.semantic import embeddings
+from cerberus.storage.sqlite_store import SQLiteIndexStore
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    clear_search_cache()
+    clear_legacy_indexes()
+    embeddings._embed_query_cached.cache_clear()
+    yield
+    clear_search_cache()
+    clear_legacy_indexes()
+    embeddings._embed_query_cached.cache_clear()
+
+
+@pytest.fixture
+def index_path(tmp_path: Path) -> Path:
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "config.py").write_text(
+        "def parse_config(path):\n    return path\n\n\ndef load_config():\n    return parse_config('x')\n"
+    )
+    path = tmp_path / "index.db"
+    build_index(src, path, extensions=[".py"])
+    return path
+
+
+def _fail(**kwargs):
+    raise AssertionError("search ran instead of using the cache")
+
+
+def test_repeated_search_served_from_cache(index_path: Path, monkeypatch) -> None:
+    first = facade.hybrid_search("parse_config", index_path, mode="keyword")
+    assert first[0].symbol.name == "parse_config"
+
+    monkeypatch.setattr(facade, "_run_hybrid_search", _fail)
+    again = facade.hybrid_search("  parse_config ", index_path, mode="keyword")
+
+    assert again == first
+    assert again[0] is not first[0]  # Callers get their own copies
+    assert cache_module.result_cache.get_stats()["hits"] == 1
+
+    # Different options are a separate entry
+    with pytest.raises(AssertionError):
+        facade.hybrid_search("parse_config", index_path, mode="keyword", top_k=1)
+
+
+def test_generation_bump_invalidates(index_path: Path, monkeypatch) -> None:
+    facade.hybrid_search("load_config", index_path, mode="keyword")
+
+    SQLiteIndexStore(index_path).bump_generation()
+
+    calls = []
+    original = facade._run_hybrid_search
+
+    def counting(**kwargs):
+        calls.append(kwargs["query"])
+        return original(**kwargs)
+
+    monkeypatch.setattr(facade, "_run_hybrid_search", counting)
+    facade.hybrid_search("load_config", index_path, mode="keyword")
+    facade.hybrid_search("load_config", index_path, mode="keyword")
+
+    assert calls == ["load_config"]
+
+
+def test_lru_eviction() -> None:
+    cache = SearchResultCache(max_size=2)
+    cache.put("a", [])
+    cache.put("b", [])
+    assert cache.get("a") == []
+    cache.put("c", [])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == [] and cache.get("c") == []
+    assert cache.get_stats()["size"] == 2
+
+    disabled = SearchResultCache(max_size=0)
+    disabled.put("a", [])
+    assert disabled.get("a") is None
+
+
+def test_query_embeddings_are_cached(monkeypatch) -> None:
+    calls = []
+
+    def fake_embed(texts, model_name="all-MiniLM-L6-v2"):
+        calls.append((tuple(texts), model_name))
+        return np.ones((len(texts), 4), dtype=np.float32)
+
+    monkeypatch.setattr(embeddings, "embed_texts", fake_embed)
+
+    first = embeddings.embed_query("parse config")
+    first[:] = 0  # Mutating a result must not corrupt the cache
+    second = embeddings.embed_query("parse config")
+    embeddings.embed_query("parse config", model_name="other-model")
+
+    assert np.array_equal(second, np.ones(4))
+    assert calls == [(("parse config",), "all-MiniLM-L6-v2"), (("parse config",), "other-model")]
+
+
+@pytest.mark.parametrize("index_name", ["index.json", "index.cidx"])
+def test_json_index_loaded_once_per_version(tmp_path: Path, monkeypatch, index_name: str) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "config.py").write_text("def parse_config(path):\n    return path\n")
+    json_path = tmp_path / index_name
+    build_index(src, json_path, extensions=[".py"])
+
+    loads = []
+    original = legacy_index.load_index
+
+    def counting(path):
+        loads.append(path)
+        return original(path)
+
+    monkeypatch.setattr(legacy_index, "load_index", counting)
+
+    for query in ("parse_config", "path", "parse_config"):
+        clear_search_cache()
+        assert facade.hybrid_search(query, json_path, mode="keyword")
+    assert len(loads) == 1
+
+    # A rewritten index is loaded again
+    (src / "config.py").write_text("def parse_settings(path):\n    return path\n")
+    build_index(src, json_path, extensions=[".py"])
+    clear_search_cache()
+    results = facade.hybrid_search("parse_settings", json_path, mode="keyword")
+
+    assert "parse_settings" in {r.symbol.name for r in results}
+    assert len(loads) == 2
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_precomputed_embeddings_matched_by_symbol(tmp_path: Path, columnar: bool) -> None:
+    symbols = [
+        CodeSymbol(name=name, type="function", file_path="a.py", start_line=i, end_line=i + 1)
+        for i, name in enumerate(["load", "save", "load"])
+    ]
+    scan_result = ScanResult(
+        total_files=1,
+        files=[],
+        scan_duration=0.0,
+        symbols=symbols,
+        embeddings=[
+            SymbolEmbedding(name="save", file_path="a.py", vector=[0.0, 1.0]),
+            SymbolEmbedding(name="load", file_path="a.py", vector=[1.0, 0.0]),
+            SymbolEmbedding(name="missing", file_path="a.py", vector=[1.0, 1.0]),
+        ],
+    )
+    if columnar:
+        scan_result = ColumnarIndexStore(ColumnarIndexStore(tmp_path / "index.cidx").write(scan_result)).read()
+    snippets = [{"symbol": symbol, "snippet_text": symbol.name} for symbol in scan_result.symbols]
+
+    documents = build_vector_documents(scan_result, snippets)
+
+    # First symbol per (name, file); embeddings without a symbol are skipped
+    assert [(d.symbol.name, d.symbol.start_line) for d in documents] == [("save", 1), ("load", 0)]
+    assert documents[1].embedding.tolist() == [1.0, 0.0]
+
@@ -0,0 +1,99 @@
+from pathlib import Path
+
+from cerberus.storage.sqlite_store import SQLiteIndexStore
+from cerberus.synthesis import SkeletonCache, SynthesisFacade
+
+LONG_FUNCTION = (
+    "def {name}(a, b):\n"
+    "    total = a + b\n"
+    "    total *= 2\n"
+    "    total -= 1\n"
+    "    return total\n"
+)
+
+
+def _write_module(path: Path, *names: str) -> None:
+    path.write_text("\n".join(LONG_FUNCTION.format(name=name) for name in names))
+
+
+def _count_rows(store: SQLiteIndexStore) -> int:
+    conn = store._get_connection()
+    try:
+        return conn.execute("SELECT COUNT(*) FROM skeleton_cache").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_skeletons_persist_across_instances(tmp_path: Path) -> None:
+    store = SQLiteIndexStore(tmp_path / ".cerberus" / "cerberus.db")
+    module = tmp_path / "mod.py"
+    _write_module(module, "alpha")
+
+    first = SkeletonCache(store).get(str(module))
+    assert "total *= 2" not in first.content
+
+    cache = SkeletonCache(store)
+    assert cache.get(str(module)) == first
+    assert cache.get_stats()["hits"] == 1
+
+    # Different preserved symbols are a separate entry
+    preserved = cache.get(str(module), preserve_symbols=["alpha"])
+    assert "total *= 2" in preserved.content
+    assert _count_rows(store) == 2
+
+
+def test_content_change_replaces_entry(tmp_path: Path) -> None:
+    store = SQLiteIndexStore(tmp_path / ".cerberus" / "cerberus.db")
+    module = tmp_path / "mod.py"
+    _write_module(module, "alpha")
+    SkeletonCache(store).get(str(module))
+
+    _write_module(module, "alpha", "beta")
+    cache = SkeletonCache(store)
+    skeleton = cache.get(str(module))
+
+    assert "def beta" in skeleton.content
+    assert cache.get_stats()["misses"] == 1
+    assert _count_rows(store) == 1
+
+
+def test_directory_skeletons_use_cache(tmp_path: Path, monkeypatch) -> None:
+    store = SQLiteIndexStore(tmp_path / ".cerberus" / "cerberus.db")
+    src = tmp_path / "src"
+    src.mkdir()
+    for i in range(6):
+        _write_module(src / f"mod{i}.py", f"func{i}")
+    (src / "broken.py").write_bytes(b"\xff\xfe not utf-8")
+
+    facade = SynthesisFacade(store=store)
+    results = facade.skeletonize_directory(str(src))
+
+    assert [Path(r.file_path).name for r in results] == [f"mod{i}.py" for i in range(6)]
+    assert _count_rows(store) == 6
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cache miss")
+
+    monkeypatch.setattr(facade.skeletonizer, "skeletonize_file", fail)
+    assert facade.skeletonize_directory(str(src)) == results
+
+
+def test_skeletonize_tool_never_loads_the_index(tmp_path: Path, monkeypatch) -> None:
+    from cerberus.mcp.tools import synthesis
+
+    class Manager:
+        _index = None
+
+        def get_index(self):
+            raise AssertionError("index was loaded")
+
+    manager = Manager()
+    monkeypatch.setattr(synthesis, "get_index_manager", lambda: manager)
+    assert synthesis._get_store() is None
+
+    store = SQLiteIndexStore(tmp_path / ".cerberus" / "cerberus.db")
+    manager._index = type("Adapter", (), {"_store": store})()
+    assert synthesis._get_store() is store
+
+    monkeypatch.setattr(synthesis, "get_index_manager", lambda: 1 / 0)
+    assert synthesis._get_store() is None
@@ -12,6 +12,7 @@ from pathlib import Path
 pytestmark = pytest.mark.fast
 
 from cerberus.storage.sqlite_store import SQLiteIndexStore
+from cerberus.storage.sqlite.tokens import identifier_subtokens
 from cerberus.schemas import (
     FileObject,
     CodeSymbol,
@@ -27,7 +28,7 @@ def test_sqlite_store_initialization(tmp_path):
     store = SQLiteIndexStore(tmp_path / "test.db")
 
     assert store.db_path.exists()
-    assert store.get_metadata('schema_version') == '1.3.0'
+    assert store.get_metadata('schema_version') == '1.4.0'
 
 
 def test_write_and_query_files(tmp_path):
@@ -343,3 +344,162 @@ def test_streaming_batch_size(tmp_path):
 
     result = list(store.query_symbols(batch_size=100))
     assert len(result) == 50
+
+
+def test_fts5_search_batch_matches_single_searches(tmp_path):
+    """Test batched FTS5 searches return the same results as one search per query."""
+    store = SQLiteIndexStore(tmp_path / "test.db")
+
+    file_obj = FileObject(path="test.py", abs_path="/test.py", size=100, last_modified=1.0)
+    store.write_file(file_obj)
+
+    names = ["parse_config", "load_config", "parse_args", "UserRepository", "validate_input"]
+    symbols = [
+        CodeSymbol(name=name, type="function", file_path="test.py", start_line=i * 10, end_line=i * 10 + 5)
+        for i, name in enumerate(names)
+    ]
+    store.write_symbols_batch(symbols)
+
+    queries = ["parse", "config", "UserRepository", "missing", 'bad "quote']
+    batched = store.fts5_search_batch(queries, top_k=2)
+
+    assert len(batched) == len(queries)
+    for query, results in zip(queries, batched):
+        expected = list(store.fts5_search(query, top_k=2))
+        assert [(s.name, score) for s, score in results] == [(s.name, score) for s, score in expected]
+
+    assert {s.name for s, _ in batched[0]} == {"parse_config", "parse_args"}
+    assert batched[3] == []
+    assert store.fts5_search_batch([]) == []
+
+
+def test_fts5_search_rows_match_fts5_search(tmp_path):
+    """Test lightweight search rows carry the same symbols and scores as fts5_search."""
+    store = SQLiteIndexStore(tmp_path / "test.db")
+    store.write_file(FileObject(path="test.py", abs_path="/test.py", size=100, last_modified=1.0))
+    store.write_symbols_batch([
+        CodeSymbol(
+            name="parse_config", type="function", file_path="test.py", start_line=1, end_line=5,
+            parameters=["path"], parameter_types={"path": "str"}, return_type="dict",
+        ),
+        CodeSymbol(name="ConfigParser", type="class", file_path="test.py", start_line=10, end_line=40),
+    ])
+
+    rows = store.fts5_search_rows("config", top_k=5)
+    expected = list(store.fts5_search("config", top_k=5))
+
+    assert [(row.to_symbol(), row.score) for row in rows] == expected
+    assert rows[0].parameters == '["path"]'  # JSON stays undecoded until to_symbol()
+    assert all(isinstance(row.id, int) for row in rows)
+
+
+def test_get_symbol_rows_batches_ids(tmp_path, monkeypatch):
+    """Test symbols are looked up by ID in chunked IN queries."""
+    import cerberus.storage.sqlite.symbols as symbols_module
+
+    monkeypatch.setattr(symbols_module, "ID_LOOKUP_CHUNK_SIZE", 2)
+    store = SQLiteIndexStore(tmp_path / "test.db")
+    store.write_file(FileObject(path="test.py", abs_path="/test.py", size=100, last_modified=1.0))
+    store.write_symbols_batch([
+        CodeSymbol(name=f"load_{i}", type="function", file_path="test.py", start_line=i, end_line=i + 1)
+        for i in range(5)
+    ])
+    ids = {row.name: row.id for row in store.fts5_search_rows("load", top_k=10)}
+
+    rows = store.get_symbol_rows([ids["load_4"], ids["load_0"], 99999, ids["load_2"], ids["load_4"]])
+
+    assert {row.name for row in rows.values()} == {"load_0", "load_2", "load_4"}
+    assert rows[ids["load_2"]].to_symbol().start_line == 2
+    assert store.get_symbol_rows([]) == {}
+
+
+def test_identifier_subtokens():
+    """Test camelCase, acronym and snake_case splitting for name_tokens."""
+    assert identifier_subtokens("parseConfigFile") == ["parse", "config", "file"]
+    assert identifier_subtokens("HTTPServer_v2") == ["http", "server", "v", "2"]
+    assert identifier_subtokens("__init__") == ["init"]
+
+
+def test_fts5_search_matches_subtokens_and_substrings(tmp_path):
+    """Test that keyword search finds camelCase words and substrings in one query."""
+    store = SQLiteIndexStore(tmp_path / "test.db")
+    store.write_file(FileObject(path="test.py", abs_path="/test.py", size=100, last_modified=1.0))
+
+    names = ["parseConfigFile", "ConfigParser", "parse", "HTTPServer", "load"]
+    store.write_symbols_batch([
+        CodeSymbol(name=name, type="function", file_path="test.py", start_line=i * 10, end_line=i * 10 + 5)
+        for i, name in enumerate(names)
+    ])
+
+    def search(query):
+        return [s.name for s, _ in store.fts5_search(query)]
+
+    # Sub-token matches rank before substring-only matches
+    assert search("parse") == ["parse", "parseConfigFile", "ConfigParser"]
+    assert search("server") == ["HTTPServer"]
+    assert search("configFile") == ["parseConfigFile"]
+    assert set(search("onfig")) == {"parseConfigFile", "ConfigParser"}
+    # Too short for trigrams, and advanced queries use tokens only
+    assert search("lo") == []
+    assert search("parse NOT config") == ["parse"]
+
+
+def test_schema_migration_adds_search_tokens(tmp_path):
+    """Test that indexes built before name_tokens are tokenized on open."""
+    db_path = tmp_path / "test.db"
+    store = SQLiteIndexStore(db_path)
+    store.write_file(FileObject(path="test.py", abs_path="/test.py", size=100, last_modified=1.0))
+    store.write_symbols_batch([
+        CodeSymbol(name="parseConfigFile", type="function", file_path="test.py", start_line=1, end_line=5)
+    ])
+
+    # Simulate a 1.3.0 index: no sub-tokens, no trigram table
+    with store.transaction() as conn:
+        conn.execute("UPDATE symbols SET name_tokens = NULL")
+        conn.execute("DROP TABLE symbols_trigram")
+        conn.execute("UPDATE metadata SET value = '1.3.0' WHERE key = 'schema_version'")
+
+    store = SQLiteIndexStore(db_path)
+    assert store.get_metadata("schema_version") == "1.4.0"
+    assert [s.name for s, _ in store.fts5_search("config")] == ["parseConfigFile"]
+    assert [s.name for s, _ in store.fts5_search("onfigFi")] == ["parseConfigFile"]
+
+
+def test_new_index_skips_migrations(tmp_path, monkeypatch):
+    """Test that a fresh database starts at the current schema without migrating."""
+    from cerberus.storage.sqlite import schema
+
+    messages = []
+    monkeypatch.setattr(schema, "logger", type("Log", (), {
+        "info": staticmethod(messages.append),
+        "debug": staticmethod(messages.append),
+        "warning": staticmethod(messages.append),
+    }))
+
+    store = SQLiteIndexStore(tmp_path / "test.db")
+
+    assert store.get_metadata("schema_version") == "1.4.0"
+    assert not [m for m in messages if m.startswith("Migrat")]
+
+
+def test_search_without_trigram_tokenizer(tmp_path, monkeypatch):
+    """Test that SQLite builds without the trigram tokenizer still index and search."""
+    from cerberus.storage.sqlite import schema, symbols
+
+    monkeypatch.setattr(schema, "trigram_supported", lambda: False)
+    monkeypatch.setattr(symbols, "trigram_supported", lambda: False)
+
+    db_path = tmp_path / "test.db"
+    store = SQLiteIndexStore(db_path)
+    store.write_file(FileObject(path="test.py", abs_path="/test.py", size=100, last_modified=1.0))
+    store.write_symbols_batch([
+        CodeSymbol(name="parseConfigFile", type="function", file_path="test.py", start_line=1, end_line=5)
+    ])
+
+    assert [s.name for s, _ in store.fts5_search("config")] == ["parseConfigFile"]
+    assert [s.name for s, _ in store.fts5_search("onfigFi")] == []
+
+    # Reopened where trigrams are available, the substring index is rebuilt
+    monkeypatch.undo()
+    store = SQLiteIndexStore(db_path)
+    assert [s.name for s, _ in store.fts5_search("onfigFi")] == ["parseConfigFile"]
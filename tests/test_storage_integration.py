@@ -111,3 +111,25 @@ def test_delete_file_with_embeddings(tmp_path):
 
     faiss_store.remove_vectors(faiss_ids_to_remove)
     assert len(faiss_store) == 0
+
+
+@requires_faiss
+def test_faiss_search_returns_symbol_ids(tmp_path):
+    """Test FAISS hits map to symbol IDs, including after vectors are removed."""
+    faiss_store = FAISSVectorStore(tmp_path / "faiss_index", dimension=4)
+    vectors = np.eye(4, dtype=np.float32)
+    faiss_ids = faiss_store.add_vectors_batch([11, 12, 13, 14], vectors)
+
+    scores, symbol_ids = faiss_store.search_symbols(vectors[2], k=2)
+    assert symbol_ids[0] == 13
+    assert scores[0] == pytest.approx(1.0)
+    assert faiss_store.get_symbol_id(faiss_ids[3]) == 14
+
+    faiss_store.remove_vectors([faiss_ids[0]])
+
+    _, symbol_ids = faiss_store.search_symbols(vectors[3], k=1)
+    assert symbol_ids.tolist() == [14]
+    assert faiss_store.symbol_ids_for([0, 5]).tolist() == [12, -1]
+    with pytest.raises(KeyError):
+        faiss_store.get_symbol_id(5)
+
@@ -0,0 +1,111 @@
+from pathlib import Path
+
+import pytest
+
+from cerberus.quality import StyleDetector, StyleFixer
+from cerberus.quality import cache as cache_module
+from cerberus.quality import detector as detector_module
+
+CLEAN = "def clean():\n    return 1\n"
+DIRTY = "def dirty():  \n    return 1"
+
+
+def _write_tree(root: Path, dirty: int = 3, clean: int = 3) -> None:
+    (root / "pkg").mkdir(parents=True)
+    for i in range(dirty):
+        (root / "pkg" / f"dirty{i}.py").write_text(DIRTY)
+    for i in range(clean):
+        (root / f"clean{i}.py").write_text(CLEAN)
+
+
+def _as_dicts(results):
+    return {path: [issue.to_dict() for issue in issues] for path, issues in results.items()}
+
+
+@pytest.fixture
+def config(tmp_path):
+    return {"cache_path": tmp_path / "style_cache.db"}
+
+
+def test_unchanged_files_skip_checks(tmp_path: Path, config, monkeypatch) -> None:
+    src = tmp_path / "src"
+    _write_tree(src)
+
+    first = StyleDetector(config).check_directory(str(src), recursive=True)
+    assert sorted(Path(p).name for p in first) == ["dirty0.py", "dirty1.py", "dirty2.py"]
+
+    checked = []
+    original = detector_module._check_path
+
+    def tracking(file_path):
+        checked.append(Path(file_path).name)
+        return original(file_path)
+
+    monkeypatch.setattr(detector_module, "_check_path", tracking)
+
+    detector = StyleDetector(config)
+    assert _as_dicts(detector.check_directory(str(src), recursive=True)) == _as_dicts(first)
+    assert checked == []
+    assert detector.cache.hits == 6
+
+    # Only changed files are checked again
+    (src / "clean0.py").write_text(DIRTY)
+    results = StyleDetector(config).check_directory(str(src), recursive=True)
+    assert checked == ["clean0.py"]
+    assert str(src / "clean0.py") in results
+
+
+def test_rules_version_change_invalidates(tmp_path: Path, config, monkeypatch) -> None:
+    src = tmp_path / "src"
+    _write_tree(src, dirty=1, clean=1)
+    StyleDetector(config).check_directory(str(src), recursive=True)
+
+    monkeypatch.setattr(cache_module, "STYLE_RULES_VERSION", "next")
+    detector = StyleDetector(config)
+    detector.check_directory(str(src), recursive=True)
+    assert detector.cache.hits == 0
+    assert detector.cache.misses == 2
+
+
+def test_process_pool_matches_serial(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    _write_tree(src, dirty=6, clean=6)
+
+    serial = StyleDetector({"cache_enabled": False, "max_workers": 1})
+    parallel = StyleDetector({"cache_enabled": False, "max_workers": 2, "parallel_min_files": 1})
+
+    expected = _as_dicts(serial.check_directory(str(src), recursive=True))
+    assert _as_dicts(parallel.check_directory(str(src), recursive=True)) == expected
+    assert len(expected) == 6
+
+
+def test_process_pool_never_forks() -> None:
+    # Forking the multithreaded MCP server can deadlock the workers
+    context = detector_module._pool_context(StyleDetector().config)
+    assert context.get_start_method() in ("forkserver", "spawn")
+
+
+def test_iter_directory_persists_partial_runs(tmp_path: Path, config) -> None:
+    src = tmp_path / "src"
+    _write_tree(src, dirty=0, clean=4)
+
+    results = StyleDetector(config).iter_directory(str(src))
+    next(results)
+    results.close()
+
+    detector = StyleDetector(config)
+    assert len(list(detector.iter_directory(str(src)))) == 4
+    assert detector.cache.hits == 1
+
+
+def test_fix_directory_fixes_only_dirty_files(tmp_path: Path, config) -> None:
+    src = tmp_path / "src"
+    _write_tree(src, dirty=2, clean=2)
+
+    results = StyleFixer(config).fix_directory(str(src), recursive=True)
+
+    assert len(results) == 4
+    fixed = {Path(p).name for p, (ok, fixes) in results.items() if ok and fixes}
+    assert fixed == {"dirty0.py", "dirty1.py"}
+    assert (src / "pkg" / "dirty0.py").read_text() == "def dirty():\n    return 1\n"
+    assert StyleDetector(config).check_directory(str(src), recursive=True) == {}
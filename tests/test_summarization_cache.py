@@ -0,0 +1,122 @@
+"""
+Tests for the summary cache, pooled LLM session and architecture fan-out.
+
+Runs against a local stub HTTP server that mimics the Ollama API.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from cerberus.summarization import SummarizationFacade, SummaryCache
+
+STUB_RESPONSE = """PURPOSE: Stub summary.
+KEY_POINTS:
+- point one
+DEPENDENCIES: os
+COMPLEXITY: 3
+"""
+
+
+class _StubOllama(BaseHTTPRequestHandler):
+    generate_calls = 0
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self._reply({"models": []})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        with self.lock:
+            type(self).generate_calls += 1
+        self._reply({"response": STUB_RESPONSE})
+
+    def _reply(self, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def stub_server():
+    _StubOllama.generate_calls = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubOllama)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _facade(base_url: str, cache_path: Path) -> SummarizationFacade:
+    return SummarizationFacade(
+        config={"cache_path": str(cache_path), "min_lines_for_summary": 1},
+        llm_config={"api_base": base_url, "model": "stub"},
+    )
+
+
+def _write_files(root: Path, count: int) -> list:
+    files = []
+    for i in range(count):
+        path = root / f"module_{i}.py"
+        path.write_text(f"def func_{i}():\n    return {i}\n")
+        files.append(str(path))
+    return files
+
+
+def test_file_summary_is_cached_across_instances(stub_server, tmp_path):
+    cache_path = tmp_path / "summaries.db"
+    [file_path] = _write_files(tmp_path, 1)
+
+    first = _facade(stub_server, cache_path).summarize_file(file_path)
+    again = _facade(stub_server, cache_path).summarize_file(file_path)
+
+    assert first.summary_text == "Stub summary."
+    assert again.summary_text == first.summary_text
+    assert _StubOllama.generate_calls == 1
+
+
+def test_changed_content_misses_cache(stub_server, tmp_path):
+    facade = _facade(stub_server, tmp_path / "summaries.db")
+    [file_path] = _write_files(tmp_path, 1)
+
+    facade.summarize_file(file_path)
+    Path(file_path).write_text("def changed():\n    return 0\n")
+    facade.summarize_file(file_path)
+
+    assert _StubOllama.generate_calls == 2
+    assert facade.cache.get_stats()["misses"] == 2
+
+
+def test_architecture_fans_out_and_caches(stub_server, tmp_path):
+    facade = _facade(stub_server, tmp_path / "summaries.db")
+    files = _write_files(tmp_path, 6)
+
+    summary = facade.summarize_architecture("stub layer", files)
+    assert summary.summary_type == "architecture"
+    # One request per file plus the combining request
+    assert _StubOllama.generate_calls == 7
+
+    facade.summarize_architecture("stub layer", files)
+    assert _StubOllama.generate_calls == 7
+
+    # Same files, different target: only the combining request is redone
+    facade.summarize_architecture("other layer", files)
+    assert _StubOllama.generate_calls == 8
+
+
+def test_cache_key_depends_on_model_and_template():
+    base = SummaryCache.make_key("code", "file", "model-a")
+    assert base == SummaryCache.make_key("code", "file", "model-a")
+    assert base != SummaryCache.make_key("code", "file", "model-b")
+    assert base != SummaryCache.make_key("code", "symbol", "model-a")
@@ -0,0 +1,83 @@
+from pathlib import Path
+
+from cerberus.analysis import test_index
+from cerberus.analysis.impact_analyzer import ImpactAnalyzer
+from cerberus.analysis import test_mapper
+from cerberus.index import build_index
+
+
+def _make_project(root: Path) -> None:
+    (root / "src").mkdir()
+    (root / "src" / "calc.py").write_text(
+        "def add(a, b):\n"
+        "    return a + b\n"
+        "\n"
+        "def unused(x):\n"
+        "    return x\n"
+    )
+    (root / "tests").mkdir()
+    (root / "tests" / "test_calc.py").write_text(
+        "from calc import add\n"
+        "\n"
+        "def test_add():\n"
+        "    assert add(1, 2) == 3\n"
+        "\n"
+        "def test_reference():\n"
+        "    fn = add\n"
+        "    assert fn(2, 2) == 4\n"
+    )
+
+
+def _build(root: Path):
+    index = build_index(root, root / ".cerberus" / "cerberus.db", skip_preflight=True)
+    return index._store
+
+
+def test_is_test_file_ignores_dirs_above_project_root(tmp_path: Path) -> None:
+    root = tmp_path / "test" / "project"
+    assert test_index.is_test_file(str(root / "tests" / "test_a.py"), str(root))
+    assert test_index.is_test_file(str(root / "pkg" / "a_test.go"), str(root))
+    assert test_index.is_test_file(str(root / "web" / "a.spec.ts"), str(root))
+    assert not test_index.is_test_file(str(root / "src" / "a.py"), str(root))
+
+
+def test_build_populates_test_links(tmp_path: Path) -> None:
+    _make_project(tmp_path)
+    store = _build(tmp_path)
+
+    assert store.get_metadata(test_index.TEST_INDEX_METADATA_KEY) == test_index.TEST_INDEX_VERSION
+
+    index = test_index.TestIndex(store, tmp_path)
+    assert index.find_tests("add") == [
+        "tests/test_calc.py::test_add",
+        "tests/test_calc.py::test_reference",
+    ]
+    assert index.find_test_files(["calc"]) == ["tests/test_calc.py"]
+    assert index.find_tests("unused") == []
+
+
+def test_mapper_and_impact_use_index(tmp_path: Path) -> None:
+    _make_project(tmp_path)
+    store = _build(tmp_path)
+
+    report = test_mapper.TestCoverageMapper(store, tmp_path).map_coverage("add")
+    assert report.test_files == ["tests/test_calc.py"]
+    assert "tests/test_calc.py::test_add" in report.covered_by
+
+    impact = ImpactAnalyzer(store, tmp_path).analyze_impact("add")
+    assert "tests/test_calc.py::test_add" in impact.affected_tests
+
+
+def test_lazy_build_and_incremental_refresh(tmp_path: Path) -> None:
+    _make_project(tmp_path)
+    store = _build(tmp_path)
+
+    # Stores without a (current) test index are built lazily on first query
+    store.delete_test_links()
+    store.set_metadata(test_index.TEST_INDEX_METADATA_KEY, "0")
+    assert len(test_index.TestIndex(store, tmp_path).find_tests("add")) == 2
+
+    # Refreshing a single file drops links it no longer has
+    (tmp_path / "tests" / "test_calc.py").write_text("def test_other():\n    assert True\n")
+    test_index.build_test_index(store, [str((tmp_path / "tests" / "test_calc.py").resolve())])
+    assert test_index.TestIndex(store, tmp_path).find_tests("add") == []
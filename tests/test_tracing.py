@@ -0,0 +1,129 @@
+import asyncio
+import json
+
+import pytest
+
+from cerberus import tracing
+from cerberus.tracing import Tracer, span, trace, trace_methods
+
+
+@pytest.fixture(autouse=True)
+def fresh_tracer(monkeypatch):
+    monkeypatch.setattr(tracing, "_tracer", Tracer(sample_rate=1.0))
+    yield tracing.get_tracer()
+
+
+def _events_by_name(document):
+    return {event["name"]: event for event in document["traceEvents"]}
+
+
+def test_spans_nest_and_export_chrome_trace(tmp_path):
+    @trace(name="inner", category="test", log=False)
+    def inner():
+        return 42
+
+    @trace
+    def outer():
+        with span("block", "test", size=3):
+            return inner()
+
+    assert outer() == 42
+
+    document = tracing.export_chrome_trace(tmp_path / "trace.json")
+    events = _events_by_name(document)
+    outer_name = outer.__qualname__
+
+    assert set(events) == {outer_name, "block", "inner"}
+    assert events["block"]["args"]["parent_id"] == events[outer_name]["args"]["span_id"]
+    assert events["inner"]["args"]["parent_id"] == events["block"]["args"]["span_id"]
+    assert events["block"]["args"]["size"] == 3
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events.values())
+    assert json.loads((tmp_path / "trace.json").read_text()) == document
+
+
+def test_histograms_count_calls_and_errors():
+    @trace(name="work", log=False)
+    def work(fail=False):
+        if fail:
+            raise ValueError("boom")
+
+    for _ in range(9):
+        work()
+    with pytest.raises(ValueError):
+        work(fail=True)
+
+    stats = tracing.get_stats()["spans"]["work"]
+    assert stats["count"] == 10
+    assert stats["errors"] == 1
+    assert 0 <= stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"] <= stats["max_ms"]
+
+
+def test_generator_span_covers_iteration_and_async_is_traced():
+    @trace(name="stream", log=False)
+    def stream():
+        return (i for i in range(3))
+
+    @trace(name="fetch", log=False)
+    async def fetch():
+        with span("child"):
+            await asyncio.sleep(0)
+        return "done"
+
+    items = stream()
+    assert tracing.get_stats()["spans"] == {}
+    assert list(items) == [0, 1, 2]
+    assert asyncio.run(fetch()) == "done"
+
+    events = _events_by_name(tracing.export_chrome_trace())
+    assert "stream" in events
+    assert events["child"]["args"]["parent_id"] == events["fetch"]["args"]["span_id"]
+
+
+
+def test_generator_spans_finish_when_closed_or_dropped(monkeypatch):
+    exits = []
+    monkeypatch.setattr(tracing, "_log_exit", lambda name, duration: exits.append(name))
+
+    @trace(name="stream")
+    def stream():
+        yield from range(3)
+
+    assert list(stream()) == [0, 1, 2]
+    assert exits == ["stream"]
+
+    partial = stream()
+    assert next(partial) == 0
+    partial.close()
+
+    stream()  # never started, garbage collected
+    assert tracing.get_stats()["spans"]["stream"]["count"] == 3
+    assert exits == ["stream"] * 3
+
+def test_sampling_is_decided_at_the_root():
+    tracing.set_sample_rate(0.0)
+    with span("root"):
+        with span("child") as child:
+            assert child is None
+    assert tracing.get_stats()["spans"] == {}
+
+    tracing.set_sample_rate(1.0)
+    with span("root"):
+        pass
+    assert tracing.get_stats()["spans"]["root"]["count"] == 1
+
+
+def test_trace_methods_wraps_public_methods():
+    @trace_methods("store", exclude=("skip",))
+    class Store:
+        def query(self):
+            return 1
+
+        def skip(self):
+            return 2
+
+        def _private(self):
+            return 3
+
+    store = Store()
+    assert (store.query(), store.skip(), store._private()) == (1, 2, 3)
+    assert list(tracing.get_stats()["spans"]) == ["store.query"]
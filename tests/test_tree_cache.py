@@ -0,0 +1,97 @@
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from cerberus.mutation.editor import CodeEditor
+from cerberus.parser import tree_cache
+from cerberus.parser.tree_cache import TreeCache, get_parser
+
+pytestmark = pytest.mark.skipif(
+    not tree_cache.TREE_SITTER_AVAILABLE, reason="tree-sitter not installed"
+)
+
+SOURCE = (
+    "def add(a, b):\n"
+    "    return a + b\n"
+    "\n"
+    "class Calc:\n"
+    "    def mul(self, a, b):\n"
+    "        return a * b\n"
+)
+
+
+def test_cache_hits_until_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "calc.py"
+    path.write_text(SOURCE)
+    cache = TreeCache()
+
+    first = cache.get(str(path))
+    assert cache.get(str(path)) is first
+    assert cache.get_stats()["hits"] == 1
+
+    # External edit: size changes, entry is reparsed
+    path.write_text(SOURCE + "\nX = 1\n")
+    second = cache.get(str(path))
+    assert second is not first
+    assert "X = 1" in second.source
+
+    # Unsupported languages are not parsed
+    assert cache.get(str(tmp_path / "notes.txt")) is None
+
+
+def test_update_reparses_incrementally(tmp_path: Path) -> None:
+    path = tmp_path / "calc.py"
+    path.write_text(SOURCE)
+    cache = TreeCache()
+    cache.get(str(path))
+
+    new_source = SOURCE.replace("return a + b", "total = a + b\n    return total")
+    path.write_text(new_source)
+    updated = cache.update(str(path), new_source)
+
+    fresh = get_parser("python").parse(new_source.encode("utf-8"))
+    assert str(updated.tree.root_node) == str(fresh.root_node)
+    assert cache.get(str(path)) is updated
+    assert cache.get_stats()["incremental_parses"] == 1
+
+
+def test_cache_is_bounded(tmp_path: Path) -> None:
+    cache = TreeCache(max_entries=2)
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"mod{i}.py"
+        path.write_text(f"def f{i}():\n    return {i}\n")
+        paths.append(path)
+        cache.get(str(path))
+
+    assert cache.get_stats()["entries"] == 2
+    cache.get(str(paths[0]))
+    assert cache.get_stats()["misses"] == 4  # evicted entry was reparsed
+
+
+def test_parsers_are_pooled_per_thread() -> None:
+    main = get_parser("python")
+    assert get_parser("python") is main
+
+    other = []
+    worker = threading.Thread(target=lambda: other.append(get_parser("python")))
+    worker.start()
+    worker.join()
+    assert other[0] is not main
+
+
+def test_editor_write_refreshes_cached_tree(tmp_path: Path) -> None:
+    path = tmp_path / "calc.py"
+    path.write_text(SOURCE)
+    cache = tree_cache.get_tree_cache()
+    cache.get(str(path))
+
+    editor = CodeEditor({"backup_enabled": False})
+    new_source = SOURCE.replace("a * b", "b * a")
+    assert editor._atomic_write(str(path), new_source)
+
+    entry = cache.get(str(path))
+    assert entry.source == new_source
+    assert entry.mtime_ns == os.stat(path).st_mtime_ns